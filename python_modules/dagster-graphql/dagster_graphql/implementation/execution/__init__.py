@@ -1,7 +1,7 @@
 import asyncio
 import os
 import sys
-from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, AsyncIterator, Optional, Sequence, Union
 
 # re-exports
 import dagster._check as check
@@ -30,6 +30,7 @@
     create_and_launch_partition_backfill as create_and_launch_partition_backfill,
     resume_partition_backfill as resume_partition_backfill,
 )
+from .run_event_log_hub import get_run_event_log_hub, storage_id_for_cursor
 
 if TYPE_CHECKING:
     from dagster_graphql.schema.logs.compute_logs import (
@@ -213,48 +214,71 @@ async def gen_events_for_run(
         after_cursor = None
 
     chunk_size = get_chunk_size()
-    # load the existing events in chunks
-    has_more = True
-    while has_more:
-        # run the fetch in a thread since its sync
-        connection = await run_in_threadpool(
-            instance.get_records_for_run,
-            run_id=run_id,
-            cursor=after_cursor,
-            limit=chunk_size,
-        )
-        if not dont_send_past_records:
-            yield GraphenePipelineRunLogsSubscriptionSuccess(
-                run=GrapheneRun(record),
-                messages=[
-                    from_event_record(record.event_log_entry, run.job_name)
-                    for record in connection.records
-                ],
-                hasMorePastEvents=connection.has_more,
-                cursor=connection.cursor,
-            )
-        has_more = connection.has_more
-        after_cursor = connection.cursor
 
-    loop = asyncio.get_event_loop()
-    queue: asyncio.Queue[Tuple[Any, Any]] = asyncio.Queue()
+    async def _gen_stored_records():
+        nonlocal after_cursor
+        # load the events stored after the cursor in chunks
+        has_more = True
+        while has_more:
+            # run the fetch in a thread since its sync
+            connection = await run_in_threadpool(
+                instance.get_records_for_run,
+                run_id=run_id,
+                cursor=after_cursor,
+                limit=chunk_size,
+            )
+            yield connection
+            has_more = connection.has_more
+            after_cursor = connection.cursor
+
+    def _stored_records_message(connection):
+        return GraphenePipelineRunLogsSubscriptionSuccess(
+            run=GrapheneRun(record),
+            messages=[
+                from_event_record(record.event_log_entry, run.job_name)
+                for record in connection.records
+            ],
+            hasMorePastEvents=connection.has_more,
+            cursor=connection.cursor,
+        )
 
-    def _enqueue(event, cursor):
-        loop.call_soon_threadsafe(queue.put_nowait, (event, cursor))
+    async for connection in _gen_stored_records():
+        if not dont_send_past_records:
+            yield _stored_records_message(connection)
 
-    # watch for live events
-    instance.watch_event_logs(run_id, after_cursor, _enqueue)
+    # watch for live events. The run's event log is watched once for all of its subscriptions, and
+    # each new event is converted once and queued for every subscription.
+    hub = get_run_event_log_hub(instance)
+    subscriber = hub.subscribe(instance, run_id, run.job_name, after_cursor)
     try:
         while True:
-            event, cursor = await queue.get()
+            if subscriber.needs_catch_up:
+                # the subscription fell behind, or joined a watch that had already broadcast
+                # events after its cursor, so load the missed events from storage
+                subscriber.start_catch_up()
+                async for connection in _gen_stored_records():
+                    if connection.records:
+                        yield _stored_records_message(connection)
+                continue
+
+            # send all of the events that arrived while the last message was being sent at once
+            batch = [
+                event
+                for event in await subscriber.get_batch(chunk_size)
+                if event.storage_id > storage_id_for_cursor(after_cursor)
+            ]
+            if not batch:
+                continue
+
+            after_cursor = batch[-1].cursor
             yield GraphenePipelineRunLogsSubscriptionSuccess(
                 run=GrapheneRun(record),
-                messages=[from_event_record(event, run.job_name)],
+                messages=[event.message for event in batch],
                 hasMorePastEvents=False,
-                cursor=cursor,
+                cursor=after_cursor,
             )
     finally:
-        instance.end_watch_event_logs(run_id, _enqueue)
+        hub.unsubscribe(run_id, subscriber)
 
 
 async def gen_compute_logs(
@@ -7,7 +7,10 @@
 from dagster._core.errors import DagsterError, DagsterUserCodeProcessError
 from dagster._core.events import AssetKey
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
-from dagster._core.execution.job_backfill import submit_backfill_runs
+from dagster._core.execution.job_backfill import (
+    ExecutionPlanSnapshotCache,
+    submit_backfill_runs,
+)
 from dagster._core.host_representation.external_data import ExternalPartitionExecutionErrorData
 from dagster._core.utils import make_new_backfill_id
 from dagster._core.workspace.permissions import Permissions
@@ -108,6 +111,7 @@ def create_and_launch_partition_backfill(
             # should only be used in a test situation
             to_submit = [name for name in partition_names]
             submitted_run_ids: List[str] = []
+            execution_plan_snapshot_cache: ExecutionPlanSnapshotCache = {}
 
             while to_submit:
                 chunk = to_submit[:BACKFILL_CHUNK_SIZE]
@@ -119,6 +123,7 @@ def create_and_launch_partition_backfill(
                         create_workspace=lambda: graphene_info.context,
                         backfill_job=backfill,
                         partition_names=chunk,
+                        execution_plan_snapshot_cache=execution_plan_snapshot_cache,
                     )
                     if run_id is not None
                 )
@@ -0,0 +1,207 @@
+"""Shares a single event log watch for each run between all of the GraphQL subscriptions to its
+logs, so that every new event is deserialized and converted to its GraphQL type once, no matter
+how many browser tabs are following the run.
+"""
+
+import asyncio
+import weakref
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, NamedTuple, Optional, Sequence, Set, Tuple
+
+import dagster._check as check
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.event_log.base import EventLogCursor
+
+if TYPE_CHECKING:
+    from dagster_graphql.schema.logs.events import GrapheneDagsterRunEvent
+
+# Number of events that can be queued for a subscriber that isn't keeping up before it is
+# switched to catching up from the event log storage instead
+DEFAULT_MAX_QUEUED_EVENTS = 10000
+
+
+def storage_id_for_cursor(cursor: Optional[str]) -> int:
+    if cursor is None:
+        return -1
+    return EventLogCursor.parse(cursor).storage_id()
+
+
+class RunEventLogMessage(NamedTuple):
+    storage_id: int
+    cursor: str
+    message: "GrapheneDagsterRunEvent"
+
+
+class RunEventLogSubscriber:
+    """The queue of live events for a single subscription to a run's logs.
+
+    Events are only ever added on the event loop, so the subscriber doesn't need any locking. If
+    the subscription falls too far behind, its queue is dropped and it is marked as needing to
+    catch up, so that a slow client can't hold up the other subscribers or grow the queue without
+    bound.
+    """
+
+    def __init__(self, max_queued_events: int):
+        self._max_queued_events = check.int_param(max_queued_events, "max_queued_events")
+        self._queue: Deque[RunEventLogMessage] = deque()
+        self._has_events = asyncio.Event()
+        self._needs_catch_up = False
+
+    @property
+    def needs_catch_up(self) -> bool:
+        """Whether events may have been missed, in which case the subscription should call
+        `start_catch_up` and then load the events after its cursor from the event log storage.
+        """
+        return self._needs_catch_up
+
+    def mark_needs_catch_up(self) -> None:
+        self._needs_catch_up = True
+        self._queue.clear()
+        self._has_events.set()
+
+    def start_catch_up(self) -> None:
+        # Events broadcast from now on are queued again, before the subscription loads the events
+        # it missed, so that nothing falls in between. Some of them may also be returned by the
+        # catch up query, so the subscription skips any events at or before its cursor.
+        self._needs_catch_up = False
+        self._queue.clear()
+        self._has_events.clear()
+
+    def put(self, message: RunEventLogMessage) -> None:
+        if self._needs_catch_up:
+            return
+
+        if len(self._queue) >= self._max_queued_events:
+            self.mark_needs_catch_up()
+            return
+
+        self._queue.append(message)
+        self._has_events.set()
+
+    async def get_batch(self, max_batch_size: int) -> Sequence[RunEventLogMessage]:
+        """Waits for new events, and returns all of the events that have been queued since the
+        last batch, so that a burst of events is sent to the client as a single message.
+
+        Returns an empty batch if the subscriber needs to catch up.
+        """
+        await self._has_events.wait()
+
+        batch = []
+        while self._queue and len(batch) < max_batch_size:
+            batch.append(self._queue.popleft())
+
+        if not self._queue and not self._needs_catch_up:
+            self._has_events.clear()
+
+        return batch
+
+
+class _RunEventLogWatch:
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        run_id: str,
+        job_name: str,
+        cursor: Optional[str],
+        loop: asyncio.AbstractEventLoop,
+    ):
+        self._instance = instance
+        self._run_id = run_id
+        self._job_name = job_name
+        self._loop = loop
+        self.subscribers: Set[RunEventLogSubscriber] = set()
+        self.last_storage_id = storage_id_for_cursor(cursor)
+
+        # keep a single reference to the bound method, since the event log storages identify
+        # handlers by identity when ending the watch
+        self._handler = self._on_event_threadsafe
+        instance.watch_event_logs(run_id, cursor, self._handler)
+
+    def _on_event_threadsafe(self, event: EventLogEntry, cursor: str) -> None:
+        # called from the event log storage's watcher thread
+        self._loop.call_soon_threadsafe(self._on_event, event, cursor)
+
+    def _on_event(self, event: EventLogEntry, cursor: str) -> None:
+        from ..events import from_event_record
+
+        storage_id = storage_id_for_cursor(cursor)
+        if storage_id <= self.last_storage_id:
+            return
+
+        self.last_storage_id = storage_id
+        message = RunEventLogMessage(
+            storage_id=storage_id,
+            cursor=cursor,
+            message=from_event_record(event, self._job_name),
+        )
+        for subscriber in self.subscribers:
+            subscriber.put(message)
+
+    def close(self) -> None:
+        self._instance.end_watch_event_logs(self._run_id, self._handler)
+
+
+class RunEventLogHub:
+    """Watches the event log of each run that has at least one subscriber, and broadcasts new
+    events to all of that run's subscribers.
+
+    All methods must be called from the event loop that the subscriptions are served on.
+    """
+
+    def __init__(self):
+        self._watches: Dict[Tuple[str, asyncio.AbstractEventLoop], _RunEventLogWatch] = {}
+
+    def subscribe(
+        self,
+        instance: DagsterInstance,
+        run_id: str,
+        job_name: str,
+        cursor: Optional[str],
+        max_queued_events: int = DEFAULT_MAX_QUEUED_EVENTS,
+    ) -> RunEventLogSubscriber:
+        """Subscribes to the events of the given run that are stored after the given cursor.
+
+        If the run is already being watched past the cursor, the returned subscriber starts out
+        needing to catch up on the events in between.
+        """
+        loop = asyncio.get_running_loop()
+        key = (run_id, loop)
+        subscriber = RunEventLogSubscriber(max_queued_events)
+
+        watch = self._watches.get(key)
+        if watch is None:
+            watch = _RunEventLogWatch(instance, run_id, job_name, cursor, loop)
+            self._watches[key] = watch
+        elif watch.last_storage_id > storage_id_for_cursor(cursor):
+            subscriber.mark_needs_catch_up()
+
+        watch.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, run_id: str, subscriber: RunEventLogSubscriber) -> None:
+        key = (run_id, asyncio.get_running_loop())
+        watch = self._watches.get(key)
+        if watch is None:
+            return
+
+        watch.subscribers.discard(subscriber)
+        if not watch.subscribers:
+            watch.close()
+            del self._watches[key]
+
+    def num_watched_runs(self) -> int:
+        return len(self._watches)
+
+
+# the hub only references the instance while one of its runs has subscribers, so the hubs don't
+# keep instances alive
+_hubs: "weakref.WeakKeyDictionary[DagsterInstance, RunEventLogHub]" = weakref.WeakKeyDictionary()
+
+
+def get_run_event_log_hub(instance: DagsterInstance) -> RunEventLogHub:
+    hub = _hubs.get(instance)
+    if hub is None:
+        hub = RunEventLogHub()
+        _hubs[instance] = hub
+    return hub
@@ -32,6 +32,7 @@
 from dagster._core.definitions.partition import (
     CachingDynamicPartitionsLoader,
     DefaultPartitionsSubset,
+    OrdinalPartitionsSubset,
     PartitionsDefinition,
     PartitionsSubset,
 )
@@ -50,9 +51,10 @@
 from dagster._core.storage.partition_status_cache import (
     build_failed_and_in_progress_partition_subset,
     get_and_update_asset_status_cache_value,
+    get_empty_partitions_subset,
     get_materialized_multipartitions,
-    get_validated_partition_keys,
     is_cacheable_partition_type,
+    with_validated_partition_keys,
 )
 
 from dagster_graphql.implementation.loader import (
@@ -354,17 +356,23 @@ def get_partition_subsets(
             instance, asset_key, partitions_def, dynamic_partitions_loader
         )
         materialized_subset = (
-            updated_cache_value.deserialize_materialized_partition_subsets(partitions_def)
+            updated_cache_value.deserialize_materialized_partition_subsets(
+                partitions_def, dynamic_partitions_loader
+            )
             if updated_cache_value
             else partitions_def.empty_subset()
         )
         failed_subset = (
-            updated_cache_value.deserialize_failed_partition_subsets(partitions_def)
+            updated_cache_value.deserialize_failed_partition_subsets(
+                partitions_def, dynamic_partitions_loader
+            )
             if updated_cache_value
             else partitions_def.empty_subset()
         )
         in_progress_subset = (
-            updated_cache_value.deserialize_in_progress_partition_subsets(partitions_def)
+            updated_cache_value.deserialize_in_progress_partition_subsets(
+                partitions_def, dynamic_partitions_loader
+            )
             if updated_cache_value
             else partitions_def.empty_subset()
         )
@@ -386,18 +394,17 @@ def get_partition_subsets(
                 if count > 0
             ]
 
-        validated_keys = get_validated_partition_keys(
-            dynamic_partitions_loader, partitions_def, set(materialized_keys)
-        )
-
-        materialized_subset = (
-            partitions_def.empty_subset().with_partition_keys(validated_keys)
-            if validated_keys
-            else partitions_def.empty_subset()
+        empty_subset = get_empty_partitions_subset(partitions_def, dynamic_partitions_loader)
+        materialized_subset = with_validated_partition_keys(
+            empty_subset, dynamic_partitions_loader, partitions_def, set(materialized_keys)
         )
 
         failed_subset, in_progress_subset, _ = build_failed_and_in_progress_partition_subset(
-            instance, asset_key, partitions_def, dynamic_partitions_loader
+            instance,
+            asset_key,
+            partitions_def,
+            dynamic_partitions_loader,
+            empty_subset=empty_subset,
         )
 
         return materialized_subset, failed_subset, in_progress_subset
@@ -474,6 +481,20 @@ def build_partition_statuses(
             failed_partitions_subset,
             in_progress_partitions_subset,
         )
+    elif isinstance(materialized_partitions_subset, OrdinalPartitionsSubset):
+        failed_partitions_subset = cast(OrdinalPartitionsSubset, failed_partitions_subset)
+        in_progress_partitions_subset = cast(OrdinalPartitionsSubset, in_progress_partitions_subset)
+
+        return GrapheneDefaultPartitions(
+            materializedPartitions=(
+                materialized_partitions_subset
+                - failed_partitions_subset
+                - in_progress_partitions_subset
+            ).get_partition_keys(),
+            failedPartitions=failed_partitions_subset.get_partition_keys(),
+            unmaterializedPartitions=materialized_partitions_subset.get_partition_keys_not_in_subset(),
+            materializingPartitions=in_progress_partitions_subset.get_partition_keys(),
+        )
     elif isinstance(materialized_partitions_subset, DefaultPartitionsSubset):
         materialized_keys = materialized_partitions_subset.get_partition_keys()
         failed_keys = failed_partitions_subset.get_partition_keys()
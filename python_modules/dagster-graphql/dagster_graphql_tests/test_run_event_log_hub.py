@@ -0,0 +1,84 @@
+import asyncio
+from unittest import mock
+
+from dagster import DagsterInstance
+from dagster_graphql.implementation.execution.run_event_log_hub import RunEventLogHub
+
+RUN_ID = "foo"
+
+
+def _report_events(instance: DagsterInstance, n_events: int) -> None:
+    for i in range(n_events):
+        instance.report_engine_event(f"event {i}", job_name="my_job", run_id=RUN_ID)
+
+
+def test_run_event_log_hub_watches_each_run_once():
+    async def _test():
+        instance = DagsterInstance.ephemeral()
+        hub = RunEventLogHub()
+
+        with mock.patch.object(
+            instance, "watch_event_logs", wraps=instance.watch_event_logs
+        ) as watch_event_logs:
+            subscriber_1 = hub.subscribe(instance, RUN_ID, "my_job", None)
+            subscriber_2 = hub.subscribe(instance, RUN_ID, "my_job", None)
+            assert watch_event_logs.call_count == 1
+            assert hub.num_watched_runs() == 1
+
+        _report_events(instance, 3)
+        # the watch hands events over to the event loop
+        await asyncio.sleep(0)
+
+        # both subscribers get the same converted events, coalesced into a single batch
+        batch_1 = await subscriber_1.get_batch(max_batch_size=10)
+        batch_2 = await subscriber_2.get_batch(max_batch_size=10)
+        assert [event.message.message for event in batch_1] == ["event 0", "event 1", "event 2"]
+        assert [event.message for event in batch_1] == [event.message for event in batch_2]
+        assert batch_1[0].message is batch_2[0].message
+
+        hub.unsubscribe(RUN_ID, subscriber_1)
+        assert hub.num_watched_runs() == 1
+        hub.unsubscribe(RUN_ID, subscriber_2)
+        assert hub.num_watched_runs() == 0
+
+        # no more events are delivered once every subscriber has left
+        _report_events(instance, 1)
+        await asyncio.sleep(0)
+        assert not subscriber_1.needs_catch_up
+
+    asyncio.run(_test())
+
+
+def test_run_event_log_hub_backpressure():
+    async def _test():
+        instance = DagsterInstance.ephemeral()
+        hub = RunEventLogHub()
+
+        slow_subscriber = hub.subscribe(instance, RUN_ID, "my_job", None, max_queued_events=2)
+        subscriber = hub.subscribe(instance, RUN_ID, "my_job", None)
+
+        _report_events(instance, 3)
+        await asyncio.sleep(0)
+
+        # the slow subscriber's queue overflowed, so it has to catch up from storage, without
+        # affecting the other subscriber
+        assert slow_subscriber.needs_catch_up
+        assert await slow_subscriber.get_batch(max_batch_size=10) == []
+        assert not subscriber.needs_catch_up
+        assert len(await subscriber.get_batch(max_batch_size=10)) == 3
+
+        slow_subscriber.start_catch_up()
+        _report_events(instance, 1)
+        await asyncio.sleep(0)
+        assert [event.message.message for event in await slow_subscriber.get_batch(10)] == [
+            "event 0"
+        ]
+
+        # a subscriber joining after events were broadcast past its cursor needs to catch up
+        late_subscriber = hub.subscribe(instance, RUN_ID, "my_job", None)
+        assert late_subscriber.needs_catch_up
+
+        for s in [slow_subscriber, subscriber, late_subscriber]:
+            hub.unsubscribe(RUN_ID, s)
+
+    asyncio.run(_test())
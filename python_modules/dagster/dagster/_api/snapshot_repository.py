@@ -1,17 +1,34 @@
-from typing import TYPE_CHECKING, Mapping
+import threading
+from typing import TYPE_CHECKING, Mapping, NamedTuple, Tuple
+
+import grpc
 
 import dagster._check as check
-from dagster._core.errors import DagsterUserCodeProcessError
+from dagster._core.errors import DagsterUserCodeProcessError, DagsterUserCodeUnreachableError
 from dagster._core.host_representation.external_data import (
     ExternalRepositoryData,
+    ExternalRepositoryDelta,
     ExternalRepositoryErrorData,
+    external_repository_data_from_delta,
 )
+from dagster._grpc.types import ExternalRepositoryDeltaArgs
 from dagster._serdes import deserialize_value
+from dagster._utils.lru_cache import LRUCache
 
 if TYPE_CHECKING:
-    from dagster._core.host_representation import CodeLocation
+    from dagster._core.host_representation import CodeLocation, ExternalRepositoryOrigin
     from dagster._grpc.client import DagsterGrpcClient
 
+# The pieces of the most recently loaded version of each repository, keyed by (code location name,
+# repository name) and then by piece id, so that reloading a code location only transfers the
+# pieces of its repositories that changed. Only the most recently loaded repositories are kept, so
+# that the cache does not grow with every code location a long-lived process has ever loaded.
+REPOSITORY_PIECE_CACHE_MAX_SIZE = 32
+_repository_piece_cache: LRUCache[Tuple[str, str], Mapping[str, NamedTuple]] = LRUCache(
+    max_size=REPOSITORY_PIECE_CACHE_MAX_SIZE
+)
+_repository_piece_cache_lock = threading.Lock()
+
 
 def sync_get_streaming_external_repositories_data_grpc(
     api_client: "DagsterGrpcClient", code_location: "CodeLocation"
@@ -21,28 +38,89 @@ def sync_get_streaming_external_repositories_data_grpc(
     check.inst_param(code_location, "code_location", CodeLocation)
 
     repo_datas = {}
+    supports_delta = True
     for repository_name in code_location.repository_names:  # type: ignore
-        external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    code_location.origin,
-                    repository_name,
-                )
-            )
-        )
+        repository_origin = ExternalRepositoryOrigin(code_location.origin, repository_name)
 
-        result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            (ExternalRepositoryData, ExternalRepositoryErrorData),
-        )
+        result = None
+        if supports_delta:
+            try:
+                result = _get_external_repository_data_from_delta(api_client, repository_origin)
+            except DagsterUserCodeUnreachableError as e:
+                # Back-compat for older gRPC servers that do not implement
+                # StreamingExternalRepositoryDelta
+                if not _is_unimplemented_error(e):
+                    raise
+                supports_delta = False
 
-        if isinstance(result, ExternalRepositoryErrorData):
-            raise DagsterUserCodeProcessError.from_error_info(result.error)
+        if result is None:
+            result = _get_full_external_repository_data(api_client, repository_origin)
 
         repo_datas[repository_name] = result
     return repo_datas
+
+
+def _get_external_repository_data_from_delta(
+    api_client: "DagsterGrpcClient", repository_origin: "ExternalRepositoryOrigin"
+) -> ExternalRepositoryData:
+    cache_key = (
+        repository_origin.code_location_origin.location_name,
+        repository_origin.repository_name,
+    )
+    with _repository_piece_cache_lock:
+        cached_pieces = _repository_piece_cache.get(cache_key, {})
+
+    result = deserialize_value(
+        api_client.streaming_external_repository_delta(
+            ExternalRepositoryDeltaArgs(
+                repository_origin=repository_origin,
+                known_piece_ids=set(cached_pieces.keys()),
+            )
+        ),
+        (ExternalRepositoryDelta, ExternalRepositoryErrorData),
+    )
+
+    if isinstance(result, ExternalRepositoryErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+    external_repository_data = external_repository_data_from_delta(result, cached_pieces)
+
+    # drop the pieces that are no longer part of the repository
+    current_piece_ids = result.manifest.all_piece_ids
+    pieces = {
+        piece_id: piece
+        for piece_id, piece in {**cached_pieces, **result.pieces}.items()
+        if piece_id in current_piece_ids
+    }
+    with _repository_piece_cache_lock:
+        _repository_piece_cache[cache_key] = pieces
+
+    return external_repository_data
+
+
+def _get_full_external_repository_data(
+    api_client: "DagsterGrpcClient", repository_origin: "ExternalRepositoryOrigin"
+) -> ExternalRepositoryData:
+    external_repository_chunks = list(
+        api_client.streaming_external_repository(external_repository_origin=repository_origin)
+    )
+
+    result = deserialize_value(
+        "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        ),
+        (ExternalRepositoryData, ExternalRepositoryErrorData),
+    )
+
+    if isinstance(result, ExternalRepositoryErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+    return result
+
+
+def _is_unimplemented_error(error: DagsterUserCodeUnreachableError) -> bool:
+    cause = error.__cause__
+    return (
+        isinstance(cause, grpc.RpcError)
+        and cause.code() == grpc.StatusCode.UNIMPLEMENTED  # type: ignore  # (bad stubs)
+    )
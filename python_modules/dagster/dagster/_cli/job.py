@@ -35,7 +35,7 @@
 from dagster._core.execution.api import create_execution_plan, execute_job
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.execution.execution_result import ExecutionResult
-from dagster._core.execution.job_backfill import create_backfill_run
+from dagster._core.execution.job_backfill import create_backfill_runs
 from dagster._core.host_representation import (
     CodeLocation,
     ExternalJob,
@@ -750,17 +750,16 @@ def _execute_backfill_command_at_location(
 
         assert isinstance(partition_execution_data, ExternalPartitionSetExecutionParamData)
 
-        for partition_data in partition_execution_data.partition_data:
-            dagster_run = create_backfill_run(
-                instance,
-                code_location,
-                external_job,
-                job_partition_set,
-                backfill_job,
-                partition_data,
-            )
-            if dagster_run:
-                instance.submit_run(dagster_run.run_id, workspace)
+        for dagster_run in create_backfill_runs(
+            instance,
+            code_location,
+            external_job,
+            job_partition_set,
+            backfill_job,
+            partition_execution_data.partition_data,
+            execution_plan_snapshot_cache={},
+        ):
+            instance.submit_run(dagster_run.run_id, workspace)
 
         instance.add_backfill(backfill_job.with_status(BulkActionStatus.COMPLETED))
 
@@ -78,6 +78,9 @@ def __init__(
 
         # memoized snap representation
         self._snap: Optional["ConfigTypeSnap"] = None
+        # memoized snap representation of this type and all of the types it contains, which is
+        # needed every time a config value is validated against this type
+        self._schema_snapshot: Optional["ConfigSchemaSnapshot"] = None
 
     @property
     def description(self) -> Optional[str]:
@@ -111,7 +114,12 @@ def type_iterator(self) -> Iterator["ConfigType"]:
     def get_schema_snapshot(self) -> "ConfigSchemaSnapshot":
         from .snap import ConfigSchemaSnapshot
 
-        return ConfigSchemaSnapshot({ct.key: ct.get_snapshot() for ct in self.type_iterator()})
+        if self._schema_snapshot is None:
+            self._schema_snapshot = ConfigSchemaSnapshot(
+                {ct.key: ct.get_snapshot() for ct in self.type_iterator()}
+            )
+
+        return self._schema_snapshot
 
 
 @whitelist_for_serdes
@@ -1,5 +1,6 @@
 import sys
 from typing import Any, Dict, List, Mapping, Optional, cast
+from weakref import WeakKeyDictionary
 
 import dagster._check as check
 from dagster._utils import ensure_single_item
@@ -8,9 +9,21 @@
 from .config_type import ConfigType, ConfigTypeKind
 from .errors import EvaluationError, PostProcessingError, create_failed_post_processing_error
 from .evaluate_value_result import EvaluateValueResult
+from .field import Field
 from .stack import EvaluationStack
 from .traversal_context import TraversalContext, TraversalType
 
+# Without post-processing, resolving the defaults of a type for a missing value, or of a field for
+# its default value, only depends on the type or field. Since types and fields are immutable, the
+# successfully resolved values are cached. This matters for nested schemas, where each enclosing
+# Field resolves the defaults of everything it contains.
+_resolved_defaults_by_config_type: "WeakKeyDictionary[ConfigType, EvaluateValueResult[Any]]" = (
+    WeakKeyDictionary()
+)
+_resolved_defaults_by_field: "WeakKeyDictionary[Field, EvaluateValueResult[Any]]" = (
+    WeakKeyDictionary()
+)
+
 
 def post_process_config(config_type: ConfigType, config_value: Any) -> EvaluateValueResult[Any]:
     ctx = TraversalContext.from_config_type(
@@ -28,7 +41,43 @@ def resolve_defaults(config_type: ConfigType, config_value: Any) -> EvaluateValu
         traversal_type=TraversalType.RESOLVE_DEFAULTS,
     )
 
-    return _recursively_process_config(ctx, config_value)
+    if config_value is not None:
+        return _recursively_process_config(ctx, config_value)
+
+    evr = _resolved_defaults_by_config_type.get(config_type)
+    if evr is None:
+        evr = _recursively_process_config(ctx, None)
+        if not evr.success:
+            return evr
+        _resolved_defaults_by_config_type[config_type] = evr
+    return EvaluateValueResult.for_value(_copy_config_value(evr.value))
+
+
+def _resolve_field_default(
+    context: TraversalContext, field_def: Field, field_name: str
+) -> EvaluateValueResult[Any]:
+    field_context = context.for_field(field_def, field_name)
+    if context.do_post_process:
+        return _recursively_process_config(field_context, field_def.default_value)
+
+    evr = _resolved_defaults_by_field.get(field_def)
+    if evr is None:
+        evr = _recursively_process_config(field_context, field_def.default_value)
+        if not evr.success:
+            return evr
+        _resolved_defaults_by_field[field_def] = evr
+    return EvaluateValueResult.for_value(_copy_config_value(evr.value))
+
+
+def _copy_config_value(config_value: Any) -> Any:
+    # callers are free to modify the values they are given, so cached values are never handed out
+    # directly. Resolved values are made up of dicts, lists and scalars.
+    if isinstance(config_value, dict):
+        return {key: _copy_config_value(value) for key, value in config_value.items()}
+    elif isinstance(config_value, list):
+        return [_copy_config_value(value) for value in config_value]
+    else:
+        return config_value
 
 
 def _recursively_process_config(
@@ -159,8 +208,8 @@ def _recurse_in_to_shape(
             )
 
         elif field_def.default_provided:
-            processed_fields[expected_field] = _recursively_process_config(
-                context.for_field(field_def, expected_field), field_def.default_value
+            processed_fields[expected_field] = _resolve_field_default(
+                context, field_def, expected_field
             )
 
         elif field_def.is_required:
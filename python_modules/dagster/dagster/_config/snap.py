@@ -1,7 +1,8 @@
-from typing import Any, List, Mapping, NamedTuple, Optional, Sequence, Set, cast
+from typing import AbstractSet, Any, List, Mapping, NamedTuple, Optional, Sequence, Set, cast
 
 import dagster._check as check
 from dagster._serdes import whitelist_for_serdes
+from dagster._utils.cached_method import cached_method
 
 from .config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
 from .field import Field
@@ -148,15 +149,30 @@ def non_scalar_type_key(self) -> str:
         type_param_keys = check.is_list(self.type_param_keys, of_type=str)
         return type_param_keys[1]
 
-    def _get_field(self, name: str) -> Optional["ConfigFieldSnap"]:
-        check.str_param(name, "name")
+    # Snapshots are immutable, so the lookups used while validating config values against the
+    # snapshot are computed once per snapshot rather than on every validation.
+
+    @cached_method
+    def get_field_snaps_by_name(self) -> Mapping[str, "ConfigFieldSnap"]:
         check.invariant(ConfigTypeKind.has_fields(self.kind))
         fields = check.is_list(self.fields, of_type=ConfigFieldSnap)
-        for f in fields:
-            if f.name == name:
-                return f
+        return {cast(str, f.name): f for f in fields}
+
+    @cached_method
+    def get_defined_field_names(self) -> AbstractSet[str]:
+        """The names of the fields of the type, including any aliases."""
+        return {
+            *self.get_field_snaps_by_name().keys(),
+            *(self.field_aliases.values() if self.field_aliases else []),
+        }
 
-        return None
+    @cached_method
+    def get_required_field_names(self) -> Sequence[str]:
+        return [name for name, f in self.get_field_snaps_by_name().items() if f.is_required]
+
+    def _get_field(self, name: str) -> Optional["ConfigFieldSnap"]:
+        check.str_param(name, "name")
+        return self.get_field_snaps_by_name().get(name)
 
     def get_field(self, name: str) -> "ConfigFieldSnap":
         field = self._get_field(name)
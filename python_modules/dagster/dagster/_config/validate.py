@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, TypeVar, cast
+from typing import AbstractSet, Any, Dict, List, Mapping, Optional, Sequence, Set, TypeVar, cast
 
 import dagster._check as check
 from dagster._utils import ensure_single_item
@@ -26,7 +26,7 @@
 from .evaluate_value_result import EvaluateValueResult
 from .field import resolve_to_config_type
 from .post_process import post_process_config
-from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap
+from .snap import ConfigSchemaSnapshot, ConfigTypeSnap
 from .stack import EvaluationStack
 from .traversal_context import ValidationContext
 
@@ -234,10 +234,6 @@ def _validate_shape_config(
         return EvaluateValueResult.for_error(create_dict_type_mismatch_error(context, config_value))
     config_value = cast(Dict[str, object], config_value)
 
-    field_snaps = check.not_none(context.config_type_snap.fields)
-    defined_field_names = {cast(str, fs.name) for fs in field_snaps}
-    defined_field_names = defined_field_names.union(set(field_aliases.values()))
-
     incoming_field_names = set(config_value.keys())
 
     errors: List[EvaluationError] = []
@@ -247,14 +243,14 @@ def _validate_shape_config(
             errors,
             _check_for_extra_incoming_fields(
                 context,
-                defined_field_names,
+                context.config_type_snap.get_defined_field_names(),
                 incoming_field_names,
             ),
         )
 
     _append_if_error(
         errors,
-        _compute_missing_fields_error(context, field_snaps, incoming_field_names, field_aliases),
+        _compute_missing_fields_error(context, incoming_field_names, field_aliases),
     )
 
     # dict is well-formed. now recursively validate all incoming fields
@@ -344,7 +340,9 @@ def _append_if_error(errors: List[EvaluationError], maybe_error: Optional[Evalua
 
 
 def _check_for_extra_incoming_fields(
-    context: ValidationContext, defined_field_names: Set[str], incoming_field_names: Set[str]
+    context: ValidationContext,
+    defined_field_names: AbstractSet[str],
+    incoming_field_names: Set[str],
 ) -> Optional[EvaluationError]:
     extra_fields = list(incoming_field_names - defined_field_names)
 
@@ -358,17 +356,16 @@ def _check_for_extra_incoming_fields(
 
 def _compute_missing_fields_error(
     context: ValidationContext,
-    field_snaps: Sequence[ConfigFieldSnap],
     incoming_fields: Set[str],
     field_aliases: Mapping[str, str],
 ) -> Optional[EvaluationError]:
     missing_fields: List[str] = []
 
-    for field_snap in field_snaps:
-        field_alias = field_aliases.get(cast(str, field_snap.name))
-        if field_snap.is_required and field_snap.name not in incoming_fields:
+    for field_name in context.config_type_snap.get_required_field_names():
+        field_alias = field_aliases.get(field_name)
+        if field_name not in incoming_fields:
             if field_alias is None or field_alias not in incoming_fields:
-                missing_fields.append(cast(str, field_snap.name))
+                missing_fields.append(field_name)
 
     if missing_fields:
         if len(missing_fields) == 1:
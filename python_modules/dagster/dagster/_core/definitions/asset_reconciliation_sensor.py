@@ -47,6 +47,10 @@
     from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer  # expensive import
 
+# If more than this many materializations or observations have occurred since the previous tick,
+# reconciliation checks every asset for updates rather than only the ones with new events.
+MAX_INCREMENTAL_RECONCILIATION_EVENTS = 10000
+
 
 def get_implicit_auto_materialize_policy(
     asset_graph: AssetGraph, asset_key: AssetKey
@@ -343,9 +347,10 @@ def find_parent_materialized_asset_partitions(
     target_asset_keys_and_parents: AbstractSet[AssetKey],
     asset_graph: AssetGraph,
     can_reconcile_fn: Callable[[AssetKeyPartitionKey], bool] = lambda _: True,
+    before_cursor: Optional[int] = None,
 ) -> Tuple[AbstractSet[AssetKeyPartitionKey], Optional[int]]:
     """Finds asset partitions in the given selection whose parents have been materialized since
-    latest_storage_id.
+    latest_storage_id, and before before_cursor if it is provided.
 
     Returns:
         - A set of asset partitions.
@@ -370,7 +375,7 @@ def find_parent_materialized_asset_partitions(
 
         partitions_def = asset_graph.get_partitions_def(asset_key)
         latest_record = instance_queryer.get_latest_materialization_record(
-            asset_key, after_cursor=latest_storage_id
+            asset_key, after_cursor=latest_storage_id, before_cursor=before_cursor
         )
         if latest_record is None:
             continue
@@ -398,6 +403,17 @@ def find_parent_materialized_asset_partitions(
             partitions_subset = partitions_def.empty_subset().with_partition_keys(
                 materialized_partitions
             )
+            if any(
+                child in target_asset_keys
+                and asset_graph.get_partitions_def(child) == partitions_def
+                for child in asset_graph.get_children(asset_key)
+            ):
+                # the latest record of each materialized partition may be needed to determine if
+                # the corresponding child partitions were planned for the same run
+                instance_queryer.prefetch_latest_materialization_records(
+                    AssetKeyPartitionKey(asset_key, partition_key)
+                    for partition_key in materialized_partitions
+                )
             for child in asset_graph.get_children(asset_key):
                 child_partitions_def = asset_graph.get_partitions_def(child)
                 if child not in target_asset_keys:
@@ -482,7 +498,7 @@ def find_never_materialized_or_requested_root_asset_partitions(
                 time_window_partition_scope=auto_materialize_policy.time_window_partition_scope,
             ):
                 asset_partition = AssetKeyPartitionKey(asset_key, partition_key)
-                if instance_queryer.get_latest_materialization_record(asset_partition, None):
+                if instance_queryer.materialization_exists(asset_partition):
                     newly_materialized_root_partitions_by_asset_key[asset_key].add(partition_key)
                 else:
                     never_materialized_or_requested.add(asset_partition)
@@ -508,12 +524,24 @@ def determine_asset_partitions_to_reconcile(
     target_asset_keys_and_parents: AbstractSet[AssetKey],
     asset_graph: AssetGraph,
     current_time: datetime.datetime,
+    updated_asset_keys: Optional[AbstractSet[AssetKey]] = None,
+    before_cursor: Optional[int] = None,
 ) -> Tuple[
     AbstractSet[AssetKeyPartitionKey],
     AbstractSet[AssetKey],
     Mapping[AssetKey, AbstractSet[str]],
     Optional[int],
 ]:
+    """Determines which asset partitions should be materialized in order to reconcile the target
+    assets.
+
+    If updated_asset_keys is provided, only those assets are checked for materializations or
+    observations since the cursor, so the cost of finding stale candidates scales with the number
+    of assets that have been updated rather than with the size of the asset graph.
+
+    If before_cursor is provided, materializations with a storage id at or after it are not
+    considered, and the returned storage id is before it.
+    """
     (
         never_materialized_or_requested_roots,
         newly_materialized_root_asset_keys,
@@ -562,9 +590,12 @@ def can_reconcile_candidate(candidate: AssetKeyPartitionKey) -> bool:
         instance_queryer=instance_queryer,
         latest_storage_id=cursor.latest_storage_id,
         target_asset_keys=target_asset_keys,
-        target_asset_keys_and_parents=target_asset_keys_and_parents,
+        target_asset_keys_and_parents=target_asset_keys_and_parents
+        if updated_asset_keys is None
+        else target_asset_keys_and_parents & updated_asset_keys,
         asset_graph=asset_graph,
         can_reconcile_fn=can_reconcile_candidate,
+        before_cursor=before_cursor,
     )
 
     backfill_target_asset_graph_subset = get_active_backfill_target_asset_graph_subset(
@@ -840,12 +871,15 @@ def reconcile(
     instance: "DagsterInstance",
     cursor: AssetReconciliationCursor,
     run_tags: Optional[Mapping[str, str]],
+    instance_queryer: Optional["CachingInstanceQueryer"] = None,
 ):
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer  # expensive import
 
     current_time = pendulum.now("UTC")
 
-    instance_queryer = CachingInstanceQueryer(instance=instance)
+    # long-lived callers may pass in a queryer that has already been refreshed for this tick
+    if instance_queryer is None:
+        instance_queryer = CachingInstanceQueryer(instance=instance)
 
     target_parent_asset_keys = {
         parent
@@ -854,11 +888,44 @@ def reconcile(
     }
     target_asset_keys_and_parents = target_asset_keys | target_parent_asset_keys
 
+    # new events are only considered up to the latest storage id at the start of the tick, so that
+    # the cursor cannot advance past an event for an asset that was stored while this tick was
+    # already examining the assets that had been updated
+    latest_asset_event_storage_id = instance_queryer.get_latest_asset_event_storage_id()
+    before_cursor = (
+        latest_asset_event_storage_id + 1 if latest_asset_event_storage_id is not None else None
+    )
+
+    # if only a limited number of events have happened since the previous tick, only the assets
+    # that were updated (and their children) need to be examined for new data
+    updated_asset_keys = (
+        instance_queryer.get_asset_keys_updated_after_cursor(
+            cursor.latest_storage_id,
+            limit=MAX_INCREMENTAL_RECONCILIATION_EVENTS,
+            before_cursor=before_cursor,
+        )
+        if cursor.latest_storage_id is not None
+        else None
+    )
+    if updated_asset_keys is None:
+        asset_keys_to_prefetch_partition_counts = target_asset_keys_and_parents
+    else:
+        updated_target_asset_keys_and_parents = target_asset_keys_and_parents & updated_asset_keys
+        asset_keys_to_prefetch_partition_counts = (
+            updated_target_asset_keys_and_parents
+            | {
+                child
+                for asset_key in updated_target_asset_keys_and_parents
+                for child in asset_graph.get_children(asset_key)
+                if child in target_asset_keys
+            }
+            | (target_asset_keys & asset_graph.root_asset_keys)
+        )
+
     # fetch some data in advance to batch some queries
-    target_asset_keys_and_parents_list = list(target_asset_keys_and_parents)
-    instance_queryer.prefetch_asset_records(target_asset_keys_and_parents_list)
+    instance_queryer.prefetch_asset_records(list(target_asset_keys_and_parents))
     instance_queryer.prefetch_asset_partition_counts(
-        target_asset_keys_and_parents_list, after_cursor=cursor.latest_storage_id
+        list(asset_keys_to_prefetch_partition_counts), after_cursor=cursor.latest_storage_id
     )
 
     asset_partitions_to_reconcile_for_freshness = (
@@ -885,6 +952,8 @@ def reconcile(
         target_asset_keys=target_asset_keys,
         target_asset_keys_and_parents=target_asset_keys_and_parents,
         current_time=current_time,
+        updated_asset_keys=updated_asset_keys,
+        before_cursor=before_cursor,
     )
 
     run_requests = build_run_requests(
@@ -332,12 +332,25 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = list(start_selector.items())[0]
 
+    reuse_processes_cfg = check.opt_nullable_dict_elem(config, "reuse_processes")
+
     return MultiprocessExecutor(
         max_concurrent=check.int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        reuse_processes=reuse_processes_cfg is not None,
+        max_steps_per_process=(
+            check.opt_int_elem(reuse_processes_cfg, "max_steps_per_process")
+            if reuse_processes_cfg is not None
+            else None
+        ),
+        max_process_memory_mb=(
+            check.opt_int_elem(reuse_processes_cfg, "max_memory_mb")
+            if reuse_processes_cfg is not None
+            else None
+        ),
     )
 
 
@@ -390,6 +403,33 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "reuse_processes": Field(
+            {
+                "max_steps_per_process": Field(
+                    Int,
+                    default_value=100,
+                    description=(
+                        "The number of steps a worker process executes before it is replaced"
+                        " with a new one."
+                    ),
+                ),
+                "max_memory_mb": Field(
+                    Int,
+                    is_required=False,
+                    description=(
+                        "Replace a worker process once its peak memory usage exceeds this many"
+                        " megabytes. Not supported on Windows."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes instead of starting a new"
+                " process for each step. Each worker loads the job and opens the instance once,"
+                " which avoids paying the process startup cost for every step. Resources are"
+                " still initialized for each step."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -419,6 +459,17 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    Setting ``reuse_processes`` executes steps in a pool of long-lived worker processes rather than
+    a new process per step, which can be much faster for jobs with many small steps:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              reuse_processes:
+                max_steps_per_process: 100
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -1,6 +1,8 @@
 import copy
 import hashlib
+import itertools
 import json
+import re
 from abc import ABC, abstractmethod
 from datetime import (
     datetime,
@@ -11,6 +13,7 @@
 from typing import (
     Any,
     Callable,
+    Dict,
     Generic,
     Iterable,
     List,
@@ -19,6 +22,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -1183,6 +1187,16 @@ def from_serialized(
         if isinstance(data, list):
             # backwards compatibility
             return cls(subset=set(data), partitions_def=partitions_def)
+        elif data.get("ordinal_ranges") is not None:
+            # subsets stored by the asset status cache
+            return cls(
+                subset=set(
+                    OrdinalPartitionsSubset.from_serialized(
+                        partitions_def, serialized
+                    ).get_partition_keys()
+                ),
+                partitions_def=partitions_def,
+            )
         else:
             if data.get("version") != cls.SERIALIZATION_VERSION:
                 raise DagsterInvalidDeserializationVersionError(
@@ -1232,3 +1246,287 @@ def __repr__(self) -> str:
     @classmethod
     def empty_subset(cls, partitions_def: PartitionsDefinition[T_str]) -> "PartitionsSubset[T_str]":
         return cls(partitions_def=partitions_def)
+
+
+# Translation tables between the binary digits of a bitmap and per-partition flag bytes
+_DIGITS_TO_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+_FLAGS_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _flags_from_bitmap(bitmap: int) -> bytes:
+    # one byte per ordinal, lowest ordinal first
+    return bin(bitmap)[:1:-1].encode("ascii").translate(_DIGITS_TO_FLAGS)
+
+
+def _bitmap_from_flags(flags: bytearray) -> int:
+    return int(flags.translate(_FLAGS_TO_DIGITS)[::-1], 2) if flags else 0
+
+
+class _PartitionKeyOrdinals:
+    """An ordered snapshot of the partition keys of a partitions definition. Shared between all the
+    OrdinalPartitionsSubsets derived from one another, so that the key-to-ordinal mapping is only
+    built once.
+    """
+
+    def __init__(self, partition_keys: Sequence[str]):
+        self.partition_keys = partition_keys
+        self._ordinals_by_key: Optional[Mapping[str, int]] = None
+        self._all_bitmap: Optional[int] = None
+        self._partitions_def_id: Optional[str] = None
+
+    @property
+    def ordinals_by_key(self) -> Mapping[str, int]:
+        if self._ordinals_by_key is None:
+            ordinals_by_key: Dict[str, int] = {}
+            for ordinal, partition_key in enumerate(self.partition_keys):
+                # a duplicated key is represented by its first ordinal
+                ordinals_by_key.setdefault(partition_key, ordinal)
+            self._ordinals_by_key = ordinals_by_key
+        return self._ordinals_by_key
+
+    @property
+    def all_bitmap(self) -> int:
+        if self._all_bitmap is None:
+            if len(self.ordinals_by_key) == len(self.partition_keys):
+                self._all_bitmap = (1 << len(self.partition_keys)) - 1
+            else:
+                self._all_bitmap = self.bitmap_for_ordinals(self.ordinals_by_key.values())
+        return self._all_bitmap
+
+    @property
+    def partitions_def_id(self) -> str:
+        # matches PartitionsDefinition.get_serializable_unique_identifier
+        if self._partitions_def_id is None:
+            self._partitions_def_id = hashlib.sha1(
+                json.dumps(list(self.partition_keys)).encode("utf-8")
+            ).hexdigest()
+        return self._partitions_def_id
+
+    def bitmap_for_ordinals(self, ordinals: Iterable[int]) -> int:
+        flags = bytearray(len(self.partition_keys))
+        for ordinal in ordinals:
+            flags[ordinal] = 1
+        return _bitmap_from_flags(flags)
+
+    def bitmap_for_ranges(self, ordinal_ranges: Iterable[Sequence[int]]) -> int:
+        flags = bytearray(len(self.partition_keys))
+        for start, end in ordinal_ranges:
+            flags[start:end] = b"\x01" * (end - start)
+        return _bitmap_from_flags(flags)
+
+
+class OrdinalPartitionsSubset(PartitionsSubset[T_str]):
+    """A subset of the partitions of a StaticPartitionsDefinition or DynamicPartitionsDefinition,
+    stored as a bitmap over the ordinals of a snapshot of its partition keys.
+
+    Unions, intersections and differences between subsets built from the same snapshot are bitwise
+    operations, and the subset serializes to the ordinal ranges it covers. Because ordinals are only
+    meaningful for the partition keys they were taken from, the serialized form records the unique
+    id of the partitions definition and can only be deserialized while its keys are unchanged.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 1
+
+    def __init__(
+        self,
+        partitions_def: PartitionsDefinition[T_str],
+        ordinals: _PartitionKeyOrdinals,
+        bitmap: int = 0,
+    ):
+        self._partitions_def = partitions_def
+        self._ordinals = ordinals
+        self._bitmap = bitmap
+
+    @classmethod
+    def empty_subset(
+        cls,
+        partitions_def: PartitionsDefinition[T_str],
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "OrdinalPartitionsSubset[T_str]":
+        check.inst_param(
+            partitions_def,
+            "partitions_def",
+            (StaticPartitionsDefinition, DynamicPartitionsDefinition),
+        )
+        return cls(
+            partitions_def,
+            _PartitionKeyOrdinals(
+                partitions_def.get_partition_keys(dynamic_partitions_store=dynamic_partitions_store)
+            ),
+        )
+
+    def _with_bitmap(self, bitmap: int) -> "OrdinalPartitionsSubset[T_str]":
+        return OrdinalPartitionsSubset(self._partitions_def, self._ordinals, bitmap)
+
+    def _iter_partition_keys(self, bitmap: int) -> Iterable[str]:
+        return itertools.compress(self._ordinals.partition_keys, _flags_from_bitmap(bitmap))
+
+    def get_partition_keys_not_in_subset(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        return set(self._iter_partition_keys(self._ordinals.all_bitmap & ~self._bitmap))
+
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[str]:
+        return set(self._iter_partition_keys(self._bitmap))
+
+    def get_ordinal_ranges(self) -> Sequence[Tuple[int, int]]:
+        """The [start, end) ranges of ordinals in the subset, in increasing order."""
+        return [match.span() for match in re.finditer(rb"\x01+", _flags_from_bitmap(self._bitmap))]
+
+    def get_partition_key_ranges(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = self._ordinals.partition_keys
+        return [
+            PartitionKeyRange(partition_keys[start], partition_keys[end - 1])
+            for start, end in self.get_ordinal_ranges()
+        ]
+
+    def with_partition_keys(
+        self, partition_keys: Iterable[str]
+    ) -> "OrdinalPartitionsSubset[T_str]":
+        ordinals_by_key = self._ordinals.ordinals_by_key
+        ordinals = []
+        for partition_key in partition_keys:
+            ordinal = ordinals_by_key.get(partition_key)
+            if ordinal is None:
+                raise DagsterUnknownPartitionError(
+                    f"Could not find a partition with key `{partition_key}`."
+                )
+            ordinals.append(ordinal)
+
+        return self._with_bitmap(self._bitmap | self._ordinals.bitmap_for_ordinals(ordinals))
+
+    def filter_valid_partition_keys(self, partition_keys: Iterable[str]) -> Set[str]:
+        """Returns the given partition keys that can be added to this subset."""
+        ordinals_by_key = self._ordinals.ordinals_by_key
+        return {
+            partition_key for partition_key in partition_keys if partition_key in ordinals_by_key
+        }
+
+    def _shares_ordinals(self, other: PartitionsSubset) -> bool:
+        return (
+            isinstance(other, OrdinalPartitionsSubset)
+            and other._ordinals.partition_keys == self._ordinals.partition_keys  # noqa: SLF001
+        )
+
+    def _bitmap_of(self, other: PartitionsSubset) -> int:
+        # partition keys of other that are not in this snapshot are dropped
+        if self._shares_ordinals(other):
+            return cast(OrdinalPartitionsSubset, other)._bitmap  # noqa: SLF001
+        ordinals_by_key = self._ordinals.ordinals_by_key
+        return self._ordinals.bitmap_for_ordinals(
+            ordinals_by_key[partition_key]
+            for partition_key in other.get_partition_keys()
+            if partition_key in ordinals_by_key
+        )
+
+    def __or__(self, other: PartitionsSubset) -> "OrdinalPartitionsSubset[T_str]":
+        if self is other:
+            return self
+        if self._shares_ordinals(other):
+            return self._with_bitmap(self._bitmap | self._bitmap_of(other))
+        return self.with_partition_keys(other.get_partition_keys())
+
+    def __and__(self, other: PartitionsSubset) -> "OrdinalPartitionsSubset[T_str]":
+        return self._with_bitmap(self._bitmap & self._bitmap_of(other))
+
+    def __sub__(self, other: PartitionsSubset) -> "OrdinalPartitionsSubset[T_str]":
+        return self._with_bitmap(self._bitmap & ~self._bitmap_of(other))
+
+    def serialize(self) -> str:
+        # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
+        # Any time the serialization format changes, we should increment the version number.
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "partitions_def_id": self._ordinals.partitions_def_id,
+                "num_partitions": len(self._ordinals.partition_keys),
+                "ordinal_ranges": [
+                    list(ordinal_range) for ordinal_range in self.get_ordinal_ranges()
+                ],
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls,
+        partitions_def: PartitionsDefinition[T_str],
+        serialized: str,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "OrdinalPartitionsSubset[T_str]":
+        data = json.loads(serialized)
+        if not isinstance(data, dict) or data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                "Attempted to deserialize ordinal partition subset with version"
+                f" {data.get('version') if isinstance(data, dict) else None}, but only version"
+                f" {cls.SERIALIZATION_VERSION} is supported."
+            )
+
+        empty_subset = cls.empty_subset(partitions_def, dynamic_partitions_store)
+        ordinals = empty_subset._ordinals  # noqa: SLF001
+        if data["partitions_def_id"] != ordinals.partitions_def_id:
+            raise DagsterInvariantViolationError(
+                "Cannot deserialize an ordinal partition subset: the partition keys of"
+                f" {partitions_def} have changed since it was serialized."
+            )
+
+        return empty_subset._with_bitmap(  # noqa: SLF001
+            ordinals.bitmap_for_ranges(data["ordinal_ranges"])
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition[T_str],
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if not isinstance(
+            partitions_def, (StaticPartitionsDefinition, DynamicPartitionsDefinition)
+        ):
+            return False
+
+        data = json.loads(serialized)
+        return (
+            isinstance(data, dict)
+            and data.get("ordinal_ranges") is not None
+            and data.get("version") == cls.SERIALIZATION_VERSION
+        )
+
+    @property
+    def partitions_def(self) -> PartitionsDefinition[T_str]:
+        return self._partitions_def
+
+    @property
+    def partitions_def_id(self) -> str:
+        """The serializable unique identifier of the partition keys this subset was built from."""
+        return self._ordinals.partitions_def_id
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, OrdinalPartitionsSubset)
+            and self._partitions_def == other._partitions_def  # noqa: SLF001
+            and self._shares_ordinals(other)
+            and self._bitmap == other._bitmap  # noqa: SLF001
+        )
+
+    def __len__(self) -> int:
+        return bin(self._bitmap).count("1")
+
+    def __contains__(self, value) -> bool:
+        ordinal = self._ordinals.ordinals_by_key.get(value)
+        return ordinal is not None and bool((self._bitmap >> ordinal) & 1)
+
+    def __repr__(self) -> str:
+        return (
+            f"OrdinalPartitionsSubset(ordinal_ranges={self.get_ordinal_ranges()},"
+            f" partitions_def={self._partitions_def})"
+        )
@@ -1,6 +1,7 @@
 import functools
 import hashlib
 import json
+import math
 import re
 from datetime import datetime
 from enum import Enum
@@ -21,10 +22,13 @@
 )
 
 import pendulum
+import pytz
+from croniter import croniter
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, public
 from dagster._core.instance import DynamicPartitionsStore
+from dagster._utils.cached_method import cached_method
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
     cron_string_iterator,
@@ -59,6 +63,139 @@ class TimeWindow(NamedTuple):
     end: PublicAttr[datetime]
 
 
+def _fixed_interval_for_cron_schedule(
+    cron_schedule: str, timezone: str
+) -> Optional[Tuple[str, int]]:
+    """Returns the (unit, amount) that separates consecutive ticks of the cron schedule, if it ticks
+    at a fixed interval, otherwise None. Units are either "seconds", for schedules that tick at
+    least hourly and are added in absolute time, or "days", "weeks" and "months", which are added
+    in local time.
+    """
+    cron_parts, nth_weekday_of_month = croniter.expand(cron_schedule)
+    if nth_weekday_of_month:
+        return None
+
+    is_numeric = [len(part) == 1 and part[0] != "*" for part in cron_parts]
+    is_wildcard = [part == ["*"] for part in cron_parts]
+
+    if all(is_wildcard[1:]):
+        minutes = cron_parts[0]
+        if is_numeric[0]:
+            # hourly
+            return ("seconds", 60 * 60)
+        # sub-hourly schedules are evaluated by croniter in local time, which only matches a fixed
+        # interval in timezones without DST transitions
+        if not isinstance(pytz.timezone(timezone), (pytz.tzinfo.StaticTzInfo, type(pytz.utc))):
+            return None
+        if minutes == ["*"]:
+            return ("seconds", 60)
+        if 60 % len(minutes) == 0 and minutes == list(range(minutes[0], 60, 60 // len(minutes))):
+            return ("seconds", 60 // len(minutes) * 60)
+        return None
+    elif all(is_numeric[0:2]) and all(is_wildcard[2:]):
+        return ("days", 1)
+    elif all(is_numeric[0:2]) and all(is_wildcard[2:4]) and is_numeric[4]:
+        return ("weeks", 1)
+    elif all(is_numeric[0:3]) and all(is_wildcard[3:]) and cron_parts[2][0] <= 28:
+        # days of the month that do not exist in every month are skipped by the schedule
+        return ("months", 1)
+    return None
+
+
+class _FixedIntervalTimeWindows:
+    """Closed-form mapping between the ordinals of the time windows of a
+    TimeWindowPartitionsDefinition and their start times, for cron schedules that tick at a fixed
+    interval. Ordinal 0 is the first partition of the definition; negative ordinals are the windows
+    before it.
+
+    Mirrors the DST handling of cron_string_iterator: schedules that tick at least hourly advance
+    in absolute time, and daily, weekly and monthly schedules advance in local time, moving to the
+    start of the hour when their time does not exist because of a DST transition.
+    """
+
+    def __init__(self, first_tick: datetime, unit: str, amount: int, cron_schedule: str, fmt: str):
+        self._first_tick = first_tick
+        self._first_timestamp = first_tick.timestamp()
+        self._unit = unit
+        self._amount = amount
+        self._fmt = fmt
+
+        cron_parts, _ = croniter.expand(cron_schedule)
+        self._hour = cron_parts[1][0] if unit != "seconds" else None
+        self._minute = cron_parts[0][0] if unit != "seconds" else None
+
+        self._partition_keys: Sequence[str] = []
+
+    def tick(self, ordinal: int) -> datetime:
+        if self._unit == "seconds":
+            return pendulum.from_timestamp(
+                self._first_timestamp + ordinal * self._amount, tz=self._first_tick.tz
+            )
+
+        local_date = pendulum.date(
+            self._first_tick.year, self._first_tick.month, self._first_tick.day
+        ).add(**{self._unit: ordinal * self._amount})
+        tick = pendulum.datetime(
+            local_date.year,
+            local_date.month,
+            local_date.day,
+            self._hour,
+            self._minute,
+            tz=self._first_tick.tz,
+        )
+        if tick.hour != self._hour:
+            # the time does not exist on this date because of a DST transition
+            tick = tick.replace(minute=0)
+        return tick
+
+    def time_window(self, ordinal: int) -> "TimeWindow":
+        return TimeWindow(self.tick(ordinal), self.tick(ordinal + 1))
+
+    def ordinal_for_timestamp(self, timestamp: float) -> int:
+        """The ordinal of the last tick at or before the given timestamp."""
+        if self._unit == "seconds":
+            return math.floor((timestamp - self._first_timestamp) / self._amount)
+
+        local_dt = pendulum.from_timestamp(timestamp, tz=self._first_tick.tz)
+        if self._unit == "months":
+            ordinal = (local_dt.year - self._first_tick.year) * 12 + (
+                local_dt.month - self._first_tick.month
+            )
+        else:
+            days = local_dt.date().toordinal() - self._first_tick.date().toordinal()
+            ordinal = days // 7 if self._unit == "weeks" else days
+
+        # the estimate is off by at most one, around DST transitions and the time of day of the tick
+        while self.tick(ordinal).timestamp() > timestamp:
+            ordinal -= 1
+        while self.tick(ordinal + 1).timestamp() <= timestamp:
+            ordinal += 1
+        return ordinal
+
+    def ordinal_at_or_after(self, timestamp: float) -> int:
+        """The ordinal of the first tick at or after the given timestamp."""
+        ordinal = self.ordinal_for_timestamp(timestamp)
+        return ordinal if self.tick(ordinal).timestamp() == timestamp else ordinal + 1
+
+    def get_partition_keys(self, start_ordinal: int, end_ordinal: int) -> Sequence[str]:
+        """The partition keys of the windows with ordinals in [start_ordinal, end_ordinal). Keys are
+        cached, since the key for an ordinal never changes.
+        """
+        partition_keys = self._partition_keys
+        if end_ordinal > len(partition_keys):
+            # replaced rather than extended in place, so that concurrent readers never observe a
+            # partially extended list
+            partition_keys = [
+                *partition_keys,
+                *(
+                    self.tick(ordinal).strftime(self._fmt)
+                    for ordinal in range(len(partition_keys), end_ordinal)
+                ),
+            ]
+            self._partition_keys = partition_keys
+        return partition_keys[start_ordinal:end_ordinal]
+
+
 class TimeWindowPartitionsDefinition(
     PartitionsDefinition,
     NamedTuple(
@@ -164,6 +301,12 @@ def get_num_partitions(
         # string format datetimes.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        fixed_interval_time_windows = self._get_fixed_interval_time_windows()
+        if fixed_interval_time_windows is not None:
+            return self._get_num_partitions_for_fixed_interval(
+                fixed_interval_time_windows, current_timestamp
+            )
+
         partitions_past_current_time = 0
 
         num_partitions = 0
@@ -180,7 +323,7 @@ def get_num_partitions(
                 break
 
         if self.end_offset < 0:
-            num_partitions += self.end_offset
+            num_partitions = max(num_partitions + self.end_offset, 0)
 
         return num_partitions
 
@@ -193,6 +336,17 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        fixed_interval_time_windows = self._get_fixed_interval_time_windows()
+        if fixed_interval_time_windows is not None:
+            num_partitions = self._get_num_partitions_for_fixed_interval(
+                fixed_interval_time_windows, current_timestamp
+            )
+            return list(
+                fixed_interval_time_windows.get_partition_keys(
+                    max(start_idx, 0), min(end_idx, num_partitions)
+                )
+            )
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -225,6 +379,15 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        fixed_interval_time_windows = self._get_fixed_interval_time_windows()
+        if fixed_interval_time_windows is not None:
+            return fixed_interval_time_windows.get_partition_keys(
+                0,
+                self._get_num_partitions_for_fixed_interval(
+                    fixed_interval_time_windows, current_timestamp
+                ),
+            )
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start):
@@ -244,6 +407,39 @@ def get_partition_keys(
 
         return partition_keys
 
+    @cached_method
+    def _get_fixed_interval_time_windows(self) -> Optional[_FixedIntervalTimeWindows]:
+        """Returns the closed-form mapping between partition ordinals and time windows, if the cron
+        schedule ticks at a fixed interval. Cached per definition, along with the partition keys it
+        has formatted.
+        """
+        fixed_interval = _fixed_interval_for_cron_schedule(self.cron_schedule, self.timezone)
+        if fixed_interval is None:
+            return None
+
+        unit, amount = fixed_interval
+        return _FixedIntervalTimeWindows(
+            first_tick=next(iter(self._iterate_time_windows(self.start))).start,
+            unit=unit,
+            amount=amount,
+            cron_schedule=self.cron_schedule,
+            fmt=self.fmt,
+        )
+
+    def _get_num_partitions_for_fixed_interval(
+        self, fixed_interval_time_windows: _FixedIntervalTimeWindows, current_timestamp: float
+    ) -> int:
+        # the windows that end at or before the current time, plus or minus end_offset windows
+        num_ended_windows = max(
+            fixed_interval_time_windows.ordinal_for_timestamp(current_timestamp), 0
+        )
+        return max(num_ended_windows + self.end_offset, 0)
+
+    def _parse_partition_key_timestamp(self, partition_key: str) -> float:
+        return pendulum.instance(
+            datetime.strptime(partition_key, self.fmt), tz=self.timezone
+        ).timestamp()
+
     def _get_validated_time_window_for_partition_key(
         self, partition_key: str, current_time: Optional[datetime] = None
     ) -> Optional[TimeWindow]:
@@ -306,6 +502,14 @@ def __hash__(self):
 
     @functools.lru_cache(maxsize=100)
     def _time_window_for_partition_key(self, *, partition_key: str) -> TimeWindow:
+        fixed_interval_time_windows = self._get_fixed_interval_time_windows()
+        if fixed_interval_time_windows is not None:
+            return fixed_interval_time_windows.time_window(
+                fixed_interval_time_windows.ordinal_at_or_after(
+                    self._parse_partition_key_timestamp(partition_key)
+                )
+            )
+
         partition_key_dt = pendulum.instance(
             datetime.strptime(partition_key, self.fmt), tz=self.timezone
         )
@@ -321,26 +525,38 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
-        sorted_pks = sorted(partition_keys, key=lambda pk: datetime.strptime(pk, self.fmt))
-        cur_windows_iterator = iter(
-            self._iterate_time_windows(
-                pendulum.instance(datetime.strptime(sorted_pks[0], self.fmt), tz=self.timezone)
-            )
-        )
         partition_key_time_windows: List[TimeWindow] = []
-        for partition_key in sorted_pks:
-            next_window = next(cur_windows_iterator)
-            if next_window.start.strftime(self.fmt) == partition_key:
-                partition_key_time_windows.append(next_window)
-            else:
-                cur_windows_iterator = iter(
-                    self._iterate_time_windows(
-                        pendulum.instance(
-                            datetime.strptime(partition_key, self.fmt), tz=self.timezone
+        fixed_interval_time_windows = self._get_fixed_interval_time_windows()
+        if fixed_interval_time_windows is not None:
+            ordinals = sorted(
+                fixed_interval_time_windows.ordinal_at_or_after(
+                    self._parse_partition_key_timestamp(partition_key)
+                )
+                for partition_key in partition_keys
+            )
+            partition_key_time_windows = [
+                fixed_interval_time_windows.time_window(ordinal) for ordinal in ordinals
+            ]
+        else:
+            sorted_pks = sorted(partition_keys, key=lambda pk: datetime.strptime(pk, self.fmt))
+            cur_windows_iterator = iter(
+                self._iterate_time_windows(
+                    pendulum.instance(datetime.strptime(sorted_pks[0], self.fmt), tz=self.timezone)
+                )
+            )
+            for partition_key in sorted_pks:
+                next_window = next(cur_windows_iterator)
+                if next_window.start.strftime(self.fmt) == partition_key:
+                    partition_key_time_windows.append(next_window)
+                else:
+                    cur_windows_iterator = iter(
+                        self._iterate_time_windows(
+                            pendulum.instance(
+                                datetime.strptime(partition_key, self.fmt), tz=self.timezone
+                            )
                         )
                     )
-                )
-                partition_key_time_windows.append(next(cur_windows_iterator))
+                    partition_key_time_windows.append(next(cur_windows_iterator))
 
         start_time_window = self.get_first_partition_window()
         end_time_window = self.get_last_partition_window()
@@ -359,6 +575,14 @@ def time_windows_for_partition_keys(
         return partition_key_time_windows
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
+        fixed_interval_time_windows = self._get_fixed_interval_time_windows()
+        if fixed_interval_time_windows is not None:
+            return fixed_interval_time_windows.tick(
+                fixed_interval_time_windows.ordinal_at_or_after(
+                    self._parse_partition_key_timestamp(partition_key)
+                )
+            )
+
         partition_key_dt = pendulum.instance(
             datetime.strptime(partition_key, self.fmt), tz=self.timezone
         )
@@ -411,6 +635,23 @@ def get_prev_partition_window(self, start_dt: datetime) -> Optional[TimeWindow]:
     def _get_first_partition_window(self, *, current_time: datetime) -> Optional[TimeWindow]:
         current_timestamp = current_time.timestamp()
 
+        fixed_interval_time_windows = self._get_fixed_interval_time_windows()
+        if fixed_interval_time_windows is not None:
+            if self.end_offset > 0:
+                # the window that starts at or after the current time, offset by end_offset
+                last_ordinal = (
+                    fixed_interval_time_windows.ordinal_at_or_after(current_timestamp)
+                    + self.end_offset
+                    - 1
+                )
+            else:
+                last_ordinal = (
+                    fixed_interval_time_windows.ordinal_for_timestamp(current_timestamp)
+                    + self.end_offset
+                    - 1
+                )
+            return fixed_interval_time_windows.time_window(0) if last_ordinal >= 0 else None
+
         time_window = next(iter(self._iterate_time_windows(self.start)))
 
         if self.end_offset == 0:
@@ -462,10 +703,17 @@ def _get_last_partition_window(self, *, current_time: datetime) -> Optional[Time
             else pendulum.now(self.timezone)
         )
 
-        if self.end_offset == 0:
+        fixed_interval_time_windows = self._get_fixed_interval_time_windows()
+        if fixed_interval_time_windows is not None:
+            return fixed_interval_time_windows.time_window(
+                self._get_num_partitions_for_fixed_interval(
+                    fixed_interval_time_windows, current_time.timestamp()
+                )
+                - 1
+            )
+        elif self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_time)))
         else:
-            # TODO: make this efficient
             last_partition_key = super().get_last_partition_key(current_time)
             return (
                 self.time_window_for_partition_key(last_partition_key)
@@ -690,6 +938,13 @@ def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = F
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        fixed_interval_time_windows = self._get_fixed_interval_time_windows()
+        if fixed_interval_time_windows is not None:
+            ordinal = fixed_interval_time_windows.ordinal_for_timestamp(timestamp)
+            if end_closed and fixed_interval_time_windows.tick(ordinal).timestamp() == timestamp:
+                ordinal -= 1
+            return fixed_interval_time_windows.tick(ordinal).strftime(self.fmt)
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
@@ -176,6 +176,16 @@ class DagsterEventType(str, Enum):
     DagsterEventType.STEP_UP_FOR_RETRY,
 }
 
+# events that mark the start or the end of an attempt to execute a step
+STEP_BOUNDARY_EVENTS = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}
+
 FAILURE_EVENTS = {
     DagsterEventType.RUN_FAILURE,
     DagsterEventType.STEP_FAILURE,
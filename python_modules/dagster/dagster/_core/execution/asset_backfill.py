@@ -3,6 +3,7 @@
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Any,
     Dict,
     Iterable,
     List,
@@ -322,12 +323,16 @@ def execute_asset_backfill_iteration(
     backfill: "PartitionBackfill",
     workspace_process_context: IWorkspaceProcessContext,
     instance: DagsterInstance,
+    instance_queryer: Optional[CachingInstanceQueryer] = None,
 ) -> Iterable[None]:
     """Runs an iteration of the backfill, including submitting runs and updating the backfill object
     in the DB.
 
     This is a generator so that we can return control to the daemon and let it heartbeat during
     expensive operations.
+
+    A long-lived instance_queryer that has been refreshed for this iteration may be provided, so
+    that its cached data can be reused across iterations.
     """
     from dagster._core.execution.backfill import BulkActionStatus
 
@@ -348,6 +353,7 @@ def execute_asset_backfill_iteration(
         instance=instance,
         asset_graph=asset_graph,
         run_tags=backfill.tags,
+        instance_queryer=instance_queryer,
     ):
         yield None
 
@@ -369,29 +375,42 @@ def execute_asset_backfill_iteration(
 
     pipeline_and_execution_plan_cache: Dict[int, Tuple[ExternalJob, ExternalExecutionPlan]] = {}
 
+    workspaces: List[BaseWorkspaceRequestContext] = []
+    run_args: List[Mapping[str, Any]] = []
     for run_request in result.run_requests:
         yield None
-        submit_run_request(
-            run_request=run_request,
-            asset_graph=asset_graph,
-            # create a new request context for each run in case the code location server
-            # is swapped out in the middle of the backfill
-            workspace=workspace_process_context.create_request_context(),
-            instance=instance,
-            pipeline_and_execution_plan_cache=pipeline_and_execution_plan_cache,
+        # create a new request context for each run in case the code location server
+        # is swapped out in the middle of the backfill
+        workspace = workspace_process_context.create_request_context()
+        workspaces.append(workspace)
+        run_args.append(
+            get_create_run_args_for_run_request(
+                run_request=run_request,
+                asset_graph=asset_graph,
+                workspace=workspace,
+                instance=instance,
+                pipeline_and_execution_plan_cache=pipeline_and_execution_plan_cache,
+            )
         )
 
+    # all of the runs requested in this iteration are written to the run storage at once
+    runs = instance.create_runs(run_args) if run_args else []
+
+    for run, workspace in zip(runs, workspaces):
+        yield None
+        instance.submit_run(run.run_id, workspace)
+
     instance.update_backfill(updated_backfill)
 
 
-def submit_run_request(
+def get_create_run_args_for_run_request(
     asset_graph: ExternalAssetGraph,
     run_request: RunRequest,
     instance: DagsterInstance,
     workspace: BaseWorkspaceRequestContext,
     pipeline_and_execution_plan_cache: Dict[int, Tuple[ExternalJob, ExternalExecutionPlan]],
-) -> None:
-    """Creates and submits a run for the given run request."""
+) -> Mapping[str, Any]:
+    """Returns the arguments to `DagsterInstance.create_run` for the given run request."""
     repo_handle = asset_graph.get_repository_handle(
         cast(Sequence[AssetKey], run_request.asset_selection)[0]
     )
@@ -437,7 +456,7 @@ def submit_run_request(
 
     external_job, external_execution_plan = pipeline_and_execution_plan_cache[selector_id]
 
-    run = instance.create_run(
+    return dict(
         job_snapshot=external_job.job_snapshot,
         execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
         parent_job_snapshot=external_job.parent_job_snapshot,
@@ -456,8 +475,6 @@ def submit_run_request(
         asset_selection=frozenset(run_request.asset_selection),
     )
 
-    instance.submit_run(run.run_id, workspace)
-
 
 def _get_implicit_job_name_for_assets(
     asset_graph: ExternalAssetGraph, asset_keys: Sequence[AssetKey]
@@ -480,6 +497,7 @@ def execute_asset_backfill_iteration_inner(
     asset_graph: ExternalAssetGraph,
     instance: DagsterInstance,
     run_tags: Mapping[str, str],
+    instance_queryer: Optional[CachingInstanceQueryer] = None,
 ) -> Iterable[Optional[AssetBackfillIterationResult]]:
     """Core logic of a backfill iteration. Has no side effects.
 
@@ -489,7 +507,8 @@ def execute_asset_backfill_iteration_inner(
     This is a generator so that we can return control to the daemon and let it heartbeat during
     expensive operations.
     """
-    instance_queryer = CachingInstanceQueryer(instance=instance)
+    if instance_queryer is None:
+        instance_queryer = CachingInstanceQueryer(instance=instance)
 
     initial_candidates: Set[AssetKeyPartitionKey] = set()
     request_roots = not asset_backfill_data.requested_runs_for_target_roots
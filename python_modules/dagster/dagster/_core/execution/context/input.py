@@ -489,7 +489,11 @@ def add_input_metadata(
             observation = AssetObservation(
                 asset_key=self.asset_key,
                 description=description,
-                partition=self.asset_partition_key if self.has_asset_partitions else None,
+                partition=(
+                    self.asset_partition_key
+                    if self.has_asset_partitions and len(self.asset_partition_keys) == 1
+                    else None
+                ),
                 metadata=metadata,
             )
             self._observations.append(observation)
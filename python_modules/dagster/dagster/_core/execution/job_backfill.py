@@ -1,7 +1,20 @@
 import logging
 import os
 import time
-from typing import Callable, Iterable, Mapping, Optional, Sequence, Tuple, cast
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+from typing_extensions import TypeAlias
 
 import dagster._check as check
 from dagster._core.definitions.selector import JobSubsetSelector
@@ -19,6 +32,7 @@
 )
 from dagster._core.host_representation.origin import ExternalPartitionSetOrigin
 from dagster._core.instance import DagsterInstance
+from dagster._core.snap import ExecutionPlanSnapshot
 from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
@@ -42,6 +56,15 @@
 CHECKPOINT_INTERVAL = 1
 CHECKPOINT_COUNT = 25
 
+# Key of the execution plan snapshot cache, see `_get_execution_plan_snapshot_cache_key`
+ExecutionPlanSnapshotCacheKey: TypeAlias = Tuple[
+    str, Optional[AbstractSet[str]], Optional[Tuple[str, ...]], Any
+]
+
+# Execution plan snapshots computed while submitting the runs of a backfill, shared between runs
+# with the same plan
+ExecutionPlanSnapshotCache: TypeAlias = Dict[ExecutionPlanSnapshotCacheKey, ExecutionPlanSnapshot]
+
 
 def execute_job_backfill_iteration(
     backfill: PartitionBackfill,
@@ -60,6 +83,8 @@ def execute_job_backfill_iteration(
 
     _check_repo_has_partition_set(workspace_process_context, backfill)
 
+    execution_plan_snapshot_cache: ExecutionPlanSnapshotCache = {}
+
     has_more = True
     while has_more:
         if backfill.status != BulkActionStatus.REQUESTED:
@@ -71,18 +96,30 @@ def execute_job_backfill_iteration(
         _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
 
         if chunk:
-            for _run_id in submit_backfill_runs(
+            chunk_start_time = time.time()
+            num_submitted = 0
+            for run_id in submit_backfill_runs(
                 instance,
                 lambda: workspace_process_context.create_request_context(),
                 backfill,
                 chunk,
+                execution_plan_snapshot_cache=execution_plan_snapshot_cache,
             ):
+                if run_id is not None:
+                    num_submitted += 1
                 yield None
                 # before submitting, refetch the backfill job to check for status changes
                 backfill = cast(PartitionBackfill, instance.get_backfill(backfill.backfill_id))
                 if backfill.status != BulkActionStatus.REQUESTED:
                     return
 
+            elapsed_seconds = time.time() - chunk_start_time
+            logger.info(
+                f"Submitted {num_submitted} runs for backfill {backfill.backfill_id} in"
+                f" {elapsed_seconds:.2f} seconds"
+                f" ({num_submitted / max(elapsed_seconds, 0.001):.2f} runs/sec)"
+            )
+
         _check_for_debug_crash(debug_crash_flags, "AFTER_SUBMIT")
 
         if has_more:
@@ -173,8 +210,16 @@ def submit_backfill_runs(
     create_workspace: Callable[[], BaseWorkspaceRequestContext],
     backfill_job: PartitionBackfill,
     partition_names: Optional[Sequence[str]] = None,
+    execution_plan_snapshot_cache: Optional[ExecutionPlanSnapshotCache] = None,
 ) -> Iterable[Optional[str]]:
-    """Returns the run IDs of the submitted runs."""
+    """Returns the run IDs of the submitted runs.
+
+    Pass the same execution_plan_snapshot_cache to each call when submitting a backfill in chunks,
+    so that runs with the same plan share its snapshot across chunks.
+    """
+    if execution_plan_snapshot_cache is None:
+        execution_plan_snapshot_cache = {}
+
     origin = cast(ExternalPartitionSetOrigin, backfill_job.partition_set_origin)
 
     repository_origin = origin.external_repository_origin
@@ -212,36 +257,87 @@ def submit_backfill_runs(
         external_job = code_location.get_external_job(pipeline_selector)
     else:
         external_job = external_repo.get_full_external_job(external_partition_set.job_name)
-    for partition_data in result.partition_data:
-        # Refresh the code location in case the workspace has reloaded mid-backfill
-        workspace = create_workspace()
-        code_location = workspace.get_code_location(location_name)
+    # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job and the
+    # partition has had a successful run since the time the backfill was scheduled
+    dagster_runs = create_backfill_runs(
+        instance,
+        code_location,
+        external_job,
+        external_partition_set,
+        backfill_job,
+        result.partition_data,
+        execution_plan_snapshot_cache=execution_plan_snapshot_cache,
+    )
+    num_submitted = 0
+    try:
+        for dagster_run in dagster_runs:
+            # Refresh the workspace in case it has reloaded mid-backfill
+            workspace = create_workspace()
+            instance.submit_run(dagster_run.run_id, workspace)
+            num_submitted += 1
+            yield dagster_run.run_id
+            yield None
+    except GeneratorExit:
+        # the runs of the chunk were created together, so the runs that haven't been submitted
+        # when the submission stops, e.g. because the backfill was canceled, are canceled too
+        for dagster_run in dagster_runs[num_submitted:]:
+            instance.report_run_canceled(
+                dagster_run, message="Canceled before the backfill submitted the run."
+            )
+        raise
 
-        dagster_run = create_backfill_run(
+
+def create_backfill_runs(
+    instance: DagsterInstance,
+    code_location: CodeLocation,
+    external_pipeline: ExternalJob,
+    external_partition_set: ExternalPartitionSet,
+    backfill_job: PartitionBackfill,
+    partition_data: Sequence[ExternalPartitionExecutionParamData],
+    execution_plan_snapshot_cache: Optional[ExecutionPlanSnapshotCache] = None,
+) -> Sequence[DagsterRun]:
+    """Creates the runs for a chunk of the partitions of a backfill, in the order of the partitions.
+
+    Runs that re-execute the last failed run of their partition are created from it one at a time,
+    the other runs are written to the run storage together.
+    """
+    if backfill_job.from_failure:
+        dagster_runs = []
+        for data in partition_data:
+            dagster_run = _create_backfill_run_from_failure(
+                instance,
+                code_location,
+                external_pipeline,
+                external_partition_set,
+                backfill_job,
+                data,
+            )
+            if dagster_run:
+                dagster_runs.append(dagster_run)
+        return dagster_runs
+
+    run_args = [
+        _get_backfill_run_args(
             instance,
             code_location,
-            external_job,
+            external_pipeline,
             external_partition_set,
             backfill_job,
-            partition_data,
+            data,
+            execution_plan_snapshot_cache=execution_plan_snapshot_cache,
         )
-        if dagster_run:
-            # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
-            # and the partition has had a successful run since the time the backfill was
-            # scheduled
-            instance.submit_run(dagster_run.run_id, workspace)
-            yield dagster_run.run_id
-        yield None
+        for data in partition_data
+    ]
+    return instance.create_runs(run_args) if run_args else []
 
 
-def create_backfill_run(
+def _get_backfill_run_tags(
     instance: DagsterInstance,
     code_location: CodeLocation,
     external_pipeline: ExternalJob,
-    external_partition_set: ExternalPartitionSet,
     backfill_job: PartitionBackfill,
     partition_data: ExternalPartitionExecutionParamData,
-) -> Optional[DagsterRun]:
+) -> Mapping[str, str]:
     from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
     log_action(
@@ -254,16 +350,57 @@ def create_backfill_run(
         },
     )
 
-    tags = merge_dicts(
+    return merge_dicts(
         external_pipeline.tags,
         partition_data.tags,
         DagsterRun.tags_for_backfill_id(backfill_job.backfill_id),
         backfill_job.tags,
     )
 
+
+def _create_backfill_run_from_failure(
+    instance: DagsterInstance,
+    code_location: CodeLocation,
+    external_pipeline: ExternalJob,
+    external_partition_set: ExternalPartitionSet,
+    backfill_job: PartitionBackfill,
+    partition_data: ExternalPartitionExecutionParamData,
+) -> Optional[DagsterRun]:
+    tags = _get_backfill_run_tags(
+        instance, code_location, external_pipeline, backfill_job, partition_data
+    )
+
+    last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
+    if not last_run or last_run.status != DagsterRunStatus.FAILURE:
+        return None
+    return instance.create_reexecuted_run(
+        parent_run=last_run,
+        code_location=code_location,
+        external_job=external_pipeline,
+        strategy=ReexecutionStrategy.FROM_FAILURE,
+        extra_tags=tags,
+        run_config=partition_data.run_config,
+        use_parent_run_tags=False,  # don't inherit tags from the previous run
+    )
+
+
+def _get_backfill_run_args(
+    instance: DagsterInstance,
+    code_location: CodeLocation,
+    external_pipeline: ExternalJob,
+    external_partition_set: ExternalPartitionSet,
+    backfill_job: PartitionBackfill,
+    partition_data: ExternalPartitionExecutionParamData,
+    execution_plan_snapshot_cache: Optional[ExecutionPlanSnapshotCache] = None,
+) -> Mapping[str, Any]:
+    """Returns the keyword arguments to `DagsterInstance.create_run` for the run of a partition."""
+    tags = _get_backfill_run_tags(
+        instance, code_location, external_pipeline, backfill_job, partition_data
+    )
+
     solids_to_execute = None
     solid_selection = None
-    if not backfill_job.from_failure and not backfill_job.reexecution_steps:
+    if not backfill_job.reexecution_steps:
         step_keys_to_execute = None
         parent_run_id = None
         root_run_id = None
@@ -272,21 +409,7 @@ def create_backfill_run(
             solids_to_execute = frozenset(external_partition_set.solid_selection)
             solid_selection = external_partition_set.solid_selection
 
-    elif backfill_job.from_failure:
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
-        if not last_run or last_run.status != DagsterRunStatus.FAILURE:
-            return None
-        return instance.create_reexecuted_run(
-            parent_run=last_run,
-            code_location=code_location,
-            external_job=external_pipeline,
-            strategy=ReexecutionStrategy.FROM_FAILURE,
-            extra_tags=tags,
-            run_config=partition_data.run_config,
-            use_parent_run_tags=False,  # don't inherit tags from the previous run
-        )
-
-    else:  # backfill_job.reexecution_steps
+    else:
         last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
         parent_run_id = last_run.run_id if last_run else None
         root_run_id = (last_run.root_run_id or last_run.run_id) if last_run else None
@@ -307,17 +430,35 @@ def create_backfill_run(
             solids_to_execute = frozenset(external_partition_set.solid_selection)
             solid_selection = external_partition_set.solid_selection
 
-    external_execution_plan = code_location.get_external_execution_plan(
-        external_pipeline,
-        partition_data.run_config,
-        step_keys_to_execute=step_keys_to_execute,
-        known_state=known_state,
-        instance=instance,
-    )
-
-    return instance.create_run(
+    execution_plan_snapshot = None
+    cache_key = None
+    # Plans that depend on the state of a previous run can't be shared with other runs. Neither can
+    # memoized plans, which only execute the steps whose outputs for the versions computed from the
+    # run config haven't been stored yet.
+    if (
+        execution_plan_snapshot_cache is not None
+        and known_state is None
+        and not external_pipeline.is_using_memoization(tags)
+    ):
+        cache_key = _get_execution_plan_snapshot_cache_key(
+            external_pipeline, backfill_job, partition_data.run_config, step_keys_to_execute
+        )
+        execution_plan_snapshot = execution_plan_snapshot_cache.get(cache_key)
+
+    if execution_plan_snapshot is None:
+        execution_plan_snapshot = code_location.get_external_execution_plan(
+            external_pipeline,
+            partition_data.run_config,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+            instance=instance,
+        ).execution_plan_snapshot
+        if execution_plan_snapshot_cache is not None and cache_key is not None:
+            execution_plan_snapshot_cache[cache_key] = execution_plan_snapshot
+
+    return dict(
         job_snapshot=external_pipeline.job_snapshot,
-        execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
+        execution_plan_snapshot=execution_plan_snapshot,
         parent_job_snapshot=external_pipeline.parent_job_snapshot,
         job_name=external_pipeline.name,
         run_id=make_new_run_id(),
@@ -337,6 +478,37 @@ def create_backfill_run(
     )
 
 
+def _get_execution_plan_snapshot_cache_key(
+    external_pipeline: ExternalJob,
+    backfill_job: PartitionBackfill,
+    run_config: Mapping[str, Any],
+    step_keys_to_execute: Optional[Sequence[str]],
+) -> ExecutionPlanSnapshotCacheKey:
+    # The runs of a partitioned job usually only differ in the values in their run config, e.g. the
+    # date of a time window partition, which don't change the steps of the plan. Which config
+    # fields are set does, e.g. choosing an executor or loading an input from config, so the plan
+    # is keyed by the structure of the run config rather than by its values.
+    return (
+        external_pipeline.computed_job_snapshot_id,
+        frozenset(backfill_job.asset_selection) if backfill_job.asset_selection else None,
+        tuple(step_keys_to_execute) if step_keys_to_execute else None,
+        _get_config_structure(run_config),
+    )
+
+
+def _get_config_structure(config_value: Any) -> Any:
+    """Returns a hashable representation of the fields set in a config value, without the values of
+    its scalars.
+    """
+    if isinstance(config_value, Mapping):
+        return tuple(
+            sorted((key, _get_config_structure(value)) for key, value in config_value.items())
+        )
+    if isinstance(config_value, (list, tuple)):
+        return tuple(_get_config_structure(value) for value in config_value)
+    return None
+
+
 def _fetch_last_run(
     instance: DagsterInstance, external_partition_set: ExternalPartitionSet, partition_name: str
 ) -> Optional[DagsterRun]:
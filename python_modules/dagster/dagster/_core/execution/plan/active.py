@@ -4,6 +4,7 @@
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -563,7 +564,7 @@ def _resolve_any_dynamic_outputs(self, step_key: str) -> None:
             self._new_dynamic_mappings = True
 
     def rebuild_from_events(
-        self, dagster_events: Sequence[DagsterEvent]
+        self, dagster_events: Iterable[DagsterEvent]
     ) -> Sequence[ExecutionStep]:
         """Replay events to rebuild the execution state and continue after a failure.
 
@@ -571,10 +572,21 @@ def rebuild_from_events(
         that the previous run worker might have crashed before launching these steps, or it may have
         launched them but they have yet to report a STEP_START event.
         """
+        for _ in self.replay_events(dagster_events):
+            pass
+
+        return self.get_possibly_in_flight_steps()
+
+    def replay_events(self, dagster_events: Iterable[DagsterEvent]) -> Iterator[DagsterEvent]:
+        """Like rebuild_from_events, but yields each event once it has been replayed, so that the
+        events can be consumed from a stream without holding all of them in memory.
+        """
         self.get_steps_to_execute()
 
         for event in dagster_events:
             self.handle_event(event)
             self.get_steps_to_execute()
+            yield event
 
+    def get_possibly_in_flight_steps(self) -> Sequence[ExecutionStep]:
         return [self.get_step_by_key(step_key) for step_key in self._in_flight]
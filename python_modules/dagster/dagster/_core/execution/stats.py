@@ -1,6 +1,6 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, cast
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, cast
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
@@ -20,8 +20,6 @@ def build_run_stats_from_events(
         raise check.ParameterCheckError(
             "Invariant violation for parameter 'records'. Description: Expected iterable."
         ) from exc
-    for i, record in enumerate(records):
-        check.inst_param(record, f"records[{i}]", EventLogEntry)
 
     steps_succeeded = 0
     steps_failed = 0
@@ -32,7 +30,9 @@ def build_run_stats_from_events(
     start_time = None
     end_time = None
 
-    for event in records:
+    # records may be a generator over a large event log, so they're only iterated over once
+    for i, event in enumerate(records):
+        check.inst_param(event, f"records[{i}]", EventLogEntry)
         if not event.is_dagster_event:
             continue
         dagster_event = event.get_dagster_event()
@@ -253,3 +253,123 @@ def __new__(
             attempts_list=check.opt_sequence_param(attempts_list, "attempts_list", RunStepMarker),
             markers=check.opt_sequence_param(markers, "markers", RunStepMarker),
         )
+
+
+# Events that the summary stats of a step, as maintained by `RunStepStatsSummary`, depend on
+STEP_STATS_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    *MARKER_EVENTS,
+}
+
+
+class RunStepStatsSummary:
+    """The summary stats of a single step, which can be updated one event at a time.
+
+    Applying the events of a step in order gives the same stats as
+    `build_run_step_stats_from_events`, except for the materialization events and expectation
+    results, which are not summarized and have to be passed in when building the snapshot.
+    """
+
+    def __init__(
+        self,
+        step_key: str,
+        status: Optional[StepEventStatus] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        attempts: Optional[int] = None,
+        attempt_start_time: Optional[float] = None,
+        attempts_list: Optional[Sequence[RunStepMarker]] = None,
+        markers: Optional[Mapping[str, RunStepMarker]] = None,
+    ):
+        self.step_key = check.str_param(step_key, "step_key")
+        self.status = check.opt_inst_param(status, "status", StepEventStatus)
+        self.start_time = check.opt_float_param(start_time, "start_time")
+        self.end_time = check.opt_float_param(end_time, "end_time")
+        self.attempts = check.opt_int_param(attempts, "attempts")
+        # start of the current attempt, if the step has been restarted
+        self.attempt_start_time = check.opt_float_param(attempt_start_time, "attempt_start_time")
+        # the attempts that ended in a retry
+        self.attempts_list = list(
+            check.opt_sequence_param(attempts_list, "attempts_list", of_type=RunStepMarker)
+        )
+        self.markers = dict(
+            check.opt_mapping_param(markers, "markers", key_type=str, value_type=RunStepMarker)
+        )
+
+    def apply_event(self, event: EventLogEntry) -> None:
+        dagster_event = event.get_dagster_event()
+        check.invariant(dagster_event.step_key == self.step_key)
+
+        if dagster_event.event_type == DagsterEventType.STEP_START:
+            self.start_time = event.timestamp
+            self.attempts = 1
+        elif dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
+            self.attempts = (self.attempts or 0) + 1
+            self.attempt_start_time = event.timestamp
+        elif dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+            self.attempts_list.append(
+                RunStepMarker(start_time=self._current_attempt_start, end_time=event.timestamp)
+            )
+        elif dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
+            self.end_time = event.timestamp
+            self.status = StepEventStatus.SUCCESS
+        elif dagster_event.event_type == DagsterEventType.STEP_FAILURE:
+            self.end_time = event.timestamp
+            self.status = StepEventStatus.FAILURE
+        elif dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
+            self.end_time = event.timestamp
+            self.status = StepEventStatus.SKIPPED
+        elif dagster_event.event_type in MARKER_EVENTS:
+            marker_start = dagster_event.engine_event_data.marker_start
+            marker_end = dagster_event.engine_event_data.marker_end
+            if marker_start:
+                marker = self.markers.get(marker_start, RunStepMarker())
+                self.markers[marker_start] = marker._replace(start_time=event.timestamp)
+            if marker_end:
+                marker = self.markers.get(marker_end, RunStepMarker())
+                self.markers[marker_end] = marker._replace(end_time=event.timestamp)
+
+    @property
+    def has_step_events(self) -> bool:
+        """Whether a start, restart or completion event of the step has been applied.
+
+        `build_run_step_stats_from_events` leaves out steps that only have marker or retry events
+        and no materializations or expectation results.
+        """
+        return self.start_time is not None or self.attempts is not None or self.end_time is not None
+
+    @property
+    def _current_attempt_start(self) -> Optional[float]:
+        return self.attempt_start_time if self.attempt_start_time is not None else self.start_time
+
+    def to_snapshot(
+        self,
+        run_id: str,
+        materialization_events: Sequence[EventLogEntry],
+        expectation_results: Sequence[ExpectationResult],
+    ) -> "RunStepKeyStatsSnapshot":
+        attempts_list = list(self.attempts_list)
+        if self.end_time:
+            attempts_list.append(
+                RunStepMarker(start_time=self._current_attempt_start, end_time=self.end_time)
+            )
+
+        return RunStepKeyStatsSnapshot(
+            run_id=run_id,
+            step_key=self.step_key,
+            status=self.status if self.end_time else StepEventStatus.IN_PROGRESS,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            materialization_events=materialization_events,
+            expectation_results=expectation_results,
+            attempts=self.attempts,
+            attempts_list=attempts_list,
+            markers=list(self.markers.values()),
+        )
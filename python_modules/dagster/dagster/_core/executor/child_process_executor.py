@@ -4,15 +4,31 @@
 import os
 import queue
 import sys
+import time
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
 from multiprocessing import Queue
+from multiprocessing.connection import Connection, wait
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -34,6 +50,14 @@ class ChildProcessDoneEvent(NamedTuple("ChildProcessDoneEvent", [("pid", int)]),
     pass
 
 
+class ChildProcessWorkerRetiringEvent(
+    NamedTuple("ChildProcessWorkerRetiringEvent", [("pid", int)]), ChildProcessEvent
+):
+    """Sent by a worker process before it finishes a task, if it will exit instead of accepting
+    another one.
+    """
+
+
 class ChildProcessSystemErrorEvent(
     NamedTuple(
         "ChildProcessSystemErrorEvent", [("pid", int), ("error_info", SerializableErrorInfo)]
@@ -57,6 +81,27 @@ def execute(self) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
         """
 
 
+class ChildProcessWorkerCommand(ABC):
+    """Inherit from this class to execute many tasks in a single long-lived worker process.
+
+    The object must be picklable; it is sent to the worker process once, when the worker starts,
+    and can hold onto state that is expensive to set up for the lifetime of the worker.
+    """
+
+    @abstractmethod
+    def worker_context(self) -> ContextManager[None]:
+        """This method is invoked in the worker process, and the context is held open while the
+        worker accepts tasks.
+        """
+
+    @abstractmethod
+    def execute_task(self, task: Any) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
+        """This method is invoked in the worker process once for each task sent to the worker.
+
+        Yields a sequence of events to be handled by ChildProcessWorker.execute_task.
+        """
+
+
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
 
@@ -65,33 +110,121 @@ def __init__(self, exit_code=None):
         super().__init__()
 
 
-def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessCommand):
+def _send_event(event_conn: Connection, event: object) -> None:
+    # events are sent along with the time they were sent, so that the parent process can measure
+    # how long they waited to be collected
+    event_conn.send((time.time(), event))
+
+
+def _execute_command_in_child_process(event_conn: Connection, command: ChildProcessCommand):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process.
+    Handles errors and communicates across a pipe with the parent process.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
     with capture_interrupts():
         pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
+        _send_event(event_conn, ChildProcessStartEvent(pid=pid))
         try:
             for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
+                _send_event(event_conn, step_event)
+            _send_event(event_conn, ChildProcessDoneEvent(pid=pid))
 
         except (
             Exception,
             KeyboardInterrupt,
             DagsterExecutionInterruptedError,
         ):
-            event_queue.put(
+            _send_event(
+                event_conn,
                 ChildProcessSystemErrorEvent(
                     pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
-                )
+                ),
             )
 
 
+def _get_max_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        # not available on windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macos, and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+WORKER_IDLE_POLL_INTERVAL = 1.0
+"""How often an idle worker checks that its parent process is still alive, in seconds."""
+
+
+def _execute_tasks_in_worker_process(
+    task_queue: Queue,
+    event_conn: Connection,
+    term_event: Any,
+    command: ChildProcessWorkerCommand,
+    max_tasks: Optional[int],
+    max_memory_bytes: Optional[int],
+):
+    """Wraps the execution of a ChildProcessWorkerCommand.
+
+    Executes the tasks sent over the task queue one at a time until it receives None, the parent
+    process exits, or the worker has executed too many tasks or used too much memory.
+    """
+    check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+    with capture_interrupts():
+        pid = os.getpid()
+        parent_pid = os.getppid()
+        start_termination_thread(term_event)
+        num_tasks = 0
+        with command.worker_context():
+            while True:
+                try:
+                    task = task_queue.get(block=True, timeout=WORKER_IDLE_POLL_INTERVAL)
+                except queue.Empty:
+                    if os.getppid() != parent_pid:
+                        return
+                    continue
+
+                if task is None:
+                    return
+
+                _send_event(event_conn, ChildProcessStartEvent(pid=pid))
+                try:
+                    for step_event in command.execute_task(task):
+                        _send_event(event_conn, step_event)
+                except (
+                    Exception,
+                    KeyboardInterrupt,
+                    DagsterExecutionInterruptedError,
+                ):
+                    _send_event(
+                        event_conn,
+                        ChildProcessSystemErrorEvent(
+                            pid=pid,
+                            error_info=serializable_error_info_from_exc_info(sys.exc_info()),
+                        ),
+                    )
+                    # the worker may be left in a bad state, so don't reuse it
+                    return
+
+                num_tasks += 1
+                max_rss_bytes = _get_max_rss_bytes()
+                retiring = (max_tasks is not None and num_tasks >= max_tasks) or (
+                    max_memory_bytes is not None
+                    and max_rss_bytes is not None
+                    and max_rss_bytes >= max_memory_bytes
+                )
+                if retiring:
+                    _send_event(event_conn, ChildProcessWorkerRetiringEvent(pid=pid))
+                _send_event(event_conn, ChildProcessDoneEvent(pid=pid))
+                if retiring:
+                    return
+
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -99,33 +232,115 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 """Sentinel value."""
 
 
+class EventLatencyStats(NamedTuple):
+    """How long the events sent by a child process waited before the parent process collected
+    them.
+    """
+
+    num_events: int
+    total_latency: float
+    max_latency: float
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.num_events if self.num_events else 0.0
+
+
+class ChildProcessEventCollector:
+    """Tracks the event pipes and process sentinels of all the child processes that are in flight,
+    so that the parent can wait on all of them at once instead of polling each child in turn.
+
+    Iterators that are passed a collector poll their child without blocking, and the caller waits
+    on the collector once it has cycled through all of its iterators without receiving an event.
+    The collector also records how long each child's events waited to be collected, keyed by the
+    key passed when the child was registered.
+    """
+
+    def __init__(self):
+        self._waitables: Dict[int, Tuple[Connection, int]] = {}
+        self._latency_stats: Dict[str, EventLatencyStats] = {}
+
+    def register(self, event_conn: Connection, sentinel: int) -> None:
+        self._waitables[id(event_conn)] = (event_conn, sentinel)
+
+    def unregister(self, event_conn: Connection) -> None:
+        self._waitables.pop(id(event_conn), None)
+
+    def wait(self, timeout: float) -> bool:
+        """Blocks until any registered child has sent an event or exited, or the timeout elapses.
+        Returns whether any child is ready.
+        """
+        if not self._waitables:
+            return False
+
+        return bool(
+            wait(
+                [handle for waitable in self._waitables.values() for handle in waitable],
+                timeout=timeout,
+            )
+        )
+
+    def record_latency(self, key: str, latency: float) -> None:
+        stats = self._latency_stats.get(key, EventLatencyStats(0, 0.0, 0.0))
+        self._latency_stats[key] = EventLatencyStats(
+            num_events=stats.num_events + 1,
+            total_latency=stats.total_latency + latency,
+            max_latency=max(stats.max_latency, latency),
+        )
+
+    @property
+    def latency_stats(self) -> Mapping[str, EventLatencyStats]:
+        return self._latency_stats
+
+
+def _receive_event(
+    event_conn: Connection,
+    event_collector: Optional[ChildProcessEventCollector],
+    collector_key: Optional[str],
+) -> Union[object, Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]:
+    try:
+        sent_at, event = event_conn.recv()
+    except EOFError:
+        # the child exited, possibly while it was part way through sending an event
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
+
+    if event_collector and collector_key:
+        event_collector.record_latency(collector_key, max(time.time() - sent_at, 0.0))
+    return event
+
+
 def _poll_for_event(
-    process, event_queue
+    process,
+    event_conn: Connection,
+    timeout: float = TICK,
+    event_collector: Optional[ChildProcessEventCollector] = None,
+    collector_key: Optional[str] = None,
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
-    try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
-            try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+    if event_conn.poll(timeout):
+        return _receive_event(event_conn, event_collector, collector_key)  # type: ignore
+
+    if not process.is_alive():
+        # There is a possibility that after the last poll the process created another event
+        # and then died. In that case we want to continue draining the pipe.
+        if event_conn.poll():
+            return _receive_event(event_conn, event_collector, collector_key)  # type: ignore
+        # If the pipe is empty we know that there are no more events and that the process has
+        # died.
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
     return None
 
 
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    event_collector: Optional[ChildProcessEventCollector] = None,
+    collector_key: Optional[str] = None,
 ) -> Iterator[Optional["DagsterEvent"]]:
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; polls the pipe for events yielded by the child process
+    until the process dies and the pipe is empty.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -143,23 +358,32 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        event_collector (Optional[ChildProcessEventCollector]): If set, the child is polled without
+            blocking, and the caller is responsible for waiting on the collector between polls.
+        collector_key (Optional[str]): The key to record event latencies under in the collector.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     """
     check.inst_param(command, "command", ChildProcessCommand)
+    poll_timeout = 0 if event_collector else TICK
 
-    event_queue = multiprocessing_ctx.Queue()
+    event_conn, child_event_conn = multiprocessing_ctx.Pipe(duplex=False)  # type: ignore
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
-            target=_execute_command_in_child_process, args=(event_queue, command)
+            target=_execute_command_in_child_process, args=(child_event_conn, command)
         )
         process.start()
+        child_event_conn.close()
+        if event_collector:
+            event_collector.register(event_conn, process.sentinel)
 
         completed_properly = False
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(
+                process, event_conn, poll_timeout, event_collector, collector_key
+            )
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -170,9 +394,190 @@ def execute_child_process_command(
                 completed_properly = True
 
         if not completed_properly:
+            # the pipe can be closed before the process has been reaped, so wait for its exit code
+            process.join()
             # TODO Figure out what to do about stderr/stdout
             raise ChildProcessCrashException(exit_code=process.exitcode)
 
         process.join()
     finally:
-        event_queue.close()
+        if event_collector:
+            event_collector.unregister(event_conn)
+        event_conn.close()
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes the tasks sent to it one at a time, using a
+    ChildProcessWorkerCommand.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        command: ChildProcessWorkerCommand,
+        max_tasks: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+    ):
+        check.inst_param(command, "command", ChildProcessWorkerCommand)
+        self._task_queue = multiprocessing_ctx.Queue()
+        self._event_conn, child_event_conn = multiprocessing_ctx.Pipe(duplex=False)  # type: ignore
+        self.term_event = multiprocessing_ctx.Event()
+        self._retiring = False
+        self._process = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_tasks_in_worker_process,
+            args=(
+                self._task_queue,
+                child_event_conn,
+                self.term_event,
+                command,
+                max_tasks,
+                max_memory_bytes,
+            ),
+        )
+        self._process.start()
+        child_event_conn.close()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    @property
+    def can_accept_task(self) -> bool:
+        return not self._retiring and self._process.is_alive()
+
+    def execute_task(
+        self,
+        task: Any,
+        event_collector: Optional[ChildProcessEventCollector] = None,
+        collector_key: Optional[str] = None,
+    ) -> Iterator[Optional["DagsterEvent"]]:
+        """Sends a task to the worker, and polls for the events it yields until it finishes the
+        task. Yields the same objects, and takes the same event_collector and collector_key
+        arguments, as execute_child_process_command.
+        """
+        check.invariant(self.can_accept_task, "Worker process cannot accept another task")
+        self._task_queue.put(task)
+        poll_timeout = 0 if event_collector else TICK
+        if event_collector:
+            event_collector.register(self._event_conn, self._process.sentinel)
+        try:
+            yield from self._poll_task_events(poll_timeout, event_collector, collector_key)
+        finally:
+            if event_collector:
+                event_collector.unregister(self._event_conn)
+
+    def _poll_task_events(
+        self,
+        poll_timeout: float,
+        event_collector: Optional[ChildProcessEventCollector],
+        collector_key: Optional[str],
+    ) -> Iterator[Optional["DagsterEvent"]]:
+        completed_properly = False
+        while not completed_properly:
+            event = _poll_for_event(
+                self._process, self._event_conn, poll_timeout, event_collector, collector_key
+            )
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
+
+            if isinstance(event, ChildProcessWorkerRetiringEvent):
+                self._retiring = True
+
+            yield event
+
+            if isinstance(event, ChildProcessSystemErrorEvent):
+                # the worker exits after a system error
+                self._retiring = True
+                completed_properly = True
+            elif isinstance(event, ChildProcessDoneEvent):
+                completed_properly = True
+
+        if not completed_properly:
+            self._retiring = True
+            self._process.join()
+            raise ChildProcessCrashException(exit_code=self._process.exitcode)
+
+    def shutdown(self, interrupt: bool = False) -> None:
+        """Stops the worker once it finishes its current task, or immediately if interrupt is set.
+        """
+        if interrupt:
+            self.term_event.set()
+        if self._process.is_alive() and not self._retiring:
+            self._task_queue.put(None)
+
+        # drain any events that haven't been consumed, otherwise the worker can block on exit
+        # while sending them
+        while self._process.is_alive():
+            try:
+                if self._event_conn.poll(TICK):
+                    self._event_conn.recv()
+            except EOFError:
+                break
+        self._process.join()
+        self._task_queue.close()
+        self._event_conn.close()
+
+
+class ChildProcessWorkerPool(AbstractContextManager):
+    """A pool of ChildProcessWorkers that are reused across tasks. Workers are started as needed,
+    so the pool grows to the maximum number of tasks that are executed at once. Workers that have
+    executed too many tasks or used too much memory are replaced with new ones.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        command: ChildProcessWorkerCommand,
+        max_tasks_per_worker: Optional[int] = None,
+        max_memory_bytes_per_worker: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._command = check.inst_param(command, "command", ChildProcessWorkerCommand)
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
+        self._max_memory_bytes_per_worker = check.opt_int_param(
+            max_memory_bytes_per_worker, "max_memory_bytes_per_worker"
+        )
+        self._idle_workers: List[ChildProcessWorker] = []
+        self._busy_workers: List[ChildProcessWorker] = []
+
+    def acquire(self) -> ChildProcessWorker:
+        """Returns an idle worker, starting a new one if none are available."""
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.can_accept_task:
+                break
+            worker.shutdown()
+        else:
+            worker = ChildProcessWorker(
+                self._multiprocessing_ctx,
+                self._command,
+                max_tasks=self._max_tasks_per_worker,
+                max_memory_bytes=self._max_memory_bytes_per_worker,
+            )
+
+        self._busy_workers.append(worker)
+        return worker
+
+    def release(self, worker: ChildProcessWorker) -> None:
+        """Returns a worker to the pool once it has finished a task."""
+        if worker not in self._busy_workers:
+            # already shut down with the pool
+            return
+
+        self._busy_workers.remove(worker)
+        if worker.can_accept_task:
+            self._idle_workers.append(worker)
+        else:
+            worker.shutdown()
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        # workers that are still busy were abandoned mid-task, so interrupt them
+        for worker in self._busy_workers:
+            worker.shutdown(interrupt=True)
+        for worker in self._idle_workers:
+            worker.shutdown()
+        self._busy_workers = []
+        self._idle_workers = []
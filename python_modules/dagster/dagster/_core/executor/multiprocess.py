@@ -1,8 +1,9 @@
 import multiprocessing
 import os
 import sys
+from contextlib import ExitStack, contextmanager
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence
 
 from dagster import (
     _check as check,
@@ -32,10 +33,15 @@
 from dagster._utils.timing import format_duration, time_execution_scope
 
 from .child_process_executor import (
+    TICK,
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessEvent,
+    ChildProcessEventCollector,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
@@ -45,6 +51,10 @@
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+# The number of steps whose event latency is included in the multiprocess executor's final
+# engine event
+MAX_REPORTED_EVENT_LATENCY_STEPS = 10
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -70,37 +80,113 @@ def __init__(
         self.repository_load_data = repository_load_data
 
     def execute(self) -> Iterator[DagsterEvent]:
-        recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             start_termination_thread(self.term_event)
-            execution_plan = create_execution_plan(
-                job=recon_job,
-                run_config=self.run_config,
-                step_keys_to_execute=[self.step_key],
-                known_state=self.known_state,
-                repository_load_data=self.repository_load_data,
+            yield from _execute_step_in_child_process(
+                instance,
+                self.recon_pipeline,
+                self.dagster_run,
+                self.run_config,
+                self.step_key,
+                self.retry_mode,
+                self.known_state,
+                self.repository_load_data,
+                message=f'Executing step "{self.step_key}" in subprocess.',
             )
 
-            log_manager = create_context_free_log_manager(instance, self.dagster_run)
 
-            yield DagsterEvent.step_worker_started(
-                log_manager,
-                self.dagster_run.job_name,
-                message=f'Executing step "{self.step_key}" in subprocess.',
-                metadata={
-                    "pid": MetadataValue.text(str(os.getpid())),
-                },
-                step_key=self.step_key,
-            )
+class MultiprocessExecutorWorkerTask(NamedTuple):
+    step_key: str
+    known_state: Optional[KnownExecutionState]
 
-            yield from execute_plan_iterator(
-                execution_plan,
-                recon_job,
-                self.dagster_run,
-                run_config=self.run_config,
-                retry_mode=self.retry_mode.for_inner_plan(),
-                instance=instance,
-            )
+
+class MultiprocessExecutorWorkerCommand(ChildProcessWorkerCommand):
+    """Executes steps of a run in a long-lived worker process, which loads the job definition and
+    opens the instance once rather than once per step.
+    """
+
+    def __init__(
+        self,
+        run_config: Mapping[str, object],
+        dagster_run: "DagsterRun",
+        instance_ref: "InstanceRef",
+        recon_pipeline: ReconstructableJob,
+        retry_mode: RetryMode,
+        repository_load_data: Optional[RepositoryLoadData],
+    ):
+        self.run_config = run_config
+        self.dagster_run = dagster_run
+        self.instance_ref = instance_ref
+        self.recon_pipeline = recon_pipeline
+        self.retry_mode = retry_mode
+        self.repository_load_data = repository_load_data
+        self._instance: Optional[DagsterInstance] = None
+
+    @contextmanager
+    def worker_context(self) -> Iterator[None]:
+        with DagsterInstance.from_ref(self.instance_ref) as instance:
+            self._instance = instance
+            # load the definition up front, it is cached for the lifetime of the worker
+            self.recon_pipeline.get_definition()
+            try:
+                yield
+            finally:
+                self._instance = None
+
+    def execute_task(self, task: MultiprocessExecutorWorkerTask) -> Iterator[DagsterEvent]:
+        check.inst_param(task, "task", MultiprocessExecutorWorkerTask)
+        yield from _execute_step_in_child_process(
+            check.not_none(self._instance),
+            self.recon_pipeline,
+            self.dagster_run,
+            self.run_config,
+            task.step_key,
+            self.retry_mode,
+            task.known_state,
+            self.repository_load_data,
+            message=f'Executing step "{task.step_key}" in worker process.',
+        )
+
+
+def _execute_step_in_child_process(
+    instance: DagsterInstance,
+    recon_job: ReconstructableJob,
+    dagster_run: "DagsterRun",
+    run_config: Mapping[str, object],
+    step_key: str,
+    retry_mode: RetryMode,
+    known_state: Optional[KnownExecutionState],
+    repository_load_data: Optional[RepositoryLoadData],
+    message: str,
+) -> Iterator[DagsterEvent]:
+    execution_plan = create_execution_plan(
+        job=recon_job,
+        run_config=run_config,
+        step_keys_to_execute=[step_key],
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+    log_manager = create_context_free_log_manager(instance, dagster_run)
+
+    yield DagsterEvent.step_worker_started(
+        log_manager,
+        dagster_run.job_name,
+        message=message,
+        metadata={
+            "pid": MetadataValue.text(str(os.getpid())),
+        },
+        step_key=step_key,
+    )
+
+    yield from execute_plan_iterator(
+        execution_plan,
+        recon_job,
+        dagster_run,
+        run_config=run_config,
+        retry_mode=retry_mode.for_inner_plan(),
+        instance=instance,
+    )
 
 
 class MultiprocessExecutor(Executor):
@@ -111,6 +197,9 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        reuse_processes: bool = False,
+        max_steps_per_process: Optional[int] = None,
+        max_process_memory_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -138,6 +227,13 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._reuse_processes = check.bool_param(reuse_processes, "reuse_processes")
+        self._max_steps_per_process = check.opt_int_param(
+            max_steps_per_process, "max_steps_per_process"
+        )
+        self._max_process_memory_mb = check.opt_int_param(
+            max_process_memory_mb, "max_process_memory_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -186,7 +282,30 @@ def execute(
             ),
         )
 
-        with time_execution_scope() as timer_result:
+        with time_execution_scope() as timer_result, ExitStack() as stack:
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        MultiprocessExecutorWorkerCommand(
+                            run_config=plan_context.run_config,
+                            dagster_run=plan_context.dagster_run,
+                            instance_ref=plan_context.instance.get_ref(),
+                            recon_pipeline=job,
+                            retry_mode=self.retries,
+                            repository_load_data=execution_plan.repository_load_data,
+                        ),
+                        max_tasks_per_worker=self._max_steps_per_process,
+                        max_memory_bytes_per_worker=(
+                            self._max_process_memory_mb * 1024 * 1024
+                            if self._max_process_memory_mb is not None
+                            else None
+                        ),
+                    )
+                )
+                if self._reuse_processes
+                else None
+            )
             with ActiveExecution(
                 execution_plan,
                 retry_mode=self.retries,
@@ -197,6 +316,7 @@ def execute(
                 errors: Dict[int, SerializableErrorInfo] = {}
                 term_events: Dict[str, Any] = {}
                 stopping: bool = False
+                event_collector = ChildProcessEventCollector()
 
                 while (not stopping and not active_execution.is_complete) or active_iters:
                     if active_execution.check_for_interrupts():
@@ -223,6 +343,20 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
+                            if worker_pool:
+                                worker = worker_pool.acquire()
+                                term_events[step.key] = worker.term_event
+                                active_iters[step.key] = execute_step_in_worker_process(
+                                    worker_pool,
+                                    worker,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    active_execution.get_known_state(),
+                                    event_collector,
+                                )
+                                continue
+
                             term_events[step.key] = multiproc_ctx.Event()
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
@@ -234,16 +368,19 @@ def execute(
                                 self.retries,
                                 active_execution.get_known_state(),
                                 execution_plan.repository_load_data,
+                                event_collector,
                             )
 
-                    # process active iterators
+                    # process active iterators, none of which block waiting for their child
                     empty_iters = []
+                    received_event = False
                     for key, step_iter in active_iters.items():
                         try:
                             event_or_none = next(step_iter)
                             if event_or_none is None:
                                 continue
                             else:
+                                received_event = True
                                 yield event_or_none
                                 active_execution.handle_event(event_or_none)
 
@@ -285,6 +422,11 @@ def execute(
                     # process skipped and abandoned steps
                     yield from active_execution.plan_events_iterator(plan_context)
 
+                    # if no child had anything to report, wait until any of them does rather
+                    # than spinning
+                    if active_iters and not received_event and not empty_iters:
+                        event_collector.wait(timeout=TICK)
+
                 errs = {pid: err for pid, err in errors.items() if err}
 
                 # After termination starts, raise an interrupted exception once all subprocesses
@@ -324,10 +466,36 @@ def execute(
             "Multiprocess executor: parent process exiting after {duration} (pid: {pid})".format(
                 duration=format_duration(timer_result.millis), pid=os.getpid()
             ),
-            event_specific_data=EngineEventData.multiprocess(os.getpid()),
+            event_specific_data=EngineEventData(
+                metadata={
+                    **EngineEventData.multiprocess(os.getpid()).metadata,
+                    **_event_latency_metadata(event_collector),
+                }
+            ),
         )
 
 
+def _event_latency_metadata(
+    event_collector: ChildProcessEventCollector,
+) -> Mapping[str, MetadataValue]:
+    latency_stats = event_collector.latency_stats
+    if not latency_stats:
+        return {}
+
+    num_events = sum(stats.num_events for stats in latency_stats.values())
+    total_latency = sum(stats.total_latency for stats in latency_stats.values())
+    slowest_steps = sorted(
+        latency_stats.items(), key=lambda item: item[1].max_latency, reverse=True
+    )[:MAX_REPORTED_EVENT_LATENCY_STEPS]
+    return {
+        "mean_event_latency_ms": MetadataValue.float(1000 * total_latency / num_events),
+        "max_event_latency_ms": MetadataValue.float(1000 * slowest_steps[0][1].max_latency),
+        "max_event_latency_ms_by_step": MetadataValue.json(
+            {step_key: round(1000 * stats.max_latency, 3) for step_key, stats in slowest_steps}
+        ),
+    }
+
+
 def execute_step_out_of_process(
     multiproc_ctx: MultiprocessingBaseContext,
     recon_job: ReconstructableJob,
@@ -338,6 +506,7 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    event_collector: Optional[ChildProcessEventCollector] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -357,7 +526,9 @@ def execute_step_out_of_process(
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    for ret in execute_child_process_command(
+        multiproc_ctx, command, event_collector=event_collector, collector_key=step.key
+    ):
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -365,3 +536,35 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+def execute_step_in_worker_process(
+    worker_pool: ChildProcessWorkerPool,
+    worker: ChildProcessWorker,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    known_state: KnownExecutionState,
+    event_collector: Optional[ChildProcessEventCollector] = None,
+) -> Iterator[Optional[DagsterEvent]]:
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Sending step "{step.key}" to worker process (pid: {worker.pid}).',
+        metadata={},
+    )
+
+    try:
+        for ret in worker.execute_task(
+            MultiprocessExecutorWorkerTask(step_key=step.key, known_state=known_state),
+            event_collector=event_collector,
+            collector_key=step.key,
+        ):
+            if ret is None or isinstance(ret, DagsterEvent):
+                yield ret
+            elif isinstance(ret, ChildProcessEvent):
+                if isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid] = ret.error_info
+            else:
+                check.failed(f"Unexpected return value from worker process {type(ret)}")
+    finally:
+        worker_pool.release(worker)
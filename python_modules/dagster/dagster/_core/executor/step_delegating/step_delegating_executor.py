@@ -1,7 +1,7 @@
 import os
 import sys
 import time
-from typing import Any, Dict, List, Optional, Sequence, cast
+from typing import Any, Dict, Iterator, List, Optional, Sequence, cast
 
 import pendulum
 
@@ -15,6 +15,7 @@
 from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
+from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._utils.error import serializable_error_info_from_exc_info
 
@@ -69,12 +70,23 @@ def __init__(
     def retries(self):
         return self._retries
 
+    def _iter_events(self, instance, run_id) -> Iterator[DagsterEvent]:
+        # the cursor is the offset of the last consumed event among the run's dagster events, and
+        # advances as the events are consumed
+        for record in instance.iter_records_for_run(
+            run_id,
+            cursor=EventLogCursor.from_offset(self._event_cursor + 1).to_string(),
+            of_type=set(DagsterEventType),
+        ):
+            dagster_event = record.event_log_entry.dagster_event
+            check.invariant(
+                dagster_event is not None, "Query should not return a non dagster event"
+            )
+            self._event_cursor += 1
+            yield dagster_event
+
     def _pop_events(self, instance, run_id) -> Sequence[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
-        self._event_cursor += len(events)
-        dagster_events = [event.dagster_event for event in events]
-        check.invariant(None not in dagster_events, "Query should not return a non dagster event")
-        return dagster_events
+        return list(self._iter_events(instance, run_id))
 
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
@@ -122,14 +134,14 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                     EngineEventData(),
                 )
 
-                prior_events = self._pop_events(
-                    plan_context.instance,
-                    plan_context.run_id,
-                )
-                for dagster_event in prior_events:
+                # the prior events are streamed from the event log rather than loaded all at once,
+                # since runs being resumed may have very large event logs
+                for dagster_event in active_execution.replay_events(
+                    self._iter_events(plan_context.instance, plan_context.run_id)
+                ):
                     yield dagster_event
 
-                possibly_in_flight_steps = active_execution.rebuild_from_events(prior_events)
+                possibly_in_flight_steps = active_execution.get_possibly_in_flight_steps()
                 for step in possibly_in_flight_steps:
                     step_handler_context = self._get_step_handler_context(
                         plan_context, [step], active_execution
@@ -46,9 +46,11 @@
 from dagster._core.origin import JobPythonOrigin, RepositoryPythonOrigin
 from dagster._core.snap import ExecutionPlanSnapshot
 from dagster._core.snap.execution_plan_snapshot import ExecutionStepSnap
+from dagster._core.storage.tags import MEMOIZED_RUN_TAG
 from dagster._core.utils import toposort
 from dagster._serdes import create_snapshot_id
 from dagster._utils.cached_method import cached_method
+from dagster._utils.merger import merge_dicts
 from dagster._utils.schedules import schedule_execution_time_iterator
 
 from .external_data import (
@@ -419,6 +421,15 @@ def tags(self) -> Mapping[str, object]:
     def metadata(self) -> Mapping[str, MetadataValue]:
         return self._job_index.job_snapshot.metadata
 
+    def is_using_memoization(self, run_tags: Mapping[str, str]) -> bool:
+        """Whether the execution plans of runs of the job with the given tags are memoized, see
+        `JobDefinition.is_using_memoization`.
+        """
+        tags = merge_dicts(self.tags, run_tags)
+        if tags.get(MEMOIZED_RUN_TAG) == "false":
+            return False
+        return tags.get(MEMOIZED_RUN_TAG) == "true" or self.external_job_data.has_version_strategy
+
     @property
     def computed_job_snapshot_id(self) -> str:
         return self._snapshot_id
@@ -8,6 +8,7 @@
 from collections import defaultdict
 from enum import Enum
 from typing import (
+    AbstractSet,
     Any,
     Dict,
     Iterable,
@@ -88,7 +89,7 @@
 from dagster._core.errors import DagsterInvalidDefinitionError
 from dagster._core.snap import JobSnapshot
 from dagster._core.snap.mode import ResourceDefSnap, build_resource_def_snap
-from dagster._serdes import whitelist_for_serdes
+from dagster._serdes import create_snapshot_id, whitelist_for_serdes
 from dagster._utils.error import SerializableErrorInfo
 
 DEFAULT_MODE_NAME = "default"
@@ -273,6 +274,7 @@ class ExternalJobData(
             ("job_snapshot", JobSnapshot),
             ("active_presets", Sequence["ExternalPresetData"]),
             ("parent_job_snapshot", Optional[JobSnapshot]),
+            ("has_version_strategy", bool),
         ],
     )
 ):
@@ -282,6 +284,7 @@ def __new__(
         job_snapshot: JobSnapshot,
         active_presets: Sequence["ExternalPresetData"],
         parent_job_snapshot: Optional[JobSnapshot],
+        has_version_strategy: bool = False,
     ):
         return super(ExternalJobData, cls).__new__(
             cls,
@@ -293,6 +296,7 @@ def __new__(
             active_presets=check.sequence_param(
                 active_presets, "active_presets", of_type=ExternalPresetData
             ),
+            has_version_strategy=check.bool_param(has_version_strategy, "has_version_strategy"),
         )
 
 
@@ -560,6 +564,164 @@ def __new__(cls, error: Optional[SerializableErrorInfo]):
         )
 
 
+# The fields of ExternalRepositoryData whose elements are transferred as individual,
+# content-addressed pieces by `ExternalRepositoryDelta`.
+EXTERNAL_REPOSITORY_PIECE_FIELDS: Final = (
+    "external_schedule_datas",
+    "external_partition_set_datas",
+    "external_sensor_datas",
+    "external_asset_graph_data",
+    "external_job_datas",
+    "external_job_refs",
+    "external_resource_data",
+)
+
+
+@whitelist_for_serdes
+class ExternalRepositoryManifest(
+    NamedTuple(
+        "_ExternalRepositoryManifest",
+        [
+            ("name", str),
+            ("piece_ids", Mapping[str, Optional[Sequence[str]]]),
+            ("utilized_env_vars", Optional[Mapping[str, Sequence["EnvVarConsumer"]]]),
+        ],
+    )
+):
+    """An ExternalRepositoryData in which the element of each piece field has been replaced with
+    the hash of its serialized representation.
+    """
+
+    def __new__(
+        cls,
+        name: str,
+        piece_ids: Mapping[str, Optional[Sequence[str]]],
+        utilized_env_vars: Optional[Mapping[str, Sequence["EnvVarConsumer"]]] = None,
+    ):
+        return super(ExternalRepositoryManifest, cls).__new__(
+            cls,
+            name=check.str_param(name, "name"),
+            piece_ids=check.mapping_param(piece_ids, "piece_ids", key_type=str),
+            utilized_env_vars=check.opt_nullable_mapping_param(
+                utilized_env_vars, "utilized_env_vars", key_type=str
+            ),
+        )
+
+    @property
+    def all_piece_ids(self) -> AbstractSet[str]:
+        return {piece_id for piece_ids in self.piece_ids.values() for piece_id in (piece_ids or [])}
+
+
+@whitelist_for_serdes
+class ExternalRepositoryDelta(
+    NamedTuple(
+        "_ExternalRepositoryDelta",
+        [
+            ("manifest", ExternalRepositoryManifest),
+            ("pieces", Mapping[str, NamedTuple]),
+        ],
+    )
+):
+    """The manifest of an ExternalRepositoryData, along with the pieces that the requesting client
+    did not already have.
+    """
+
+    def __new__(cls, manifest: ExternalRepositoryManifest, pieces: Mapping[str, NamedTuple]):
+        return super(ExternalRepositoryDelta, cls).__new__(
+            cls,
+            manifest=check.inst_param(manifest, "manifest", ExternalRepositoryManifest),
+            pieces=check.mapping_param(pieces, "pieces", key_type=str),
+        )
+
+
+# The id of each piece of an ExternalRepositoryData, keyed by the identity of the piece object. The
+# piece is kept alongside its id so that the object, and so its identity, stays alive.
+ExternalRepositoryPieceIds = Mapping[int, Tuple[NamedTuple, str]]
+
+
+def get_external_repository_piece_ids(
+    external_repository_data: ExternalRepositoryData,
+    cached_piece_ids: Optional[ExternalRepositoryPieceIds] = None,
+) -> ExternalRepositoryPieceIds:
+    """Computes the ids of the pieces of an ExternalRepositoryData. The ids in `cached_piece_ids`
+    are reused for the same piece objects, rather than serializing those pieces again.
+    """
+    check.inst_param(external_repository_data, "external_repository_data", ExternalRepositoryData)
+    cached_piece_ids = check.opt_mapping_param(cached_piece_ids, "cached_piece_ids", key_type=int)
+
+    piece_ids: Dict[int, Tuple[NamedTuple, str]] = {}
+    for field in EXTERNAL_REPOSITORY_PIECE_FIELDS:
+        for piece in getattr(external_repository_data, field) or []:
+            cached = cached_piece_ids.get(id(piece))
+            if cached is not None and cached[0] is piece:
+                piece_ids[id(piece)] = cached
+            else:
+                piece_ids[id(piece)] = (piece, create_snapshot_id(piece))
+    return piece_ids
+
+
+def external_repository_delta_from_data(
+    external_repository_data: ExternalRepositoryData,
+    known_piece_ids: AbstractSet[str],
+    piece_ids_by_object: Optional[ExternalRepositoryPieceIds] = None,
+) -> ExternalRepositoryDelta:
+    check.inst_param(external_repository_data, "external_repository_data", ExternalRepositoryData)
+    check.set_param(known_piece_ids, "known_piece_ids", of_type=str)
+    if piece_ids_by_object is None:
+        piece_ids_by_object = get_external_repository_piece_ids(external_repository_data)
+
+    piece_ids: Dict[str, Optional[Sequence[str]]] = {}
+    pieces: Dict[str, NamedTuple] = {}
+    for field in EXTERNAL_REPOSITORY_PIECE_FIELDS:
+        field_pieces = getattr(external_repository_data, field)
+        if field_pieces is None:
+            piece_ids[field] = None
+            continue
+
+        field_piece_ids = []
+        for piece in field_pieces:
+            piece_id = piece_ids_by_object[id(piece)][1]
+            field_piece_ids.append(piece_id)
+            if piece_id not in known_piece_ids:
+                pieces[piece_id] = piece
+        piece_ids[field] = field_piece_ids
+
+    return ExternalRepositoryDelta(
+        manifest=ExternalRepositoryManifest(
+            name=external_repository_data.name,
+            piece_ids=piece_ids,
+            utilized_env_vars=external_repository_data.utilized_env_vars,
+        ),
+        pieces=pieces,
+    )
+
+
+def external_repository_data_from_delta(
+    delta: ExternalRepositoryDelta, cached_pieces: Mapping[str, NamedTuple]
+) -> ExternalRepositoryData:
+    check.inst_param(delta, "delta", ExternalRepositoryDelta)
+    check.mapping_param(cached_pieces, "cached_pieces", key_type=str)
+
+    def _get_piece(piece_id: str) -> NamedTuple:
+        piece = delta.pieces.get(piece_id) or cached_pieces.get(piece_id)
+        if piece is None:
+            check.failed(
+                f"Piece {piece_id} of repository {delta.manifest.name} was not transferred"
+            )
+        return piece
+
+    return ExternalRepositoryData(
+        name=delta.manifest.name,
+        utilized_env_vars=delta.manifest.utilized_env_vars,
+        **{
+            field: [_get_piece(piece_id) for piece_id in piece_ids]
+            if piece_ids is not None
+            else None
+            for field, piece_ids in delta.manifest.piece_ids.items()
+        },
+    )
+
+
 @whitelist_for_serdes
 class ExternalSensorExecutionErrorData(
     NamedTuple("_ExternalSensorExecutionErrorData", [("error", Optional[SerializableErrorInfo])])
@@ -1493,6 +1655,7 @@ def external_job_data_from_def(job_def: JobDefinition) -> ExternalJobData:
         job_snapshot=job_def.get_job_snapshot(),
         parent_job_snapshot=job_def.get_parent_job_snapshot(),
         active_presets=active_presets_from_job_def(job_def),
+        has_version_strategy=job_def.version_strategy is not None,
     )
 
 
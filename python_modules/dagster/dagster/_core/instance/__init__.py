@@ -4,6 +4,7 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import weakref
 from collections import defaultdict
@@ -17,6 +18,7 @@
     Callable,
     Dict,
     Generic,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -33,7 +35,7 @@
 
 import dagster._check as check
 from dagster._annotations import public
-from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.pipeline_base import InMemoryJob
 from dagster._core.errors import (
     DagsterHomeNotSetError,
@@ -72,6 +74,8 @@
 
 from .config import (
     DAGSTER_CONFIG_YAML_FILENAME,
+    DEFAULT_EVENT_LOG_BATCH_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_EVENT_LOG_BATCH_SIZE,
     DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT,
     get_default_tick_retention_settings,
     get_tick_retention_settings,
@@ -216,6 +220,25 @@ def emit(self, record: DagsterLogRecord) -> None:
                 )
 
 
+class _PersistedSnapshotIds:
+    """The ids of the snapshots that have been persisted while creating a batch of runs.
+
+    Snapshots are tracked by object identity, since callers pass the same snapshot objects for
+    many runs, and computing a snapshot id means serializing and hashing the whole snapshot. The
+    snapshots are held on to so that their ids can't be reused by other objects.
+    """
+
+    def __init__(self):
+        self._snapshot_ids: Dict[int, Tuple[object, str]] = {}
+
+    def get(self, snapshot: object) -> Optional[str]:
+        entry = self._snapshot_ids.get(id(snapshot))
+        return entry[1] if entry else None
+
+    def add(self, snapshot: object, snapshot_id: str) -> None:
+        self._snapshot_ids[id(snapshot)] = (snapshot, snapshot_id)
+
+
 class InstanceType(Enum):
     PERSISTENT = "PERSISTENT"
     EPHEMERAL = "EPHEMERAL"
@@ -407,6 +430,11 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        # events held by handle_new_event until the next flush, when event log batching is enabled
+        self._event_buffer: List[EventLogEntry] = []
+        self._event_buffer_flush_timer: Optional[threading.Timer] = None
+        self._event_buffer_lock = threading.RLock()
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         self._run_monitoring_enabled = run_monitoring_enabled
         if self.run_monitoring_enabled and self.run_monitoring_max_resume_run_attempts:
@@ -793,6 +821,22 @@ def run_retries_enabled(self) -> bool:
     def run_retries_max_retries(self) -> int:
         return self.get_settings("run_retries").get("max_retries")
 
+    @property
+    def event_log_batching_enabled(self) -> bool:
+        return self.get_settings("event_log_batching").get("enabled", False)
+
+    @property
+    def event_log_batching_max_batch_size(self) -> int:
+        return self.get_settings("event_log_batching").get(
+            "max_batch_size", DEFAULT_EVENT_LOG_BATCH_SIZE
+        )
+
+    @property
+    def event_log_batching_flush_interval_seconds(self) -> float:
+        return self.get_settings("event_log_batching").get(
+            "flush_interval_seconds", DEFAULT_EVENT_LOG_BATCH_FLUSH_INTERVAL_SECONDS
+        )
+
     @property
     def auto_materialize_enabled(self) -> bool:
         return self.get_settings("auto_materialize").get("enabled", True)
@@ -858,6 +902,7 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self.flush_event_buffer()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
@@ -941,6 +986,12 @@ def get_run_tags(
             tag_keys=tag_keys, value_prefix=value_prefix, limit=limit
         )
 
+    @traced
+    def get_run_tags_by_run_id(
+        self, filters: RunsFilter, tag_keys: Sequence[str]
+    ) -> Mapping[str, Mapping[str, str]]:
+        return self._run_storage.get_run_tags_by_run_id(filters, tag_keys)
+
     @traced
     def get_run_tag_keys(self) -> Sequence[str]:
         return self._run_storage.get_run_tag_keys()
@@ -1044,6 +1095,7 @@ def _construct_run_with_snapshots(
         solid_selection: Optional[Sequence[str]] = None,
         external_job_origin: Optional["ExternalJobOrigin"] = None,
         job_code_origin: Optional[JobPythonOrigin] = None,
+        persisted_snapshot_ids: Optional[_PersistedSnapshotIds] = None,
     ) -> DagsterRun:
         # https://github.com/dagster-io/dagster/issues/2403
         if tags and IS_AIRFLOW_INGEST_PIPELINE_STR in tags:
@@ -1062,19 +1114,26 @@ def _construct_run_with_snapshots(
             ),
         )
 
-        job_snapshot_id = (
-            self._ensure_persisted_job_snapshot(job_snapshot, parent_job_snapshot)
-            if job_snapshot
-            else None
-        )
+        if persisted_snapshot_ids is None:
+            persisted_snapshot_ids = _PersistedSnapshotIds()
 
-        execution_plan_snapshot_id = (
-            self._ensure_persisted_execution_plan_snapshot(
-                execution_plan_snapshot, job_snapshot_id, step_keys_to_execute
-            )
-            if execution_plan_snapshot and job_snapshot_id
-            else None
-        )
+        job_snapshot_id = None
+        if job_snapshot:
+            job_snapshot_id = persisted_snapshot_ids.get(job_snapshot)
+            if job_snapshot_id is None:
+                job_snapshot_id = self._ensure_persisted_job_snapshot(
+                    job_snapshot, parent_job_snapshot
+                )
+                persisted_snapshot_ids.add(job_snapshot, job_snapshot_id)
+
+        execution_plan_snapshot_id = None
+        if execution_plan_snapshot and job_snapshot_id:
+            execution_plan_snapshot_id = persisted_snapshot_ids.get(execution_plan_snapshot)
+            if execution_plan_snapshot_id is None:
+                execution_plan_snapshot_id = self._ensure_persisted_execution_plan_snapshot(
+                    execution_plan_snapshot, job_snapshot_id, step_keys_to_execute
+                )
+                persisted_snapshot_ids.add(execution_plan_snapshot, execution_plan_snapshot_id)
 
         return DagsterRun(
             job_name=job_name,
@@ -1243,6 +1302,84 @@ def create_run(
         solid_selection: Optional[Sequence[str]],
         external_job_origin: Optional["ExternalJobOrigin"],
         job_code_origin: Optional[JobPythonOrigin],
+    ) -> DagsterRun:
+        dagster_run = self._construct_run(
+            job_name=job_name,
+            run_id=run_id,
+            run_config=run_config,
+            status=status,
+            tags=tags,
+            root_run_id=root_run_id,
+            parent_run_id=parent_run_id,
+            step_keys_to_execute=step_keys_to_execute,
+            execution_plan_snapshot=execution_plan_snapshot,
+            job_snapshot=job_snapshot,
+            parent_job_snapshot=parent_job_snapshot,
+            asset_selection=asset_selection,
+            solids_to_execute=solids_to_execute,
+            solid_selection=solid_selection,
+            external_job_origin=external_job_origin,
+            job_code_origin=job_code_origin,
+        )
+
+        dagster_run = self._run_storage.add_run(dagster_run)
+
+        if execution_plan_snapshot:
+            self._log_asset_materialization_planned_events(dagster_run, execution_plan_snapshot)
+
+        return dagster_run
+
+    def create_runs(self, run_args: Sequence[Mapping[str, Any]]) -> Sequence[DagsterRun]:
+        """Creates a batch of runs, writing them to the run storage together.
+
+        Each distinct job and execution plan snapshot is only persisted once for the batch, which
+        makes this much cheaper than calling ``create_run`` for each run when many runs are created
+        for the same job, e.g. by a sensor tick or a backfill.
+
+        Args:
+            run_args (Sequence[Mapping[str, Any]]): The keyword arguments to ``create_run`` for
+                each run.
+
+        Returns:
+            Sequence[DagsterRun]: The created runs, in the same order as ``run_args``.
+        """
+        check.sequence_param(run_args, "run_args", of_type=Mapping)
+
+        persisted_snapshot_ids = _PersistedSnapshotIds()
+        dagster_runs = [
+            self._construct_run(**args, persisted_snapshot_ids=persisted_snapshot_ids)
+            for args in run_args
+        ]
+
+        dagster_runs = self._run_storage.add_runs(dagster_runs)
+
+        for dagster_run, args in zip(dagster_runs, run_args):
+            execution_plan_snapshot = args["execution_plan_snapshot"]
+            if execution_plan_snapshot:
+                self._log_asset_materialization_planned_events(dagster_run, execution_plan_snapshot)
+
+        return dagster_runs
+
+    def _construct_run(
+        self,
+        *,
+        job_name: str,
+        run_id: Optional[str],
+        run_config: Optional[Mapping[str, object]],
+        status: Optional[DagsterRunStatus],
+        tags: Optional[Mapping[str, Any]],
+        root_run_id: Optional[str],
+        parent_run_id: Optional[str],
+        step_keys_to_execute: Optional[Sequence[str]],
+        execution_plan_snapshot: Optional[ExecutionPlanSnapshot],
+        job_snapshot: Optional[JobSnapshot],
+        parent_job_snapshot: Optional[JobSnapshot],
+        asset_selection: Optional[AbstractSet[AssetKey]],
+        solids_to_execute: Optional[AbstractSet[str]],
+        solid_selection: Optional[Sequence[str]],
+        external_job_origin: Optional["ExternalJobOrigin"],
+        job_code_origin: Optional[JobPythonOrigin],
+        persisted_snapshot_ids: Optional[_PersistedSnapshotIds] = None,
     ) -> DagsterRun:
         from dagster._core.definitions.utils import validate_tags
         from dagster._core.host_representation.origin import ExternalJobOrigin
@@ -1340,7 +1477,7 @@ def create_run(
         check.opt_inst_param(external_job_origin, "external_job_origin", ExternalJobOrigin)
         check.opt_inst_param(job_code_origin, "job_code_origin", JobPythonOrigin)
 
-        dagster_run = self._construct_run_with_snapshots(
+        return self._construct_run_with_snapshots(
             job_name=job_name,
             run_id=run_id,  # type: ignore  # (possible none)
             run_config=run_config,
@@ -1357,15 +1494,9 @@ def create_run(
             parent_job_snapshot=parent_job_snapshot,
             external_job_origin=external_job_origin,
             job_code_origin=job_code_origin,
+            persisted_snapshot_ids=persisted_snapshot_ids,
         )
 
-        dagster_run = self._run_storage.add_run(dagster_run)
-
-        if execution_plan_snapshot:
-            self._log_asset_materialization_planned_events(dagster_run, execution_plan_snapshot)
-
-        return dagster_run
-
     def create_reexecuted_run(
         self,
         *,
@@ -1649,6 +1780,20 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit)
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator["EventLogRecord"]:
+        """Iterate over the event log records of a run, loading them from storage in chunks so
+        that memory use doesn't grow with the size of the run's event log.
+        """
+        if chunk_size is None:
+            return self._event_storage.iter_records_for_run(run_id, cursor, of_type)
+        return self._event_storage.iter_records_for_run(run_id, cursor, of_type, chunk_size)
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -1725,6 +1870,20 @@ def get_event_records(
         """
         return self._event_storage.get_event_records(event_records_filter, limit, ascending)
 
+    @traced
+    def get_event_record_asset_keys(
+        self,
+        event_records_filter: "EventRecordsFilter",
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[Tuple[int, Optional[AssetKey]]]:
+        """Return the storage id and asset key of each event record that matches the filter,
+        without loading the events themselves.
+        """
+        return self._event_storage.get_event_record_asset_keys(
+            event_records_filter, limit, ascending
+        )
+
     @public
     @traced
     def get_asset_records(
@@ -1771,6 +1930,29 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         return self._event_storage.get_materialization_count_by_partition(asset_keys, after_cursor)
 
+    @traced
+    def get_latest_materialization_records(
+        self,
+        asset_partitions: Sequence[AssetKeyPartitionKey],
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[AssetKeyPartitionKey, "EventLogRecord"]:
+        """Return the latest materialization record for each of the given asset partitions, in as
+        few queries as the event log storage allows. Asset partitions without a partition key
+        refer to the latest materialization of the asset across all of its partitions.
+
+        Args:
+            asset_partitions (Sequence[AssetKeyPartitionKey]): The asset partitions to query.
+            after_cursor (Optional[int]): Only records with a storage_id greater than this value
+                will be considered.
+
+        Returns:
+            Mapping[AssetKeyPartitionKey, EventLogRecord]: The latest materialization record for
+                each asset partition that has been materialized after the cursor.
+        """
+        return self._event_storage.get_latest_materialization_records(
+            asset_partitions, after_cursor
+        )
+
     @public
     @traced
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
@@ -1858,15 +2040,66 @@ def store_event(self, event: EventLogEntry) -> None:
         self._event_storage.store_event(event)
 
     def handle_new_event(self, event: EventLogEntry) -> None:
-        run_id = event.run_id
+        if not self.event_log_batching_enabled:
+            self._store_and_dispatch_events([event])
+            return
 
-        self._event_storage.store_event(event)
+        with self._event_buffer_lock:
+            if not self._event_buffer:
+                # flush events that are still buffered after the flush interval even if no further
+                # events arrive, e.g. during long-running compute after a burst of log messages
+                self._event_buffer_flush_timer = threading.Timer(
+                    self.event_log_batching_flush_interval_seconds, self.flush_event_buffer
+                )
+                self._event_buffer_flush_timer.daemon = True
+                self._event_buffer_flush_timer.start()
+            self._event_buffer.append(event)
+
+            if self._should_flush_event_buffer(event):
+                self.flush_event_buffer()
+
+    def flush_event_buffer(self) -> None:
+        """Writes any events held back by event log batching to the event log storage, and
+        dispatches them to run storage and event listeners.
+        """
+        with self._event_buffer_lock:
+            if self._event_buffer_flush_timer:
+                self._event_buffer_flush_timer.cancel()
+                self._event_buffer_flush_timer = None
+
+            if not self._event_buffer:
+                return
+
+            events = self._event_buffer
+            self._event_buffer = []
+            self._store_and_dispatch_events(events)
+
+    def _should_flush_event_buffer(self, event: EventLogEntry) -> bool:
+        from dagster._core.events import STEP_BOUNDARY_EVENTS
+
+        # Events emitted outside of a step (run status changes, orchestration engine events,
+        # planned materializations) and step boundaries are written immediately along with any
+        # buffered events, so that run status and step state in storage are never stale.
+        if not event.step_key:
+            return True
+
+        if event.is_dagster_event and event.get_dagster_event().event_type in STEP_BOUNDARY_EVENTS:
+            return True
+
+        return len(self._event_buffer) >= self.event_log_batching_max_batch_size
+
+    def _store_and_dispatch_events(self, events: Sequence[EventLogEntry]) -> None:
+        if len(events) == 1:
+            self._event_storage.store_event(events[0])
+        else:
+            self._event_storage.store_events(events)
 
-        if event.is_dagster_event and event.get_dagster_event().is_job_event:
-            self._run_storage.handle_run_event(run_id, event.get_dagster_event())
+        for event in events:
+            if event.is_dagster_event and event.get_dagster_event().is_job_event:
+                self._run_storage.handle_run_event(event.run_id, event.get_dagster_event())
 
-        for sub in self._subscribers[run_id]:
-            sub(event)
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
 
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
@@ -7,7 +7,15 @@
     Bool,
     _check as check,
 )
-from dagster._config import Field, Permissive, ScalarUnion, Selector, StringSource, validate_config
+from dagster._config import (
+    Field,
+    IntSource,
+    Permissive,
+    ScalarUnion,
+    Selector,
+    StringSource,
+    validate_config,
+)
 from dagster._core.errors import DagsterInvalidConfigError
 from dagster._core.storage.config import mysql_config, pg_config
 from dagster._serdes import class_from_code_pointer
@@ -174,6 +182,9 @@ def python_logs_config_schema() -> Field:
 
 DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT = 180
 
+DEFAULT_EVENT_LOG_BATCH_SIZE = 1000
+DEFAULT_EVENT_LOG_BATCH_FLUSH_INTERVAL_SECONDS = 1.0
+
 
 def get_default_tick_retention_settings(
     instigator_type: "InstigatorType",
@@ -251,6 +262,23 @@ def sensors_daemon_config() -> Field:
         {
             "use_threads": Field(Bool, is_required=False, default_value=False),
             "num_workers": Field(int, is_required=False),
+            "num_shards": Field(
+                IntSource,
+                is_required=False,
+                description=(
+                    "Split the running sensors across this many sensor daemon replicas. Each"
+                    " sensor is evaluated by exactly one replica, picked by a stable hash of its"
+                    " origin."
+                ),
+            ),
+            "shard_index": Field(
+                IntSource,
+                is_required=False,
+                description=(
+                    "Which shard of the sensors this sensor daemon is responsible for, between 0"
+                    " and num_shards - 1."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -321,6 +349,14 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
             },
             is_required=False,
         ),
+        "event_log_batching": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "max_batch_size": Field(int, is_required=False),
+                "flush_interval_seconds": Field(float, is_required=False),
+            },
+            is_required=False,
+        ),
         "secrets": secrets_loader_config_schema(),
         "retention": retention_config_schema(),
         "sensors": sensors_daemon_config(),
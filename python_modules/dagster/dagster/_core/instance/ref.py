@@ -454,6 +454,7 @@ def from_dir(
             "schedules",
             "nux",
             "auto_materialize",
+            "event_log_batching",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
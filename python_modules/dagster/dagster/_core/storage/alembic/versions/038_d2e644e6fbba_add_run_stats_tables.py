@@ -0,0 +1,88 @@
+"""add run stats tables
+
+Revision ID: d2e644e6fbba
+Revises: d9092588866f
+Create Date: 2023-03-20 10:12:45.516410
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "d2e644e6fbba"
+down_revision = "d9092588866f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("run_stats"):
+        op.create_table(
+            "run_stats",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("steps_succeeded", db.Integer, nullable=False),
+            db.Column("steps_failed", db.Integer, nullable=False),
+            db.Column("materializations", db.Integer, nullable=False),
+            db.Column("expectations", db.Integer, nullable=False),
+            db.Column("enqueued_time", db.Float),
+            db.Column("launch_time", db.Float),
+            db.Column("start_time", db.Float),
+            db.Column("end_time", db.Float),
+        )
+        op.create_index(
+            "idx_run_stats",
+            "run_stats",
+            ["run_id"],
+            mysql_length=64,
+            unique=True,
+        )
+
+    if not has_table("run_step_stats"):
+        op.create_table(
+            "run_step_stats",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("status", db.String(63)),
+            db.Column("start_time", db.Float),
+            db.Column("end_time", db.Float),
+            db.Column("attempts", db.Integer),
+            db.Column("attempt_start_time", db.Float),
+            db.Column("attempts_body", db.Text),
+            db.Column("markers_body", db.Text),
+            db.Column("version", db.Integer, nullable=False, default=0),
+        )
+        op.create_index(
+            "idx_run_step_stats",
+            "run_step_stats",
+            ["run_id", "step_key"],
+            mysql_length={"run_id": 64, "step_key": 64},
+            unique=True,
+        )
+
+
+def downgrade():
+    if has_index("run_step_stats", "idx_run_step_stats"):
+        op.drop_index("idx_run_step_stats", "run_step_stats")
+
+    if has_table("run_step_stats"):
+        op.drop_table("run_step_stats")
+
+    if has_index("run_stats", "idx_run_stats"):
+        op.drop_index("idx_run_stats", "run_stats")
+
+    if has_table("run_stats"):
+        op.drop_table("run_stats")
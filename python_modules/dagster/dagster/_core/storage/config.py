@@ -37,6 +37,7 @@ def mysql_config() -> UserConfigSchema:
 class PostgresStorageConfig(TypedDict):
     postgres_url: str
     postgres_db: "PostgresStorageConfigDb"
+    pool: "PostgresStorageConfigPool"
 
 
 class PostgresStorageConfigDb(TypedDict):
@@ -49,6 +50,14 @@ class PostgresStorageConfigDb(TypedDict):
     scheme: str
 
 
+class PostgresStorageConfigPool(TypedDict):
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    pool_pre_ping: bool
+
+
 def pg_config() -> UserConfigSchema:
     return {
         "postgres_url": Field(StringSource, is_required=False),
@@ -65,4 +74,18 @@ def pg_config() -> UserConfigSchema:
             is_required=False,
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
+        "pool": Field(
+            {
+                "pool_size": Field(IntSource, is_required=False, default_value=5),
+                "max_overflow": Field(IntSource, is_required=False, default_value=10),
+                "pool_timeout": Field(IntSource, is_required=False, default_value=30),
+                "pool_recycle": Field(IntSource, is_required=False, default_value=3600),
+                "pool_pre_ping": Field(bool, is_required=False, default_value=True),
+            },
+            is_required=False,
+            description=(
+                "Hold a pool of open connections to the database instead of opening a new"
+                " connection for every query. Connections are not shared across forked processes."
+            ),
+        ),
     }
@@ -1,9 +1,11 @@
+import warnings
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from typing import (
     Any,
     Dict,
     Generic,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -14,12 +16,12 @@
     Union,
     cast,
 )
+from uuid import uuid4
 
 import dagster._check as check
 from dagster._check import CheckError
 from dagster._core.definitions.metadata import RawMetadataValue
 from dagster._core.definitions.multi_dimensional_partitions import (
-    MultiPartitionKey,
     MultiPartitionsDefinition,
 )
 from dagster._core.definitions.time_window_partitions import (
@@ -33,6 +35,8 @@
 
 T = TypeVar("T")
 
+STAGING_TABLE_SUFFIX = "_dagster_staging"
+
 
 class TablePartitionDimension(NamedTuple):
     partition_expr: str
@@ -58,6 +62,16 @@ def handle_output(
     def load_input(self, context: InputContext, table_slice: TableSlice, connection) -> T:
         """Loads the contents of the given table in the given schema."""
 
+    def load_input_chunks(
+        self, context: InputContext, table_slice: TableSlice, connection, chunk_size: int
+    ) -> Iterator[T]:
+        """Loads the contents of the given table in the given schema as a sequence of objects of
+        roughly chunk_size rows each.
+
+        Handlers that can't fetch results incrementally load the whole table as a single chunk.
+        """
+        yield self.load_input(context, table_slice, connection)
+
     @property
     @abstractmethod
     def supported_types(self) -> Sequence[Type[object]]:
@@ -85,6 +99,38 @@ def ensure_schema_exists(context: OutputContext, table_slice: TableSlice, connec
     def connect(context: Union[OutputContext, InputContext], table_slice: TableSlice):
         ...
 
+    @staticmethod
+    def create_staging_table(
+        context: OutputContext,
+        table_slice: TableSlice,
+        staging_table_slice: TableSlice,
+        connection,
+    ) -> None:
+        """Creates the staging table before the type handler writes to it. By default the type
+        handler creates it, so clients only need to override this if the staging table should
+        have the same column types as an existing table.
+        """
+
+    @staticmethod
+    def replace_table_slice(
+        context: OutputContext,
+        table_slice: TableSlice,
+        staging_table_slice: TableSlice,
+        connection,
+    ) -> None:
+        """Replaces the rows of the given table slice with the contents of the staging table in a
+        single transaction, creating the table from the staging table if it doesn't exist yet.
+
+        DbIOManagers configured to write through a staging table fall back to deleting the slice
+        and writing to the table directly if their client doesn't implement this.
+        """
+        raise NotImplementedError("This DbClient does not support writing through a staging table.")
+
+    @staticmethod
+    def drop_table(context: OutputContext, table_slice: TableSlice, connection) -> None:
+        """Drops the given table if it exists. Used to clean up staging tables."""
+        raise NotImplementedError("This DbClient does not support writing through a staging table.")
+
 
 class DbIOManager(IOManager):
     def __init__(
@@ -96,6 +142,7 @@ def __init__(
         schema: Optional[str] = None,
         io_manager_name: Optional[str] = None,
         default_load_type: Optional[Type] = None,
+        use_staging_table: bool = False,
     ):
         self._handlers_by_type: Dict[Optional[Type], DbTypeHandler] = {}
         self._io_manager_name = io_manager_name or self.__class__.__name__
@@ -122,6 +169,14 @@ def __init__(
             self._default_load_type = type_handlers[0].supported_types[0]
         else:
             self._default_load_type = default_load_type
+        self._use_staging_table = check.bool_param(use_staging_table, "use_staging_table")
+        if self._use_staging_table and not _supports_staging_table(db_client):
+            warnings.warn(
+                f"{self._io_manager_name} was configured to write through a staging table, but"
+                f" {type(db_client).__name__} does not implement replace_table_slice and"
+                " drop_table. Outputs will be written directly to their tables instead."
+            )
+            self._use_staging_table = False
 
     def handle_output(self, context: OutputContext, obj: object) -> None:
         table_slice = self._get_table_slice(context, context)
@@ -132,12 +187,19 @@ def handle_output(self, context: OutputContext, obj: object) -> None:
 
             with self._db_client.connect(context, table_slice) as conn:
                 self._db_client.ensure_schema_exists(context, table_slice, conn)
-                self._db_client.delete_table_slice(context, table_slice, conn)
+                if self._use_staging_table:
+                    handler_metadata = self._handle_output_through_staging_table(
+                        context, table_slice, obj, conn
+                    )
+                else:
+                    self._db_client.delete_table_slice(context, table_slice, conn)
 
-                handler_metadata = (
-                    self._handlers_by_type[obj_type].handle_output(context, table_slice, obj, conn)
-                    or {}
-                )
+                    handler_metadata = (
+                        self._handlers_by_type[obj_type].handle_output(
+                            context, table_slice, obj, conn
+                        )
+                        or {}
+                    )
         else:
             check.invariant(
                 context.dagster_type.is_nothing,
@@ -153,6 +215,34 @@ def handle_output(self, context: OutputContext, obj: object) -> None:
             {**handler_metadata, "Query": self._db_client.get_select_statement(table_slice)}
         )
 
+    def _handle_output_through_staging_table(
+        self, context: OutputContext, table_slice: TableSlice, obj: object, connection
+    ) -> Mapping[str, RawMetadataValue]:
+        # The object is written to a fresh table, and the target table is only touched by the
+        # client's replace, which swaps in just the rows of this slice in a single transaction.
+        # Readers never see a partially written slice, and locks on the target table are held
+        # for the duration of the swap rather than the whole write.
+        staging_table_slice = table_slice._replace(
+            table=f"{table_slice.table}{STAGING_TABLE_SUFFIX}_{uuid4().hex[:8]}"
+        )
+        try:
+            self._db_client.create_staging_table(
+                context, table_slice, staging_table_slice, connection
+            )
+            handler_metadata = (
+                self._handlers_by_type[type(obj)].handle_output(
+                    context, staging_table_slice, obj, connection
+                )
+                or {}
+            )
+            self._db_client.replace_table_slice(
+                context, table_slice, staging_table_slice, connection
+            )
+        finally:
+            self._db_client.drop_table(context, staging_table_slice, connection)
+
+        return handler_metadata
+
     def load_input(self, context: InputContext) -> object:
         obj_type = context.dagster_type.typing_type
         if obj_type is Any and self._default_load_type is not None:
@@ -163,9 +253,35 @@ def load_input(self, context: InputContext) -> object:
         self._check_supported_type(load_type)
 
         table_slice = self._get_table_slice(context, cast(OutputContext, context.upstream_output))
+        handler = self._handlers_by_type[load_type]
+
+        fetch_chunk_size = (context.metadata or {}).get("fetch_chunk_size")
+        if fetch_chunk_size is not None:
+            check.invariant(
+                obj_type is Any,
+                (
+                    "Inputs with 'fetch_chunk_size' metadata are loaded as an iterator, so they"
+                    f" must not have a type annotation other than Any: is '{obj_type}'."
+                ),
+            )
+            return self._load_input_chunks(
+                context, handler, table_slice, check.int_param(fetch_chunk_size, "fetch_chunk_size")
+            )
 
         with self._db_client.connect(context, table_slice) as conn:
-            return self._handlers_by_type[load_type].load_input(context, table_slice, conn)
+            return handler.load_input(context, table_slice, conn)
+
+    def _load_input_chunks(
+        self,
+        context: InputContext,
+        handler: DbTypeHandler,
+        table_slice: TableSlice,
+        chunk_size: int,
+    ) -> Iterator[object]:
+        # the connection is opened when the op starts consuming the iterator, and stays open until
+        # the iterator is exhausted or discarded
+        with self._db_client.connect(context, table_slice) as conn:
+            yield from handler.load_input_chunks(context, table_slice, conn, chunk_size)
 
     def _get_table_slice(
         self, context: Union[OutputContext, InputContext], output_context: OutputContext
@@ -202,32 +318,13 @@ def _get_table_slice(
                     )
 
                 if isinstance(context.asset_partitions_def, MultiPartitionsDefinition):
-                    multi_partition_key_mapping = cast(
-                        MultiPartitionKey, context.asset_partition_key
-                    ).keys_by_dimension
-                    for part in context.asset_partitions_def.partitions_defs:
-                        partition_key = multi_partition_key_mapping[part.name]
-                        if isinstance(part.partitions_def, TimeWindowPartitionsDefinition):
-                            partitions = part.partitions_def.time_window_for_partition_key(
-                                partition_key
-                            )
-                        else:
-                            partitions = [partition_key]
-
-                        partition_expr_str = cast(Mapping[str, str], partition_expr).get(part.name)
-                        if partition_expr is None:
-                            raise ValueError(
-                                f"Asset '{context.asset_key}' has partition {part.name}, but the"
-                                f" 'partition_expr' metadata does not contain a {part.name} entry,"
-                                " so we don't know what column to filter it on. Specify which"
-                                " column of the database contains data for the"
-                                f" {part.name} partition."
-                            )
-                        partition_dimensions.append(
-                            TablePartitionDimension(
-                                partition_expr=cast(str, partition_expr_str), partitions=partitions
-                            )
+                    partition_dimensions.extend(
+                        _get_multi_partition_dimensions(
+                            context,
+                            context.asset_partitions_def,
+                            cast(Mapping[str, str], partition_expr),
                         )
+                    )
                 elif isinstance(context.asset_partitions_def, TimeWindowPartitionsDefinition):
                     partition_dimensions.append(
                         TablePartitionDimension(
@@ -287,3 +384,75 @@ def _check_supported_type(self, obj_type):
                 )
 
             raise CheckError(msg)
+
+
+def _supports_staging_table(db_client: DbClient) -> bool:
+    return (
+        db_client.replace_table_slice is not DbClient.replace_table_slice
+        and db_client.drop_table is not DbClient.drop_table
+    )
+
+
+def _get_multi_partition_dimensions(
+    context: Union[OutputContext, InputContext],
+    partitions_def: MultiPartitionsDefinition,
+    partition_expr: Mapping[str, str],
+) -> Sequence[TablePartitionDimension]:
+    """Returns a partition dimension for each dimension of the multi-partitions definition that
+    together select all of the given partitions.
+
+    When a run targets a range of multi-partitions, they are written in a single batch, which is
+    only possible if the partitions are the cross product of a contiguous time window and a set of
+    keys for each of the other dimensions.
+    """
+    multi_partition_keys = [
+        partitions_def.get_partition_key_from_str(partition_key)
+        for partition_key in context.asset_partition_keys
+    ]
+
+    partition_dimensions: List[TablePartitionDimension] = []
+    num_partitions_selected = 1
+    for part in partitions_def.partitions_defs:
+        partition_expr_str = partition_expr.get(part.name)
+        if partition_expr_str is None:
+            raise ValueError(
+                f"Asset '{context.asset_key}' has partition {part.name}, but the"
+                f" 'partition_expr' metadata does not contain a {part.name} entry,"
+                " so we don't know what column to filter it on. Specify which"
+                " column of the database contains data for the"
+                f" {part.name} partition."
+            )
+
+        dimension_keys = sorted({key.keys_by_dimension[part.name] for key in multi_partition_keys})
+        if isinstance(part.partitions_def, TimeWindowPartitionsDefinition):
+            time_windows = [
+                part.partitions_def.time_window_for_partition_key(partition_key)
+                for partition_key in dimension_keys
+            ]
+            time_window = TimeWindow(
+                min(window.start for window in time_windows),
+                max(window.end for window in time_windows),
+            )
+            num_partitions_selected *= len(
+                part.partitions_def.get_partition_keys_in_time_window(time_window)
+            )
+            partition_dimensions.append(
+                TablePartitionDimension(partition_expr=partition_expr_str, partitions=time_window)
+            )
+        else:
+            num_partitions_selected *= len(dimension_keys)
+            partition_dimensions.append(
+                TablePartitionDimension(
+                    partition_expr=partition_expr_str, partitions=dimension_keys
+                )
+            )
+
+    if num_partitions_selected != len(set(multi_partition_keys)):
+        raise ValueError(
+            f"Asset '{context.asset_key}' is being stored or loaded for partitions"
+            f" {sorted(set(multi_partition_keys))}, which can't be selected with a single query"
+            " because they don't cover every combination of a contiguous time window and the"
+            " selected keys of the other dimensions."
+        )
+
+    return partition_dimensions
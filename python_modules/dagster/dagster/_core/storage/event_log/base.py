@@ -3,6 +3,8 @@
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
+    Iterator,
+    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -14,7 +16,7 @@
 
 import dagster._check as check
 from dagster._core.assets import AssetDetails
-from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.event_api import EventHandlerFn, EventLogRecord, EventRecordsFilter
 from dagster._core.events import DagsterEventType
 from dagster._core.events.log import EventLogEntry
@@ -32,6 +34,9 @@
 if TYPE_CHECKING:
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
+# Number of records fetched at a time when iterating over the event log of a run
+DEFAULT_RECORDS_FOR_RUN_CHUNK_SIZE = 1000
+
 
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
@@ -187,21 +192,79 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        chunk_size: int = DEFAULT_RECORDS_FOR_RUN_CHUNK_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        """Iterate over all of the event log records corresponding to a run, fetching at most
+        chunk_size records into memory at a time, so that runs with very large event logs can be
+        processed without loading the whole log.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[str]): Cursor value after which records should be returned.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            chunk_size (int): Max number of records to fetch at once.
+        """
+        check.int_param(chunk_size, "chunk_size")
+        check.invariant(chunk_size > 0, "chunk_size must be positive")
+
+        has_more = True
+        while has_more:
+            connection = self.get_records_for_run(run_id, cursor, of_type, limit=chunk_size)
+            yield from connection.records
+            cursor = connection.cursor
+            has_more = connection.has_more
+
+    def get_records_for_runs(
+        self,
+        cursor_by_run_id: Mapping[str, Optional[int]],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event log records stored after a given storage id for each of several runs.
+
+        Used by event watchers to poll many runs at once. By default, each run is queried
+        separately; storages that can fetch all of the runs in one query should override this.
+
+        Args:
+            cursor_by_run_id (Mapping[str, Optional[int]]): For each run id, the storage id after
+                which records should be returned, or None to return all records for the run.
+            limit (Optional[int]): Max number of records to return.
+        """
+        records: List[EventLogRecord] = []
+        for run_id, storage_id in cursor_by_run_id.items():
+            remaining = limit - len(records) if limit else None
+            if remaining is not None and remaining <= 0:
+                break
+
+            cursor = (
+                EventLogCursor.from_storage_id(storage_id).to_string()
+                if storage_id is not None
+                else None
+            )
+            records.extend(self.get_records_for_run(run_id, cursor, limit=remaining).records)
+        return records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
-        return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
+        return build_run_stats_from_events(
+            run_id, (record.event_log_entry for record in self.iter_records_for_run(run_id))
+        )
 
     def get_step_stats_for_run(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
     ) -> Sequence[RunStepKeyStatsSnapshot]:
         """Get per-step stats for a pipeline run."""
-        logs = self.get_logs_for_run(run_id)
+        logs = (record.event_log_entry for record in self.iter_records_for_run(run_id))
         if step_keys:
-            logs = [
+            logs = (
                 event
                 for event in logs
                 if event.is_dagster_event and event.get_dagster_event().step_key in step_keys
-            ]
+            )
 
         return build_run_step_stats_from_events(run_id, logs)
 
@@ -213,6 +276,18 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events, preserving their order.
+
+        Storages that can write several events in a single round-trip should override this method.
+        By default, each event is stored individually via `store_event`.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
@@ -264,6 +339,26 @@ def get_event_records(
     ) -> Sequence[EventLogRecord]:
         pass
 
+    def get_event_record_asset_keys(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[Tuple[int, Optional[AssetKey]]]:
+        """Returns the storage id and asset key of each event record that matches the filter, in
+        the same order as get_event_records. Storages may override this to avoid loading and
+        deserializing the events themselves.
+        """
+        return [
+            (
+                record.storage_id,
+                record.event_log_entry.dagster_event.asset_key
+                if record.event_log_entry.dagster_event
+                else None,
+            )
+            for record in self.get_event_records(event_records_filter, limit, ascending)
+        ]
+
     def supports_event_consumer_queries(self) -> bool:
         return False
 
@@ -372,6 +467,42 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         pass
 
+    def get_latest_materialization_records(
+        self,
+        asset_partitions: Sequence[AssetKeyPartitionKey],
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[AssetKeyPartitionKey, EventLogRecord]:
+        """Fetch the latest materialization record for each of the given asset partitions. An asset
+        partition without a partition key refers to the latest materialization of that asset across
+        all of its partitions. Asset partitions without any materializations after the cursor are
+        omitted from the result.
+
+        Storages that can fetch the records for many asset partitions in a single query should
+        override this method. By default, each asset partition is queried individually.
+
+        Args:
+            asset_partitions (Sequence[AssetKeyPartitionKey]): The asset partitions to query.
+            after_cursor (Optional[int]): Filter parameter such that only records with a storage_id
+                greater than this value will be considered.
+        """
+        latest_materialization_records = {}
+        for asset_partition in asset_partitions:
+            records = self.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                    asset_key=asset_partition.asset_key,
+                    asset_partitions=[asset_partition.partition_key]
+                    if asset_partition.partition_key is not None
+                    else None,
+                    after_cursor=after_cursor,
+                ),
+                limit=1,
+                ascending=False,
+            )
+            if records:
+                latest_materialization_records[asset_partition] = records[0]
+        return latest_materialization_records
+
     @abstractmethod
     def get_latest_asset_partition_materialization_attempts_without_materializations(
         self, asset_key: AssetKey
@@ -1,11 +1,16 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, NamedTuple, Optional
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
 
 POLLING_CADENCE = 0.1  # 100 ms
+MAX_POLLING_INTERVAL = 1.0  # polling backs off to this interval while no new events are found
+MAX_RECORDS_PER_POLL = 1000
 
 
 class CallbackAfterCursor(NamedTuple):
@@ -20,30 +25,88 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry, str], None]
 
 
+class EventLogNotifier(ABC):
+    """Pushes notifications of newly stored events to a SqlPollingEventWatcher, so that new events
+    are picked up as soon as they are stored instead of on the next poll.
+
+    Notifications are only hints: the watcher keeps polling at a reduced rate, so a notifier that
+    misses events or fails only increases latency.
+    """
+
+    @abstractmethod
+    def start(self, on_new_events: Callable[[], None]) -> None:
+        """Start delivering notifications by calling `on_new_events` whenever new events may have
+        been stored.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop delivering notifications and release any held resources."""
+
+
+class _WatchedRun:
+    """The callbacks registered for a watched run, each with the storage id of the last event
+    delivered to it.
+    """
+
+    def __init__(self):
+        self.callbacks: List[CallbackAfterCursor] = []
+        self.storage_ids: List[Optional[int]] = []
+
+    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
+        self.callbacks.append(CallbackAfterCursor(cursor, callback))
+        self.storage_ids.append(EventLogCursor.parse(cursor).storage_id() if cursor else None)
+
+    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
+        kept = [
+            (callback_with_cursor, storage_id)
+            for callback_with_cursor, storage_id in zip(self.callbacks, self.storage_ids)
+            if callback_with_cursor.callback != callback
+        ]
+        self.callbacks = [callback_with_cursor for callback_with_cursor, _ in kept]
+        self.storage_ids = [storage_id for _, storage_id in kept]
+
+    @property
+    def min_storage_id(self) -> Optional[int]:
+        if any(storage_id is None for storage_id in self.storage_ids):
+            return None
+        return min(self.storage_ids)  # type: ignore  # (all non-None)
+
+
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that polls the event log for new events for all of its watched run_ids.
+
+    A single thread (SqlPollingEventWatcherThread) fetches the new events for every watched run with
+    one `get_records_for_runs` call per poll, then fires the callbacks of each run, so the number of
+    queries does not grow with the number of watched runs. Polling starts every POLLING_CADENCE and
+    backs off to MAX_POLLING_INTERVAL while the watched runs are idle. If an EventLogNotifier is
+    provided (or `notify` is called after storing events in-process), the thread polls immediately.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _watched_runs_lock protects _watched_runs
     """
 
-    def __init__(self, event_log_storage: EventLogStorage):
+    def __init__(
+        self, event_log_storage: EventLogStorage, notifier: Optional[EventLogNotifier] = None
+    ):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
+        self._notifier = check.opt_inst_param(notifier, "notifier", EventLogNotifier)
+
+        # INVARIANT: _watched_runs_lock protects _watched_runs
+        # reentrant so that callbacks can unwatch their run while being fired
+        self._watched_runs_lock: threading.RLock = threading.RLock()
+        self._watched_runs: Dict[str, _WatchedRun] = {}
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        self._wake_event = threading.Event()
+        self._thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+        with self._watched_runs_lock:
+            _has_run_id = run_id in self._watched_runs
         return _has_run_id
 
     def watch_run(
@@ -52,23 +115,84 @@ def watch_run(
         run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+        with self._watched_runs_lock:
+            if run_id not in self._watched_runs:
+                self._watched_runs[run_id] = _WatchedRun()
+            self._watched_runs[run_id].add_callback(cursor, callback)
+
+            if self._thread is None:
+                self._thread = SqlPollingEventWatcherThread(self)
+                self._thread.daemon = True
+                self._thread.start()
+                if self._notifier:
+                    self._notifier.start(self.notify)
+
+        # pick up any events after the cursor right away
+        self.notify()
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._watched_runs_lock:
+            if run_id in self._watched_runs:
+                self._watched_runs[run_id].remove_callback(handler)
+                if not self._watched_runs[run_id].callbacks:
+                    del self._watched_runs[run_id]
+
+    def notify(self) -> None:
+        """Signals that new events may have been stored, waking the polling thread."""
+        self._wake_event.set()
+
+    def wait_for_notification(self, timeout: float) -> bool:
+        notified = self._wake_event.wait(timeout)
+        self._wake_event.clear()
+        return notified
+
+    def poll(self) -> bool:
+        """Fetches new events for all watched runs and fires the callbacks registered for each run.
+
+        Returns:
+            bool: Whether any new events were found.
+        """
+        with self._watched_runs_lock:
+            cursor_by_run_id = {
+                run_id: watched_run.min_storage_id
+                for run_id, watched_run in self._watched_runs.items()
+            }
+
+        if not cursor_by_run_id:
+            return False
+
+        records = self._event_log_storage.get_records_for_runs(
+            cursor_by_run_id, limit=MAX_RECORDS_PER_POLL
+        )
+
+        with self._watched_runs_lock:
+            for record in records:
+                watched_run = self._watched_runs.get(record.event_log_entry.run_id)
+                if not watched_run:
+                    continue
+
+                cursor = str(EventLogCursor.from_storage_id(record.storage_id))
+                for i, callback_with_cursor in enumerate(watched_run.callbacks):
+                    storage_id = watched_run.storage_ids[i]
+                    if storage_id is not None and storage_id >= record.storage_id:
+                        continue
+
+                    watched_run.storage_ids[i] = record.storage_id
+                    try:
+                        callback_with_cursor.callback(record.event_log_entry, cursor)
+                    except Exception:
+                        logging.exception(
+                            "Exception in callback for event watch on run %s.",
+                            record.event_log_entry.run_id,
+                        )
+
+        return bool(records)
+
+    @property
+    def should_thread_exit(self) -> bool:
+        return self._disposed
 
     def __del__(self):
         self.close()
@@ -76,95 +200,51 @@ def __del__(self):
     def close(self):
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                del self._run_id_to_watcher_dict
-
-
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
-
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
-
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
+            if self._notifier:
+                self._notifier.close()
+            self._wake_event.set()
+            if self._thread:
+                self._thread.join()
+                self._thread = None
+            with self._watched_runs_lock:
+                self._watched_runs = {}
+
+
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that polls for new events for all runs watched by a SqlPollingEventWatcher.
+
+    Polls every POLLING_CADENCE while new events are being found, doubling the interval up to
+    MAX_POLLING_INTERVAL while the watched runs are idle. A notification resets the interval and
+    triggers a poll right away, but polls are never issued more often than every POLLING_CADENCE.
+    Exits when the watcher is closed.
     """
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
-
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
-
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
-
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
-        """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
-
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
-
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
-
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+    def __init__(self, watcher: SqlPollingEventWatcher):
+        super(SqlPollingEventWatcherThread, self).__init__()
+        self._watcher = check.inst_param(watcher, "watcher", SqlPollingEventWatcher)
+        self.name = "sql-event-watch"
 
     def run(self):
-        """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
-        """
-        cursor = None
-        while not self._should_thread_exit.wait(POLLING_CADENCE):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor if conn.cursor else cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
+        interval = POLLING_CADENCE
+        last_poll_time = 0.0
+        while not self._watcher.should_thread_exit:
+            notified = self._watcher.wait_for_notification(interval)
+            if self._watcher.should_thread_exit:
+                break
+
+            # coalesce bursts of notifications into at most one poll per POLLING_CADENCE
+            time_since_last_poll = time.time() - last_poll_time
+            if time_since_last_poll < POLLING_CADENCE:
+                time.sleep(POLLING_CADENCE - time_since_last_poll)
+
+            last_poll_time = time.time()
+            try:
+                found_events = self._watcher.poll()
+            except Exception:
+                logging.exception("Exception while polling for new events.")
+                found_events = False
+
+            if found_events or notified:
+                interval = POLLING_CADENCE
+            else:
+                interval = min(interval * 2, MAX_POLLING_INTERVAL)
@@ -80,6 +80,49 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Summary of the stats of each run, maintained as its events are stored so that the stats of a run
+# can be read without aggregating over its event log.
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("enqueued_time", db.Float),
+    db.Column("launch_time", db.Float),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
+)
+
+RunStepStatsTable = db.Table(
+    "run_step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("status", db.String(63)),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
+    db.Column("attempts", db.Integer),
+    db.Column("attempt_start_time", db.Float),
+    db.Column("attempts_body", db.Text),
+    db.Column("markers_body", db.Text),
+    # incremented on every update, so that concurrent updates of a step's stats can be detected
+    db.Column("version", db.Integer, nullable=False, default=0),
+)
 
 db.Index(
     "idx_step_key",
@@ -138,3 +181,16 @@
     mysql_length={"partitions_def_name": 64, "partition": 64},
     unique=True,
 )
+db.Index(
+    "idx_run_stats",
+    RunStatsTable.c.run_id,
+    mysql_length=64,
+    unique=True,
+)
+db.Index(
+    "idx_run_step_stats",
+    RunStepStatsTable.c.run_id,
+    RunStepStatsTable.c.step_key,
+    mysql_length={"run_id": 64, "step_key": 64},
+    unique=True,
+)
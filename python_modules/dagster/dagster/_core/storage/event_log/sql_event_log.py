@@ -1,13 +1,16 @@
 import logging
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import groupby, islice, takewhile
 from typing import (
     TYPE_CHECKING,
     Any,
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -28,15 +31,31 @@
 import dagster._check as check
 import dagster._seven as seven
 from dagster._core.assets import AssetDetails
-from dagster._core.definitions.events import AssetKey, AssetMaterialization
+from dagster._core.definitions.events import (
+    AssetKey,
+    AssetKeyPartitionKey,
+    AssetMaterialization,
+    ExpectationResult,
+)
 from dagster._core.errors import (
     DagsterEventLogInvalidForRun,
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
 )
 from dagster._core.event_api import RunShardedEventsCursor
-from dagster._core.events import ASSET_EVENTS, MARKER_EVENTS, DagsterEventType
-from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
+from dagster._core.events import (
+    ASSET_EVENTS,
+    MARKER_EVENTS,
+    DagsterEventType,
+    StepExpectationResultData,
+)
+from dagster._core.execution.stats import (
+    STEP_STATS_EVENT_TYPES,
+    RunStepKeyStatsSnapshot,
+    RunStepStatsSummary,
+    StepEventStatus,
+    build_run_step_stats_from_events,
+)
 from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
 from dagster._serdes import (
     deserialize_value,
@@ -52,6 +71,7 @@
 
 from ..pipeline_run import DagsterRunStatsSnapshot
 from .base import (
+    DEFAULT_RECORDS_FOR_RUN_CHUNK_SIZE,
     AssetEntry,
     AssetRecord,
     EventLogConnection,
@@ -61,11 +81,18 @@
     EventLogStorage,
     EventRecordsFilter,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_TABLES,
+)
 from .schema import (
     AssetEventTagsTable,
     AssetKeyTable,
     DynamicPartitionsTable,
+    RunStatsTable,
+    RunStepStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
 )
@@ -75,12 +102,80 @@
 
 MIN_ASSET_ROWS = 25
 
+# The number of asset partitions to look up in each query when fetching latest materialization
+# records in bulk, which keeps the number of bound parameters per query within database limits.
+LATEST_MATERIALIZATION_RECORDS_CHUNK_SIZE = 400
+
+# Columns of the run stats table that count the events of a given type
+RUN_STATS_COUNT_COLUMNS = {
+    DagsterEventType.STEP_SUCCESS: "steps_succeeded",
+    DagsterEventType.STEP_FAILURE: "steps_failed",
+    DagsterEventType.ASSET_MATERIALIZATION: "materializations",
+    DagsterEventType.STEP_EXPECTATION_RESULT: "expectations",
+}
+
+# Columns of the run stats table that hold the time of the latest event of a given type
+RUN_STATS_TIME_COLUMNS = {
+    DagsterEventType.PIPELINE_ENQUEUED: "enqueued_time",
+    DagsterEventType.PIPELINE_STARTING: "launch_time",
+    DagsterEventType.PIPELINE_START: "start_time",
+    DagsterEventType.PIPELINE_SUCCESS: "end_time",
+    DagsterEventType.PIPELINE_FAILURE: "end_time",
+    DagsterEventType.PIPELINE_CANCELED: "end_time",
+}
+
+RUN_STATS_EVENT_TYPES = {*RUN_STATS_COUNT_COLUMNS, *RUN_STATS_TIME_COLUMNS}
+
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
 # whole can be dropped.
 SqlDbConnection: TypeAlias = Any
 
 
+def is_asset_event_to_index(event: EventLogEntry) -> bool:
+    """Whether the event needs to be written to the cross-run asset index tables."""
+    return bool(
+        event.is_dagster_event
+        and event.dagster_event_type in ASSET_EVENTS
+        and event.get_dagster_event().asset_key
+    )
+
+
+def _run_step_stats_summary_from_row(row: SqlAlchemyRow) -> RunStepStatsSummary:
+    return RunStepStatsSummary(
+        step_key=row.step_key,
+        status=StepEventStatus(row.status) if row.status else None,
+        start_time=row.start_time,
+        end_time=row.end_time,
+        attempts=row.attempts,
+        attempt_start_time=row.attempt_start_time,
+        attempts_list=deserialize_value(row.attempts_body, list) if row.attempts_body else None,
+        markers=deserialize_value(row.markers_body, dict) if row.markers_body else None,
+    )
+
+
+def _run_step_stats_row_values(summary: RunStepStatsSummary) -> Dict[str, Any]:
+    return dict(
+        status=summary.status.value if summary.status else None,
+        start_time=summary.start_time,
+        end_time=summary.end_time,
+        attempts=summary.attempts,
+        attempt_start_time=summary.attempt_start_time,
+        attempts_body=serialize_value(summary.attempts_list),
+        markers_body=serialize_value(summary.markers),
+    )
+
+
+def group_events_by_run(
+    events: Sequence[EventLogEntry],
+) -> Iterator[Tuple[str, Sequence[EventLogEntry]]]:
+    """Splits a sequence of events into consecutive groups that share the same run id, so that
+    batches spanning several runs can be written while preserving the order of events.
+    """
+    for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+        yield run_id, list(run_events)
+
+
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
 
@@ -88,6 +183,8 @@ class SqlEventLogStorage(EventLogStorage):
     sharding, while maintaining the ability to do cross-run queries
     """
 
+    _has_run_stats_tables = False
+
     @abstractmethod
     def run_connection(self, run_id: Optional[str]) -> ContextManager[Connection]:
         """Context manager yielding a connection to access the event logs for a specific run.
@@ -101,6 +198,16 @@ def run_connection(self, run_id: Optional[str]) -> ContextManager[Connection]:
     def index_connection(self) -> ContextManager[Connection]:
         """Context manager yielding a connection to access cross-run indexed tables."""
 
+    @contextmanager
+    def run_transaction(self, run_id: Optional[str]) -> Iterator[Connection]:
+        """Context manager yielding a connection to access the event logs for a specific run, on
+        which all of the statements are committed together when the block exits, or rolled back if
+        it raises.
+        """
+        with self.run_connection(run_id) as conn:
+            with conn.begin():
+                yield conn
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema migrations necessary to bring an
@@ -118,21 +225,28 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(**self.get_insert_event_values(event))
+
+    def get_insert_event_values(self, event: EventLogEntry) -> Dict[str, Any]:
+        """Returns the column values of the event log row for the given event. Shared by the single
+        event insert statement and the multi-row inserts used by `store_events`.
+        """
         dagster_event_type = None
         asset_key_str = None
         partition = None
         step_key = event.step_key
         if event.is_dagster_event:
-            dagster_event_type = event.dagster_event.event_type_value
-            step_key = event.dagster_event.step_key
-            if event.dagster_event.asset_key:
-                check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-                asset_key_str = event.dagster_event.asset_key.to_string()
-            if event.dagster_event.partition:
-                partition = event.dagster_event.partition
-
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(
+            dagster_event = event.get_dagster_event()
+            dagster_event_type = dagster_event.event_type_value
+            step_key = dagster_event.step_key
+            if dagster_event.asset_key:
+                check.inst_param(dagster_event.asset_key, "asset_key", AssetKey)
+                asset_key_str = dagster_event.asset_key.to_string()
+            if dagster_event.partition:
+                partition = dagster_event.partition
+
+        return dict(
             run_id=event.run_id,
             event=serialize_value(event),
             dagster_event_type=dagster_event_type,
@@ -319,11 +433,10 @@ def add_asset_event_tags(
                     ],
                 )
 
-    def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
-        check.inst_param(event, "event", EventLogEntry)
-        check.int_param(event_id, "event_id")
-
-        if (
+    def _get_asset_event_tag_rows(
+        self, event: EventLogEntry, event_id: int
+    ) -> Sequence[Mapping[str, Any]]:
+        if not (
             event.dagster_event
             and event.dagster_event.asset_key
             and event.dagster_event.is_step_materialization
@@ -332,32 +445,41 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
             )
             and event.dagster_event.step_materialization_data.materialization.tags
         ):
-            if not self.has_table(AssetEventTagsTable.name):
-                # If tags table does not exist, silently exit. This is to support OSS
-                # users who have not yet run the migration to create the table.
-                # On read, we will throw an error if the table does not exist.
-                return
+            return []
+
+        check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
+        asset_key_str = event.dagster_event.asset_key.to_string()
+
+        tags = event.dagster_event.step_materialization_data.materialization.tags
+        return [
+            dict(
+                event_id=event_id,
+                asset_key=asset_key_str,
+                key=key,
+                value=value,
+                # Postgres requires a datetime that is in UTC but has no timezone info
+                # set in order to be stored correctly
+                event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            )
+            for key, value in tags.items()
+        ]
 
-            check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-            asset_key_str = event.dagster_event.asset_key.to_string()
+    def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
+        check.inst_param(event, "event", EventLogEntry)
+        check.int_param(event_id, "event_id")
 
-            tags = event.dagster_event.step_materialization_data.materialization.tags
-            with self.index_connection() as conn:
-                conn.execute(
-                    AssetEventTagsTable.insert(),
-                    [
-                        dict(
-                            event_id=event_id,
-                            asset_key=asset_key_str,
-                            key=key,
-                            value=value,
-                            # Postgres requires a datetime that is in UTC but has no timezone info
-                            # set in order to be stored correctly
-                            event_timestamp=datetime.utcfromtimestamp(event.timestamp),
-                        )
-                        for key, value in tags.items()
-                    ],
-                )
+        tag_rows = self._get_asset_event_tag_rows(event, event_id)
+        if not tag_rows:
+            return
+
+        if not self.has_table(AssetEventTagsTable.name):
+            # If tags table does not exist, silently exit. This is to support OSS
+            # users who have not yet run the migration to create the table.
+            # On read, we will throw an error if the table does not exist.
+            return
+
+        with self.index_connection() as conn:
+            conn.execute(AssetEventTagsTable.insert(), tag_rows)
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
@@ -371,9 +493,11 @@ def store_event(self, event: EventLogEntry) -> None:
 
         event_id = None
 
-        with self.run_connection(run_id) as conn:
+        # the event and its stats are committed together, see `rebuild_run_stats`
+        with self.run_transaction(run_id) as conn:
             result = conn.execute(insert_event_statement)
             event_id = result.inserted_primary_key[0]
+            self.update_run_stats(conn, run_id, [event])
 
         if (
             event.is_dagster_event
@@ -389,6 +513,261 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, preserving their order.
+
+        Consecutive events for the same run are written in a single transaction using multi-row
+        inserts, and the asset index and asset event tag writes are coalesced across the batch.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        asset_events: List[Tuple[EventLogEntry, int]] = []
+        for run_id, run_events in group_events_by_run(events):
+            with self.run_transaction(run_id) as conn:
+                asset_events.extend(self.insert_event_batch(conn, run_events))
+                self.update_run_stats(conn, run_id, run_events)
+
+        self.store_asset_event_batch(asset_events)
+
+    def insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Tuple[EventLogEntry, int]]:
+        """Inserts the event log rows for a batch of events using the given connection, returning
+        each asset event paired with its storage id.
+
+        Runs of events that do not need their storage id to be known are written with a single
+        multi-row insert; asset events are inserted individually to retrieve their primary key.
+        """
+        asset_events = []
+        pending_rows = []
+        for event in events:
+            if is_asset_event_to_index(event):
+                if pending_rows:
+                    conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+                    pending_rows = []
+
+                result = conn.execute(self.prepare_insert_event(event))
+                event_id = result.inserted_primary_key[0]
+                if event_id is None:
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
+                asset_events.append((event, event_id))
+            else:
+                pending_rows.append(self.get_insert_event_values(event))
+
+        if pending_rows:
+            conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+
+        return asset_events
+
+    def store_asset_event_batch(self, asset_events: Sequence[Tuple[EventLogEntry, int]]) -> None:
+        """Updates the asset index and asset event tags for a batch of stored asset events.
+
+        Only the last event of each event type per asset key can affect the final state of its
+        asset index row, so earlier events are skipped. All tag rows are written in one insert.
+        """
+        if not asset_events:
+            return
+
+        last_event_index_by_type: Dict[Tuple[AssetKey, DagsterEventType], int] = {}
+        for i, (event, _event_id) in enumerate(asset_events):
+            dagster_event = event.get_dagster_event()
+            last_event_index_by_type[
+                (check.not_none(dagster_event.asset_key), dagster_event.event_type)
+            ] = i
+
+        for i in sorted(last_event_index_by_type.values()):
+            event, event_id = asset_events[i]
+            self.store_asset_event(event, event_id)
+
+        tag_rows = [
+            row
+            for event, event_id in asset_events
+            for row in self._get_asset_event_tag_rows(event, event_id)
+        ]
+        if tag_rows and self.has_table(AssetEventTagsTable.name):
+            with self.index_connection() as conn:
+                conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
+    def has_run_stats_tables(self) -> bool:
+        # Only a positive result is cached, since the tables can be created by `dagster instance
+        # migrate` while the storage is in use
+        if not self._has_run_stats_tables:
+            self._has_run_stats_tables = self.has_table(RunStatsTable.name)
+        return self._has_run_stats_tables
+
+    def _should_read_run_stats_tables(self) -> bool:
+        # The tables only hold the stats of every run once the data migration that backfills the
+        # stats of existing runs has completed
+        return self.has_run_stats_tables() and self.has_secondary_index(RUN_STATS_TABLES)
+
+    def update_run_stats(
+        self, conn: Connection, run_id: str, events: Sequence[EventLogEntry]
+    ) -> None:
+        """Updates the summary stats of a run with a batch of its newly stored events, using the
+        connection that the events were stored with, within its transaction (see
+        `run_transaction`). Events that don't affect the stats of the run are ignored.
+        """
+        run_stats_events = []
+        step_stats_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            if not event.is_dagster_event:
+                continue
+            dagster_event = event.get_dagster_event()
+            if dagster_event.event_type in RUN_STATS_EVENT_TYPES:
+                run_stats_events.append(event)
+            if dagster_event.event_type in STEP_STATS_EVENT_TYPES and dagster_event.step_key:
+                step_stats_events[dagster_event.step_key].append(event)
+
+        if not (run_stats_events or step_stats_events) or not self.has_run_stats_tables():
+            return
+
+        if run_stats_events:
+            self._update_run_stats_row(conn, run_id, run_stats_events)
+
+        for step_key, step_events in step_stats_events.items():
+            self._update_run_step_stats_row(conn, run_id, step_key, step_events)
+
+    def _update_run_stats_row(
+        self, conn: Connection, run_id: str, events: Sequence[EventLogEntry]
+    ) -> None:
+        counts: Dict[str, int] = defaultdict(int)
+        times: Dict[str, float] = {}
+        for event in events:
+            event_type = event.get_dagster_event().event_type
+            if event_type in RUN_STATS_COUNT_COLUMNS:
+                counts[RUN_STATS_COUNT_COLUMNS[event_type]] += 1
+            else:
+                times[RUN_STATS_TIME_COLUMNS[event_type]] = event.timestamp
+
+        # counts are incremented in the database, since the steps of a run may be storing events
+        # concurrently
+        update_statement = (
+            RunStatsTable.update()
+            .where(RunStatsTable.c.run_id == run_id)
+            .values(
+                **{column: RunStatsTable.c[column] + count for column, count in counts.items()},
+                **times,
+            )
+        )
+        if conn.execute(update_statement).rowcount:
+            return
+
+        try:
+            # a failed insert only rolls back to the savepoint, rather than aborting the whole
+            # transaction on databases like Postgres
+            with conn.begin_nested():
+                conn.execute(
+                    RunStatsTable.insert().values(
+                        run_id=run_id,
+                        **{column: counts[column] for column in RUN_STATS_COUNT_COLUMNS.values()},
+                        **times,
+                    )
+                )
+        except db_exc.IntegrityError:
+            # the row was inserted concurrently
+            conn.execute(update_statement)
+
+    def _update_run_step_stats_row(
+        self, conn: Connection, run_id: str, step_key: str, events: Sequence[EventLogEntry]
+    ) -> None:
+        row_query = db.select([RunStepStatsTable]).where(
+            db.and_(
+                RunStepStatsTable.c.run_id == run_id,
+                RunStepStatsTable.c.step_key == step_key,
+            )
+        )
+
+        # The events are applied to the stats in Python, so the row is only written back if its
+        # version hasn't changed since it was read. Otherwise another writer updated the step
+        # concurrently, and the events are applied again to the new row.
+        while True:
+            row = conn.execute(row_query).fetchone()
+            if not row:
+                summary = RunStepStatsSummary(step_key)
+                for event in events:
+                    summary.apply_event(event)
+                try:
+                    with conn.begin_nested():
+                        conn.execute(
+                            RunStepStatsTable.insert().values(
+                                run_id=run_id,
+                                step_key=step_key,
+                                version=0,
+                                **_run_step_stats_row_values(summary),
+                            )
+                        )
+                    return
+                except db_exc.IntegrityError:
+                    # the row was inserted concurrently, so apply the events to it instead
+                    continue
+
+            summary = _run_step_stats_summary_from_row(row)
+            for event in events:
+                summary.apply_event(event)
+            result = conn.execute(
+                RunStepStatsTable.update()
+                .where(
+                    db.and_(
+                        RunStepStatsTable.c.id == row.id,
+                        RunStepStatsTable.c.version == row.version,
+                    )
+                )
+                .values(version=row.version + 1, **_run_step_stats_row_values(summary))
+            )
+            if result.rowcount:
+                return
+
+    def get_all_run_ids(self) -> Sequence[str]:
+        """Returns the ids of all of the runs that have stored events."""
+        with self.index_connection() as conn:
+            rows = conn.execute(
+                db.select([SqlEventLogStorageTable.c.run_id])
+                .where(SqlEventLogStorageTable.c.run_id != None)  # noqa: E711
+                .distinct()
+            ).fetchall()
+        return [run_id for (run_id,) in rows]
+
+    def rebuild_run_stats(self, run_id: str) -> None:
+        """Rebuilds the summary stats of a run from its event log. Used to backfill the stats of
+        runs whose events were stored before the run stats tables were created.
+        """
+        check.str_param(run_id, "run_id")
+
+        with self.run_transaction(run_id) as conn:
+            conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+            conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
+            # events stored from here on update the stats as they are stored, so only the events
+            # stored before the stats were deleted are rebuilt from the event log
+            max_storage_id = conn.execute(
+                db.select([db.func.max(SqlEventLogStorageTable.c.id)]).where(
+                    SqlEventLogStorageTable.c.run_id == run_id
+                )
+            ).scalar()
+
+        if max_storage_id is None:
+            return
+
+        records = takewhile(
+            lambda record: record.storage_id <= max_storage_id,
+            self.iter_records_for_run(
+                run_id, of_type=RUN_STATS_EVENT_TYPES | STEP_STATS_EVENT_TYPES
+            ),
+        )
+        while True:
+            chunk = [
+                record.event_log_entry
+                for record in islice(records, DEFAULT_RECORDS_FOR_RUN_CHUNK_SIZE)
+            ]
+            if not chunk:
+                break
+            with self.run_transaction(run_id) as conn:
+                self.update_run_stats(conn, run_id, chunk)
+
     def get_records_for_run(
         self,
         run_id,
@@ -408,6 +787,80 @@ def get_records_for_run(
         check.str_param(run_id, "run_id")
         check.opt_str_param(cursor, "cursor")
 
+        query = self._get_records_for_run_query(run_id, of_type)
+
+        # adjust 0 based index cursor to SQL offset
+        if cursor is not None:
+            cursor_obj = EventLogCursor.parse(cursor)
+            if cursor_obj.is_offset_cursor():
+                query = query.offset(cursor_obj.offset())
+            elif cursor_obj.is_id_cursor():
+                query = query.where(SqlEventLogStorageTable.c.id > cursor_obj.storage_id())
+
+        if limit:
+            query = query.limit(limit)
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        records = self._deserialize_records_for_run(run_id, results)
+        last_record_id = records[-1].storage_id if records else None
+
+        if last_record_id is not None:
+            next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
+        elif cursor:
+            # record fetch returned no new logs, return the same cursor
+            next_cursor = cursor
+        else:
+            # rely on the fact that all storage ids will be positive integers
+            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+
+        return EventLogConnection(
+            records=records,
+            cursor=next_cursor,
+            has_more=bool(limit and len(results) == limit),
+        )
+
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        chunk_size: int = DEFAULT_RECORDS_FOR_RUN_CHUNK_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        check.str_param(run_id, "run_id")
+        check.opt_str_param(cursor, "cursor")
+        check.int_param(chunk_size, "chunk_size")
+        check.invariant(chunk_size > 0, "chunk_size must be positive")
+
+        query = self._get_records_for_run_query(run_id, of_type)
+        cursor_obj = EventLogCursor.parse(cursor) if cursor is not None else None
+
+        # Scan the run's events in chunks of ids greater than the last record fetched, each with its
+        # own short-lived connection, so that no connection or transaction is held open while the
+        # records are consumed. Only the first chunk needs an offset, if one was provided.
+        offset = cursor_obj.offset() if cursor_obj and cursor_obj.is_offset_cursor() else None
+        after_id = cursor_obj.storage_id() if cursor_obj and cursor_obj.is_id_cursor() else None
+        while True:
+            chunk_query = query
+            if after_id is not None:
+                chunk_query = chunk_query.where(SqlEventLogStorageTable.c.id > after_id)
+            elif offset:
+                chunk_query = chunk_query.offset(offset)
+
+            with self.run_connection(run_id) as conn:
+                rows = conn.execute(chunk_query.limit(chunk_size)).fetchall()
+
+            yield from self._deserialize_records_for_run(run_id, rows)
+            if len(rows) < chunk_size:
+                return
+            after_id = rows[-1][0]
+
+    def _get_records_for_run_query(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+    ) -> SqlAlchemyQuery:
         check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
 
         dagster_event_types = (
@@ -427,56 +880,76 @@ def get_records_for_run(
                     [dagster_event_type.value for dagster_event_type in dagster_event_types]
                 )
             )
+        return query
 
-        # adjust 0 based index cursor to SQL offset
-        if cursor is not None:
-            cursor_obj = EventLogCursor.parse(cursor)
-            if cursor_obj.is_offset_cursor():
-                query = query.offset(cursor_obj.offset())
-            elif cursor_obj.is_id_cursor():
-                query = query.where(SqlEventLogStorageTable.c.id > cursor_obj.storage_id())
+    def _deserialize_records_for_run(
+        self, run_id: str, rows: Sequence[SqlAlchemyRow]
+    ) -> Sequence[EventLogRecord]:
+        try:
+            return [
+                EventLogRecord(
+                    storage_id=record_id,
+                    event_log_entry=deserialize_value(json_str, EventLogEntry),
+                )
+                for (record_id, json_str) in rows
+            ]
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def get_records_for_runs(
+        self,
+        cursor_by_run_id: Mapping[str, Optional[int]],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        check.mapping_param(cursor_by_run_id, "cursor_by_run_id", key_type=str)
+        check.opt_int_param(limit, "limit")
 
+        if self.is_run_sharded:
+            # run shards do not share a table, so each run needs to be queried separately
+            return super().get_records_for_runs(cursor_by_run_id, limit)
+
+        if not cursor_by_run_id:
+            return []
+
+        run_filters = [
+            db.and_(
+                SqlEventLogStorageTable.c.run_id == run_id,
+                SqlEventLogStorageTable.c.id > storage_id,
+            )
+            if storage_id is not None
+            else SqlEventLogStorageTable.c.run_id == run_id
+            for run_id, storage_id in cursor_by_run_id.items()
+        ]
+        query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(db.or_(*run_filters))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
         if limit:
             query = query.limit(limit)
 
-        with self.run_connection(run_id) as conn:
+        with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
 
-        last_record_id = None
-        try:
-            records = []
-            for (
-                record_id,
-                json_str,
-            ) in results:
+        records = []
+        for record_id, json_str in results:
+            try:
                 records.append(
                     EventLogRecord(
                         storage_id=record_id,
                         event_log_entry=deserialize_value(json_str, EventLogEntry),
                     )
                 )
-                last_record_id = record_id
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
-
-        if last_record_id is not None:
-            next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
-        elif cursor:
-            # record fetch returned no new logs, return the same cursor
-            next_cursor = cursor
-        else:
-            # rely on the fact that all storage ids will be positive integers
-            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
-
-        return EventLogConnection(
-            records=records,
-            cursor=next_cursor,
-            has_more=bool(limit and len(results) == limit),
-        )
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning("Could not parse event record id `%s`.", record_id)
+        return records
 
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
+        if self._should_read_run_stats_tables():
+            return self._get_stats_for_run_from_run_stats_table(run_id)
+
         query = (
             db.select(
                 [
@@ -531,12 +1004,33 @@ def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def _get_stats_for_run_from_run_stats_table(self, run_id: str) -> DagsterRunStatsSnapshot:
+        with self.run_connection(run_id) as conn:
+            row = conn.execute(
+                db.select([RunStatsTable]).where(RunStatsTable.c.run_id == run_id)
+            ).fetchone()
+
+        return DagsterRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=row.steps_succeeded if row else 0,
+            steps_failed=row.steps_failed if row else 0,
+            materializations=row.materializations if row else 0,
+            expectations=row.expectations if row else 0,
+            enqueued_time=row.enqueued_time if row else None,
+            launch_time=row.launch_time if row else None,
+            start_time=row.start_time if row else None,
+            end_time=row.end_time if row else None,
+        )
+
     def get_step_stats_for_run(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
     ) -> Sequence[RunStepKeyStatsSnapshot]:
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self._should_read_run_stats_tables():
+            return self._get_step_stats_for_run_from_run_step_stats_table(run_id, step_keys)
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -585,6 +1079,75 @@ def get_step_stats_for_run(
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def _get_step_stats_for_run_from_run_step_stats_table(
+        self, run_id: str, step_keys: Optional[Sequence[str]]
+    ) -> Sequence[RunStepKeyStatsSnapshot]:
+        step_stats_query = (
+            db.select([RunStepStatsTable])
+            .where(RunStepStatsTable.c.run_id == run_id)
+            .order_by(RunStepStatsTable.c.id.asc())
+        )
+        # materializations and expectation results aren't summarized, so they are loaded from the
+        # event log, without having to read the rest of the run's events
+        raw_event_query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [
+                        DagsterEventType.ASSET_MATERIALIZATION.value,
+                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if step_keys:
+            step_stats_query = step_stats_query.where(RunStepStatsTable.c.step_key.in_(step_keys))
+            raw_event_query = raw_event_query.where(
+                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+            )
+
+        with self.run_connection(run_id) as conn:
+            step_stats_rows = conn.execute(step_stats_query).fetchall()
+            raw_event_results = conn.execute(raw_event_query).fetchall()
+
+        materialization_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        expectation_results: Dict[str, List[ExpectationResult]] = defaultdict(list)
+        try:
+            for (json_str,) in raw_event_results:
+                event = deserialize_value(json_str, EventLogEntry)
+                dagster_event = event.get_dagster_event()
+                step_key = check.not_none(dagster_event.step_key)
+                if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                    materialization_events[step_key].append(event)
+                else:
+                    expectation_data = cast(
+                        StepExpectationResultData, dagster_event.event_specific_data
+                    )
+                    expectation_results[step_key].append(expectation_data.expectation_result)
+
+            step_stats = []
+            for row in step_stats_rows:
+                summary = _run_step_stats_summary_from_row(row)
+                if not (
+                    summary.has_step_events
+                    or materialization_events[row.step_key]
+                    or expectation_results[row.step_key]
+                ):
+                    continue
+                step_stats.append(
+                    summary.to_snapshot(
+                        run_id,
+                        materialization_events=materialization_events[row.step_key],
+                        expectation_results=expectation_results[row.step_key],
+                    )
+                )
+            return step_stats
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -601,6 +1164,13 @@ def _apply_migration(self, migration_name, migration_fn, print_fn, force):
     def reindex_events(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
         """Call this method to run any data migrations across the event_log table."""
         for migration_name, migration_fn in EVENT_LOG_DATA_MIGRATIONS.items():
+            if migration_name == RUN_STATS_TABLES and not self.has_run_stats_tables():
+                if print_fn:
+                    print_fn(
+                        f"Skipping data migration: {migration_name}, run `dagster instance migrate`"
+                        " to create the run stats tables first"
+                    )
+                continue
             self._apply_migration(migration_name, migration_fn, print_fn, force)
 
     def reindex_assets(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
@@ -624,6 +1194,10 @@ def wipe(self) -> None:
             if self.has_table("dynamic_partitions"):
                 conn.execute(DynamicPartitionsTable.delete())
 
+            if self.has_run_stats_tables():
+                conn.execute(RunStatsTable.delete())
+                conn.execute(RunStepStatsTable.delete())
+
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())
             conn.execute(AssetKeyTable.delete())
@@ -634,6 +1208,10 @@ def wipe(self) -> None:
             if self.has_table("dynamic_partitions"):
                 conn.execute(DynamicPartitionsTable.delete())
 
+            if self.has_run_stats_tables():
+                conn.execute(RunStatsTable.delete())
+                conn.execute(RunStepStatsTable.delete())
+
     def delete_events(self, run_id: str) -> None:
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
@@ -658,6 +1236,9 @@ def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
             for row in conn.execute(removed_asset_key_query).fetchall()
         ]
         conn.execute(delete_statement)
+        if self.has_run_stats_tables():
+            conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+            conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
         if len(removed_asset_keys) > 0:
             keys_to_check = []
             keys_to_check.extend([key.to_string() for key in removed_asset_keys])  # type: ignore  # (bad sig?)
@@ -865,6 +1446,43 @@ def _apply_tags_table_joins(
             )
         return table
 
+    def get_event_record_asset_keys(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[Tuple[int, Optional[AssetKey]]]:
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.opt_int_param(limit, "limit")
+        check.bool_param(ascending, "ascending")
+
+        if (
+            event_records_filter.event_type not in ASSET_EVENTS
+            or event_records_filter.asset_key
+            or event_records_filter.tags
+        ):
+            # only asset events are indexed by asset key in every storage, and asset key and tag
+            # filters depend on wipe and tag handling in get_event_records
+            return super().get_event_record_asset_keys(event_records_filter, limit, ascending)
+
+        query = db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.asset_key])
+        query = self._apply_filter_to_query(query=query, event_records_filter=event_records_filter)
+        if limit:
+            query = query.limit(limit)
+
+        if ascending:
+            query = query.order_by(SqlEventLogStorageTable.c.id.asc())
+        else:
+            query = query.order_by(SqlEventLogStorageTable.c.id.desc())
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        return [
+            (row_id, AssetKey.from_db_string(asset_key_str) if asset_key_str else None)
+            for row_id, asset_key_str in rows
+        ]
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -1671,6 +2289,123 @@ def get_materialization_count_by_partition(
 
         return materialization_count_by_partition
 
+    def get_latest_materialization_records(
+        self,
+        asset_partitions: Sequence[AssetKeyPartitionKey],
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[AssetKeyPartitionKey, EventLogRecord]:
+        check.sequence_param(asset_partitions, "asset_partitions", AssetKeyPartitionKey)
+        check.opt_int_param(after_cursor, "after_cursor")
+
+        asset_partitions = list(dict.fromkeys(asset_partitions))
+        if not asset_partitions:
+            return {}
+
+        asset_keys = list({asset_partition.asset_key for asset_partition in asset_partitions})
+        assets_details_by_asset_key = dict(zip(asset_keys, self._get_assets_details(asset_keys)))
+
+        # asset partitions without a partition key are grouped by asset key alone, so they are
+        # queried separately from the asset partitions with a partition key
+        unpartitioned = [
+            asset_partition
+            for asset_partition in asset_partitions
+            if asset_partition.partition_key is None
+        ]
+        partitioned = [
+            asset_partition
+            for asset_partition in asset_partitions
+            if asset_partition.partition_key is not None
+        ]
+
+        latest_materialization_records: Dict[AssetKeyPartitionKey, EventLogRecord] = {}
+        for chunk_asset_partitions, group_by_partition in [
+            *(
+                (unpartitioned[i : i + LATEST_MATERIALIZATION_RECORDS_CHUNK_SIZE], False)
+                for i in range(0, len(unpartitioned), LATEST_MATERIALIZATION_RECORDS_CHUNK_SIZE)
+            ),
+            *(
+                (partitioned[i : i + LATEST_MATERIALIZATION_RECORDS_CHUNK_SIZE], True)
+                for i in range(0, len(partitioned), LATEST_MATERIALIZATION_RECORDS_CHUNK_SIZE)
+            ),
+        ]:
+            chunk_asset_keys = list(
+                {asset_partition.asset_key for asset_partition in chunk_asset_partitions}
+            )
+            group_by_columns = (
+                [SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition]
+                if group_by_partition
+                else [SqlEventLogStorageTable.c.asset_key]
+            )
+            latest_event_ids_subquery = db.select(
+                [*group_by_columns, db.func.max(SqlEventLogStorageTable.c.id).label("id")]
+            ).where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in chunk_asset_keys]
+                    ),
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+            if group_by_partition:
+                latest_event_ids_subquery = latest_event_ids_subquery.where(
+                    SqlEventLogStorageTable.c.partition.in_(
+                        list(
+                            {
+                                asset_partition.partition_key
+                                for asset_partition in chunk_asset_partitions
+                            }
+                        )
+                    )
+                )
+            if after_cursor is not None:
+                latest_event_ids_subquery = latest_event_ids_subquery.where(
+                    SqlEventLogStorageTable.c.id > after_cursor
+                )
+            latest_event_ids_subquery = (
+                self._add_assets_wipe_filter_to_query(
+                    latest_event_ids_subquery,
+                    [assets_details_by_asset_key[asset_key] for asset_key in chunk_asset_keys],
+                    chunk_asset_keys,
+                )
+                .group_by(*group_by_columns)
+                .alias("latest_event_ids")
+            )
+
+            query = db.select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            ).select_from(
+                latest_event_ids_subquery.join(
+                    SqlEventLogStorageTable,
+                    SqlEventLogStorageTable.c.id == latest_event_ids_subquery.c.id,
+                )
+            )
+
+            with self.index_connection() as conn:
+                rows = conn.execute(query).fetchall()
+
+            chunk_asset_partitions_set = set(chunk_asset_partitions)
+            for asset_key_str, partition, storage_id, event_json in rows:
+                asset_key = AssetKey.from_db_string(asset_key_str)
+                if not asset_key:
+                    continue
+                asset_partition = AssetKeyPartitionKey(
+                    asset_key, partition if group_by_partition else None
+                )
+                # the query may match asset keys and partitions that were requested separately
+                if asset_partition in chunk_asset_partitions_set:
+                    latest_materialization_records[asset_partition] = EventLogRecord(
+                        storage_id=storage_id,
+                        event_log_entry=deserialize_value(event_json, EventLogEntry),
+                    )
+
+        return latest_materialization_records
+
     def get_latest_asset_partition_materialization_attempts_without_materializations(
         self, asset_key: AssetKey
     ) -> Mapping[str, Tuple[str, int]]:
@@ -45,8 +45,8 @@
 from dagster._serdes.serdes import deserialize_value
 from dagster._utils import mkdir_p
 
-from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..schema import RunStatsTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage, group_events_by_run
 
 if TYPE_CHECKING:
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
@@ -149,6 +149,15 @@ def has_table(self, table_name: str) -> bool:
         with engine.connect() as conn:
             return bool(engine.dialect.has_table(conn, table_name))
 
+    def rebuild_run_stats(self, run_id: str) -> None:
+        # skip databases in the base directory that aren't run shards, like the `runs.db` of the run
+        # storage, and run shards that haven't been upgraded to have the run stats tables
+        with self.run_connection(run_id) as conn:
+            if not conn.dialect.has_table(conn, RunStatsTable.name):
+                return
+
+        super().rebuild_run_stats(run_id)
+
     def path_for_shard(self, run_id: str) -> str:
         return os.path.join(self._base_dir, f"{run_id}.db")
 
@@ -237,8 +246,9 @@ def store_event(self, event: EventLogEntry) -> None:
         insert_event_statement = self.prepare_insert_event(event)
         run_id = event.run_id
 
-        with self.run_connection(run_id) as conn:
+        with self.run_transaction(run_id) as conn:
             conn.execute(insert_event_statement)
+            self.update_run_stats(conn, run_id, [event])
 
         if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
             check.invariant(
@@ -265,6 +275,45 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run's events to its own shard in a single transaction,
+        then mirror the batch's asset events in the central assets.db sqlite shard.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in group_events_by_run(events):
+            with self.run_transaction(run_id) as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.insert(),
+                    [self.get_insert_event_values(event) for event in run_events],
+                )
+                self.update_run_stats(conn, run_id, run_events)
+
+        index_events = []
+        for event in events:
+            if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
+                check.invariant(
+                    event.dagster_event_type in ASSET_EVENTS,
+                    (
+                        "Can only store asset materializations, materialization_planned, and"
+                        " observations in index database"
+                    ),
+                )
+                index_events.append(event)
+
+        if not index_events:
+            return
+
+        # mirror the asset events in the cross-run index database
+        with self.index_connection() as conn:
+            with conn.begin():
+                asset_events = self.insert_event_batch(conn, index_events)
+
+        self.store_asset_event_batch(asset_events)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
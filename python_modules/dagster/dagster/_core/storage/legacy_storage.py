@@ -1,6 +1,7 @@
 from typing import (
     TYPE_CHECKING,
     Iterable,
+    Iterator,
     Mapping,
     Optional,
     Sequence,
@@ -17,6 +18,7 @@
 
 from .base_storage import DagsterStorage
 from .event_log.base import (
+    DEFAULT_RECORDS_FOR_RUN_CHUNK_SIZE,
     AssetRecord,
     EventLogConnection,
     EventLogRecord,
@@ -27,7 +29,7 @@
 from .schedules.base import ScheduleStorage
 
 if TYPE_CHECKING:
-    from dagster._core.definitions.events import AssetKey
+    from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
     from dagster._core.definitions.run_request import InstigatorType
     from dagster._core.events import DagsterEvent, DagsterEventType
     from dagster._core.events.log import EventLogEntry
@@ -184,6 +186,9 @@ def from_config_value(
     def add_run(self, dagster_run: "DagsterRun") -> "DagsterRun":
         return self._storage.run_storage.add_run(dagster_run)
 
+    def add_runs(self, dagster_runs: Sequence["DagsterRun"]) -> Sequence["DagsterRun"]:
+        return self._storage.run_storage.add_runs(dagster_runs)
+
     def handle_run_event(self, run_id: str, event: "DagsterEvent") -> None:
         return self._storage.run_storage.handle_run_event(run_id, event)
 
@@ -231,6 +236,11 @@ def get_run_tags(
     ) -> Sequence[Tuple[str, Set[str]]]:
         return self._storage.run_storage.get_run_tags(tag_keys, value_prefix, limit)
 
+    def get_run_tags_by_run_id(
+        self, filters: "RunsFilter", tag_keys: Sequence[str]
+    ) -> Mapping[str, Mapping[str, str]]:
+        return self._storage.run_storage.get_run_tags_by_run_id(filters, tag_keys)
+
     def get_run_tag_keys(self) -> Sequence[str]:
         return self._storage.run_storage.get_run_tag_keys()
 
@@ -385,6 +395,24 @@ def get_logs_for_run(
     ) -> Iterable["EventLogEntry"]:
         return self._storage.event_log_storage.get_logs_for_run(run_id, cursor, of_type, limit)
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        chunk_size: int = DEFAULT_RECORDS_FOR_RUN_CHUNK_SIZE,
+    ) -> Iterator["EventLogRecord"]:
+        return self._storage.event_log_storage.iter_records_for_run(
+            run_id, cursor, of_type, chunk_size
+        )
+
+    def get_records_for_runs(
+        self,
+        cursor_by_run_id: Mapping[str, Optional[int]],
+        limit: Optional[int] = None,
+    ) -> Sequence["EventLogRecord"]:
+        return self._storage.event_log_storage.get_records_for_runs(cursor_by_run_id, limit)
+
     def get_stats_for_run(self, run_id: str) -> "DagsterRunStatsSnapshot":
         return self._storage.event_log_storage.get_stats_for_run(run_id)
 
@@ -396,6 +424,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_events(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -439,6 +470,16 @@ def get_event_records(
             event_records_filter, limit, ascending  # type: ignore
         )
 
+    def get_event_record_asset_keys(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[Tuple[int, Optional["AssetKey"]]]:
+        return self._storage.event_log_storage.get_event_record_asset_keys(
+            event_records_filter, limit, ascending
+        )
+
     def get_asset_records(
         self, asset_keys: Optional[Sequence["AssetKey"]] = None
     ) -> Iterable[AssetRecord]:
@@ -476,6 +517,15 @@ def get_materialization_count_by_partition(
             asset_keys, after_cursor
         )
 
+    def get_latest_materialization_records(
+        self,
+        asset_partitions: Sequence["AssetKeyPartitionKey"],
+        after_cursor: Optional[int] = None,
+    ) -> Mapping["AssetKeyPartitionKey", EventLogRecord]:
+        return self._storage.event_log_storage.get_latest_materialization_records(
+            asset_partitions, after_cursor
+        )
+
     def get_latest_asset_partition_materialization_attempts_without_materializations(
         self, asset_key: "AssetKey"
     ) -> Mapping[str, Tuple[str, int]]:
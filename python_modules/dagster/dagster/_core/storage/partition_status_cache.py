@@ -15,6 +15,7 @@
 )
 from dagster._core.definitions.partition import (
     DynamicPartitionsDefinition,
+    OrdinalPartitionsSubset,
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
@@ -131,28 +132,115 @@ def from_db_string(db_string: str) -> Optional["AssetStatusCacheValue"]:
         return cached_data
 
     def deserialize_materialized_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
         if not self.serialized_materialized_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_materialized_partition_subset)
+        return _deserialize_subset(
+            partitions_def, self.serialized_materialized_partition_subset, dynamic_partitions_store
+        )
 
     def deserialize_failed_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
         if not self.serialized_failed_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_failed_partition_subset)
+        return _deserialize_subset(
+            partitions_def, self.serialized_failed_partition_subset, dynamic_partitions_store
+        )
 
     def deserialize_in_progress_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
         if not self.serialized_in_progress_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_in_progress_partition_subset)
+        return _deserialize_subset(
+            partitions_def, self.serialized_in_progress_partition_subset, dynamic_partitions_store
+        )
+
+
+def _deserialize_subset(
+    partitions_def: PartitionsDefinition,
+    serialized: str,
+    dynamic_partitions_store: Optional[DynamicPartitionsStore],
+) -> PartitionsSubset:
+    if OrdinalPartitionsSubset.can_deserialize(partitions_def, serialized, None, None):
+        return OrdinalPartitionsSubset.from_serialized(
+            partitions_def, serialized, dynamic_partitions_store
+        )
+    return partitions_def.deserialize_subset(serialized)
+
+
+def get_empty_partitions_subset(
+    partitions_def: PartitionsDefinition, dynamic_partitions_store: DynamicPartitionsStore
+) -> PartitionsSubset:
+    """Returns the empty subset that the status cache builds partition subsets from. Static and
+    dynamic partition subsets are stored as bitmaps over the ordinals of the current partition keys,
+    which keeps them compact for partitions definitions with many keys.
+    """
+    if isinstance(partitions_def, (StaticPartitionsDefinition, DynamicPartitionsDefinition)):
+        return OrdinalPartitionsSubset.empty_subset(partitions_def, dynamic_partitions_store)
+    return partitions_def.empty_subset()
+
+
+def _deserialize_cached_subset(
+    empty_subset: PartitionsSubset,
+    partitions_def: PartitionsDefinition,
+    serialized: Optional[str],
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> PartitionsSubset:
+    if not serialized:
+        return empty_subset
+
+    subset = _deserialize_subset(partitions_def, serialized, dynamic_partitions_store)
+    if isinstance(empty_subset, OrdinalPartitionsSubset) and not isinstance(
+        subset, OrdinalPartitionsSubset
+    ):
+        # subsets cached before static and dynamic subsets were stored as ordinals
+        return with_validated_partition_keys(
+            empty_subset,
+            dynamic_partitions_store,
+            partitions_def,
+            set(subset.get_partition_keys()),
+        )
+    return subset
+
+
+def _get_partitions_def_id(
+    partitions_def: PartitionsDefinition,
+    empty_subset: PartitionsSubset,
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> str:
+    if isinstance(empty_subset, OrdinalPartitionsSubset):
+        # use the id of the keys the subsets were built from, even if they have changed since
+        return empty_subset.partitions_def_id
+    return partitions_def.get_serializable_unique_identifier(
+        dynamic_partitions_store=dynamic_partitions_store
+    )
+
+
+def with_validated_partition_keys(
+    subset: PartitionsSubset,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    partitions_def: PartitionsDefinition,
+    partition_keys: Set[str],
+) -> PartitionsSubset:
+    if not partition_keys:
+        return subset
+    if isinstance(subset, OrdinalPartitionsSubset):
+        return subset.with_partition_keys(subset.filter_valid_partition_keys(partition_keys))
+    return subset.with_partition_keys(
+        get_validated_partition_keys(dynamic_partitions_store, partitions_def, partition_keys)
+    )
 
 
 def get_materialized_multipartitions(
@@ -232,26 +320,22 @@ def _build_status_cache(
             if count > 0
         ]
 
-    serialized_materialized_partition_subset = partitions_def.empty_subset()
+    empty_subset = get_empty_partitions_subset(partitions_def, dynamic_partitions_store)
 
-    serialized_materialized_partition_subset = (
-        serialized_materialized_partition_subset.with_partition_keys(
-            get_validated_partition_keys(
-                dynamic_partitions_store, partitions_def, set(materialized_keys)
-            )
-        )
+    materialized_subset = with_validated_partition_keys(
+        empty_subset, dynamic_partitions_store, partitions_def, set(materialized_keys)
     )
 
     failed_subset, in_progress_subset, cursor = build_failed_and_in_progress_partition_subset(
-        instance, asset_key, partitions_def, dynamic_partitions_store
+        instance, asset_key, partitions_def, dynamic_partitions_store, empty_subset=empty_subset
     )
 
     return AssetStatusCacheValue(
         latest_storage_id=latest_storage_id,
-        partitions_def_id=partitions_def.get_serializable_unique_identifier(
-            dynamic_partitions_store=dynamic_partitions_store
+        partitions_def_id=_get_partitions_def_id(
+            partitions_def, empty_subset, dynamic_partitions_store
         ),
-        serialized_materialized_partition_subset=serialized_materialized_partition_subset.serialize(),
+        serialized_materialized_partition_subset=materialized_subset.serialize(),
         serialized_failed_partition_subset=failed_subset.serialize(),
         serialized_in_progress_partition_subset=in_progress_subset.serialize(),
         earliest_in_progress_materialization_event_id=cursor,
@@ -263,13 +347,19 @@ def build_failed_and_in_progress_partition_subset(
     asset_key: AssetKey,
     partitions_def: PartitionsDefinition,
     dynamic_partitions_store: DynamicPartitionsStore,
+    empty_subset: Optional[PartitionsSubset] = None,
 ) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
+    empty_subset = (
+        empty_subset
+        if empty_subset is not None
+        else get_empty_partitions_subset(partitions_def, dynamic_partitions_store)
+    )
     incomplete_materializations = instance.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations(
         asset_key
     )
 
     if not incomplete_materializations:
-        return partitions_def.empty_subset(), partitions_def.empty_subset(), None
+        return empty_subset, empty_subset, None
 
     finished_runs = {
         r.run_id: r.status
@@ -296,18 +386,12 @@ def build_failed_and_in_progress_partition_subset(
                 cursor = event_id
 
     return (
-        partitions_def.empty_subset().with_partition_keys(
-            get_validated_partition_keys(
-                dynamic_partitions_store, partitions_def, new_failed_partitions
-            )
-        )
-        if new_failed_partitions
-        else partitions_def.empty_subset(),
-        partitions_def.empty_subset().with_partition_keys(
-            get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
-        )
-        if in_progress_partitions
-        else partitions_def.empty_subset(),
+        with_validated_partition_keys(
+            empty_subset, dynamic_partitions_store, partitions_def, new_failed_partitions
+        ),
+        with_validated_partition_keys(
+            empty_subset, instance, partitions_def, in_progress_partitions
+        ),
         cursor,
     )
 
@@ -319,6 +403,7 @@ def _get_updated_failed_and_in_progress_partition_subset(
     current_cached_subset: PartitionsSubset,
     unevaluated_event_records: Sequence[EventLogRecord],
     dynamic_partitions_store: DynamicPartitionsStore,
+    empty_subset: PartitionsSubset,
 ) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
     current_failed_partitions = set(current_cached_subset.get_partition_keys())
 
@@ -364,13 +449,14 @@ def _get_updated_failed_and_in_progress_partition_subset(
                     cursor = record.storage_id
 
     return (
-        partitions_def.empty_subset().with_partition_keys(
-            get_validated_partition_keys(
-                instance, partitions_def, new_failed_partitions | current_failed_partitions
-            )
+        with_validated_partition_keys(
+            empty_subset,
+            instance,
+            partitions_def,
+            new_failed_partitions | current_failed_partitions,
         ),
-        partitions_def.empty_subset().with_partition_keys(
-            get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
+        with_validated_partition_keys(
+            empty_subset, instance, partitions_def, in_progress_partitions
         ),
         cursor,
     )
@@ -419,19 +505,16 @@ def _get_updated_status_cache(
     if not partitions_def or not is_cacheable_partition_type(partitions_def):
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
+    empty_subset = get_empty_partitions_subset(partitions_def, dynamic_partitions_store)
     check.invariant(
         current_status_cache_value.partitions_def_id
-        == partitions_def.get_serializable_unique_identifier(
-            dynamic_partitions_store=dynamic_partitions_store
-        )
+        == _get_partitions_def_id(partitions_def, empty_subset, dynamic_partitions_store)
     )
-    materialized_subset: PartitionsSubset = (
-        partitions_def.deserialize_subset(
-            current_status_cache_value.serialized_materialized_partition_subset
-        )
-        if current_status_cache_value
-        and current_status_cache_value.serialized_materialized_partition_subset
-        else partitions_def.empty_subset()
+    materialized_subset = _deserialize_cached_subset(
+        empty_subset,
+        partitions_def,
+        current_status_cache_value.serialized_materialized_partition_subset,
+        dynamic_partitions_store,
     )
     newly_materialized_partitions = set()
 
@@ -445,19 +528,15 @@ def _get_updated_status_cache(
         elif not record.event_log_entry.dagster_event.is_asset_materialization_planned:
             check.failed("Expected materialization or materialization planned event")
 
-    materialized_subset = materialized_subset.with_partition_keys(
-        get_validated_partition_keys(
-            dynamic_partitions_store, partitions_def, newly_materialized_partitions
-        )
+    materialized_subset = with_validated_partition_keys(
+        materialized_subset, dynamic_partitions_store, partitions_def, newly_materialized_partitions
     )
 
-    failed_subset: PartitionsSubset = (
-        partitions_def.deserialize_subset(
-            current_status_cache_value.serialized_failed_partition_subset
-        )
-        if current_status_cache_value
-        and current_status_cache_value.serialized_failed_partition_subset
-        else partitions_def.empty_subset()
+    failed_subset = _deserialize_cached_subset(
+        empty_subset,
+        partitions_def,
+        current_status_cache_value.serialized_failed_partition_subset,
+        dynamic_partitions_store,
     )
 
     (
@@ -471,6 +550,7 @@ def _get_updated_status_cache(
         failed_subset,
         unevaluated_event_records,
         dynamic_partitions_store=dynamic_partitions_store,
+        empty_subset=empty_subset,
     )
 
     return AssetStatusCacheValue(
@@ -53,6 +53,20 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             dagster_run (DagsterRun): The run to add.
         """
 
+    def add_runs(self, dagster_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        """Add a batch of runs to storage.
+
+        Storages that can write the whole batch at once should override this method, so that the
+        runs are either all added or none of them are. By default, the runs are added one by one.
+
+        If a run already exists with the same ID, raise DagsterRunAlreadyExists
+        If a run's snapshot ID does not exist raise DagsterSnapshotDoesNotExist
+
+        Args:
+            dagster_runs (Sequence[DagsterRun]): The runs to add.
+        """
+        return [self.add_run(dagster_run) for dagster_run in dagster_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         """Update run storage in accordance to a pipeline run related DagsterEvent.
@@ -190,6 +204,25 @@ def get_run_tags(
             List[Tuple[str, Set[str]]]
         """
 
+    def get_run_tags_by_run_id(
+        self, filters: RunsFilter, tag_keys: Sequence[str]
+    ) -> Mapping[str, Mapping[str, str]]:
+        """Get the given tags of each of the runs that match the given filters, without loading
+        the runs themselves.
+
+        Args:
+            filters (RunsFilter): the filter by which to filter runs.
+            tag_keys (Sequence[str]): the tag keys to fetch for each run.
+
+        Returns:
+            Mapping[str, Mapping[str, str]]: The tags of each run, keyed by run id and ordered from
+                the oldest run to the newest.
+        """
+        return {
+            run.run_id: {key: value for key, value in run.tags.items() if key in tag_keys}
+            for run in reversed(self.get_runs(filters))
+        }
+
     @abstractmethod
     def get_run_tag_keys(self) -> Sequence[str]:
         """Get a list of tag keys.
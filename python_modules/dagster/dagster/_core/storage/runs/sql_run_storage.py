@@ -1,8 +1,11 @@
 import logging
+import threading
+import time
 import uuid
 import zlib
 from abc import abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from typing import (
@@ -11,6 +14,7 @@
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -57,6 +61,7 @@
 )
 from dagster._seven import JSONDecodeError
 from dagster._utils import PrintFn, utc_datetime_from_timestamp
+from dagster._utils.lru_cache import CacheStats, LRUCache
 from dagster._utils.merger import merge_dicts
 
 from ..pipeline_run import (
@@ -86,12 +91,114 @@
     SnapshotsTable,
 )
 
+# Runs and run tags are written in chunks, so that a multi-row insert stays within the bound
+# parameter limits of the databases we support (999 for older versions of SQLite)
+MAX_ROWS_PER_INSERT = 100
+
+
+def _run_row_values(dagster_run: DagsterRun) -> Dict[str, Any]:
+    has_tags = dagster_run.tags and len(dagster_run.tags) > 0
+    partition = dagster_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
+    partition_set = dagster_run.tags.get(PARTITION_SET_TAG) if has_tags else None
+
+    return dict(
+        run_id=dagster_run.run_id,
+        pipeline_name=dagster_run.job_name,
+        status=dagster_run.status.value,
+        run_body=serialize_value(dagster_run),
+        snapshot_id=dagster_run.job_snapshot_id,
+        partition=partition,
+        partition_set=partition_set,
+    )
+
+
+def _run_tag_rows(dagster_run: DagsterRun) -> Sequence[Dict[str, Any]]:
+    return [
+        dict(run_id=dagster_run.run_id, key=k, value=v)
+        for k, v in dagster_run.tags_for_storage().items()
+    ]
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
     EXECUTION_PLAN = "EXECUTION_PLAN"
 
 
+# Snapshots are immutable and keyed by a hash of their contents, so deserialized snapshots and the
+# ids of snapshots known to exist can be cached for the lifetime of the storage
+MAX_CACHED_SNAPSHOTS = 64
+MAX_CACHED_SNAPSHOT_IDS = 10000
+# A snapshot that is missing may be added by another process at any time, so lookups of missing
+# snapshots are only cached briefly
+MISSING_SNAPSHOT_ID_TTL_SECONDS = 5.0
+
+
+class _SnapshotCache:
+    """In-process cache of the snapshots read from and written to a run storage.
+
+    Shared by all of the threads that use the storage (e.g. dagit's request threads), so access is
+    guarded by a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshots: LRUCache[str, Union[JobSnapshot, ExecutionPlanSnapshot]] = LRUCache(
+            MAX_CACHED_SNAPSHOTS
+        )
+        self._existing_snapshot_ids: LRUCache[str, bool] = LRUCache(MAX_CACHED_SNAPSHOT_IDS)
+        # snapshot id => monotonic time after which the lookup must be repeated
+        self._missing_snapshot_ids: LRUCache[str, float] = LRUCache(MAX_CACHED_SNAPSHOT_IDS)
+
+    def get_snapshot(self, snapshot_id: str) -> Optional[Union[JobSnapshot, ExecutionPlanSnapshot]]:
+        with self._lock:
+            return self._snapshots[snapshot_id] if snapshot_id in self._snapshots else None
+
+    def has_snapshot_id(self, snapshot_id: str, allow_missing: bool = True) -> Optional[bool]:
+        """Returns whether the snapshot exists, or None if that is not known. Cached lookups of
+        missing snapshots are only used if allow_missing is set.
+        """
+        with self._lock:
+            if snapshot_id in self._existing_snapshot_ids:
+                return True
+            if not allow_missing or snapshot_id not in self._missing_snapshot_ids:
+                return None
+            if self._missing_snapshot_ids[snapshot_id] > time.monotonic():
+                return False
+            self._missing_snapshot_ids.discard(snapshot_id)
+            return None
+
+    def add_snapshot(
+        self,
+        snapshot_id: str,
+        snapshot: Optional[Union[JobSnapshot, ExecutionPlanSnapshot]] = None,
+    ) -> None:
+        with self._lock:
+            self._existing_snapshot_ids[snapshot_id] = True
+            self._missing_snapshot_ids.discard(snapshot_id)
+            if snapshot is not None:
+                self._snapshots[snapshot_id] = snapshot
+
+    def add_missing_snapshot_id(self, snapshot_id: str) -> None:
+        with self._lock:
+            self._missing_snapshot_ids[snapshot_id] = (
+                time.monotonic() + MISSING_SNAPSHOT_ID_TTL_SECONDS
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            for cache in (self._snapshots, self._existing_snapshot_ids, self._missing_snapshot_ids):
+                for key in list(cache):
+                    cache.discard(key)
+
+    def get_stats(self) -> Mapping[str, CacheStats]:
+        with self._lock:
+            return {
+                "snapshots": self._snapshots.stats,
+                "existing_snapshot_ids": self._existing_snapshot_ids.stats,
+                "missing_snapshot_ids": self._missing_snapshot_ids.stats,
+            }
+
+
 class SqlRunStorage(RunStorage):
     """Base class for SQL based run storages."""
 
@@ -105,6 +212,30 @@ def upgrade(self) -> None:
         out-of-date instance of the storage up to date.
         """
 
+    @property
+    def _snapshot_cache(self) -> _SnapshotCache:
+        # subclasses are not required to call a shared constructor, so the cache is created on
+        # first use
+        snapshot_cache = self.__dict__.get("_snapshot_cache_instance")
+        if snapshot_cache is None:
+            snapshot_cache = self.__dict__.setdefault("_snapshot_cache_instance", _SnapshotCache())
+        return snapshot_cache
+
+    def get_snapshot_cache_stats(self) -> Mapping[str, CacheStats]:
+        """Returns the number of hits, misses and entries for each of the in-process caches of
+        job and execution plan snapshots.
+        """
+        return self._snapshot_cache.get_stats()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        """Context manager yielding a sqlalchemy.engine.Connection, on which all of the statements
+        are committed together when the block exits, or rolled back if it raises.
+        """
+        with self.connect() as conn:
+            with conn.begin():
+                yield conn
+
     def fetchall(self, query: SqlAlchemyQuery) -> Sequence[Any]:
         with self.connect() as conn:
             result_proxy = conn.execute(query)
@@ -124,44 +255,76 @@ def fetchone(self, query: SqlAlchemyQuery) -> Optional[Any]:
     def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
         check.inst_param(dagster_run, "dagster_run", DagsterRun)
 
-        if dagster_run.job_snapshot_id and not self.has_job_snapshot(dagster_run.job_snapshot_id):
+        if dagster_run.job_snapshot_id and not self._has_snapshot_id(
+            dagster_run.job_snapshot_id, allow_cached_missing=False
+        ):
             raise DagsterSnapshotDoesNotExist(
                 "Snapshot {ss_id} does not exist in run storage".format(
                     ss_id=dagster_run.job_snapshot_id
                 )
             )
 
-        has_tags = dagster_run.tags and len(dagster_run.tags) > 0
-        partition = dagster_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
-        partition_set = dagster_run.tags.get(PARTITION_SET_TAG) if has_tags else None
-
-        runs_insert = RunsTable.insert().values(
-            run_id=dagster_run.run_id,
-            pipeline_name=dagster_run.job_name,
-            status=dagster_run.status.value,
-            run_body=serialize_value(dagster_run),
-            snapshot_id=dagster_run.job_snapshot_id,
-            partition=partition,
-            partition_set=partition_set,
-        )
+        runs_insert = RunsTable.insert().values(**_run_row_values(dagster_run))
         with self.connect() as conn:
             try:
                 conn.execute(runs_insert)
             except db_exc.IntegrityError as exc:
                 raise DagsterRunAlreadyExists from exc
 
-            tags_to_insert = dagster_run.tags_for_storage()
+            tags_to_insert = _run_tag_rows(dagster_run)
             if tags_to_insert:
-                conn.execute(
-                    RunTagsTable.insert(),
-                    [
-                        dict(run_id=dagster_run.run_id, key=k, value=v)
-                        for k, v in tags_to_insert.items()
-                    ],
-                )
+                conn.execute(RunTagsTable.insert(), tags_to_insert)
 
         return dagster_run
 
+    def add_runs(self, dagster_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        check.sequence_param(dagster_runs, "dagster_runs", of_type=DagsterRun)
+
+        if not dagster_runs:
+            return []
+
+        job_snapshot_ids = {
+            dagster_run.job_snapshot_id
+            for dagster_run in dagster_runs
+            if dagster_run.job_snapshot_id
+            and not self._snapshot_cache.has_snapshot_id(
+                dagster_run.job_snapshot_id, allow_missing=False
+            )
+        }
+        if job_snapshot_ids:
+            existing_snapshot_ids = {
+                row[0]
+                for row in self.fetchall(
+                    db.select([SnapshotsTable.c.snapshot_id]).where(
+                        SnapshotsTable.c.snapshot_id.in_(job_snapshot_ids)
+                    )
+                )
+            }
+            for snapshot_id in existing_snapshot_ids:
+                self._snapshot_cache.add_snapshot(snapshot_id)
+            missing_snapshot_ids = job_snapshot_ids - existing_snapshot_ids
+            if missing_snapshot_ids:
+                raise DagsterSnapshotDoesNotExist(
+                    "Snapshot {ss_id} does not exist in run storage".format(
+                        ss_id=sorted(missing_snapshot_ids)[0]
+                    )
+                )
+
+        run_rows = [_run_row_values(dagster_run) for dagster_run in dagster_runs]
+        tag_rows = [row for dagster_run in dagster_runs for row in _run_tag_rows(dagster_run)]
+
+        with self.transaction() as conn:
+            try:
+                for i in range(0, len(run_rows), MAX_ROWS_PER_INSERT):
+                    conn.execute(RunsTable.insert().values(run_rows[i : i + MAX_ROWS_PER_INSERT]))
+            except db_exc.IntegrityError as exc:
+                raise DagsterRunAlreadyExists from exc
+
+            for i in range(0, len(tag_rows), MAX_ROWS_PER_INSERT):
+                conn.execute(RunTagsTable.insert().values(tag_rows[i : i + MAX_ROWS_PER_INSERT]))
+
+        return dagster_runs
+
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         check.str_param(run_id, "run_id")
         check.inst_param(event, "event", DagsterEvent)
@@ -543,6 +706,37 @@ def get_run_tags(
             result[r[0]].add(r[1])
         return sorted(list([(k, v) for k, v in result.items()]), key=lambda x: x[0])
 
+    def get_run_tags_by_run_id(
+        self, filters: RunsFilter, tag_keys: Sequence[str]
+    ) -> Mapping[str, Mapping[str, str]]:
+        check.inst_param(filters, "filters", RunsFilter)
+        check.sequence_param(tag_keys, "tag_keys", of_type=str)
+
+        runs_subquery = self._runs_query(filters=filters, columns=["id", "run_id"]).alias(
+            "runs_subquery"
+        )
+        # outer join, so that runs without any of the tags are returned as well
+        query = (
+            db.select([runs_subquery.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value])
+            .select_from(
+                runs_subquery.outerjoin(
+                    RunTagsTable,
+                    db.and_(
+                        runs_subquery.c.run_id == RunTagsTable.c.run_id,
+                        RunTagsTable.c.key.in_(tag_keys),
+                    ),
+                )
+            )
+            .order_by(runs_subquery.c.id.asc())
+        )
+
+        tags_by_run_id: Dict[str, Dict[str, str]] = {}
+        for run_id, key, value in self.fetchall(query):
+            run_tags = tags_by_run_id.setdefault(run_id, {})
+            if key is not None:
+                run_tags[key] = value
+        return tags_by_run_id
+
     def get_run_tag_keys(self) -> Sequence[str]:
         query = (
             db.select([RunTagsTable.c.key])
@@ -824,7 +1018,7 @@ def get_job_snapshot(self, job_snapshot_id: str) -> JobSnapshot:
 
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
-        return bool(self.get_execution_plan_snapshot(execution_plan_snapshot_id))
+        return self._has_snapshot_id(execution_plan_snapshot_id)
 
     def add_execution_plan_snapshot(
         self, execution_plan_snapshot: ExecutionPlanSnapshot, snapshot_id: Optional[str] = None
@@ -857,7 +1051,9 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                 snapshot_type=snapshot_type.value,
             )
             conn.execute(snapshot_insert)
-            return snapshot_id
+
+        self._snapshot_cache.add_snapshot(snapshot_id, snapshot_obj)
+        return snapshot_id
 
     def get_run_storage_id(self) -> str:
         query = db.select([InstanceInfo.c.run_storage_id])
@@ -870,23 +1066,42 @@ def get_run_storage_id(self) -> str:
         else:
             return row[0]
 
-    def _has_snapshot_id(self, snapshot_id: str) -> bool:
+    def _has_snapshot_id(self, snapshot_id: str, allow_cached_missing: bool = True) -> bool:
+        cached = self._snapshot_cache.has_snapshot_id(
+            snapshot_id, allow_missing=allow_cached_missing
+        )
+        if cached is not None:
+            return cached
+
         query = db.select([SnapshotsTable.c.snapshot_id]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
 
+        if row:
+            self._snapshot_cache.add_snapshot(snapshot_id)
+        else:
+            self._snapshot_cache.add_missing_snapshot_id(snapshot_id)
+
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnapshot]:
+        cached = self._snapshot_cache.get_snapshot(snapshot_id)
+        if cached is not None:
+            return cached  # type: ignore
+
         query = db.select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
 
-        return defensively_unpack_execution_plan_snapshot_query(logging, row) if row else None  # type: ignore
+        snapshot = defensively_unpack_execution_plan_snapshot_query(logging, row) if row else None
+        if snapshot is not None:
+            self._snapshot_cache.add_snapshot(snapshot_id, snapshot)
+
+        return snapshot  # type: ignore
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -1065,6 +1280,8 @@ def wipe(self) -> None:
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
 
+        self._snapshot_cache.clear()
+
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
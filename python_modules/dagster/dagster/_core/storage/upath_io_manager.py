@@ -1,5 +1,7 @@
+import time
 from abc import abstractmethod
-from typing import Any, Dict, Mapping, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Sequence, TypeVar, Union
 
 from upath import UPath
 
@@ -12,6 +14,8 @@
 )
 from dagster._core.storage.memoizable_io_manager import MemoizableIOManager
 
+T = TypeVar("T")
+
 
 class UPathIOManager(MemoizableIOManager):
     """Abstract IOManager base class compatible with local and cloud storage via `universal-pathlib` and `fsspec`.
@@ -23,10 +27,15 @@ class UPathIOManager(MemoizableIOManager):
      - the `get_metadata` method can be customized to add additional metadata to the output
      - the `allow_missing_partitions` metadata value can be set to `True` to skip missing partitions
        (the default behavior is to raise an error)
+     - multiple partitions are loaded concurrently by up to `partition_load_concurrency` threads,
+       which can be overridden with the `partition_load_concurrency` input metadata value
+     - the `lazy_load_partitions` metadata value can be set to `True` to load multiple partitions
+       on access instead of upfront (the input must not have a type annotation other than `Any`)
 
     """
 
     extension: Optional[str] = None  # override in child class
+    partition_load_concurrency: int = 1  # override in child class
 
     def __init__(
         self,
@@ -174,40 +183,91 @@ def _load_single_input(
         context.add_input_metadata({"path": MetadataValue.path(str(path))})
         return obj
 
-    def _load_multiple_inputs(self, context: InputContext) -> Dict[str, Any]:
+    def _load_partition_from_path(
+        self, context: InputContext, path: UPath, backcompat_path: Optional[UPath] = None
+    ) -> Any:
+        context.log.debug(f"Loading partition from {path} using {self.__class__.__name__}")
+        try:
+            return self.load_from_path(context=context, path=path)
+        except FileNotFoundError as e:
+            if backcompat_path is not None:
+                try:
+                    return self.load_from_path(context=context, path=backcompat_path)
+                except FileNotFoundError:
+                    pass
+            raise e
+
+    def _partition_exists(self, path: UPath, backcompat_path: Optional[UPath] = None) -> bool:
+        return self.path_exists(path) or (
+            backcompat_path is not None and self.path_exists(backcompat_path)
+        )
+
+    def _load_multiple_inputs(self, context: InputContext) -> Mapping[str, Any]:
         # load multiple partitions
-        allow_missing_partitions = (
-            context.metadata.get("allow_missing_partitions", False)
-            if context.metadata is not None
-            else False
+        input_metadata = context.metadata or {}
+        allow_missing_partitions = input_metadata.get("allow_missing_partitions", False)
+        concurrency = check.int_param(
+            input_metadata.get("partition_load_concurrency", self.partition_load_concurrency),
+            "partition_load_concurrency",
         )
 
-        objs: Dict[str, Any] = {}
         paths = self._get_paths_for_partitions(context)
         backcompat_paths = self._get_multipartition_backcompat_paths(context)
+        partition_keys = list(paths.keys())
+
+        if input_metadata.get("lazy_load_partitions", False):
+            if allow_missing_partitions:
+                partitions_exist = _map_concurrently(
+                    lambda key: self._partition_exists(paths[key], backcompat_paths.get(key)),
+                    partition_keys,
+                    concurrency,
+                )
+                partition_keys = [
+                    key for key, exists in zip(partition_keys, partitions_exist) if exists
+                ]
+
+            return LazyPartitionMapping(
+                partition_keys,
+                lambda key: self._load_partition_from_path(
+                    context, paths[key], backcompat_paths.get(key)
+                ),
+            )
 
         context.log.debug(f"Loading {len(paths)} partitions...")
 
-        for partition_key, path in paths.items():
-            context.log.debug(f"Loading partition from {path} using {self.__class__.__name__}")
+        def _load_partition(partition_key: str):
+            path = paths[partition_key]
+            start_time = time.perf_counter()
             try:
-                obj = self.load_from_path(context=context, path=path)
-                objs[partition_key] = obj
-            except FileNotFoundError as e:
-                backcompat_path = backcompat_paths.get(partition_key)
-                if backcompat_path is not None:
-                    obj = self.load_from_path(context=context, path=backcompat_path)
-                    objs[partition_key] = obj
-
-                if not allow_missing_partitions and objs.get(partition_key) is None:
-                    raise e
+                obj = self._load_partition_from_path(
+                    context, path, backcompat_paths.get(partition_key)
+                )
+            except FileNotFoundError:
+                if not allow_missing_partitions:
+                    raise
 
                 context.log.debug(
                     f"Couldn't load partition {path} and skipped it "
                     "because the input metadata includes allow_missing_partitions=True"
                 )
+                return None
+            return obj, time.perf_counter() - start_time
 
-        # TODO: context.add_output_metadata fails in the partitioned context. this should be fixed?
+        objs: Dict[str, Any] = {}
+        load_seconds: Dict[str, float] = {}
+        results = _map_concurrently(_load_partition, partition_keys, concurrency)
+        for partition_key, result in zip(partition_keys, results):
+            if result is not None:
+                objs[partition_key], load_seconds[partition_key] = result
+
+        context.add_input_metadata(
+            {
+                "num_partitions_loaded": len(objs),
+                "partition_load_seconds": MetadataValue.json(
+                    {key: round(seconds, 4) for key, seconds in load_seconds.items()}
+                ),
+            }
+        )
         return objs
 
     def load_input(self, context: InputContext) -> Union[Any, Dict[str, Any]]:
@@ -237,6 +297,14 @@ def load_input(self, context: InputContext) -> Union[Any, Dict[str, Any]]:
                         " type annotation on the op input is not a dict, Dict, Mapping, or"
                         f" Any: is '{type_annotation}'."
                     )
+                if (context.metadata or {}).get("lazy_load_partitions") and (
+                    type_annotation != Any
+                ):
+                    check.failed(
+                        "Lazily loading an input that corresponds to multiple partitions, but the"
+                        " type annotation on the op input is not Any: is"
+                        f" '{type_annotation}'."
+                    )
 
                 return self._load_multiple_inputs(context)
 
@@ -268,6 +336,46 @@ def handle_output(self, context: OutputContext, obj: Any):
         context.add_output_metadata(metadata)
 
 
+class LazyPartitionMapping(Mapping[str, Any]):
+    """A mapping of partition keys to objects that are loaded on first access."""
+
+    def __init__(self, partition_keys: Sequence[str], load_fn: Callable[[str], Any]):
+        self._partition_keys = list(partition_keys)
+        self._partition_key_set = set(partition_keys)
+        self._load_fn = load_fn
+        self._loaded: Dict[str, Any] = {}
+
+    def __getitem__(self, partition_key: str) -> Any:
+        if partition_key not in self._partition_key_set:
+            raise KeyError(partition_key)
+        if partition_key not in self._loaded:
+            self._loaded[partition_key] = self._load_fn(partition_key)
+        return self._loaded[partition_key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._partition_keys)
+
+    def __len__(self) -> int:
+        return len(self._partition_keys)
+
+
+def _map_concurrently(fn: Callable[[str], T], keys: Sequence[str], max_workers: int) -> Sequence[T]:
+    """Applies fn to each key using up to max_workers threads, preserving the order of the keys."""
+    if max_workers <= 1 or len(keys) <= 1:
+        return [fn(key) for key in keys]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(keys)), thread_name_prefix="upath_io_manager"
+    ) as executor:
+        futures = [executor.submit(fn, key) for key in keys]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            # don't start loading the remaining keys if one of them failed
+            for future in futures:
+                future.cancel()
+
+
 def is_dict_type(type_obj) -> bool:
     if type_obj == dict:
         return True
@@ -1,3 +1,5 @@
+from typing import Any, List, Mapping, Optional
+
 import dagster._check as check
 from dagster._core.definitions.asset_reconciliation_sensor import (
     AssetReconciliationCursor,
@@ -9,7 +11,8 @@
 from dagster._core.storage.pipeline_run import DagsterRunStatus
 from dagster._core.storage.tags import CREATED_BY_TAG
 from dagster._core.workspace.context import IWorkspaceProcessContext
-from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
+from dagster._daemon.daemon import DaemonIterator, IntervalDaemon, get_daemon_instance_queryer
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 CURSOR_KEY = "ASSET_DAEMON_CURSOR"
 ASSET_DAEMON_PAUSED_KEY = "ASSET_DAEMON_PAUSED"
@@ -33,6 +36,7 @@ def set_auto_materialize_paused(instance: DagsterInstance, paused: bool):
 class AssetDaemon(IntervalDaemon):
     def __init__(self, interval_seconds: int):
         super().__init__(interval_seconds=interval_seconds)
+        self._instance_queryer: Optional[CachingInstanceQueryer] = None
 
     @classmethod
     def daemon_type(cls) -> str:
@@ -70,14 +74,22 @@ def run_iteration(
             else AssetReconciliationCursor.empty()
         )
 
+        self._instance_queryer = get_daemon_instance_queryer(self._instance_queryer, instance)
+        self._instance_queryer.refresh()
+
         run_requests, new_cursor = reconcile(
             asset_graph=asset_graph,
             target_asset_keys=target_asset_keys,
             instance=instance,
             cursor=cursor,
             run_tags=None,
+            instance_queryer=self._instance_queryer,
+        )
+        self._logger.debug(
+            "Instance queryer cache stats: %s", self._instance_queryer.get_cache_stats()
         )
 
+        run_args: List[Mapping[str, Any]] = []
         for run_request in run_requests:
             yield
 
@@ -120,24 +132,32 @@ def run_iteration(
             )
             execution_plan_snapshot = external_execution_plan.execution_plan_snapshot
 
-            run = instance.create_run(
-                job_name=external_job.name,
-                run_id=None,
-                run_config=None,
-                solids_to_execute=None,
-                step_keys_to_execute=None,
-                status=DagsterRunStatus.NOT_STARTED,
-                solid_selection=None,
-                root_run_id=None,
-                parent_run_id=None,
-                tags=tags,
-                job_snapshot=external_job.job_snapshot,
-                execution_plan_snapshot=execution_plan_snapshot,
-                parent_job_snapshot=external_job.parent_job_snapshot,
-                external_job_origin=external_job.get_external_origin(),
-                job_code_origin=external_job.get_python_origin(),
-                asset_selection=frozenset(asset_keys),
+            run_args.append(
+                dict(
+                    job_name=external_job.name,
+                    run_id=None,
+                    run_config=None,
+                    solids_to_execute=None,
+                    step_keys_to_execute=None,
+                    status=DagsterRunStatus.NOT_STARTED,
+                    solid_selection=None,
+                    root_run_id=None,
+                    parent_run_id=None,
+                    tags=tags,
+                    job_snapshot=external_job.job_snapshot,
+                    execution_plan_snapshot=execution_plan_snapshot,
+                    parent_job_snapshot=external_job.parent_job_snapshot,
+                    external_job_origin=external_job.get_external_origin(),
+                    job_code_origin=external_job.get_python_origin(),
+                    asset_selection=frozenset(asset_keys),
+                )
             )
+
+        # all of the runs requested on this tick are written to the run storage at once
+        runs = instance.create_runs(run_args) if run_args else []
+
+        for run in runs:
+            yield
             instance.submit_run(run.run_id, workspace)
 
         instance.daemon_cursor_storage.set_cursor_values({CURSOR_KEY: new_cursor.serialize()})
@@ -6,6 +6,7 @@
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.execution.job_backfill import execute_job_backfill_iteration
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 
@@ -13,6 +14,7 @@ def execute_backfill_iteration(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
     debug_crash_flags: Optional[Mapping[str, int]] = None,
+    instance_queryer: Optional[CachingInstanceQueryer] = None,
 ) -> Iterable[Optional[SerializableErrorInfo]]:
     instance = workspace_process_context.instance
     backfills = instance.get_backfills(status=BulkActionStatus.REQUESTED)
@@ -22,6 +24,9 @@ def execute_backfill_iteration(
         yield None
         return
 
+    if instance_queryer is not None and any(backfill.is_asset_backfill for backfill in backfills):
+        instance_queryer.refresh()
+
     for backfill_job in backfills:
         backfill_id = backfill_job.backfill_id
 
@@ -30,7 +35,7 @@ def execute_backfill_iteration(
         try:
             if backfill.is_asset_backfill:
                 yield from execute_asset_backfill_iteration(
-                    backfill, workspace_process_context, instance
+                    backfill, workspace_process_context, instance, instance_queryer
                 )
             else:
                 yield from execute_job_backfill_iteration(
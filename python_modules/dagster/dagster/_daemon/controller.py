@@ -26,6 +26,7 @@
     SensorDaemon,
 )
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
+from dagster._daemon.sensor import get_sensor_daemon_shard
 from dagster._daemon.types import DaemonHeartbeat, DaemonStatus
 from dagster._utils.interrupts import raise_interrupts_as
 from dagster._utils.log import configure_loggers
@@ -203,6 +204,10 @@ def _daemon_heartbeat_health(self) -> Mapping[str, bool]:
                 heartbeat_interval_seconds=self._heartbeat_interval_seconds,
                 heartbeat_tolerance_seconds=self._heartbeat_tolerance_seconds,
                 ignore_errors=True,
+                heartbeat_keys={
+                    daemon_type: daemon.heartbeat_key()
+                    for daemon_type, daemon in self._daemons.items()
+                },
             )
             daemon_health_by_type = {
                 daemon_type: daemon_status.healthy
@@ -324,7 +329,7 @@ def create_daemon_of_type(daemon_type: str, instance: DagsterInstance) -> Dagste
     if daemon_type == SchedulerDaemon.daemon_type():
         return SchedulerDaemon()
     elif daemon_type == SensorDaemon.daemon_type():
-        return SensorDaemon()
+        return SensorDaemon(shard=get_sensor_daemon_shard(instance))
     elif daemon_type == QueuedRunCoordinatorDaemon.daemon_type():
         return QueuedRunCoordinatorDaemon(
             interval_seconds=instance.run_coordinator.dequeue_interval_seconds  # type: ignore  # (??)
@@ -390,7 +395,14 @@ def get_daemon_statuses(
     ignore_errors: bool = False,
     heartbeat_interval_seconds: float = DEFAULT_HEARTBEAT_INTERVAL_SECONDS,
     heartbeat_tolerance_seconds: float = DEFAULT_DAEMON_HEARTBEAT_TOLERANCE_SECONDS,
+    heartbeat_keys: Optional[Mapping[str, str]] = None,
 ) -> Mapping[str, DaemonStatus]:
+    """Computes the health of each of the given daemon types from its latest heartbeat.
+
+    heartbeat_keys optionally maps a daemon type to the key its heartbeats are stored under, for
+    daemons that heartbeat once per replica (e.g. sharded sensor daemons).
+    """
+    heartbeat_keys = check.opt_mapping_param(heartbeat_keys, "heartbeat_keys")
     curr_time_seconds = check.opt_float_param(
         curr_time_seconds, "curr_time_seconds", default=pendulum.now("UTC").float_timestamp
     )
@@ -406,13 +418,14 @@ def get_daemon_statuses(
             )
         else:
             # check if daemon has a heartbeat
-            if daemon_type not in heartbeats:
+            heartbeat_key = heartbeat_keys.get(daemon_type, daemon_type)
+            if heartbeat_key not in heartbeats:
                 daemon_statuses_by_type[daemon_type] = DaemonStatus(
                     daemon_type=daemon_type, required=True, healthy=False, last_heartbeat=None
                 )
             else:
                 # check if daemon has sent a recent heartbeat
-                latest_heartbeat = heartbeats[daemon_type]
+                latest_heartbeat = heartbeats[heartbeat_key]
                 hearbeat_timestamp = latest_heartbeat.timestamp
                 maximum_tolerated_time = (
                     hearbeat_timestamp + heartbeat_interval_seconds + heartbeat_tolerance_seconds
@@ -426,7 +439,7 @@ def get_daemon_statuses(
                     daemon_type=daemon_type,
                     required=True,
                     healthy=healthy,
-                    last_heartbeat=heartbeats[daemon_type],
+                    last_heartbeat=latest_heartbeat,
                 )
 
     return daemon_statuses_by_type
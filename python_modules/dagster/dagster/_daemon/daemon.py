@@ -20,9 +20,10 @@
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.backfill import execute_backfill_iteration
 from dagster._daemon.monitoring import execute_monitoring_iteration
-from dagster._daemon.sensor import execute_sensor_iteration_loop
+from dagster._daemon.sensor import SensorDaemonShard, execute_sensor_iteration_loop
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._scheduler.scheduler import execute_scheduler_iteration_loop
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 if TYPE_CHECKING:
@@ -48,6 +49,24 @@ def get_telemetry_daemon_session_id() -> str:
 TContext = TypeVar("TContext", bound=IWorkspaceProcessContext)
 
 
+# Limits for the caches of instance queryers that are retained across daemon iterations
+DAEMON_QUERYER_MAX_CACHE_SIZE = 50000
+DAEMON_QUERYER_MAX_CACHE_AGE_SECONDS = 600
+
+
+def get_daemon_instance_queryer(
+    instance_queryer: Optional[CachingInstanceQueryer], instance: DagsterInstance
+) -> CachingInstanceQueryer:
+    """Returns the given long-lived queryer, or a new one if there is none for this instance."""
+    if instance_queryer is not None and instance_queryer.instance is instance:
+        return instance_queryer
+    return CachingInstanceQueryer(
+        instance=instance,
+        max_cache_size=DAEMON_QUERYER_MAX_CACHE_SIZE,
+        max_cache_age_seconds=DAEMON_QUERYER_MAX_CACHE_AGE_SECONDS,
+    )
+
+
 class DagsterDaemon(AbstractContextManager, ABC, Generic[TContext]):
     _logger: logging.Logger
     _last_heartbeat_time: Optional["DateTime"]
@@ -68,6 +87,13 @@ def __init__(self):
     def daemon_type(cls) -> str:
         """returns: str."""
 
+    def heartbeat_key(self) -> str:
+        """The key under which this particular daemon's heartbeats are stored and checked by its
+        controller. Daemons that run as one of several replicas override this so that each replica
+        heartbeats separately.
+        """
+        return self.daemon_type()
+
     def __exit__(self, _exception_type, _exception_value, _traceback):
         pass
 
@@ -151,8 +177,9 @@ def _check_add_heartbeat(
             return
 
         daemon_type = self.daemon_type()
+        heartbeat_key = self.heartbeat_key()
 
-        last_stored_heartbeat = instance.get_daemon_heartbeats().get(daemon_type)
+        last_stored_heartbeat = instance.get_daemon_heartbeats().get(heartbeat_key)
         if (
             self._last_heartbeat_time
             and last_stored_heartbeat
@@ -165,21 +192,25 @@ def _check_add_heartbeat(
                     "Last heartbeat daemon id: %s, "
                     "Current daemon_id: %s"
                 ),
-                daemon_type,
+                heartbeat_key,
                 last_stored_heartbeat.daemon_id,
                 daemon_uuid,
             )
 
         self._last_heartbeat_time = curr_time
 
+        errors = [error for (error, timestamp) in self._errors]
         instance.add_daemon_heartbeat(
-            DaemonHeartbeat(
-                curr_time.float_timestamp,
-                daemon_type,
-                daemon_uuid,
-                errors=[error for (error, timestamp) in self._errors],
-            )
+            DaemonHeartbeat(curr_time.float_timestamp, daemon_type, daemon_uuid, errors=errors)
         )
+        if heartbeat_key != daemon_type:
+            # also heartbeat under the per-replica key, so that a replica that stops heartbeating
+            # isn't masked by the others
+            instance.add_daemon_heartbeat(
+                DaemonHeartbeat(
+                    curr_time.float_timestamp, heartbeat_key, daemon_uuid, errors=errors
+                )
+            )
         if (
             not self._last_log_time
             or (curr_time - self._last_log_time).total_seconds() >= TELEMETRY_LOGGING_INTERVAL
@@ -258,10 +289,19 @@ def core_loop(
 
 
 class SensorDaemon(DagsterDaemon):
+    def __init__(self, shard: Optional[SensorDaemonShard] = None):
+        self._shard = check.opt_inst_param(shard, "shard", SensorDaemonShard)
+        super().__init__()
+
     @classmethod
     def daemon_type(cls) -> str:
         return "SENSOR"
 
+    def heartbeat_key(self) -> str:
+        if self._shard:
+            return f"{self.daemon_type()}_SHARD_{self._shard.shard_index}"
+        return self.daemon_type()
+
     def core_loop(
         self,
         workspace_process_context: IWorkspaceProcessContext,
@@ -271,10 +311,15 @@ def core_loop(
             workspace_process_context,
             self._logger,
             shutdown_event,
+            shard=self._shard,
         )
 
 
 class BackfillDaemon(IntervalDaemon):
+    def __init__(self, interval_seconds):
+        super().__init__(interval_seconds=interval_seconds)
+        self._instance_queryer: Optional[CachingInstanceQueryer] = None
+
     @classmethod
     def daemon_type(cls) -> str:
         return "BACKFILL"
@@ -283,7 +328,15 @@ def run_iteration(
         self,
         workspace_process_context: IWorkspaceProcessContext,
     ) -> DaemonIterator:
-        yield from execute_backfill_iteration(workspace_process_context, self._logger)
+        self._instance_queryer = get_daemon_instance_queryer(
+            self._instance_queryer, workspace_process_context.instance
+        )
+        yield from execute_backfill_iteration(
+            workspace_process_context, self._logger, instance_queryer=self._instance_queryer
+        )
+        self._logger.debug(
+            "Instance queryer cache stats: %s", self._instance_queryer.get_cache_stats()
+        )
 
 
 class MonitoringDaemon(IntervalDaemon):
@@ -3,7 +3,10 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from datetime import datetime, timedelta
+from typing import AbstractSet, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence
+
+import pendulum
 
 from dagster import (
     DagsterEvent,
@@ -24,13 +27,35 @@
     DagsterRunStatus,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._core.storage.tags import PRIORITY_TAG, REPOSITORY_LABEL_TAG
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
+# In progress runs are tracked between iterations by fetching the runs that were updated since the
+# previous iteration. They are periodically fetched from scratch, as deleted runs are never updated.
+IN_PROGRESS_RUNS_RESYNC_INTERVAL_SECONDS = 60
+# Consecutive update windows overlap by this much, to allow for clock skew between the processes
+# that update runs
+RUN_UPDATE_WINDOW_OVERLAP_SECONDS = 5
+# Number of queued runs that are loaded at once while checking the queue against the limits
+QUEUED_RUNS_PAGE_SIZE = 100
+
+
+class _RunTags(NamedTuple):
+    run_id: str
+    tags: Mapping[str, str]
+
+
+def _get_priority(run_tags: _RunTags) -> int:
+    priority_tag_value = run_tags.tags.get(PRIORITY_TAG, "0")
+    try:
+        return int(priority_tag_value)
+    except ValueError:
+        return 0
+
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
@@ -42,6 +67,13 @@ def __init__(self, interval_seconds) -> None:
         self._executor: Optional[ThreadPoolExecutor] = None
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
+        # tags of each in progress run, restricted to the tag keys that limits are checked against,
+        # for the instance that they were fetched from
+        self._in_progress_runs_instance: Optional[DagsterInstance] = None
+        self._in_progress_run_tags: Optional[Dict[str, Mapping[str, str]]] = None
+        self._in_progress_tag_keys: AbstractSet[str] = frozenset()
+        self._in_progress_runs_resync_time = 0.0
+        self._runs_updated_after: Optional[datetime] = None
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -190,28 +222,35 @@ def _get_runs_to_dequeue(
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
+        now = fixed_iteration_time or time.time()
+
+        # only the tags that are needed to check limits and order the queue are fetched. The
+        # repository label tag is only stored in the run tags table, not on the run itself, so it
+        # is excluded to check limits against the same tags as the run.
+        tag_keys = (
+            {tag_limit["key"] for tag_limit in tag_concurrency_limits or []} | {PRIORITY_TAG}
+        ) - {REPOSITORY_LABEL_TAG}
+
+        in_progress_run_tags = self._get_in_progress_run_tags(instance, tag_keys, now)
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
-        max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
+        max_runs_to_launch = max_concurrent_runs - len(in_progress_run_tags)
         if max_concurrent_runs_enabled:
             # Possibly under 0 if runs were launched without queuing
             if max_runs_to_launch <= 0:
                 self._logger.info(
                     "{} runs are currently in progress. Maximum is {}, won't launch more.".format(
-                        len(in_progress_runs), max_concurrent_runs
+                        len(in_progress_run_tags), max_concurrent_runs
                     )
                 )
                 return []
 
-        queued_runs = self._get_queued_runs(instance)
+        queued_run_tags = self._get_queued_run_tags(instance, tag_keys)
 
-        if not queued_runs:
+        if not queued_run_tags:
             self._logger.debug("Poll returned no queued runs.")
             return []
 
-        now = fixed_iteration_time or time.time()
-
         with self._location_timeouts_lock:
             paused_location_names = {
                 location_name
@@ -227,21 +266,42 @@ def _get_runs_to_dequeue(
             )
 
         self._logger.info(
-            f"Retrieved %d queued runs, checking limits.{locations_clause}", len(queued_runs)
+            f"Retrieved %d queued runs, checking limits.{locations_clause}", len(queued_run_tags)
         )
 
         # place in order
-        sorted_runs = self._priority_sort(queued_runs)
+        sorted_run_tags = self._priority_sort(queued_run_tags)
         tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-            tag_concurrency_limits, in_progress_runs
+            tag_concurrency_limits, list(in_progress_run_tags)
         )
 
+        # queued runs are only loaded once they have been checked against the tag limits, a page
+        # at a time
+        runs_by_id: Dict[str, Optional[DagsterRun]] = {}
         batch: List[DagsterRun] = []
-        for run in sorted_runs:
+        for i, run_tags in enumerate(sorted_run_tags):
             if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
                 break
 
-            if tag_concurrency_limits_counter.is_blocked(run):
+            if tag_concurrency_limits_counter.is_blocked(run_tags):
+                continue
+
+            if run_tags.run_id not in runs_by_id:
+                # counters only ever increase, so runs that are already blocked are skipped
+                page_run_ids = [
+                    page_run_tags.run_id
+                    for page_run_tags in sorted_run_tags[i : i + QUEUED_RUNS_PAGE_SIZE]
+                    if not tag_concurrency_limits_counter.is_blocked(page_run_tags)
+                ]
+                runs_by_id.update({run_id: None for run_id in page_run_ids})
+                runs_by_id.update(
+                    (run.run_id, run)
+                    for run in instance.get_runs(filters=RunsFilter(run_ids=page_run_ids))
+                )
+
+            # the run may have been deleted since the queue was fetched
+            run = runs_by_id.get(run_tags.run_id)
+            if not run:
                 continue
 
             location_name = (
@@ -250,31 +310,68 @@ def _get_runs_to_dequeue(
             if location_name and location_name in paused_location_names:
                 continue
 
-            tag_concurrency_limits_counter.update_counters_with_launched_item(run)
+            tag_concurrency_limits_counter.update_counters_with_launched_item(run_tags)
             batch.append(run)
 
         return batch
 
-    def _get_queued_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        queued_runs_filter = RunsFilter(statuses=[DagsterRunStatus.QUEUED])
-
-        # Reversed for fifo ordering
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+    def _get_queued_run_tags(
+        self, instance: DagsterInstance, tag_keys: AbstractSet[str]
+    ) -> Sequence[_RunTags]:
+        # ordered from oldest to newest, for fifo ordering
+        tags_by_run_id = instance.get_run_tags_by_run_id(
+            filters=RunsFilter(statuses=[DagsterRunStatus.QUEUED]), tag_keys=list(tag_keys)
+        )
+        return [_RunTags(run_id, tags) for run_id, tags in tags_by_run_id.items()]
+
+    def _get_in_progress_run_tags(
+        self, instance: DagsterInstance, tag_keys: AbstractSet[str], now: float
+    ) -> Sequence[_RunTags]:
+        """Returns the tags of the in progress runs of the instance.
+
+        The tags are cached between iterations, and only the runs updated since the previous
+        iteration are fetched, apart from a periodic full resync. Runs whose tags change while they
+        are in progress are only picked up before the next resync if the change also bumps the
+        run's `update_timestamp`.
+        """
+        query_time = pendulum.now("UTC")
+
+        if (
+            instance is not self._in_progress_runs_instance
+            or self._in_progress_run_tags is None
+            or self._runs_updated_after is None
+            or tag_keys != self._in_progress_tag_keys
+            or now - self._in_progress_runs_resync_time >= IN_PROGRESS_RUNS_RESYNC_INTERVAL_SECONDS
+        ):
+            self._in_progress_run_tags = dict(
+                instance.get_run_tags_by_run_id(
+                    filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES),
+                    tag_keys=list(tag_keys),
+                )
+            )
+            self._in_progress_runs_instance = instance
+            self._in_progress_tag_keys = tag_keys
+            self._in_progress_runs_resync_time = now
+        else:
+            updated_after = self._runs_updated_after - timedelta(
+                seconds=RUN_UPDATE_WINDOW_OVERLAP_SECONDS
+            )
+            for record in instance.get_run_records(filters=RunsFilter(updated_after=updated_after)):
+                run = record.dagster_run
+                if run.status in IN_PROGRESS_RUN_STATUSES:
+                    self._in_progress_run_tags[run.run_id] = {
+                        key: value for key, value in run.tags.items() if key in tag_keys
+                    }
+                else:
+                    self._in_progress_run_tags.pop(run.run_id, None)
 
-    def _get_in_progress_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        self._runs_updated_after = query_time
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> Sequence[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+        return [_RunTags(run_id, tags) for run_id, tags in self._in_progress_run_tags.items()]
 
+    def _priority_sort(self, run_tags: Sequence[_RunTags]) -> Sequence[_RunTags]:
         # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        return sorted(run_tags, key=_get_priority, reverse=True)
 
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import os
 import sys
@@ -9,6 +10,7 @@
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     Iterator,
     List,
@@ -16,6 +18,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -78,6 +81,79 @@ class SkippedSensorRun(NamedTuple):
     existing_run: DagsterRun
 
 
+class SensorDaemonShard(NamedTuple):
+    """The subset of sensors that a sensor daemon is responsible for evaluating, when the sensors
+    are split across several daemon replicas.
+    """
+
+    shard_index: int
+    num_shards: int
+
+    def contains(self, origin_id: str) -> bool:
+        # use a digest of the origin id rather than hash(), which is salted per process
+        digest = hashlib.sha1(origin_id.encode("utf-8")).hexdigest()
+        return int(digest, 16) % self.num_shards == self.shard_index
+
+    def __str__(self) -> str:
+        return f"{self.shard_index + 1}/{self.num_shards}"
+
+
+def get_sensor_daemon_shard(instance: DagsterInstance) -> Optional[SensorDaemonShard]:
+    settings = instance.get_settings("sensors")
+    num_shards = settings.get("num_shards")
+    if num_shards is None or num_shards == 1:
+        return None
+
+    check.invariant(num_shards > 1, f"sensors.num_shards must be positive, got {num_shards}")
+    shard_index = settings.get("shard_index")
+    check.invariant(
+        shard_index is not None, "sensors.shard_index must be set when sensors.num_shards is set"
+    )
+    check.invariant(
+        0 <= shard_index < num_shards,
+        f"sensors.shard_index must be between 0 and {num_shards - 1}, got {shard_index}",
+    )
+    return SensorDaemonShard(shard_index=shard_index, num_shards=num_shards)
+
+
+class SensorTickLatencyStats(NamedTuple):
+    num_ticks: int
+    max_lag_seconds: float
+    mean_lag_seconds: float
+    max_duration_seconds: float
+
+
+class SensorTickLatencyTracker:
+    """Collects how long after they were due sensor ticks started, and how long they took, so that
+    the daemon can report whether it is keeping up with its sensors. Ticks may be recorded from
+    worker threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ticks: List[Tuple[float, float]] = []
+
+    def record(self, lag_seconds: float, duration_seconds: float) -> None:
+        with self._lock:
+            self._ticks.append((max(lag_seconds, 0.0), duration_seconds))
+
+    def flush(self) -> Optional[SensorTickLatencyStats]:
+        """Returns the stats for the ticks recorded since the last flush, and resets them."""
+        with self._lock:
+            ticks, self._ticks = self._ticks, []
+
+        if not ticks:
+            return None
+
+        lags = [lag for lag, _ in ticks]
+        return SensorTickLatencyStats(
+            num_ticks=len(ticks),
+            max_lag_seconds=max(lags),
+            mean_lag_seconds=sum(lags) / len(lags),
+            max_duration_seconds=max(duration for _, duration in ticks),
+        )
+
+
 class SensorLaunchContext:
     def __init__(
         self,
@@ -239,14 +315,19 @@ def execute_sensor_iteration_loop(
     logger: logging.Logger,
     shutdown_event: threading.Event,
     until: Optional[float] = None,
+    shard: Optional[SensorDaemonShard] = None,
 ) -> TDaemonGenerator:
     """Helper function that performs sensor evaluations on a tighter loop, while reusing grpc locations
     within a given daemon interval.  Rather than relying on the daemon machinery to run the
     iteration loop every 30 seconds, sensors are continuously evaluated, every 5 seconds. We rely on
     each sensor definition's min_interval to check that sensor evaluations are spaced appropriately.
+
+    If a shard is passed, only the sensors that fall in that shard are evaluated, so that the
+    sensors can be split across several daemon replicas.
     """
     sensor_state_lock = threading.Lock()
     sensor_tick_futures: Dict[str, Future] = {}
+    tick_latency_tracker = SensorTickLatencyTracker()
     with ExitStack() as stack:
         settings = workspace_process_context.instance.get_settings("sensors")
         if settings.get("use_threads"):
@@ -277,6 +358,8 @@ def execute_sensor_iteration_loop(
                 sensor_tick_futures=sensor_tick_futures,
                 sensor_state_lock=sensor_state_lock,
                 log_verbose_checks=verbose_logs_iteration,
+                shard=shard,
+                tick_latency_tracker=tick_latency_tracker,
             )
             # Yield to check for heartbeats in case there were no yields within
             # execute_sensor_iteration
@@ -286,6 +369,7 @@ def execute_sensor_iteration_loop(
 
             if verbose_logs_iteration:
                 last_verbose_time = end_time
+                _log_tick_latency_stats(logger, tick_latency_tracker, shard)
 
             loop_duration = end_time - start_time
             sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
@@ -302,6 +386,8 @@ def execute_sensor_iteration(
     sensor_state_lock: Optional[threading.Lock] = None,
     log_verbose_checks: bool = True,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    shard: Optional[SensorDaemonShard] = None,
+    tick_latency_tracker: Optional[SensorTickLatencyTracker] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -318,6 +404,7 @@ def execute_sensor_iteration(
     all_sensor_states = {
         sensor_state.selector_id: sensor_state
         for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
+        if not shard or shard.contains(sensor_state.instigator_origin_id)
     }
 
     tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
@@ -328,6 +415,8 @@ def execute_sensor_iteration(
         if code_location:
             for repo in code_location.get_repositories().values():
                 for sensor in repo.get_external_sensors():
+                    if shard and not shard.contains(sensor.get_external_origin_id()):
+                        continue
                     selector_id = sensor.selector_id
                     if sensor.get_current_instigator_state(
                         all_sensor_states.get(selector_id)
@@ -382,7 +471,13 @@ def execute_sensor_iteration(
 
     if not sensors:
         if log_verbose_checks:
-            logger.info("Not checking for any runs since no sensors have been started.")
+            if shard:
+                logger.info(
+                    f"Not checking for any runs since no sensors in shard {shard} have been"
+                    " started."
+                )
+            else:
+                logger.info("Not checking for any runs since no sensors have been started.")
         yield
         return
 
@@ -422,6 +517,7 @@ def execute_sensor_iteration(
                 sensor_state_lock,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
+                tick_latency_tracker,
             )
             sensor_tick_futures[external_sensor.selector_id] = future
             yield
@@ -437,9 +533,27 @@ def execute_sensor_iteration(
                 sensor_state_lock,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
+                tick_latency_tracker,
             )
 
 
+def _log_tick_latency_stats(
+    logger: logging.Logger,
+    tick_latency_tracker: SensorTickLatencyTracker,
+    shard: Optional[SensorDaemonShard],
+) -> None:
+    stats = tick_latency_tracker.flush()
+    if not stats:
+        return
+
+    shard_str = f" in shard {shard}" if shard else ""
+    logger.info(
+        f"Evaluated {stats.num_ticks} sensor ticks{shard_str} since the last report. Ticks started"
+        f" a mean of {stats.mean_lag_seconds:.2f}s (max {stats.max_lag_seconds:.2f}s) after they"
+        f" were due, and the slowest tick took {stats.max_duration_seconds:.2f}s."
+    )
+
+
 def _process_tick(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -448,6 +562,7 @@ def _process_tick(
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
+    tick_latency_tracker: Optional[SensorTickLatencyTracker] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -460,6 +575,7 @@ def _process_tick(
             sensor_state_lock,
             sensor_debug_crash_flags,
             tick_retention_settings,
+            tick_latency_tracker,
         )
     )
 
@@ -472,6 +588,7 @@ def _process_tick_generator(
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
+    tick_latency_tracker: Optional[SensorTickLatencyTracker] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
@@ -489,6 +606,7 @@ def _process_tick_generator(
             # check the since we might have been queued before processing
             return
         else:
+            tick_lag = _get_tick_lag(sensor_state, external_sensor, now)
             _mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
 
     try:
@@ -521,9 +639,30 @@ def _process_tick_generator(
         error_info = serializable_error_info_from_exc_info(sys.exc_info())
         logger.exception(f"Sensor daemon caught an error for sensor {external_sensor.name}")
 
+    if tick_latency_tracker:
+        tick_latency_tracker.record(tick_lag, pendulum.now("UTC").timestamp() - now.timestamp())
+
     yield error_info
 
 
+def _get_tick_lag(
+    state: InstigatorState, external_sensor: ExternalSensor, now: "DateTime"
+) -> float:
+    # how long after the sensor was next due to be evaluated this tick started
+    instigator_data = _sensor_instigator_data(state)
+    if not instigator_data:
+        return 0.0
+
+    if not instigator_data.last_tick_start_timestamp and not instigator_data.last_tick_timestamp:
+        return 0.0
+
+    due_timestamp = max(
+        instigator_data.last_tick_timestamp or 0,
+        instigator_data.last_tick_start_timestamp or 0,
+    ) + (external_sensor.min_interval_seconds or 0)
+    return now.timestamp() - due_timestamp
+
+
 def _sensor_instigator_data(state: InstigatorState) -> Optional[SensorInstigatorData]:
     instigator_data = state.instigator_data
     if instigator_data is None or isinstance(instigator_data, SensorInstigatorData):
@@ -673,6 +812,10 @@ def _evaluate_sensor(
         instance, external_sensor, sensor_runtime_data.run_requests
     )
 
+    resolved_run_requests: List[
+        Tuple[RunRequest, Union[DagsterRun, SkippedSensorRun, Mapping[str, Any]]]
+    ] = []
+
     for raw_run_request in sensor_runtime_data.run_requests:
         if raw_run_request.stale_assets_only:
             stale_assets = resolve_stale_or_missing_assets(workspace_process_context, raw_run_request, external_sensor)  # type: ignore
@@ -698,23 +841,41 @@ def _evaluate_sensor(
             asset_selection=run_request.asset_selection,
         )
         external_job = code_location.get_external_job(pipeline_selector)
-        run = _get_or_create_sensor_run(
-            context,
-            instance,
-            code_location,
-            external_sensor,
-            external_job,
-            run_request,
-            target_data,
-            existing_runs_by_key,
+        resolved_run_requests.append(
+            (
+                run_request,
+                _get_existing_sensor_run_or_run_args(
+                    context,
+                    instance,
+                    code_location,
+                    external_sensor,
+                    external_job,
+                    run_request,
+                    target_data,
+                    existing_runs_by_key,
+                ),
+            )
         )
+        yield
 
-        if isinstance(run, SkippedSensorRun):
-            skipped_runs.append(run)
+    # the new runs for this tick are written to the run storage at once, before any of them are
+    # launched
+    run_args = [
+        run_or_args
+        for _, run_or_args in resolved_run_requests
+        if not isinstance(run_or_args, (DagsterRun, SkippedSensorRun))
+    ]
+    created_runs = iter(instance.create_runs(run_args) if run_args else [])
+
+    for run_request, run_or_args in resolved_run_requests:
+        if isinstance(run_or_args, SkippedSensorRun):
+            skipped_runs.append(run_or_args)
             context.add_run_info(run_id=None, run_key=run_request.run_key)
             yield
             continue
 
+        run = run_or_args if isinstance(run_or_args, DagsterRun) else next(created_runs)
+
         _check_for_debug_crash(sensor_debug_crash_flags, "RUN_CREATED")
 
         error_info = None
@@ -812,7 +973,7 @@ def _fetch_existing_runs(
     return existing_runs
 
 
-def _get_or_create_sensor_run(
+def _get_existing_sensor_run_or_run_args(
     context: SensorLaunchContext,
     instance: DagsterInstance,
     code_location: CodeLocation,
@@ -821,9 +982,12 @@ def _get_or_create_sensor_run(
     run_request: RunRequest,
     target_data: ExternalTargetData,
     existing_runs_by_key: Mapping[str, DagsterRun],
-) -> Union[DagsterRun, SkippedSensorRun]:
+) -> Union[DagsterRun, SkippedSensorRun, Mapping[str, Any]]:
+    """Returns the run that was already created for the run request's run key, or the arguments
+    to create a new run for it.
+    """
     if not run_request.run_key:
-        return _create_sensor_run(
+        return _get_sensor_create_run_args(
             instance, code_location, external_sensor, external_pipeline, run_request, target_data
         )
 
@@ -843,19 +1007,19 @@ def _get_or_create_sensor_run(
 
     context.logger.info(f"Creating new run for {external_sensor.name}")
 
-    return _create_sensor_run(
+    return _get_sensor_create_run_args(
         instance, code_location, external_sensor, external_pipeline, run_request, target_data
     )
 
 
-def _create_sensor_run(
+def _get_sensor_create_run_args(
     instance: DagsterInstance,
     code_location: CodeLocation,
     external_sensor: ExternalSensor,
     external_pipeline: ExternalJob,
     run_request: RunRequest,
     target_data: ExternalTargetData,
-) -> DagsterRun:
+) -> Mapping[str, Any]:
     from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
     external_execution_plan = code_location.get_external_execution_plan(
@@ -886,7 +1050,7 @@ def _create_sensor_run(
         },
     )
 
-    return instance.create_run(
+    return dict(
         job_name=target_data.job_name,
         run_id=None,
         run_config=run_request.run_config,
@@ -96,6 +96,11 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
             response_deserializer=api__pb2.StreamingExternalRepositoryEvent.FromString,
         )
+        self.StreamingExternalRepositoryDelta = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalRepositoryDelta",
+            request_serializer=api__pb2.ExternalRepositoryDeltaRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingChunkEvent.FromString,
+        )
         self.ExternalScheduleExecution = channel.unary_stream(
             "/api.DagsterApi/ExternalScheduleExecution",
             request_serializer=api__pb2.ExternalScheduleExecutionRequest.SerializeToString,
@@ -231,6 +236,12 @@ def StreamingExternalRepository(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamingExternalRepositoryDelta(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ExternalScheduleExecution(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -357,6 +368,11 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
             response_serializer=api__pb2.StreamingExternalRepositoryEvent.SerializeToString,
         ),
+        "StreamingExternalRepositoryDelta": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalRepositoryDelta,
+            request_deserializer=api__pb2.ExternalRepositoryDeltaRequest.FromString,
+            response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
+        ),
         "ExternalScheduleExecution": grpc.unary_stream_rpc_method_handler(
             servicer.ExternalScheduleExecution,
             request_deserializer=api__pb2.ExternalScheduleExecutionRequest.FromString,
@@ -841,6 +857,35 @@ def StreamingExternalRepository(
             metadata,
         )
 
+    @staticmethod
+    def StreamingExternalRepositoryDelta(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalRepositoryDelta",
+            api__pb2.ExternalRepositoryDeltaRequest.SerializeToString,
+            api__pb2.StreamingChunkEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ExternalScheduleExecution(
         request,
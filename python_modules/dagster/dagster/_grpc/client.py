@@ -26,6 +26,7 @@
     CancelExecutionRequest,
     ExecuteExternalJobArgs,
     ExecutionPlanSnapshotArgs,
+    ExternalRepositoryDeltaArgs,
     ExternalScheduleExecutionArgs,
     JobSubsetSnapshotArgs,
     PartitionArgs,
@@ -352,6 +353,27 @@ def streaming_external_repository(
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
             }
 
+    def streaming_external_repository_delta(
+        self, external_repository_delta_args: ExternalRepositoryDeltaArgs
+    ) -> str:
+        check.inst_param(
+            external_repository_delta_args,
+            "external_repository_delta_args",
+            ExternalRepositoryDeltaArgs,
+        )
+
+        chunks = list(
+            self._streaming_query(
+                "StreamingExternalRepositoryDelta",
+                api_pb2.ExternalRepositoryDeltaRequest,
+                serialized_external_repository_delta_args=serialize_value(
+                    external_repository_delta_args
+                ),
+            )
+        )
+
+        return "".join([chunk.serialized_chunk for chunk in chunks])
+
     def external_schedule_execution(self, external_schedule_execution_args):
         check.inst_param(
             external_schedule_execution_args,
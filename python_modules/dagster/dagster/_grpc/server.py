@@ -23,12 +23,19 @@
 import dagster._seven as seven
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.reconstruct import ReconstructableRepository
-from dagster._core.definitions.repository_definition import RepositoryDefinition
+from dagster._core.definitions.repository_definition import (
+    CachingRepositoryData,
+    RepositoryDefinition,
+)
 from dagster._core.errors import DagsterUserCodeUnreachableError
 from dagster._core.host_representation.external_data import (
+    ExternalRepositoryData,
     ExternalRepositoryErrorData,
+    ExternalRepositoryPieceIds,
     external_job_data_from_def,
     external_repository_data_from_def,
+    external_repository_delta_from_data,
+    get_external_repository_piece_ids,
 )
 from dagster._core.host_representation.origin import ExternalRepositoryOrigin
 from dagster._core.instance import DagsterInstance, InstanceRef
@@ -68,6 +75,7 @@
     CancelExecutionResult,
     ExecuteExternalJobArgs,
     ExecutionPlanSnapshotArgs,
+    ExternalRepositoryDeltaArgs,
     ExternalScheduleExecutionArgs,
     GetCurrentImageResult,
     GetCurrentRunsResult,
@@ -186,6 +194,12 @@ def _get_code_pointer(
         check.failed("Invalid loadable target origin")
 
 
+class _CachedExternalRepositoryData(NamedTuple):
+    repository_def: RepositoryDefinition
+    external_repository_data: ExternalRepositoryData
+    piece_ids: ExternalRepositoryPieceIds
+
+
 class DagsterApiServer(DagsterApiServicer):
     # The loadable_target_origin is currently Noneable to support instaniating a server.
     # This helps us test the ping methods, and incrementally migrate each method to
@@ -236,6 +250,13 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # The external data of each loaded repository and the ids of its pieces, keyed by
+        # repository name and whether snapshots are deferred, so that delta requests don't
+        # serialize the pieces that haven't changed again to compute their ids.
+        self._cached_external_repository_data: Dict[
+            Tuple[str, bool], _CachedExternalRepositoryData
+        ] = {}
+
         self._entry_point = (
             check.sequence_param(entry_point, "entry_point", of_type=str)
             if entry_point is not None
@@ -578,6 +599,59 @@ def StreamingExternalRepository(self, request, _context):
                 ],
             )
 
+    def StreamingExternalRepositoryDelta(self, request, _context):
+        try:
+            args = deserialize_value(
+                request.serialized_external_repository_delta_args,
+                ExternalRepositoryDeltaArgs,
+            )
+
+            cached = self._get_cached_external_repository_data(
+                self._get_repo_for_origin(args.repository_origin), args.defer_snapshots
+            )
+            serialized_delta = serialize_value(
+                external_repository_delta_from_data(
+                    cached.external_repository_data,
+                    known_piece_ids=args.known_piece_ids,
+                    piece_ids_by_object=cached.piece_ids,
+                )
+            )
+        except Exception:
+            serialized_delta = serialize_value(
+                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            )
+
+        yield from self._split_serialized_data_into_chunk_events(serialized_delta)
+
+    def _get_cached_external_repository_data(
+        self, repository_def: RepositoryDefinition, defer_snapshots: bool
+    ) -> _CachedExternalRepositoryData:
+        cache_key = (repository_def.name, defer_snapshots)
+        cached = self._cached_external_repository_data.get(cache_key)
+        if cached and cached.repository_def is not repository_def:
+            # the repository was reloaded
+            cached = None
+
+        if cached and isinstance(
+            repository_def._repository_data, CachingRepositoryData  # noqa: SLF001
+        ):
+            return cached
+
+        # A dynamic RepositoryData can return different definitions on every call, so its external
+        # data is rebuilt, and only the ids of the piece objects that are reused are kept
+        external_repository_data = external_repository_data_from_def(
+            repository_def, defer_snapshots=defer_snapshots
+        )
+        cached = _CachedExternalRepositoryData(
+            repository_def=repository_def,
+            external_repository_data=external_repository_data,
+            piece_ids=get_external_repository_piece_ids(
+                external_repository_data, cached.piece_ids if cached else None
+            ),
+        )
+        self._cached_external_repository_data[cache_key] = cached
+        return cached
+
     def _split_serialized_data_into_chunk_events(self, serialized_data):
         num_chunks = int(math.ceil(float(len(serialized_data)) / STREAMING_CHUNK_SIZE))
         for i in range(num_chunks):
@@ -417,6 +417,37 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class ExternalRepositoryDeltaArgs(
+    NamedTuple(
+        "_ExternalRepositoryDeltaArgs",
+        [
+            ("repository_origin", ExternalRepositoryOrigin),
+            ("defer_snapshots", bool),
+            ("known_piece_ids", AbstractSet[str]),
+        ],
+    )
+):
+    """Requests the ExternalRepositoryDelta of a repository, which omits the pieces whose ids are in
+    `known_piece_ids` (because the client has cached them from an earlier request).
+    """
+
+    def __new__(
+        cls,
+        repository_origin: ExternalRepositoryOrigin,
+        defer_snapshots: bool = False,
+        known_piece_ids: Optional[AbstractSet[str]] = None,
+    ):
+        return super(ExternalRepositoryDeltaArgs, cls).__new__(
+            cls,
+            repository_origin=check.inst_param(
+                repository_origin, "repository_origin", ExternalRepositoryOrigin
+            ),
+            defer_snapshots=check.bool_param(defer_snapshots, "defer_snapshots"),
+            known_piece_ids=check.opt_set_param(known_piece_ids, "known_piece_ids", of_type=str),
+        )
+
+
 @whitelist_for_serdes
 class PartitionNamesArgs(
     NamedTuple(
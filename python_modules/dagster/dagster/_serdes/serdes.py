@@ -398,6 +398,8 @@ class EnumSerializer(Serializer, Generic[T_Enum]):
     def __init__(self, *, klass: Type[T_Enum], storage_name: Optional[str] = None):
         self.klass = klass
         self.storage_name = storage_name
+        # resolved once here, since `pack` is called for every serialized member
+        self._packed_prefix = f"{self.get_storage_name()}."
 
     def unpack(self, value: str) -> T_Enum:
         return self.klass[value]
@@ -408,7 +410,7 @@ def pack(
         whitelist_map: WhitelistMap,
         descent_path: str,
     ) -> str:
-        return f"{self.get_storage_name()}.{value.name}"
+        return self._packed_prefix + value.name
 
     def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
@@ -439,6 +441,41 @@ def __init__(
         self.skip_when_empty_fields = skip_when_empty_fields or set()
         self.field_serializers = field_serializers or {}
 
+        # Packing and unpacking are hot code paths, so everything that only depends on the class and
+        # the serializer options is resolved once here, at decoration time, rather than per value.
+        self._packed_class_name = self.get_storage_name()
+        self._pack_plan = self._compile_pack_plan(self.klass._fields)
+        self._unpack_plan = self._compile_unpack_plan()
+        self._has_after_pack_hook = type(self).after_pack is not NamedTupleSerializer.after_pack
+        self._has_before_unpack_hook = (
+            type(self).before_unpack is not NamedTupleSerializer.before_unpack
+        )
+
+    def _compile_pack_plan(
+        self, fields: Sequence[str]
+    ) -> Sequence[Tuple[str, str, Optional["FieldSerializer"], bool]]:
+        # (field name, storage key, field serializer, skip when empty) for each field, in order
+        return [
+            (
+                field,
+                self.storage_field_names.get(field, field),
+                self.field_serializers.get(field),
+                field in self.skip_when_empty_fields,
+            )
+            for field in fields
+        ]
+
+    def _compile_unpack_plan(self) -> Mapping[str, Tuple[str, Optional["FieldSerializer"]]]:
+        # maps each storage key that is loaded to (constructor param name, field serializer)
+        param_names = set(self.constructor_param_names)
+        plan = {name: (name, self.field_serializers.get(name)) for name in param_names}
+        for storage_key, loaded_name in self.loaded_field_names.items():
+            if loaded_name in param_names:
+                plan[storage_key] = (loaded_name, self.field_serializers.get(loaded_name))
+            else:
+                plan.pop(storage_key, None)
+        return plan
+
     def unpack(
         self,
         unpacked_dict: Dict[str, UnpackedValue],
@@ -446,16 +483,18 @@ def unpack(
         context: UnpackContext,
     ) -> T_NamedTuple:
         try:
-            unpacked_dict = self.before_unpack(context, unpacked_dict)
+            if self._has_before_unpack_hook:
+                unpacked_dict = self.before_unpack(context, unpacked_dict)
+            unpack_plan = self._unpack_plan
             unpacked: Dict[str, PackableValue] = {}
             for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
+                field_plan = unpack_plan.get(key)
                 # Naively implements backwards compatibility by filtering arguments that aren't present in
                 # the constructor. If a property is present in the serialized object, but doesn't exist in
                 # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
+                if field_plan:
+                    loaded_name, custom = field_plan
                     # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
                     if custom:
                         unpacked[loaded_name] = custom.unpack(
                             value,
@@ -467,7 +506,7 @@ def unpack(
                     else:
                         unpacked[loaded_name] = cast(PackableValue, value)
 
-                else:
+                elif context.observed_unknown_serdes_values:
                     context.clear_ignored_unknown_values(value)
 
             # False positive type error here due to an eccentricity of `NamedTuple`-- calling `NamedTuple`
@@ -507,13 +546,16 @@ def pack(
         whitelist_map: WhitelistMap,
         descent_path: str,
     ) -> Dict[str, JsonSerializableValue]:
-        packed: Dict[str, JsonSerializableValue] = {}
-        packed["__class__"] = self.get_storage_name()
-        for key, inner_value in value._asdict().items():
-            if key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+        # values of a different class registered under the same name fall back to their own fields
+        pack_plan = (
+            self._pack_plan
+            if value.__class__ is self.klass
+            else self._compile_pack_plan(value._fields)
+        )
+        packed: Dict[str, JsonSerializableValue] = {"__class__": self._packed_class_name}
+        for (key, storage_key, custom, skip_when_empty), inner_value in zip(pack_plan, value):
+            if skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
                 continue
-            storage_key = self.storage_field_names.get(key, key)
-            custom = self.field_serializers.get(key)
             if custom:
                 packed[storage_key] = custom.pack(
                     inner_value,
@@ -522,13 +564,12 @@ def pack(
                 )
             else:
                 packed[storage_key] = _pack_value(
-                    inner_value,
-                    whitelist_map=whitelist_map,
-                    descent_path=f"{descent_path}.{key}",
+                    inner_value, whitelist_map, f"{descent_path}.{key}"
                 )
-        for key, default in self.old_fields.items():
-            packed[key] = default
-        packed = self.after_pack(**packed)
+        if self.old_fields:
+            packed.update(self.old_fields)
+        if self._has_after_pack_hook:
+            packed = self.after_pack(**packed)
         return packed
 
     # Hook: Modify the contents of the packed, json-serializable dict before it is converted to a
@@ -662,26 +703,25 @@ def _pack_value(
 
     # inlined is_named_tuple_instance
     if isinstance(val, tuple) and hasattr(val, "_fields"):
-        klass_name = val.__class__.__name__
-        if not whitelist_map.has_tuple_serializer(klass_name):
+        serializer = whitelist_map.tuple_serializers.get(tval.__name__)
+        if serializer is None:
             raise SerializationError(
                 (
                     "Can only serialize whitelisted namedtuples, received"
                     f" {val}.\nDescent path: {descent_path}"
                 ),
             )
-        serializer = whitelist_map.get_tuple_serializer(klass_name)
         return serializer.pack(cast(NamedTuple, val), whitelist_map, descent_path)
     if isinstance(val, Enum):
-        klass_name = val.__class__.__name__
-        if not whitelist_map.has_enum_entry(klass_name):
+        klass_name = tval.__name__
+        enum_serializer = whitelist_map.enums.get(klass_name)
+        if enum_serializer is None:
             raise SerializationError(
                 (
                     "Can only serialize whitelisted Enums, received"
                     f" {klass_name}.\nDescent path: {descent_path}"
                 ),
             )
-        enum_serializer = whitelist_map.get_enum_entry(klass_name)
         return {"__enum__": enum_serializer.pack(val, whitelist_map, descent_path)}
     if isinstance(val, set):
         set_path = descent_path + "{}"
@@ -800,7 +840,8 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext):
     if "__class__" in val:
         klass_name = cast(str, val["__class__"])
-        if not whitelist_map.has_tuple_deserializer(klass_name):
+        deserializer = whitelist_map.tuple_deserializers.get(klass_name)
+        if deserializer is None:
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.',
@@ -809,7 +850,6 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
             )
 
         val.pop("__class__")
-        deserializer = whitelist_map.get_tuple_deserializer(klass_name)
         return deserializer.unpack(val, whitelist_map, context)
 
     if "__enum__" in val:
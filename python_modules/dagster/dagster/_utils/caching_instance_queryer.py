@@ -1,3 +1,4 @@
+import time
 from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
@@ -25,40 +26,153 @@
     RunRecord,
 )
 from dagster._core.storage.tags import PARTITION_NAME_TAG
-from dagster._utils.cached_method import cached_method
+from dagster._utils.cached_method import CACHED_METHOD_FIELD_SUFFIX, cached_method
+from dagster._utils.lru_cache import CacheStats, LRUCache
 
 if TYPE_CHECKING:
     from dagster._core.storage.event_log import EventLogRecord
     from dagster._core.storage.event_log.base import AssetRecord
 
+# If more than this many materializations or observations have occurred since a long-lived queryer
+# was last refreshed, all of its cached entries are discarded rather than invalidated one by one.
+MAX_INVALIDATION_EVENTS = 10000
+
+# Events that change the cached state of their asset. Planned materializations update the last run
+# id of the asset record.
+INVALIDATING_EVENT_TYPES = (
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.ASSET_OBSERVATION,
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+)
+
 
 class CachingInstanceQueryer(DynamicPartitionsStore):
     """Provides utility functions for querying for asset-materialization related data from the
     instance which will attempt to limit redundant expensive calls. Intended for use within the
     scope of a single "request" (e.g. GQL request, sensor tick).
 
+    A queryer may also be kept alive across ticks of a long-running process (e.g. a daemon), as
+    long as `refresh` is called at the start of each tick. Cached asset records, latest
+    materialization records, partition counts and finished run records are then retained between
+    ticks, and are only invalidated when new events for the corresponding asset are written.
+
     Args:
         instance (DagsterInstance): The instance to query.
+        max_cache_size (Optional[int]): The maximum number of entries to retain in each of the
+            caches that are retained across ticks. Defaults to no limit.
+        max_cache_age_seconds (Optional[float]): If set, all cached entries will be discarded by
+            `refresh` once they are older than this, so that changes which do not produce events
+            (such as asset wipes) are eventually observed.
     """
 
-    def __init__(self, instance: DagsterInstance):
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        max_cache_size: Optional[int] = None,
+        max_cache_age_seconds: Optional[float] = None,
+    ):
         self._instance = instance
+        self._max_cache_size = check.opt_int_param(max_cache_size, "max_cache_size")
+        self._max_cache_age_seconds = check.opt_numeric_param(
+            max_cache_age_seconds, "max_cache_age_seconds"
+        )
 
-        self._asset_record_cache: Dict[AssetKey, Optional[AssetRecord]] = {}
-        self._latest_materialization_record_cache: Dict[
+        self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
+        self._latest_refreshed_storage_id: Optional[int] = None
+        self._init_caches()
+
+    def _init_caches(self) -> None:
+        self._asset_record_cache: LRUCache[AssetKey, Optional[AssetRecord]] = LRUCache(
+            self._max_cache_size
+        )
+        self._latest_materialization_record_cache: LRUCache[
             AssetKeyPartitionKey, Optional[EventLogRecord]
-        ] = {}
+        ] = LRUCache(self._max_cache_size)
 
         self._asset_partition_count_cache: Dict[
-            Optional[int], Dict[AssetKey, Mapping[str, int]]
-        ] = defaultdict(dict)
+            Optional[int], LRUCache[AssetKey, Mapping[str, int]]
+        ] = defaultdict(lambda: LRUCache(self._max_cache_size))
 
-        self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
+        self._run_record_cache: LRUCache[str, Optional[RunRecord]] = LRUCache(self._max_cache_size)
+
+        self._caches_created_at = time.monotonic()
 
     @property
     def instance(self) -> DagsterInstance:
         return self._instance
 
+    def get_cache_stats(self) -> Mapping[str, CacheStats]:
+        """Returns the number of hits, misses and entries for each of the caches that are retained
+        across ticks.
+        """
+        return {
+            "asset_records": self._asset_record_cache.stats,
+            "latest_materialization_records": self._latest_materialization_record_cache.stats,
+            "partition_counts": self._asset_partition_count_cache[None].stats,
+            "run_records": self._run_record_cache.stats,
+        }
+
+    def refresh(self) -> None:
+        """Prepares a long-lived queryer for a new tick.
+
+        Discards everything that is only valid within the scope of a single tick, and invalidates
+        the cached entries of each asset that has been materialized, observed or planned to be
+        materialized since the previous call. Asset wipes do not produce events, so they are only
+        observed once the caches exceed max_cache_age_seconds.
+        """
+        # results of cached methods and dynamic partitions are only valid within a single tick
+        for attr_name in list(vars(self)):
+            if attr_name.endswith(CACHED_METHOD_FIELD_SUFFIX):
+                delattr(self, attr_name)
+        self._dynamic_partitions_cache = {}
+        for after_cursor in list(self._asset_partition_count_cache):
+            if after_cursor is not None:
+                del self._asset_partition_count_cache[after_cursor]
+
+        # runs that have not finished may change status between ticks
+        for run_id, run_record in list(self._run_record_cache.items()):
+            if run_record is None or not run_record.dagster_run.is_finished:
+                del self._run_record_cache[run_id]
+
+        # fetch this before looking for updated assets, so that no events are missed in between
+        latest_storage_id = (
+            self.get_latest_asset_event_storage_id(event_types=INVALIDATING_EVENT_TYPES) or 0
+        )
+
+        updated_asset_keys = (
+            self.get_asset_keys_updated_after_cursor(
+                self._latest_refreshed_storage_id,
+                limit=MAX_INVALIDATION_EVENTS,
+                event_types=INVALIDATING_EVENT_TYPES,
+            )
+            if self._latest_refreshed_storage_id is not None
+            else None
+        )
+        if updated_asset_keys is None or (
+            self._max_cache_age_seconds is not None
+            and time.monotonic() - self._caches_created_at > self._max_cache_age_seconds
+        ):
+            self._init_caches()
+        else:
+            self._invalidate_asset_keys(updated_asset_keys)
+
+        self._latest_refreshed_storage_id = latest_storage_id
+
+    def _invalidate_asset_keys(self, asset_keys: AbstractSet[AssetKey]) -> None:
+        if not asset_keys:
+            return
+
+        for asset_key in asset_keys:
+            self._asset_record_cache.discard(asset_key)
+            self._asset_partition_count_cache[None].discard(asset_key)
+
+        for asset_partition in [
+            asset_partition
+            for asset_partition in self._latest_materialization_record_cache
+            if asset_partition.asset_key in asset_keys
+        ]:
+            del self._latest_materialization_record_cache[asset_partition]
+
     ####################
     # QUERY BATCHING
     ####################
@@ -67,22 +181,30 @@ def prefetch_asset_partition_counts(
         self, asset_keys: Sequence[AssetKey], after_cursor: Optional[int]
     ):
         """For performance, batches together queries for selected assets."""
-        self._asset_partition_count_cache[None] = dict(
-            self.instance.get_materialization_count_by_partition(
-                asset_keys=asset_keys,
-                after_cursor=None,
-            )
-        )
-        if after_cursor is not None:
-            self._asset_partition_count_cache[after_cursor] = dict(
-                self.instance.get_materialization_count_by_partition(
-                    asset_keys=asset_keys,
-                    after_cursor=after_cursor,
+        for cursor in {None, after_cursor}:
+            # counts may have been retained from a previous tick
+            uncached_asset_keys = [
+                asset_key
+                for asset_key in asset_keys
+                if asset_key not in self._asset_partition_count_cache[cursor]
+            ]
+            if uncached_asset_keys:
+                self._asset_partition_count_cache[cursor].update(
+                    self.instance.get_materialization_count_by_partition(
+                        asset_keys=uncached_asset_keys,
+                        after_cursor=cursor,
+                    )
                 )
-            )
 
     def prefetch_asset_records(self, asset_keys: Sequence[AssetKey]):
         """For performance, batches together queries for selected assets."""
+        # records may have been retained from a previous tick
+        asset_keys = [
+            asset_key for asset_key in asset_keys if asset_key not in self._asset_record_cache
+        ]
+        if not asset_keys:
+            return
+
         # get all asset records for the selected assets
         asset_records = self.instance.get_asset_records(asset_keys)
         for asset_record in asset_records:
@@ -112,6 +234,28 @@ def prefetch_asset_records(self, asset_keys: Sequence[AssetKey]):
                     )
                 ] = latest_materialization_record
 
+    def prefetch_latest_materialization_records(
+        self, asset_partitions: Iterable[AssetKeyPartitionKey]
+    ) -> None:
+        """For performance, batches together queries for the latest materialization records of the
+        selected asset partitions.
+        """
+        uncached_asset_partitions = [
+            asset_partition
+            for asset_partition in dict.fromkeys(asset_partitions)
+            if asset_partition not in self._latest_materialization_record_cache
+        ]
+        if not uncached_asset_partitions:
+            return
+
+        latest_materialization_records = self.instance.get_latest_materialization_records(
+            uncached_asset_partitions
+        )
+        for asset_partition in uncached_asset_partitions:
+            self._latest_materialization_record_cache[
+                asset_partition
+            ] = latest_materialization_records.get(asset_partition)
+
     ####################
     # MATERIALIZATION / ASSET RECORDS
     ####################
@@ -399,9 +543,10 @@ def _new_version_of_source_exists_after_asset_partition(
     # RUNS
     ####################
 
-    @cached_method
     def _get_run_record_by_id(self, *, run_id: str) -> Optional[RunRecord]:
-        return self.instance.get_run_record_by_id(run_id)
+        if run_id not in self._run_record_cache:
+            self._run_record_cache[run_id] = self.instance.get_run_record_by_id(run_id)
+        return self._run_record_cache[run_id]
 
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         run_record = self._get_run_record_by_id(run_id=run_id)
@@ -554,6 +699,65 @@ def get_latest_storage_id(self, event_type: DagsterEventType) -> Optional[int]:
         else:
             return None
 
+    def get_latest_asset_event_storage_id(
+        self,
+        event_types: Sequence[DagsterEventType] = (
+            DagsterEventType.ASSET_MATERIALIZATION,
+            DagsterEventType.ASSET_OBSERVATION,
+        ),
+    ) -> Optional[int]:
+        """Returns the latest storage id of any event of the given event types, which default to
+        asset materializations and observations. If no such event exists, returns None.
+        """
+        storage_ids = [
+            storage_id
+            for storage_id in (self.get_latest_storage_id(event_type) for event_type in event_types)
+            if storage_id is not None
+        ]
+        return max(storage_ids) if storage_ids else None
+
+    def get_asset_keys_updated_after_cursor(
+        self,
+        after_cursor: int,
+        limit: int,
+        before_cursor: Optional[int] = None,
+        event_types: Sequence[DagsterEventType] = (
+            DagsterEventType.ASSET_MATERIALIZATION,
+            DagsterEventType.ASSET_OBSERVATION,
+        ),
+    ) -> Optional[AbstractSet[AssetKey]]:
+        """Returns the set of asset keys that have been materialized or observed since the given
+        cursor. If more than `limit` events of any type have occurred since the cursor, returns
+        None, as it is likely to be cheaper to query the state of each asset individually.
+
+        Args:
+            after_cursor (int): Only events with a storage_id greater than this will be considered.
+            limit (int): The maximum number of events of each type to fetch.
+            before_cursor (Optional[int]): Only events with a storage_id less than this will be
+                considered.
+            event_types (Sequence[DagsterEventType]): The types of events that update an asset.
+                Defaults to materializations and observations.
+        """
+        from dagster._core.event_api import EventRecordsFilter
+
+        updated_asset_keys = set()
+        for event_type in event_types:
+            # only the asset key of each event is needed, so the events are not loaded
+            storage_ids_and_asset_keys = self.instance.get_event_record_asset_keys(
+                event_records_filter=EventRecordsFilter(
+                    event_type=event_type, after_cursor=after_cursor, before_cursor=before_cursor
+                ),
+                limit=limit + 1,
+                ascending=True,
+            )
+            if len(storage_ids_and_asset_keys) > limit:
+                return None
+            for _, asset_key in storage_ids_and_asset_keys:
+                if asset_key is not None:
+                    updated_asset_keys.add(asset_key)
+
+        return updated_asset_keys
+
     @cached_method
     def is_reconciled(
         self, *, asset_partition: AssetKeyPartitionKey, asset_graph: AssetGraph
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, Iterator, MutableMapping, NamedTuple, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+class LRUCache(MutableMapping[K, V], Generic[K, V]):
+    """A mapping that evicts its least recently used entries once it holds more than max_size
+    entries. Membership checks are counted as cache hits or misses, as callers check whether a
+    value is cached before fetching it.
+    """
+
+    def __init__(self, max_size: Optional[int]):
+        self._max_size = max_size
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._entries:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def __getitem__(self, key: K) -> V:
+        value = self._entries[key]
+        self._entries.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if self._max_size is not None and len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def __delitem__(self, key: K) -> None:
+        del self._entries[key]
+
+    def discard(self, key: K) -> None:
+        """Removes the entry for the given key, if there is one, without counting a hit or miss."""
+        self._entries.pop(key, None)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses, size=len(self._entries))
@@ -1,6 +1,8 @@
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Dict, Mapping, Sequence, Tuple, Union
 
+from typing_extensions import Protocol
+
 from dagster import _check as check
 
 if TYPE_CHECKING:
@@ -8,6 +10,16 @@
     from dagster._core.storage.pipeline_run import DagsterRun
 
 
+class TaggedItem(Protocol):
+    """Anything with tags that can be counted against tag concurrency limits, e.g. the tags of a run
+    that were fetched without loading the run itself.
+    """
+
+    @property
+    def tags(self) -> Mapping[str, str]:
+        ...
+
+
 class TagConcurrencyLimitsCounter:
     """Helper object that keeps track of when the tag concurrency limits are met."""
 
@@ -21,7 +33,7 @@ class TagConcurrencyLimitsCounter:
     def __init__(
         self,
         tag_concurrency_limits: Sequence[Mapping[str, Any]],
-        in_progress_tagged_items: Sequence[Union["DagsterRun", "ExecutionStep"]],
+        in_progress_tagged_items: Sequence[Union["DagsterRun", "ExecutionStep", TaggedItem]],
     ):
         check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
         check.list_param(in_progress_tagged_items, "in_progress_tagged_items")
@@ -50,7 +62,7 @@ def __init__(
         for item in in_progress_tagged_items:
             self.update_counters_with_launched_item(item)
 
-    def is_blocked(self, item: Union["DagsterRun", "ExecutionStep"]) -> bool:
+    def is_blocked(self, item: Union["DagsterRun", "ExecutionStep", TaggedItem]) -> bool:
         """True if there are in progress item which are blocking this item based on tag limits."""
         for key, value in item.tags.items():
             if key in self._key_limits and self._key_counts[key] >= self._key_limits[key]:
@@ -72,7 +84,7 @@ def is_blocked(self, item: Union["DagsterRun", "ExecutionStep"]) -> bool:
         return False
 
     def update_counters_with_launched_item(
-        self, item: Union["DagsterRun", "ExecutionStep"]
+        self, item: Union["DagsterRun", "ExecutionStep", TaggedItem]
     ) -> None:
         """Add a new in progress item to the counters."""
         for key, value in item.tags.items():
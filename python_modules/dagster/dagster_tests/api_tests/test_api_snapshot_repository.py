@@ -1,24 +1,38 @@
 import sys
+import threading
 from contextlib import contextmanager
 
+import grpc
+import mock
 import pytest
-from dagster import job, op, repository
+from dagster import file_relative_path, job, op, repository
+from dagster._api import snapshot_repository
 from dagster._api.snapshot_repository import (
     sync_get_streaming_external_repositories_data_grpc,
 )
-from dagster._core.errors import DagsterUserCodeProcessError
+from dagster._core.errors import DagsterUserCodeProcessError, DagsterUserCodeUnreachableError
 from dagster._core.host_representation import (
     ExternalRepositoryData,
+    InProcessCodeLocationOrigin,
     ManagedGrpcPythonEnvCodeLocationOrigin,
+    external_data,
 )
 from dagster._core.host_representation.external import ExternalRepository
-from dagster._core.host_representation.external_data import ExternalJobData
+from dagster._core.host_representation.external_data import (
+    ExternalJobData,
+    ExternalRepositoryDelta,
+    external_repository_data_from_delta,
+)
 from dagster._core.host_representation.handle import RepositoryHandle
 from dagster._core.host_representation.origin import ExternalRepositoryOrigin
 from dagster._core.instance import DagsterInstance
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value
+from dagster._grpc.__generated__ import api_pb2
+from dagster._grpc.server import DagsterApiServer
+from dagster._grpc.types import ExternalRepositoryDeltaArgs
+from dagster._serdes.serdes import deserialize_value, serialize_value
+from dagster._utils.lru_cache import LRUCache
 
 from .utils import get_bar_repo_code_location
 
@@ -37,6 +51,163 @@ def test_streaming_external_repositories_api_grpc(instance):
         assert external_repository_data.name == "bar_repo"
 
 
+def test_streaming_external_repository_delta_grpc(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+        full_data = deserialize_value(
+            "".join(
+                chunk["serialized_external_repository_chunk"]
+                for chunk in code_location.client.streaming_external_repository(repo_origin)
+            ),
+            ExternalRepositoryData,
+        )
+
+        delta = deserialize_value(
+            code_location.client.streaming_external_repository_delta(
+                ExternalRepositoryDeltaArgs(repository_origin=repo_origin)
+            ),
+            ExternalRepositoryDelta,
+        )
+        assert set(delta.pieces.keys()) == delta.manifest.all_piece_ids
+        assert external_repository_data_from_delta(delta, {}) == full_data
+
+        # once every piece is known, only the manifest is sent
+        second_delta = deserialize_value(
+            code_location.client.streaming_external_repository_delta(
+                ExternalRepositoryDeltaArgs(
+                    repository_origin=repo_origin,
+                    known_piece_ids=delta.manifest.all_piece_ids,
+                )
+            ),
+            ExternalRepositoryDelta,
+        )
+        assert second_delta.manifest == delta.manifest
+        assert not second_delta.pieces
+        assert external_repository_data_from_delta(second_delta, delta.pieces) == full_data
+
+        # repeated loads through the api reuse the cached pieces
+        assert (
+            sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)[
+                "bar_repo"
+            ]
+            == full_data
+        )
+        assert (
+            sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)[
+                "bar_repo"
+            ]
+            == full_data
+        )
+
+
+@contextmanager
+def _in_process_api_server(loadable_target_origin):
+    server_termination_event = threading.Event()
+    server = DagsterApiServer(
+        server_termination_event=server_termination_event,
+        loadable_target_origin=loadable_target_origin,
+    )
+    try:
+        yield server
+    finally:
+        server_termination_event.set()
+        server.cleanup()
+
+
+def _get_delta(server, repository_origin, known_piece_ids=frozenset()):
+    request = api_pb2.ExternalRepositoryDeltaRequest(
+        serialized_external_repository_delta_args=serialize_value(
+            ExternalRepositoryDeltaArgs(
+                repository_origin=repository_origin, known_piece_ids=known_piece_ids
+            )
+        )
+    )
+    return deserialize_value(
+        "".join(
+            event.serialized_chunk
+            for event in server.StreamingExternalRepositoryDelta(request, None)
+        ),
+        ExternalRepositoryDelta,
+    )
+
+
+@pytest.mark.parametrize(
+    "python_file,is_dynamic",
+    [
+        (file_relative_path(__file__, "api_tests_repo.py"), False),
+        (
+            file_relative_path(
+                __file__, "../core_tests/host_representation_tests/test_custom_repository_data.py"
+            ),
+            True,
+        ),
+    ],
+)
+def test_server_caches_repository_piece_ids(python_file, is_dynamic):
+    loadable_target_origin = LoadableTargetOrigin(
+        executable_path=sys.executable, python_file=python_file, attribute="bar_repo"
+    )
+    repository_origin = ExternalRepositoryOrigin(
+        InProcessCodeLocationOrigin(loadable_target_origin), "bar_repo"
+    )
+
+    with _in_process_api_server(loadable_target_origin) as server:
+        delta = _get_delta(server, repository_origin)
+
+        with mock.patch.object(
+            external_data, "create_snapshot_id", wraps=external_data.create_snapshot_id
+        ) as create_snapshot_id_mock:
+            second_delta = _get_delta(
+                server, repository_origin, known_piece_ids=delta.manifest.all_piece_ids
+            )
+
+        if is_dynamic:
+            # the jobs of the dynamic repository change on every call, so its pieces are rebuilt
+            assert create_snapshot_id_mock.call_count > 0
+            assert second_delta.manifest != delta.manifest
+            assert second_delta.pieces
+        else:
+            # the unchanged pieces aren't serialized again to compute their ids
+            assert create_snapshot_id_mock.call_count == 0
+            assert second_delta.manifest == delta.manifest
+            assert not second_delta.pieces
+
+
+def test_repository_piece_cache_is_bounded(instance, monkeypatch):
+    piece_cache = LRUCache(max_size=1)
+    piece_cache[("other_location", "other_repo")] = {}
+    monkeypatch.setattr(snapshot_repository, "_repository_piece_cache", piece_cache)
+
+    with get_bar_repo_code_location(instance) as code_location:
+        sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)
+
+        # the least recently loaded repository is evicted
+        assert list(piece_cache.keys()) == [(code_location.name, "bar_repo")]
+
+
+class _UnimplementedRpcError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNIMPLEMENTED
+
+
+def test_streaming_external_repository_delta_unimplemented(instance, monkeypatch):
+    with get_bar_repo_code_location(instance) as code_location:
+
+        def _unimplemented(_args):
+            raise DagsterUserCodeUnreachableError(
+                "Could not reach user code server"
+            ) from _UnimplementedRpcError()
+
+        # older servers do not implement the delta API, so fall back to the full repository
+        monkeypatch.setattr(
+            code_location.client, "streaming_external_repository_delta", _unimplemented
+        )
+        external_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )
+        assert external_repo_datas["bar_repo"].name == "bar_repo"
+
+
 def test_streaming_external_repositories_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         code_location.repository_names = {"does_not_exist"}
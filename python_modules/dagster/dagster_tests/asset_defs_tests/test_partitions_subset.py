@@ -1,11 +1,22 @@
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
+from dagster import (
+    DagsterInstance,
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
-from dagster._core.definitions.partition import DefaultPartitionsSubset
+from dagster._core.definitions.partition import DefaultPartitionsSubset, OrdinalPartitionsSubset
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     TimeWindowPartitionsSubset,
 )
-from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.errors import (
+    DagsterInvalidDeserializationVersionError,
+    DagsterInvariantViolationError,
+    DagsterUnknownPartitionError,
+)
 
 
 def test_default_subset_cannot_deserialize_invalid_version():
@@ -78,3 +89,69 @@ def test_empty_subsets():
     assert type(composite.empty_subset()) is MultiPartitionsSubset
     assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
+
+
+def test_ordinal_subset_set_operations():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(10)])
+    empty_subset = OrdinalPartitionsSubset.empty_subset(partitions_def)
+    a = empty_subset.with_partition_keys(["0", "1", "2", "3", "7"])
+    b = empty_subset.with_partition_keys(["2", "3", "4", "8"])
+
+    assert (a | b).get_partition_keys() == {"0", "1", "2", "3", "4", "7", "8"}
+    assert (a & b).get_partition_keys() == {"2", "3"}
+    assert (a - b).get_partition_keys() == {"0", "1", "7"}
+    assert len(a) == 5
+    assert "7" in a and "8" not in a and "nonexistent" not in a
+    assert a.get_partition_keys_not_in_subset() == {"4", "5", "6", "8", "9"}
+    assert a.get_partition_key_ranges() == [
+        PartitionKeyRange("0", "3"),
+        PartitionKeyRange("7", "7"),
+    ]
+
+    # set operations with subsets of other types
+    default_subset = partitions_def.empty_subset().with_partition_keys(["3", "9"])
+    assert (a | default_subset).get_partition_keys() == {"0", "1", "2", "3", "7", "9"}
+    assert (a - default_subset).get_partition_keys() == {"0", "1", "2", "7"}
+
+    with pytest.raises(DagsterUnknownPartitionError):
+        a.with_partition_keys(["nonexistent"])
+
+
+def test_ordinal_subset_serialization():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(10)])
+    subset = OrdinalPartitionsSubset.empty_subset(partitions_def).with_partition_keys(
+        ["0", "1", "2", "5", "9"]
+    )
+    serialized = subset.serialize()
+
+    assert OrdinalPartitionsSubset.from_serialized(partitions_def, serialized) == subset
+    # can also be read back as a default subset
+    assert partitions_def.deserialize_subset(serialized).get_partition_keys() == {
+        "0",
+        "1",
+        "2",
+        "5",
+        "9",
+    }
+
+    changed_partitions_def = StaticPartitionsDefinition([str(i) for i in range(11)])
+    with pytest.raises(DagsterInvariantViolationError, match="have changed"):
+        OrdinalPartitionsSubset.from_serialized(changed_partitions_def, serialized)
+
+
+def test_ordinal_subset_dynamic_partitions():
+    partitions_def = DynamicPartitionsDefinition(name="fruits")
+    with DagsterInstance.ephemeral() as instance:
+        instance.add_dynamic_partitions("fruits", ["apple", "banana", "cherry"])
+        subset = OrdinalPartitionsSubset.empty_subset(partitions_def, instance).with_partition_keys(
+            ["banana"]
+        )
+        assert subset.get_partition_keys_not_in_subset() == {"apple", "cherry"}
+
+        deserialized = OrdinalPartitionsSubset.from_serialized(
+            partitions_def, subset.serialize(), instance
+        )
+        assert deserialized == subset
+        assert deserialized.partitions_def_id == partitions_def.get_serializable_unique_identifier(
+            instance
+        )
@@ -27,6 +27,10 @@
                     'enabled': {
                     }
                 },
+                'reuse_processes': {
+                    'max_memory_mb': 0,
+                    'max_steps_per_process': 0
+                },
                 'start_method': {
                     'forkserver': {
                         'preload_modules': [
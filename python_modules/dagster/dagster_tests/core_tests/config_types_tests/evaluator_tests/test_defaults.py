@@ -6,6 +6,7 @@
     ConfigTypeKind,
     Selector,
     post_process_config,
+    resolve_defaults,
     resolve_to_config_type,
 )
 
@@ -193,3 +194,22 @@ def test_post_process_config():
     }
     assert post_process_config(noneable_permissive_config_type, {"args": {}}).value["args"] == {}
     assert post_process_config(noneable_permissive_config_type, None).value["args"] is None
+
+
+def test_resolved_defaults_are_not_shared():
+    config_type = resolve_to_config_type(
+        {
+            "resource": {
+                "options": {"timeout": Field(int, default_value=30)},
+                "hosts": Field([str], default_value=["a", "b"]),
+            }
+        }
+    )
+
+    first = resolve_defaults(config_type, None).value
+    first["resource"]["options"]["timeout"] = 0
+    first["resource"]["hosts"].append("c")
+
+    # the resolved defaults of a config type are cached, but each call gets its own copy
+    second = resolve_defaults(config_type, None).value
+    assert second == {"resource": {"options": {"timeout": 30}, "hosts": ["a", "b"]}}
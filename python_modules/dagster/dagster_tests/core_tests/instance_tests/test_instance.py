@@ -1,6 +1,8 @@
 import re
+import time
 from typing import Any, Mapping, Optional
 
+import mock
 import pytest
 import yaml
 from dagster import (
@@ -20,6 +22,8 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEventType
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
@@ -46,6 +50,7 @@
     environ,
     instance_for_test,
 )
+from dagster._core.utils import make_new_run_id
 from dagster._daemon.asset_daemon import AssetDaemon
 from dagster._serdes import ConfigurableClass
 from dagster._serdes.config_class import ConfigurableClassData
@@ -352,6 +357,57 @@ def test_create_run_with_asset_partitions():
         )
 
 
+def test_create_runs():
+    with instance_for_test() as instance:
+        job_snapshot = noop_asset_job.get_job_snapshot()
+        ep_snapshot = snapshot_from_execution_plan(
+            create_execution_plan(noop_asset_job), noop_asset_job.get_job_snapshot_id()
+        )
+
+        run_args = [
+            dict(
+                job_name=noop_asset_job.name,
+                run_id=None,
+                run_config=None,
+                status=None,
+                tags={"index": str(i)},
+                root_run_id=None,
+                parent_run_id=None,
+                step_keys_to_execute=None,
+                execution_plan_snapshot=ep_snapshot,
+                job_snapshot=job_snapshot,
+                parent_job_snapshot=None,
+                asset_selection=None,
+                solids_to_execute=None,
+                solid_selection=None,
+                external_job_origin=None,
+                job_code_origin=None,
+            )
+            for i in range(5)
+        ]
+
+        with mock.patch.object(
+            instance.run_storage, "has_job_snapshot", wraps=instance.run_storage.has_job_snapshot
+        ) as has_job_snapshot, mock.patch.object(
+            instance.run_storage, "add_run", wraps=instance.run_storage.add_run
+        ) as add_run:
+            runs = instance.create_runs(run_args)
+            # the snapshots are only persisted once for the whole batch, and the runs are
+            # written together
+            assert has_job_snapshot.call_count == 1
+            assert add_run.call_count == 0
+
+        assert [run.tags["index"] for run in runs] == ["0", "1", "2", "3", "4"]
+        assert len({run.run_id for run in runs}) == 5
+        for run in runs:
+            assert instance.get_run_by_id(run.run_id) == run
+            assert run.job_snapshot_id == create_job_snapshot_id(job_snapshot)
+            assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
+            assert instance.get_records_for_run(
+                run.run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
+            ).records
+
+
 def test_get_required_daemon_types():
     from dagster._daemon.daemon import (
         BackfillDaemon,
@@ -443,6 +499,108 @@ def test_grpc_override_settings():
         assert instance.code_server_process_startup_timeout == 60
 
 
+def _log_entry(run_id, step_key, message):
+    return EventLogEntry(
+        error_info=None,
+        user_message=message,
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key=step_key,
+    )
+
+
+def test_event_log_batching_buffers_step_events():
+    with instance_for_test(
+        overrides={
+            "event_log_batching": {
+                "enabled": True,
+                "max_batch_size": 3,
+                "flush_interval_seconds": 600.0,
+            }
+        }
+    ) as instance:
+        assert instance.event_log_batching_enabled
+
+        run_id = make_new_run_id()
+        instance.handle_new_event(_log_entry(run_id, "my_step", "one"))
+        instance.handle_new_event(_log_entry(run_id, "my_step", "two"))
+        assert instance.all_logs(run_id) == []
+
+        # the buffer is flushed once it reaches the max batch size
+        instance.handle_new_event(_log_entry(run_id, "my_step", "three"))
+        assert [event.message for event in instance.all_logs(run_id)] == ["one", "two", "three"]
+
+        # events outside of a step are written immediately, along with anything buffered
+        instance.handle_new_event(_log_entry(run_id, "my_step", "four"))
+        instance.handle_new_event(_log_entry(run_id, None, "five"))
+        assert len(instance.all_logs(run_id)) == 5
+
+        instance.handle_new_event(_log_entry(run_id, "my_step", "six"))
+        assert len(instance.all_logs(run_id)) == 5
+        instance.flush_event_buffer()
+        assert len(instance.all_logs(run_id)) == 6
+
+
+def test_event_log_batching_flushes_after_interval():
+    with instance_for_test(
+        overrides={
+            "event_log_batching": {
+                "enabled": True,
+                "max_batch_size": 100,
+                "flush_interval_seconds": 0.1,
+            }
+        }
+    ) as instance:
+        run_id = make_new_run_id()
+        instance.handle_new_event(_log_entry(run_id, "my_step", "one"))
+        instance.handle_new_event(_log_entry(run_id, "my_step", "two"))
+
+        # no further events arrive, but the buffered events are still written
+        start_time = time.time()
+        while len(instance.all_logs(run_id)) < 2:
+            assert time.time() - start_time < 30, "Timed out waiting for the event buffer flush"
+            time.sleep(0.1)
+
+        assert [event.message for event in instance.all_logs(run_id)] == ["one", "two"]
+
+
+def test_event_log_batching_execute_job():
+    @op
+    def chatty_op(context):
+        for i in range(25):
+            context.log.info(f"message {i}")
+
+    @job
+    def chatty_job():
+        chatty_op()
+
+    with instance_for_test() as instance:
+        unbatched_result = chatty_job.execute_in_process(instance=instance)
+        unbatched_logs = instance.all_logs(unbatched_result.run_id)
+
+    with instance_for_test(
+        overrides={"event_log_batching": {"enabled": True, "max_batch_size": 10}}
+    ) as instance:
+        with mock.patch.object(
+            instance.event_log_storage,
+            "store_events",
+            wraps=instance.event_log_storage.store_events,
+        ) as store_events_mock:
+            batched_result = chatty_job.execute_in_process(instance=instance)
+            assert store_events_mock.call_count > 0
+
+        assert batched_result.success
+        batched_logs = instance.all_logs(batched_result.run_id)
+        assert [event.message for event in batched_logs if not event.is_dagster_event] == [
+            event.message for event in unbatched_logs if not event.is_dagster_event
+        ]
+        assert [event.dagster_event_type for event in batched_logs] == [
+            event.dagster_event_type for event in unbatched_logs
+        ]
+        assert instance.get_run_by_id(batched_result.run_id).is_success
+
+
 def test_run_monitoring(capsys):
     with instance_for_test(
         overrides={
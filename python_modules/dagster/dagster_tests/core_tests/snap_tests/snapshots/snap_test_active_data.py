@@ -10,6 +10,7 @@
 snapshots['test_external_pipeline_data 1'] = '''{
   "__class__": "ExternalPipelineData",
   "active_presets": [],
+  "has_version_strategy": false,
   "is_job": true,
   "name": "foo_job",
   "parent_pipeline_snapshot": null,
@@ -186,7 +187,7 @@
             "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
           ]
         },
-        "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+        "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -194,31 +195,31 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-              "description": "Execute all steps in a single process.",
+              "default_value_as_json_str": "{}",
+              "description": null,
               "is_required": false,
-              "name": "in_process",
-              "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+              "name": "disabled",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-              "description": "Execute each step in an individual process.",
+              "default_value_as_json_str": "{}",
+              "description": null,
               "is_required": false,
-              "name": "multiprocess",
-              "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+              "name": "enabled",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
             }
           ],
           "given_name": null,
-          "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+          "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
           "kind": {
             "__enum__": "ConfigTypeKind.SELECTOR"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+        "Selector.2d88a539f3f647f88bd2e0c1c5ebfe48a69c22f8": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -226,24 +227,24 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
+              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+              "description": "Execute all steps in a single process.",
               "is_required": false,
-              "name": "disabled",
-              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+              "name": "in_process",
+              "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
+              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+              "description": "Execute each step in an individual process.",
               "is_required": false,
-              "name": "enabled",
-              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+              "name": "multiprocess",
+              "type_key": "Shape.b932916453b784a9b8243ee2fb6c6a2b00cd9577"
             }
           ],
           "given_name": null,
-          "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+          "key": "Selector.2d88a539f3f647f88bd2e0c1c5ebfe48a69c22f8",
           "kind": {
             "__enum__": "ConfigTypeKind.SELECTOR"
           },
@@ -487,7 +488,39 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.07cb4c25af1ee77ffdc2d3d5b312fd61d8dc3989": {
+        "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "\\"INFO\\"",
+              "description": "The logger\'s threshold.",
+              "is_required": false,
+              "name": "log_level",
+              "type_key": "String"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "\\"dagster\\"",
+              "description": "The name of your logger.",
+              "is_required": false,
+              "name": "name",
+              "type_key": "String"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.0a2e0594e4cae2c0a7bdccd7a230d6c379c53e4a": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -502,7 +535,7 @@
               "description": "Configure how steps are executed within a run.",
               "is_required": false,
               "name": "execution",
-              "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
+              "type_key": "Shape.a61155448f5ca22eee5fe2fae0ea284373a8b7be"
             },
             {
               "__class__": "ConfigFieldSnap",
@@ -533,39 +566,7 @@
             }
           ],
           "given_name": null,
-          "key": "Shape.07cb4c25af1ee77ffdc2d3d5b312fd61d8dc3989",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "\\"INFO\\"",
-              "description": "The logger\'s threshold.",
-              "is_required": false,
-              "name": "log_level",
-              "type_key": "String"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "\\"dagster\\"",
-              "description": "The name of your logger.",
-              "is_required": false,
-              "name": "name",
-              "type_key": "String"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
+          "key": "Shape.0a2e0594e4cae2c0a7bdccd7a230d6c379c53e4a",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -812,7 +813,85 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+        "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Any"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.75f52c73c0d86277b426e49dfa4fab05c1481ab0": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Replace a worker process once its peak memory usage exceeds this many megabytes. Not supported on Windows.",
+              "is_required": false,
+              "name": "max_memory_mb",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "100",
+              "description": "The number of steps a worker process executes before it is replaced with a new one.",
+              "is_required": false,
+              "name": "max_steps_per_process",
+              "type_key": "Int"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.75f52c73c0d86277b426e49dfa4fab05c1481ab0",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.a61155448f5ca22eee5fe2fae0ea284373a8b7be": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Selector.2d88a539f3f647f88bd2e0c1c5ebfe48a69c22f8"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.a61155448f5ca22eee5fe2fae0ea284373a8b7be",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.b932916453b784a9b8243ee2fb6c6a2b00cd9577": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -835,6 +914,15 @@
               "name": "retries",
               "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
             },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Execute steps in a pool of long-lived worker processes instead of starting a new process for each step. Each worker loads the job and opens the instance once, which avoids paying the process startup cost for every step. Resources are still initialized for each step.",
+              "is_required": false,
+              "name": "reuse_processes",
+              "type_key": "Shape.75f52c73c0d86277b426e49dfa4fab05c1481ab0"
+            },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": false,
@@ -855,30 +943,7 @@
             }
           ],
           "given_name": null,
-          "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": null,
-              "is_required": false,
-              "name": "config",
-              "type_key": "Any"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+          "key": "Shape.b932916453b784a9b8243ee2fb6c6a2b00cd9577",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -921,29 +986,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"multiprocess\\": {}}",
-              "description": null,
-              "is_required": false,
-              "name": "config",
-              "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "String": {
           "__class__": "ConfigTypeSnap",
           "description": "",
@@ -1103,7 +1145,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.07cb4c25af1ee77ffdc2d3d5b312fd61d8dc3989"
+        "root_config_key": "Shape.0a2e0594e4cae2c0a7bdccd7a230d6c379c53e4a"
       }
     ],
     "name": "foo_job",
@@ -1173,6 +1215,7 @@
     {
       "__class__": "ExternalPipelineData",
       "active_presets": [],
+      "has_version_strategy": false,
       "is_job": true,
       "name": "foo_job",
       "parent_pipeline_snapshot": null,
@@ -1349,7 +1392,7 @@
                 "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
               ]
             },
-            "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+            "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1357,31 +1400,31 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-                  "description": "Execute all steps in a single process.",
+                  "default_value_as_json_str": "{}",
+                  "description": null,
                   "is_required": false,
-                  "name": "in_process",
-                  "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+                  "name": "disabled",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-                  "description": "Execute each step in an individual process.",
+                  "default_value_as_json_str": "{}",
+                  "description": null,
                   "is_required": false,
-                  "name": "multiprocess",
-                  "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+                  "name": "enabled",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
                 }
               ],
               "given_name": null,
-              "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+              "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+            "Selector.2d88a539f3f647f88bd2e0c1c5ebfe48a69c22f8": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1389,24 +1432,24 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": null,
+                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+                  "description": "Execute all steps in a single process.",
                   "is_required": false,
-                  "name": "disabled",
-                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                  "name": "in_process",
+                  "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": null,
+                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+                  "description": "Execute each step in an individual process.",
                   "is_required": false,
-                  "name": "enabled",
-                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                  "name": "multiprocess",
+                  "type_key": "Shape.b932916453b784a9b8243ee2fb6c6a2b00cd9577"
                 }
               ],
               "given_name": null,
-              "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+              "key": "Selector.2d88a539f3f647f88bd2e0c1c5ebfe48a69c22f8",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
@@ -1650,7 +1693,39 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.07cb4c25af1ee77ffdc2d3d5b312fd61d8dc3989": {
+            "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "\\"INFO\\"",
+                  "description": "The logger\'s threshold.",
+                  "is_required": false,
+                  "name": "log_level",
+                  "type_key": "String"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "\\"dagster\\"",
+                  "description": "The name of your logger.",
+                  "is_required": false,
+                  "name": "name",
+                  "type_key": "String"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.0a2e0594e4cae2c0a7bdccd7a230d6c379c53e4a": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1665,7 +1740,7 @@
                   "description": "Configure how steps are executed within a run.",
                   "is_required": false,
                   "name": "execution",
-                  "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
+                  "type_key": "Shape.a61155448f5ca22eee5fe2fae0ea284373a8b7be"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
@@ -1696,39 +1771,7 @@
                 }
               ],
               "given_name": null,
-              "key": "Shape.07cb4c25af1ee77ffdc2d3d5b312fd61d8dc3989",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "\\"INFO\\"",
-                  "description": "The logger\'s threshold.",
-                  "is_required": false,
-                  "name": "log_level",
-                  "type_key": "String"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "\\"dagster\\"",
-                  "description": "The name of your logger.",
-                  "is_required": false,
-                  "name": "name",
-                  "type_key": "String"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
+              "key": "Shape.0a2e0594e4cae2c0a7bdccd7a230d6c379c53e4a",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -1975,7 +2018,85 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+            "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Any"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.75f52c73c0d86277b426e49dfa4fab05c1481ab0": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Replace a worker process once its peak memory usage exceeds this many megabytes. Not supported on Windows.",
+                  "is_required": false,
+                  "name": "max_memory_mb",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "100",
+                  "description": "The number of steps a worker process executes before it is replaced with a new one.",
+                  "is_required": false,
+                  "name": "max_steps_per_process",
+                  "type_key": "Int"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.75f52c73c0d86277b426e49dfa4fab05c1481ab0",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.a61155448f5ca22eee5fe2fae0ea284373a8b7be": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Selector.2d88a539f3f647f88bd2e0c1c5ebfe48a69c22f8"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.a61155448f5ca22eee5fe2fae0ea284373a8b7be",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.b932916453b784a9b8243ee2fb6c6a2b00cd9577": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1998,6 +2119,15 @@
                   "name": "retries",
                   "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
                 },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Execute steps in a pool of long-lived worker processes instead of starting a new process for each step. Each worker loads the job and opens the instance once, which avoids paying the process startup cost for every step. Resources are still initialized for each step.",
+                  "is_required": false,
+                  "name": "reuse_processes",
+                  "type_key": "Shape.75f52c73c0d86277b426e49dfa4fab05c1481ab0"
+                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": false,
@@ -2018,30 +2148,7 @@
                 }
               ],
               "given_name": null,
-              "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": null,
-                  "is_required": false,
-                  "name": "config",
-                  "type_key": "Any"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+              "key": "Shape.b932916453b784a9b8243ee2fb6c6a2b00cd9577",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2084,29 +2191,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"multiprocess\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "config",
-                  "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "String": {
               "__class__": "ConfigTypeSnap",
               "description": "",
@@ -2266,7 +2350,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.07cb4c25af1ee77ffdc2d3d5b312fd61d8dc3989"
+            "root_config_key": "Shape.0a2e0594e4cae2c0a7bdccd7a230d6c379c53e4a"
           }
         ],
         "name": "foo_job",
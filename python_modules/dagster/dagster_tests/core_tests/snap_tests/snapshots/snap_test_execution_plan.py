@@ -21,7 +21,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "51195d3aa0d176dab02c5a02baec4ad6150b0168",
+  "pipeline_snapshot_id": "4fec7ef0df7fd2c0f27c574d06369f86710d4d47",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "op_one",
@@ -157,7 +157,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "3dc50e708ae1722762640e81bc754957d981d996",
+  "pipeline_snapshot_id": "4b51724e77db59ebb8b21b2d333782168d7480af",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_op"
@@ -221,7 +221,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "a02868fc2a5bdcc984279d68367d5025eea32905",
+  "pipeline_snapshot_id": "fde393965f5c8ec18e92edce91bf74f16e87c0c9",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_op"
@@ -299,7 +299,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "f0ff563d45d38e9bead6edd739faed0ca55123a9",
+  "pipeline_snapshot_id": "eabcd22b8ffe8934b248602d96b3cf7e2e61540b",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
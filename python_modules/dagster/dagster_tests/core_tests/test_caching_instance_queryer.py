@@ -0,0 +1,111 @@
+from dagster import AssetKey, DagsterInstance, asset
+from dagster._core.definitions.events import AssetKeyPartitionKey
+from dagster._core.definitions.materialize import materialize_to_memory
+from dagster._core.events import (
+    AssetMaterializationPlannedData,
+    DagsterEvent,
+    DagsterEventType,
+)
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+
+
+@asset
+def asset1():
+    return 1
+
+
+@asset
+def asset2():
+    return 2
+
+
+def test_refresh_invalidates_updated_assets():
+    instance = DagsterInstance.ephemeral()
+    materialize_to_memory([asset1, asset2], instance=instance)
+
+    instance_queryer = CachingInstanceQueryer(instance=instance)
+    instance_queryer.refresh()
+
+    record1 = instance_queryer.get_latest_materialization_record(AssetKey("asset1"))
+    record2 = instance_queryer.get_latest_materialization_record(AssetKey("asset2"))
+    assert record1 is not None
+    assert record2 is not None
+    assert instance_queryer.get_cache_stats()["latest_materialization_records"].misses == 2
+
+    # nothing has changed, so the records are retained across ticks
+    instance_queryer.refresh()
+    assert instance_queryer.get_latest_materialization_record(AssetKey("asset1")) == record1
+    assert instance_queryer.get_latest_materialization_record(AssetKey("asset2")) == record2
+    stats = instance_queryer.get_cache_stats()["latest_materialization_records"]
+    assert stats.hits == 2
+    assert stats.misses == 2
+
+    # only the entries for the newly materialized asset are invalidated
+    materialize_to_memory([asset1], instance=instance)
+    instance_queryer.refresh()
+    new_record1 = instance_queryer.get_latest_materialization_record(AssetKey("asset1"))
+    assert new_record1 is not None
+    assert new_record1.storage_id > record1.storage_id
+    assert instance_queryer.get_latest_materialization_record(AssetKey("asset2")) == record2
+    stats = instance_queryer.get_cache_stats()["latest_materialization_records"]
+    assert stats.hits == 3
+    assert stats.misses == 3
+
+
+def test_refresh_invalidates_planned_assets():
+    instance = DagsterInstance.ephemeral()
+    materialize_to_memory([asset1], instance=instance)
+
+    instance_queryer = CachingInstanceQueryer(instance=instance)
+    instance_queryer.refresh()
+    asset_record = instance_queryer.get_asset_record(AssetKey("asset1"))
+    assert asset_record is not None
+
+    # a planned materialization changes the last run id of the asset record
+    instance.report_dagster_event(
+        DagsterEvent(
+            event_type_value=DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+            job_name="my_job",
+            event_specific_data=AssetMaterializationPlannedData(AssetKey("asset1")),
+        ),
+        run_id="planned_run_id",
+    )
+    instance_queryer.refresh()
+    new_asset_record = instance_queryer.get_asset_record(AssetKey("asset1"))
+    assert new_asset_record is not None
+    assert new_asset_record.asset_entry.last_run_id == "planned_run_id"
+
+
+def test_cache_size_is_bounded():
+    instance = DagsterInstance.ephemeral()
+    materialize_to_memory([asset1, asset2], instance=instance)
+
+    instance_queryer = CachingInstanceQueryer(instance=instance, max_cache_size=1)
+    instance_queryer.refresh()
+
+    instance_queryer.get_latest_materialization_record(AssetKey("asset1"))
+    instance_queryer.get_latest_materialization_record(AssetKey("asset2"))
+    instance_queryer.get_latest_materialization_record(AssetKey("asset1"))
+
+    stats = instance_queryer.get_cache_stats()["latest_materialization_records"]
+    assert stats.size == 1
+    assert stats.hits == 0
+    assert stats.misses == 3
+
+
+def test_prefetch_latest_materialization_records():
+    instance = DagsterInstance.ephemeral()
+    materialize_to_memory([asset1], instance=instance)
+
+    instance_queryer = CachingInstanceQueryer(instance=instance)
+    instance_queryer.prefetch_latest_materialization_records(
+        [AssetKeyPartitionKey(AssetKey("asset1")), AssetKeyPartitionKey(AssetKey("asset2"))]
+    )
+    stats = instance_queryer.get_cache_stats()["latest_materialization_records"]
+    assert stats.size == 2
+
+    assert instance_queryer.get_latest_materialization_record(AssetKey("asset1")) is not None
+    assert instance_queryer.get_latest_materialization_record(AssetKey("asset2")) is None
+    stats = instance_queryer.get_cache_stats()["latest_materialization_records"]
+    assert stats.hits == 2
+    assert stats.misses == 2
@@ -60,7 +60,12 @@
 )
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._daemon import get_default_daemon_logger
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorDaemonShard,
+    SensorTickLatencyTracker,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
 from .conftest import create_workspace_load_target
@@ -3100,3 +3105,58 @@ def cross_code_location_sensor(context):
         raise Exception("never executed")
 
     assert cross_code_location_sensor
+
+
+def test_sharded_sensors(instance, workspace_context, external_repo):
+    sensor_names = ["simple_sensor", "always_on_sensor", "run_key_sensor", "skip_cursor_sensor"]
+    external_sensors = [external_repo.get_external_sensor(name) for name in sensor_names]
+    for external_sensor in external_sensors:
+        instance.add_instigator_state(
+            InstigatorState(
+                external_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+
+    num_shards = 3
+    logger = get_default_daemon_logger("SensorDaemon")
+    for shard_index in range(num_shards):
+        shard = SensorDaemonShard(shard_index=shard_index, num_shards=num_shards)
+        tick_latency_tracker = SensorTickLatencyTracker()
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                logger,
+                shard=shard,
+                tick_latency_tracker=tick_latency_tracker,
+            )
+        )
+
+        sensors_in_shard = [
+            external_sensor
+            for external_sensor in external_sensors
+            if shard.contains(external_sensor.get_external_origin_id())
+        ]
+        stats = tick_latency_tracker.flush()
+        if sensors_in_shard:
+            assert stats
+            assert stats.num_ticks == len(sensors_in_shard)
+        else:
+            assert stats is None
+
+        # each sensor is only evaluated by the shard it falls in
+        for external_sensor in external_sensors:
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            assert len(ticks) == (
+                1
+                if any(
+                    SensorDaemonShard(i, num_shards).contains(
+                        external_sensor.get_external_origin_id()
+                    )
+                    for i in range(shard_index + 1)
+                )
+                else 0
+            )
@@ -3,6 +3,7 @@
 import string
 import sys
 import time
+from unittest import mock
 
 import pendulum
 import pytest
@@ -31,13 +32,15 @@
 )
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.definitions.partition import PartitionedConfig
+from dagster._core.definitions.version_strategy import SourceHashVersionStrategy
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.host_representation import (
     ExternalRepository,
     ExternalRepositoryOrigin,
+    InProcessCodeLocation,
     InProcessCodeLocationOrigin,
 )
-from dagster._core.storage.pipeline_run import DagsterRunStatus, RunsFilter
+from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import BACKFILL_ID_TAG, PARTITION_NAME_TAG
 from dagster._core.test_utils import (
     step_did_not_run,
@@ -158,6 +161,29 @@ def config_job():
     config_op()
 
 
+versioned_job_config = PartitionedConfig(
+    partitions_def=one_two_three_partitions,
+    run_config_for_partition_key_fn=lambda partition_key: {
+        "ops": {"versioned_op": {"config": {"partition": partition_key}}}
+    },
+)
+
+
+@op(config_schema={"partition": str})
+def versioned_op(context):
+    return context.op_config["partition"]
+
+
+@job(
+    partitions_def=one_two_three_partitions,
+    config=versioned_job_config,
+    version_strategy=SourceHashVersionStrategy(),
+    resource_defs={"io_manager": fs_io_manager},
+)
+def versioned_job():
+    versioned_op()
+
+
 def _unloadable_partition_set_origin():
     working_directory = os.path.dirname(__file__)
     return ExternalRepositoryOrigin(
@@ -257,6 +283,7 @@ def the_repo():
         conditional_failure_job,
         partial_job,
         config_job,
+        versioned_job,
         always_succeed_job,
         parallel_failure_job,
         # the lineage graph defined with these assets is such that: foo -> a1 -> bar -> b1
@@ -348,6 +375,107 @@ def test_simple_backfill(
     assert three.tags[PARTITION_NAME_TAG] == "three"
 
 
+def test_backfill_reuses_execution_plan_snapshot(
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    external_repo: ExternalRepository,
+):
+    for partition_set_name, num_plans in [
+        # the partitions of the job have the same run config, so they have the same plan
+        ("the_job_partition_set", 1),
+        # the partitions of the job set different config fields, so each plan is computed
+        ("config_job_partition_set", 3),
+    ]:
+        external_partition_set = external_repo.get_external_partition_set(partition_set_name)
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id=partition_set_name,
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+            )
+        )
+
+        with mock.patch.object(
+            InProcessCodeLocation,
+            "get_external_execution_plan",
+            autospec=True,
+            side_effect=InProcessCodeLocation.get_external_execution_plan,
+        ) as get_external_execution_plan:
+            list(
+                execute_backfill_iteration(
+                    workspace_context, get_default_daemon_logger("BackfillDaemon")
+                )
+            )
+            assert get_external_execution_plan.call_count == num_plans
+
+        runs = instance.get_runs(
+            RunsFilter(tags=DagsterRun.tags_for_backfill_id(partition_set_name))
+        )
+        assert len(runs) == 3
+        # the plans have the same steps either way
+        assert len({run.execution_plan_snapshot_id for run in runs}) == 1
+
+
+def test_backfill_memoized_job_does_not_reuse_execution_plan_snapshot(
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    external_repo: ExternalRepository,
+):
+    external_partition_set = external_repo.get_external_partition_set("versioned_job_partition_set")
+
+    def _backfill(backfill_id, partition_names):
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id=backfill_id,
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=partition_names,
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+            )
+        )
+        with mock.patch.object(
+            InProcessCodeLocation,
+            "get_external_execution_plan",
+            autospec=True,
+            side_effect=InProcessCodeLocation.get_external_execution_plan,
+        ) as get_external_execution_plan:
+            list(
+                execute_backfill_iteration(
+                    workspace_context, get_default_daemon_logger("BackfillDaemon")
+                )
+            )
+            # the memoized plan depends on the stored outputs, so it is computed for every run
+            assert get_external_execution_plan.call_count == len(partition_names)
+
+        wait_for_all_runs_to_finish(instance)
+        return {
+            run.tags[PARTITION_NAME_TAG]: run
+            for run in instance.get_runs(
+                RunsFilter(tags=DagsterRun.tags_for_backfill_id(backfill_id))
+            )
+        }
+
+    _backfill("versioned_one", ["one"])
+    runs = _backfill("versioned_one_two", ["one", "two"])
+
+    # the output for partition "one" is already stored, so only partition "two" executes its step
+    step_keys_by_partition = {
+        partition_name: instance.get_execution_plan_snapshot(
+            run.execution_plan_snapshot_id
+        ).step_keys_to_execute
+        for partition_name, run in runs.items()
+    }
+    assert step_keys_by_partition == {"one": [], "two": ["versioned_op"]}
+
+
 def test_canceled_backfill(
     instance: DagsterInstance,
     workspace_context: WorkspaceProcessContext,
@@ -372,7 +500,9 @@ def test_canceled_backfill(
         execute_backfill_iteration(workspace_context, get_default_daemon_logger("BackfillDaemon"))
     )
     next(iterator)
-    assert instance.get_runs_count() == 1
+    # the runs of the chunk are created together, and the first one is submitted
+    assert instance.get_runs_count() == 3
+    assert instance.get_runs_count(RunsFilter(statuses=[DagsterRunStatus.NOT_STARTED])) == 2
     backfill = instance.get_backfills()[0]
     assert backfill.status == BulkActionStatus.REQUESTED
     instance.update_backfill(backfill.with_status(BulkActionStatus.CANCELED))
@@ -380,7 +510,9 @@ def test_canceled_backfill(
     backfill = instance.get_backfill(backfill.backfill_id)
     assert backfill
     assert backfill.status == BulkActionStatus.CANCELED
-    assert instance.get_runs_count() == 1
+    # the runs that were created but not submitted are canceled
+    assert instance.get_runs_count() == 3
+    assert instance.get_runs_count(RunsFilter(statuses=[DagsterRunStatus.CANCELED])) == 2
 
 
 def test_failure_backfill(
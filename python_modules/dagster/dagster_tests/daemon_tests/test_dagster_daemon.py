@@ -4,8 +4,9 @@
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget
 from dagster._daemon.cli import run_command
 from dagster._daemon.controller import daemon_controller_from_instance
-from dagster._daemon.daemon import SchedulerDaemon
+from dagster._daemon.daemon import SchedulerDaemon, SensorDaemon
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
+from dagster._daemon.sensor import SensorDaemonShard
 
 
 def test_scheduler_instance():
@@ -47,6 +48,22 @@ def test_run_coordinator_instance():
             assert any(isinstance(daemon, QueuedRunCoordinatorDaemon) for daemon in daemons)
 
 
+def test_sharded_sensor_daemon_instance():
+    with instance_for_test(overrides={"sensors": {"num_shards": 4, "shard_index": 2}}) as instance:
+        with daemon_controller_from_instance(
+            instance,
+            workspace_load_target=EmptyWorkspaceTarget(),
+        ) as controller:
+            sensor_daemon = controller.get_daemon(SensorDaemon.daemon_type())
+            assert isinstance(sensor_daemon, SensorDaemon)
+            assert sensor_daemon.heartbeat_key() == "SENSOR_SHARD_2"
+
+    assert SensorDaemon(shard=SensorDaemonShard(0, 2)).heartbeat_key() != (
+        SensorDaemon(shard=SensorDaemonShard(1, 2)).heartbeat_key()
+    )
+    assert SensorDaemon().heartbeat_key() == SensorDaemon.daemon_type()
+
+
 def test_ephemeral_instance():
     runner = CliRunner()
     with pytest.raises(Exception, match="DAGSTER_HOME is not set"):
@@ -3,6 +3,7 @@
 from typing import Iterator
 
 import pytest
+from dagster import _check as check
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.host_representation.code_location import GrpcServerCodeLocation
 from dagster._core.host_representation.handle import JobHandle
@@ -834,3 +835,45 @@ def test_key_limit_with_extra_tags(use_threads, workspace_context, daemon, job_h
 
         list(daemon.run_iteration(bounded_ctx))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_in_progress_runs_tracked_between_iterations(workspace_context, daemon, job_handle):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_queued_run(instance, job_handle, run_id="tiny-1", tags={"database": "tiny"})
+        create_queued_run(instance, job_handle, run_id="tiny-2", tags={"database": "tiny"})
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1"]
+
+        # the dequeued run is still in progress, so the limit is still reached
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1"]
+
+        instance.report_run_failed(check.not_none(instance.get_run_by_id("tiny-1")))
+
+        # the finished run is picked up from the runs updated since the previous iteration
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1", "tiny-2"]
+
+
+def test_in_progress_runs_tracked_per_instance(workspace_context, daemon, job_handle):
+    for run_id in ["tiny-1", "tiny-2"]:
+        with instance_for_queued_run_coordinator(
+            max_concurrent_runs=10,
+            tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+        ) as instance:
+            bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+            create_queued_run(instance, job_handle, run_id=run_id, tags={"database": "tiny"})
+
+            # the in progress runs of the previous instance don't count against the limit
+            list(daemon.run_iteration(bounded_ctx))
+            assert get_run_ids(instance.run_launcher.queue()) == [run_id]
+
+            # track the launched run as in progress
+            list(daemon.run_iteration(bounded_ctx))
@@ -11,6 +11,7 @@
     repository,
 )
 from dagster._check import CheckError
+from dagster._core.definitions import asset_reconciliation_sensor
 from dagster._core.definitions.time_window_partitions import (
     HourlyPartitionsDefinition,
 )
@@ -19,6 +20,20 @@
 from .scenarios import ASSET_RECONCILIATION_SCENARIOS
 
 
+def assert_run_requests_match(run_requests, expected_run_requests):
+    assert len(run_requests) == len(expected_run_requests)
+
+    def sort_run_request_key_fn(run_request):
+        return (min(run_request.asset_selection), run_request.partition_key)
+
+    sorted_run_requests = sorted(run_requests, key=sort_run_request_key_fn)
+    sorted_expected_run_requests = sorted(expected_run_requests, key=sort_run_request_key_fn)
+
+    for run_request, expected_run_request in zip(sorted_run_requests, sorted_expected_run_requests):
+        assert set(run_request.asset_selection) == set(expected_run_request.asset_selection)
+        assert run_request.partition_key == expected_run_request.partition_key
+
+
 @pytest.mark.parametrize(
     "scenario",
     list(ASSET_RECONCILIATION_SCENARIOS.values()),
@@ -28,19 +43,25 @@ def test_reconciliation(scenario):
     instance = DagsterInstance.ephemeral()
     run_requests, _ = scenario.do_sensor_scenario(instance)
 
-    assert len(run_requests) == len(scenario.expected_run_requests)
+    assert_run_requests_match(run_requests, scenario.expected_run_requests)
 
-    def sort_run_request_key_fn(run_request):
-        return (min(run_request.asset_selection), run_request.partition_key)
 
-    sorted_run_requests = sorted(run_requests, key=sort_run_request_key_fn)
-    sorted_expected_run_requests = sorted(
-        scenario.expected_run_requests, key=sort_run_request_key_fn
-    )
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        scenario
+        for scenario in ASSET_RECONCILIATION_SCENARIOS.values()
+        if scenario.cursor_from is not None
+    ],
+)
+def test_reconciliation_too_many_events_for_incremental(scenario, monkeypatch):
+    # simulates a tick after a large volume of events, where every asset is checked for updates
+    # instead of only the ones with new events
+    monkeypatch.setattr(asset_reconciliation_sensor, "MAX_INCREMENTAL_RECONCILIATION_EVENTS", 0)
+    instance = DagsterInstance.ephemeral()
+    run_requests, _ = scenario.do_sensor_scenario(instance)
 
-    for run_request, expected_run_request in zip(sorted_run_requests, sorted_expected_run_requests):
-        assert set(run_request.asset_selection) == set(expected_run_request.asset_selection)
-        assert run_request.partition_key == expected_run_request.partition_key
+    assert_run_requests_match(run_requests, scenario.expected_run_requests)
 
 
 @pytest.mark.parametrize(
@@ -55,19 +76,7 @@ def test_reconciliation_no_tags(scenario):
 
     run_requests, _ = scenario.do_sensor_scenario(instance)
 
-    assert len(run_requests) == len(scenario.expected_run_requests)
-
-    def sort_run_request_key_fn(run_request):
-        return (min(run_request.asset_selection), run_request.partition_key)
-
-    sorted_run_requests = sorted(run_requests, key=sort_run_request_key_fn)
-    sorted_expected_run_requests = sorted(
-        scenario.expected_run_requests, key=sort_run_request_key_fn
-    )
-
-    for run_request, expected_run_request in zip(sorted_run_requests, sorted_expected_run_requests):
-        assert set(run_request.asset_selection) == set(expected_run_request.asset_selection)
-        assert run_request.partition_key == expected_run_request.partition_key
+    assert_run_requests_match(run_requests, scenario.expected_run_requests)
 
 
 @pytest.mark.parametrize(
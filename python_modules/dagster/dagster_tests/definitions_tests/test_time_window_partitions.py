@@ -1,3 +1,4 @@
+from collections import Counter
 from datetime import datetime
 from typing import cast
 
@@ -22,6 +23,7 @@
     TimeWindow,
     TimeWindowPartitionsSubset,
 )
+from dagster._utils.cached_method import CACHED_METHOD_FIELD_SUFFIX
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 
 DATE_FORMAT = "%Y-%m-%d"
@@ -647,6 +649,47 @@ def my_partitioned_config_2(_start, _end):
     )
 
 
+@pytest.mark.parametrize("cron_schedule", ["0 0 * * *", "0 0 * * 1-5"])
+def test_negative_end_offset_before_enough_partitions(cron_schedule: str):
+    partitions_def = TimeWindowPartitionsDefinition(
+        start="2021-05-05", fmt=DATE_FORMAT, cron_schedule=cron_schedule, end_offset=-2
+    )
+
+    # only one window has ended, so there are no partitions rather than a negative number of them
+    current_time = datetime.strptime("2021-05-06-12:00", "%Y-%m-%d-%H:%M")
+    assert partitions_def.get_num_partitions(current_time=current_time) == 0
+    assert partitions_def.get_partition_keys(current_time=current_time) == []
+
+
+def test_partition_keys_between_indexes_past_last_partition():
+    partitions_def = DailyPartitionsDefinition(start_date="2021-05-05", end_offset=-1)
+
+    # the windows for 05-05 through 05-09 have ended, so 05-08 is the last partition
+    current_time = datetime.strptime("2021-05-10-12:00", "%Y-%m-%d-%H:%M")
+    assert partitions_def.get_num_partitions(current_time=current_time) == 4
+    assert partitions_def.get_partition_keys_between_indexes(3, 5, current_time=current_time) == [
+        "2021-05-08"
+    ]
+    assert (
+        partitions_def.get_partition_keys_between_indexes(3, 5, current_time=current_time)
+        == partitions_def.get_partition_keys(current_time=current_time)[3:5]
+    )
+
+
+def test_fixed_interval_time_windows_cached_per_definition():
+    partitions_def = DailyPartitionsDefinition(start_date="2021-05-05")
+    time_windows = partitions_def._get_fixed_interval_time_windows()  # noqa: SLF001
+    assert time_windows is not None
+    assert partitions_def._get_fixed_interval_time_windows() is time_windows  # noqa: SLF001
+
+    # the cache is held by the definition itself, so an equal definition has its own cache and no
+    # module-level cache keeps definitions alive
+    other_partitions_def = DailyPartitionsDefinition(start_date="2021-05-05")
+    other_time_windows = other_partitions_def._get_fixed_interval_time_windows()  # noqa: SLF001
+    assert other_time_windows is not time_windows
+    assert any(attr_name.endswith(CACHED_METHOD_FIELD_SUFFIX) for attr_name in vars(partitions_def))
+
+
 def test_get_first_partition_window():
     assert DailyPartitionsDefinition(
         start_date="2023-01-01"
@@ -809,3 +852,64 @@ def test_has_partition_key():
     )
     assert partitions_def.has_partition_key("2020-01-01")
     assert partitions_def.has_partition_key("2020-03-15")
+
+
+@pytest.mark.parametrize(
+    "cron_schedule,fmt",
+    [
+        ("0 * * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("30 * * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("0 0 * * *", DATE_FORMAT),
+        ("30 2 * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("30 2 * * 0", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("15 2 10 * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        # not a fixed interval
+        ("0 0 * * 1-5", DATE_FORMAT),
+    ],
+)
+@pytest.mark.parametrize("timezone", ["UTC", "US/Central", "Australia/Sydney"])
+def test_partition_keys_match_cron_iteration(cron_schedule: str, fmt: str, timezone: str):
+    partitions_def = TimeWindowPartitionsDefinition(
+        start="2020-01-01", fmt=DATE_FORMAT, cron_schedule=cron_schedule, timezone=timezone
+    )._replace(fmt=fmt)
+    current_time = datetime(2021, 1, 15, 12, 30)
+
+    # spans the DST transitions of 2020
+    expected_windows = []
+    for window in partitions_def._iterate_time_windows(partitions_def.start):  # noqa: SLF001
+        if window.end > pendulum.instance(current_time, tz=timezone):
+            break
+        expected_windows.append(window)
+    expected_keys = [window.start.strftime(fmt) for window in expected_windows]
+
+    assert partitions_def.get_partition_keys(current_time=current_time) == expected_keys
+    assert partitions_def.get_num_partitions(current_time=current_time) == len(expected_keys)
+    assert partitions_def.get_partition_keys_between_indexes(10, 20, current_time=current_time) == (
+        expected_keys[10:20]
+    )
+    assert partitions_def.get_last_partition_window(current_time=current_time) == (
+        expected_windows[-1]
+    )
+
+    # keys without a UTC offset are ambiguous when clocks are set back
+    partition_key_counts = Counter(expected_keys)
+    unambiguous_windows_and_keys = [
+        (window, partition_key)
+        for window, partition_key in zip(expected_windows, expected_keys)
+        if partition_key_counts[partition_key] == 1
+    ]
+    assert partitions_def.time_windows_for_partition_keys(
+        [partition_key for _, partition_key in unambiguous_windows_and_keys[::7]]
+    ) == [window for window, _ in unambiguous_windows_and_keys[::7]]
+
+    for window, partition_key in unambiguous_windows_and_keys[::5]:
+        assert partitions_def.time_window_for_partition_key(partition_key) == window
+        assert partitions_def.start_time_for_partition_key(partition_key) == window.start
+        assert (
+            partitions_def.get_partition_key_for_timestamp(window.start.timestamp())
+            == partition_key
+        )
+        assert (
+            partitions_def.get_partition_key_for_timestamp(window.end.timestamp(), end_closed=True)
+            == partition_key
+        )
@@ -1,6 +1,7 @@
 import multiprocessing
 import os
 import time
+from contextlib import contextmanager
 
 import pytest
 from dagster._core.executor.child_process_executor import (
@@ -8,8 +9,11 @@
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventCollector,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -50,6 +54,25 @@ def execute(self):
         yield 1
 
 
+class DoubleAStringWorkerCommand(ChildProcessWorkerCommand):
+    @contextmanager
+    def worker_context(self):
+        yield
+
+    def execute_task(self, task):
+        if task == "crash":
+            os._exit(1)  # noqa: SLF001
+        yield task + task
+
+
+def _execute_in_pool(pool, task):
+    worker = pool.acquire()
+    try:
+        return [event for event in worker.execute_task(task) if event]
+    finally:
+        pool.release(worker)
+
+
 def test_basic_child_process_command():
     events = list(
         filter(
@@ -105,3 +128,82 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+def test_child_process_event_collector():
+    event_collector = ChildProcessEventCollector()
+    active_iters = {
+        key: execute_child_process_command(
+            multiprocessing,
+            LongRunningCommand(),
+            event_collector=event_collector,
+            collector_key=key,
+        )
+        for key in ["first", "second"]
+    }
+
+    results = {key: [] for key in active_iters}
+    while active_iters:
+        received_event = False
+        for key, child_iter in list(active_iters.items()):
+            try:
+                event = next(child_iter)
+            except StopIteration:
+                del active_iters[key]
+                continue
+
+            if event is not None:
+                received_event = True
+                if not isinstance(event, ChildProcessEvent):
+                    results[key].append(event)
+
+        if active_iters and not received_event:
+            event_collector.wait(timeout=1)
+
+    assert results == {"first": [1], "second": [1]}
+    # one start, one value and one done event per child
+    assert {key: stats.num_events for key, stats in event_collector.latency_stats.items()} == {
+        "first": 3,
+        "second": 3,
+    }
+    # all children have exited, so there is nothing to wait on
+    assert not event_collector.wait(timeout=1)
+
+
+def test_worker_pool_reuses_workers():
+    with ChildProcessWorkerPool(multiprocessing, DoubleAStringWorkerCommand()) as pool:
+        first_events = _execute_in_pool(pool, "aa")
+        second_events = _execute_in_pool(pool, "bb")
+
+    assert [event for event in first_events if not isinstance(event, ChildProcessEvent)] == ["aaaa"]
+    assert [event for event in second_events if not isinstance(event, ChildProcessEvent)] == [
+        "bbbb"
+    ]
+    assert isinstance(first_events[0], ChildProcessStartEvent)
+    assert isinstance(first_events[-1], ChildProcessDoneEvent)
+    assert first_events[0].pid == second_events[0].pid
+    assert first_events[0].pid != os.getpid()
+
+
+def test_worker_pool_max_tasks_per_worker():
+    with ChildProcessWorkerPool(
+        multiprocessing, DoubleAStringWorkerCommand(), max_tasks_per_worker=1
+    ) as pool:
+        first_events = _execute_in_pool(pool, "aa")
+        second_events = _execute_in_pool(pool, "bb")
+
+    assert first_events[0].pid != second_events[0].pid
+
+
+def test_worker_pool_crashy_worker():
+    with ChildProcessWorkerPool(multiprocessing, DoubleAStringWorkerCommand()) as pool:
+        with pytest.raises(ChildProcessCrashException) as exc:
+            _execute_in_pool(pool, "crash")
+        assert exc.value.exit_code == 1
+
+        # the crashed worker is replaced
+        assert [
+            event
+            for event in _execute_in_pool(pool, "aa")
+            if not isinstance(event, ChildProcessEvent)
+        ] == ["aaaa"]
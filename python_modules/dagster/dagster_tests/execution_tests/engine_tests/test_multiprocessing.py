@@ -61,6 +61,21 @@ def test_diamond_multi_execution():
             assert result.success
             assert result.output_for_node("adder") == 11
 
+            exit_event = [
+                event
+                for event in result.all_events
+                if event.event_type == DagsterEventType.ENGINE_EVENT
+                and "parent process exiting" in event.message
+            ][0]
+            metadata = exit_event.engine_event_data.metadata
+            assert metadata["max_event_latency_ms"].value >= metadata["mean_event_latency_ms"].value
+            assert set(metadata["max_event_latency_ms_by_step"].value.keys()) == {
+                "return_two",
+                "add_three",
+                "mult_three",
+                "adder",
+            }
+
 
 def test_explicit_spawn():
     with instance_for_test() as instance:
@@ -110,6 +125,68 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+def _step_worker_pids(result: execution_result.ExecutionResult):
+    return [
+        event.pid
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    ]
+
+
+@pytest.mark.parametrize("start_method", ["spawn", "forkserver"])
+def test_reuse_processes(start_method):
+    if start_method == "forkserver" and os.name == "nt":
+        pytest.skip("No forkserver on windows")
+
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "start_method": {start_method: {}},
+                            "reuse_processes": {},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+            pids = _step_worker_pids(result)
+            assert len(pids) == 4
+            assert len(set(pids)) == 1
+            assert os.getpid() not in pids
+
+
+def test_reuse_processes_max_steps_per_process():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "reuse_processes": {"max_steps_per_process": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+            pids = _step_worker_pids(result)
+            assert len(pids) == 4
+            assert len(set(pids)) == 2
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
@@ -443,6 +520,21 @@ def test_crash_multiprocessing():
             # )
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_reuse_processes():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            run_config={"execution": {"config": {"multiprocess": {"reuse_processes": {}}}}},
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
 # segfault test
 @op
 def segfault_op(context):
@@ -24,6 +24,7 @@
 from dagster._core.test_utils import instance_for_test
 from dagster._utils import safe_tempfile_path, send_interrupt
 from dagster._utils.interrupts import capture_interrupts, check_captured_interrupt
+from dagster._utils.merger import merge_dicts
 
 
 def _send_kbd_int(temp_files):
@@ -95,7 +96,8 @@ def write_a_file_job():
 
 
 @pytest.mark.skipif(_seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
-def test_interrupt_multiproc():
+@pytest.mark.parametrize("reuse_processes", [False, True])
+def test_interrupt_multiproc(reuse_processes):
     with tempfile.TemporaryDirectory() as tempdir:
         with instance_for_test(temp_dir=tempdir) as instance:
             file_1 = os.path.join(tempdir, "file_1")
@@ -118,7 +120,14 @@ def test_interrupt_multiproc():
                         "write_3": {"config": {"tempfile": file_3}},
                         "write_4": {"config": {"tempfile": file_4}},
                     },
-                    "execution": {"config": {"multiprocess": {"max_concurrent": 4}}},
+                    "execution": {
+                        "config": {
+                            "multiprocess": merge_dicts(
+                                {"max_concurrent": 4},
+                                {"reuse_processes": {}} if reuse_processes else {},
+                            )
+                        }
+                    },
                 },
                 instance=instance,
             ) as result:
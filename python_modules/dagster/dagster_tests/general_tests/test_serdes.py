@@ -4,8 +4,15 @@
 from enum import Enum
 from typing import Any, Dict, Mapping, NamedTuple, Optional, Sequence
 
+import mock
 import pytest
+from dagster import DagsterEvent, DagsterEventType, Definitions, In, Nothing, asset, job, op
 from dagster._check import ParameterCheckError, inst_param, set_param
+from dagster._core.definitions.metadata import MetadataValue
+from dagster._core.events import EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.host_representation.external_data import external_repository_data_from_def
+from dagster._core.snap import JobSnapshot
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
     EnumSerializer,
@@ -490,6 +497,31 @@ class Foo(NamedTuple):
     assert deserialized == val
 
 
+def test_named_tuple_swapped_storage_field_names() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env, storage_field_names={"color": "shape", "shape": "color"})
+    class Foo(NamedTuple):
+        color: str
+        shape: str
+
+    val = Foo("red", "square")
+    serialized = serialize_value(val, whitelist_map=test_env)
+    assert serialized == '{"__class__": "Foo", "color": "square", "shape": "red"}'
+    deserialized = deserialize_value(serialized, whitelist_map=test_env)
+    assert deserialized == val
+
+    # a class registered under the same name as a previously serialized value packs its own fields
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        color: str
+
+    assert (
+        serialize_value(val, whitelist_map=test_env)
+        == '{"__class__": "Foo", "color": "red", "shape": "square"}'
+    )
+
+
 def test_named_tuple_old_fields() -> None:
     test_env = WhitelistMap.create()
 
@@ -712,3 +744,82 @@ class Foo(Enum):
     assert serialized == '{"__enum__": "Foo.BLUE"}'
     deserialized = deserialize_value(serialized, whitelist_map=test_env)
     assert deserialized == Foo.RED
+
+
+def _job_snapshot():
+    ops = []
+    for i in range(10):
+
+        @op(
+            name=f"op_{i}",
+            ins={"start": In(Nothing)},
+            config_schema={"a_string": str, "an_int": int},
+            tags={"index": str(i)},
+        )
+        def _op():
+            ...
+
+        ops.append(_op)
+
+    @job
+    def a_job():
+        outputs = [ops[0]()]
+        for i, an_op in enumerate(ops[1:], start=1):
+            outputs.append(an_op(outputs[(i - 1) // 2]))
+
+    return JobSnapshot.from_job_def(a_job)
+
+
+def _event_log_entries():
+    return [
+        EventLogEntry(
+            error_info=None,
+            user_message=f"message {i}",
+            level="debug",
+            run_id="run_id",
+            timestamp=1.0,
+            step_key="my_step",
+            job_name="my_job",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                "my_job",
+                event_specific_data=EngineEventData(
+                    metadata={"index": MetadataValue.int(i), "label": MetadataValue.text("label")}
+                ),
+            ),
+        )
+        for i in range(10)
+    ]
+
+
+def _external_repository_data():
+    assets = []
+    for i in range(10):
+
+        @asset(name=f"asset_{i}", non_argument_deps={f"asset_{i - 1}"} if i else None)
+        def _asset():
+            ...
+
+        assets.append(_asset)
+
+    return external_repository_data_from_def(Definitions(assets=assets).get_repository_def())
+
+
+@pytest.mark.parametrize(
+    "build_value", [_job_snapshot, _event_log_entries, _external_repository_data]
+)
+def test_pack_plans_compiled_at_whitelist_time(build_value):
+    value = build_value()
+
+    # values of the whitelisted classes themselves are packed with the plans compiled when the
+    # class was whitelisted, rather than compiling a plan per value
+    with mock.patch.object(
+        NamedTupleSerializer,
+        "_compile_pack_plan",
+        autospec=True,
+        side_effect=NamedTupleSerializer._compile_pack_plan,  # noqa: SLF001
+    ) as compile_pack_plan_mock:
+        serialized = serialize_value(value)
+        assert compile_pack_plan_mock.call_count == 0
+
+    assert serialize_value(deserialize_value(serialized)) == serialized
@@ -1,12 +1,18 @@
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 from dagster import AssetKey, InputContext, OutputContext, asset, build_output_context
 from dagster._check import CheckError
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionKey,
+    MultiPartitionsDefinition,
+)
 from dagster._core.definitions.partition import StaticPartitionsDefinition
 from dagster._core.definitions.time_window_partitions import DailyPartitionsDefinition, TimeWindow
 from dagster._core.errors import DagsterInvalidDefinitionError
 from dagster._core.storage.db_io_manager import (
+    STAGING_TABLE_SUFFIX,
     DbClient,
     DbIOManager,
     DbTypeHandler,
@@ -59,7 +65,9 @@ def supported_types(self):
         return [str]
 
 
-def build_db_io_manager(type_handlers, db_client, resource_config_override=None):
+def build_db_io_manager(
+    type_handlers, db_client, resource_config_override=None, use_staging_table=False
+):
     conf = resource_config_override if resource_config_override else resource_config
 
     return DbIOManager(
@@ -67,6 +75,7 @@ def build_db_io_manager(type_handlers, db_client, resource_config_override=None)
         db_client=db_client,
         database=conf["database"],
         schema=conf.get("schema"),
+        use_staging_table=use_staging_table,
     )
 
 
@@ -255,7 +264,7 @@ def test_asset_out_multiple_static_partitions():
     output_context = MagicMock(
         asset_key=asset_key,
         resource_config=resource_config,
-        asset_partition_keys=["red", "yellow"],
+        asset_partition_keys=["blue", "yellow"],
         metadata={"partition_expr": "abc"},
         asset_partitions_def=partitions_def,
     )
@@ -265,7 +274,7 @@ def test_asset_out_multiple_static_partitions():
         upstream_output=output_context,
         resource_config=resource_config,
         dagster_type=resolve_dagster_type(int),
-        asset_partition_keys=["red", "yellow"],
+        asset_partition_keys=["blue", "yellow"],
         metadata=None,
         asset_partitions_def=partitions_def,
     )
@@ -278,7 +287,7 @@ def test_asset_out_multiple_static_partitions():
         table="table1",
         partition_dimensions=[
             TablePartitionDimension(
-                partitions=["red", "yellow"],
+                partitions=["blue", "yellow"],
                 partition_expr="abc",
             )
         ],
@@ -292,6 +301,231 @@ def test_asset_out_multiple_static_partitions():
     assert handler.handle_input_calls[0][1] == table_slice
 
 
+def test_asset_out_non_lexicographic_static_partitions():
+    handler = IntHandler()
+    connect_mock = MagicMock()
+    db_client = MagicMock(
+        spec=DbClient, get_select_statement=MagicMock(return_value=""), connect=connect_mock
+    )
+    manager = build_db_io_manager(type_handlers=[handler], db_client=db_client)
+    asset_key = AssetKey(["schema1", "table1"])
+    partitions_def = StaticPartitionsDefinition(["1", "2", "10"])
+    output_context = MagicMock(
+        asset_key=asset_key,
+        resource_config=resource_config,
+        asset_partition_keys=["2", "10"],
+        metadata={"partition_expr": "abc"},
+        asset_partitions_def=partitions_def,
+    )
+    manager.handle_output(output_context, 5)
+    input_context = MagicMock(
+        asset_key=asset_key,
+        upstream_output=output_context,
+        resource_config=resource_config,
+        dagster_type=resolve_dagster_type(int),
+        asset_partition_keys=["2", "10"],
+        metadata=None,
+        asset_partitions_def=partitions_def,
+    )
+    assert manager.load_input(input_context) == 7
+
+    assert len(handler.handle_output_calls) == 1
+    # the keys are selected by value, since the partition column may not order them like strings
+    table_slice = TableSlice(
+        database="database_abc",
+        schema="schema1",
+        table="table1",
+        partition_dimensions=[
+            TablePartitionDimension(
+                partitions=["2", "10"],
+                partition_expr="abc",
+            )
+        ],
+    )
+    assert handler.handle_output_calls[0][1:] == (table_slice, 5)
+    db_client.delete_table_slice.assert_called_once_with(
+        output_context, table_slice, connect_mock().__enter__()
+    )
+
+    assert len(handler.handle_input_calls) == 1
+    assert handler.handle_input_calls[0][1] == table_slice
+
+
+def test_load_input_chunks():
+    class ChunkedIntHandler(IntHandler):
+        def load_input_chunks(
+            self, context: InputContext, table_slice: TableSlice, connection, chunk_size: int
+        ):
+            yield from range(chunk_size)
+
+    handler = ChunkedIntHandler()
+    connect_mock = MagicMock()
+    db_client = MagicMock(
+        spec=DbClient, get_select_statement=MagicMock(return_value=""), connect=connect_mock
+    )
+    manager = build_db_io_manager(type_handlers=[handler], db_client=db_client)
+    asset_key = AssetKey(["schema1", "table1"])
+    output_context = build_output_context(asset_key=asset_key, resource_config=resource_config)
+    input_context = MagicMock(
+        upstream_output=output_context,
+        resource_config=resource_config,
+        dagster_type=resolve_dagster_type(Any),
+        asset_key=asset_key,
+        has_asset_partitions=False,
+        metadata={"fetch_chunk_size": 3},
+    )
+    chunks = manager.load_input(input_context)
+    # the connection is only opened once the chunks are consumed
+    assert not connect_mock.called
+    assert list(chunks) == [0, 1, 2]
+    assert connect_mock.call_count == 1
+
+    # handlers that can't fetch incrementally load a single chunk
+    assert list(IntHandler().load_input_chunks(input_context, MagicMock(), MagicMock(), 3)) == [7]
+
+    input_context.dagster_type = resolve_dagster_type(int)
+    with pytest.raises(CheckError, match="fetch_chunk_size"):
+        manager.load_input(input_context)
+
+
+def test_asset_out_multi_partition_range():
+    handler = IntHandler()
+    connect_mock = MagicMock()
+    db_client = MagicMock(
+        spec=DbClient, get_select_statement=MagicMock(return_value=""), connect=connect_mock
+    )
+    manager = build_db_io_manager(type_handlers=[handler], db_client=db_client)
+    asset_key = AssetKey(["schema1", "table1"])
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "time": DailyPartitionsDefinition(start_date="2020-01-01"),
+            "color": StaticPartitionsDefinition(["blue", "red", "yellow"]),
+        }
+    )
+    partition_keys = [
+        MultiPartitionKey({"time": time_key, "color": color})
+        for time_key in ["2020-01-02", "2020-01-03"]
+        for color in ["red", "yellow"]
+    ]
+    output_context = MagicMock(
+        asset_key=asset_key,
+        resource_config=resource_config,
+        asset_partition_keys=partition_keys,
+        metadata={"partition_expr": {"time": "ts", "color": "color"}},
+        asset_partitions_def=partitions_def,
+    )
+    manager.handle_output(output_context, 5)
+
+    table_slice = TableSlice(
+        database="database_abc",
+        schema="schema1",
+        table="table1",
+        partition_dimensions=[
+            TablePartitionDimension(
+                partitions=["red", "yellow"],
+                partition_expr="color",
+            ),
+            TablePartitionDimension(
+                partitions=TimeWindow(datetime(2020, 1, 2), datetime(2020, 1, 4)),
+                partition_expr="ts",
+            ),
+        ],
+    )
+    # the whole range is deleted and written at once
+    assert handler.handle_output_calls[0][1:] == (table_slice, 5)
+    db_client.delete_table_slice.assert_called_once_with(
+        output_context, table_slice, connect_mock().__enter__()
+    )
+
+    # partitions that aren't a cross product of the dimension keys can't be written at once
+    output_context.asset_partition_keys = partition_keys[:3]
+    with pytest.raises(ValueError, match="can't be selected with a single query"):
+        manager.handle_output(output_context, 5)
+
+
+def test_handle_output_through_staging_table():
+    handler = IntHandler()
+    connect_mock = MagicMock()
+    db_client = MagicMock(
+        spec=DbClient, get_select_statement=MagicMock(return_value=""), connect=connect_mock
+    )
+    manager = build_db_io_manager(
+        type_handlers=[handler], db_client=db_client, use_staging_table=True
+    )
+    asset_key = AssetKey(["schema1", "table1"])
+    output_context = build_output_context(asset_key=asset_key, resource_config=resource_config)
+    manager.handle_output(output_context, 5)
+
+    table_slice = TableSlice(
+        database="database_abc", schema="schema1", table="table1", partition_dimensions=[]
+    )
+    conn = connect_mock().__enter__()
+    db_client.delete_table_slice.assert_not_called()
+
+    assert len(handler.handle_output_calls) == 1
+    _, staging_table_slice, obj = handler.handle_output_calls[0]
+    assert obj == 5
+    assert staging_table_slice.table.startswith(f"table1{STAGING_TABLE_SUFFIX}_")
+    assert staging_table_slice._replace(table="table1") == table_slice
+
+    db_client.create_staging_table.assert_called_once_with(
+        output_context, table_slice, staging_table_slice, conn
+    )
+    db_client.replace_table_slice.assert_called_once_with(
+        output_context, table_slice, staging_table_slice, conn
+    )
+    db_client.drop_table.assert_called_once_with(output_context, staging_table_slice, conn)
+
+
+def test_staging_table_falls_back_without_client_support():
+    class NoStagingDbClient(DbClient):
+        delete_table_slice = MagicMock()
+        get_select_statement = MagicMock(return_value="")
+        ensure_schema_exists = MagicMock()
+        connect = MagicMock()
+
+    handler = IntHandler()
+    db_client = NoStagingDbClient()
+    with pytest.warns(UserWarning, match="does not implement replace_table_slice"):
+        manager = build_db_io_manager(
+            type_handlers=[handler], db_client=db_client, use_staging_table=True
+        )
+
+    output_context = build_output_context(
+        asset_key=AssetKey(["schema1", "table1"]), resource_config=resource_config
+    )
+    manager.handle_output(output_context, 5)
+
+    table_slice = TableSlice(
+        database="database_abc", schema="schema1", table="table1", partition_dimensions=[]
+    )
+    assert handler.handle_output_calls[0][1:] == (table_slice, 5)
+    db_client.delete_table_slice.assert_called_once()
+
+
+def test_staging_table_dropped_on_failure():
+    class FailingIntHandler(IntHandler):
+        def handle_output(self, context, table_slice, obj, connection):
+            super().handle_output(context, table_slice, obj, connection)
+            raise Exception("write failed")
+
+    handler = FailingIntHandler()
+    db_client = MagicMock(spec=DbClient, get_select_statement=MagicMock(return_value=""))
+    manager = build_db_io_manager(
+        type_handlers=[handler], db_client=db_client, use_staging_table=True
+    )
+    output_context = build_output_context(
+        asset_key=AssetKey(["schema1", "table1"]), resource_config=resource_config
+    )
+    with pytest.raises(Exception, match="write failed"):
+        manager.handle_output(output_context, 5)
+
+    staging_table_slice = handler.handle_output_calls[0][1]
+    db_client.replace_table_slice.assert_not_called()
+    db_client.drop_table.assert_called_once()
+    assert db_client.drop_table.call_args[0][1] == staging_table_slice
+
+
 def test_different_output_and_input_types():
     int_handler = IntHandler()
     str_handler = StringHandler()
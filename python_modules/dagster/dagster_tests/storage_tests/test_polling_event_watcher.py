@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Mapping, Union
@@ -8,6 +9,7 @@
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.polling_event_watcher import MAX_POLLING_INTERVAL
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
 
@@ -31,6 +33,10 @@ def from_config_value(
     ) -> Self:
         return SqlitePollingEventLogStorage(inst_data=inst_data, **config_value)
 
+    def store_event(self, event: EventLogEntry) -> None:
+        super(SqlitePollingEventLogStorage, self).store_event(event)
+        self._watcher.notify()
+
     def watch(
         self, run_id: str, cursor: Union[str, int], callback: Callable[[EventLogEntry], None]
     ):
@@ -74,7 +80,11 @@ def create_event(count: int, run_id: str = RUN_ID):
 @contextmanager
 def create_sqlite_run_event_logstorage():
     with tempfile.TemporaryDirectory() as tmpdir_path:
-        yield SqlitePollingEventLogStorage(tmpdir_path)
+        storage = SqlitePollingEventLogStorage(tmpdir_path)
+        try:
+            yield storage
+        finally:
+            storage.dispose()
 
 
 def test_using_logstorage():
@@ -133,3 +143,74 @@ def watch_two(event, _cursor):
 
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0):
+    start = time.time()
+    while not condition() and time.time() - start < timeout:
+        time.sleep(0.05)
+
+
+def test_watch_multiple_runs_single_thread():
+    run_ids = ["run_a", "run_b", "run_c"]
+    with create_sqlite_run_event_logstorage() as storage:
+        watched = {run_id: [] for run_id in run_ids}
+
+        for run_id in run_ids:
+            storage.watch(
+                run_id,
+                None,
+                lambda event, _cursor, run_id=run_id: watched[run_id].append(event),
+            )
+
+        assert (
+            len([thread for thread in threading.enumerate() if thread.name == "sql-event-watch"])
+            == 1
+        )
+
+        for i, run_id in enumerate(run_ids):
+            for count in range(i + 1):
+                storage.store_event(create_event(count, run_id=run_id))
+
+        _wait_for(lambda: all(len(watched[run_id]) == i + 1 for i, run_id in enumerate(run_ids)))
+
+        for i, run_id in enumerate(run_ids):
+            assert [event.run_id for event in watched[run_id]] == [run_id] * (i + 1)
+            assert [int(event.message) for event in watched[run_id]] == list(range(i + 1))
+
+        storage.dispose()
+        assert not any(thread.name == "sql-event-watch" for thread in threading.enumerate())
+
+
+def test_notify_wakes_idle_watcher():
+    with create_sqlite_run_event_logstorage() as storage:
+        watched = []
+        storage.watch(RUN_ID, None, lambda event, _cursor: watched.append(event))
+
+        # let the polling interval back off to its maximum
+        time.sleep(MAX_POLLING_INTERVAL * 2)
+
+        start = time.time()
+        storage.store_event(create_event(1))
+        _wait_for(lambda: len(watched) == 1)
+        assert len(watched) == 1
+        assert time.time() - start < MAX_POLLING_INTERVAL / 2
+
+        storage.end_watch(RUN_ID, watched.append)
+
+
+def test_callback_error_does_not_stop_watcher():
+    with create_sqlite_run_event_logstorage() as storage:
+        watched = []
+
+        def failing_callback(_event, _cursor):
+            raise Exception("callback failure")
+
+        storage.watch(RUN_ID, None, failing_callback)
+        storage.watch(RUN_ID, None, lambda event, _cursor: watched.append(event))
+
+        storage.store_event(create_event(1))
+        storage.store_event(create_event(2))
+        _wait_for(lambda: len(watched) == 2)
+
+        assert [int(event.message) for event in watched] == [1, 2]
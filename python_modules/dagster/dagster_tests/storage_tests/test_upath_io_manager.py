@@ -1,5 +1,6 @@
 import json
 import pickle
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
@@ -27,9 +28,9 @@
 )
 from dagster._check import CheckError
 from dagster._core.definitions import build_assets_job
-from dagster._core.events import HandledOutputData
+from dagster._core.events import HandledOutputData, LoadedInputData
 from dagster._core.storage.io_manager import IOManagerDefinition
-from dagster._core.storage.upath_io_manager import UPathIOManager
+from dagster._core.storage.upath_io_manager import LazyPartitionMapping, UPathIOManager
 from upath import UPath
 
 
@@ -415,3 +416,164 @@ def my_asset() -> Any:
     ].event_specific_data
     assert isinstance(handled_output_data, HandledOutputData)
     assert handled_output_data.metadata["length"] == MetadataValue.int(get_length(json_data))
+
+
+class ThreadRecordingIOManager(DummyIOManager):
+    partition_load_concurrency = 4
+
+    def __init__(self, base_path: UPath):
+        super().__init__(base_path=base_path)
+        self.loaded_paths: List[str] = []
+        self.load_thread_names = set()
+
+    def load_from_path(self, context: InputContext, path: UPath) -> str:
+        self.loaded_paths.append(str(path))
+        self.load_thread_names.add(threading.current_thread().name)
+        return super().load_from_path(context, path)
+
+
+def test_upath_io_manager_concurrent_partition_loading(
+    tmp_path: Path,
+    daily: DailyPartitionsDefinition,
+    hourly: HourlyPartitionsDefinition,
+    start: datetime,
+):
+    manager = ThreadRecordingIOManager(base_path=UPath(tmp_path))
+
+    @asset(partitions_def=hourly)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(partitions_def=daily)
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    result = materialize(
+        [*upstream_asset.to_source_assets(), downstream_asset],
+        partition_key=start.strftime(daily.fmt),
+        resources={"io_manager": manager},
+    )
+    downstream_asset_data = result.output_for_node("downstream_asset", "result")
+    assert list(downstream_asset_data.keys()) == hourly.get_partition_keys()[:24]
+    assert all(
+        path == str(tmp_path / "upstream_asset" / key)
+        for key, path in downstream_asset_data.items()
+    )
+    assert len(manager.load_thread_names) > 1
+    assert all(name.startswith("upath_io_manager") for name in manager.load_thread_names)
+
+    loaded_input_data = next(
+        event.event_specific_data
+        for event in result.all_node_events
+        if event.is_loaded_input and event.step_key == "downstream_asset"
+    )
+    assert isinstance(loaded_input_data, LoadedInputData)
+    assert loaded_input_data.metadata["num_partitions_loaded"] == MetadataValue.int(24)
+    assert set(loaded_input_data.metadata["partition_load_seconds"].value.keys()) == set(
+        downstream_asset_data.keys()
+    )
+
+
+def test_upath_io_manager_concurrent_partition_loading_missing_partition(
+    tmp_path: Path,
+):
+    class MissingPartitionIOManager(DummyIOManager):
+        partition_load_concurrency = 4
+
+        def load_from_path(self, context: InputContext, path: UPath) -> str:
+            if path.name == "C":
+                raise FileNotFoundError(str(path))
+            return super().load_from_path(context, path)
+
+    upstream_partitions_def = StaticPartitionsDefinition(["A", "B", "C", "D"])
+
+    @asset(partitions_def=upstream_partitions_def)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(ins={"upstream_asset": AssetIn(partition_mapping=AllPartitionMapping())})
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    @asset(
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(),
+                metadata={"allow_missing_partitions": True},
+            )
+        }
+    )
+    def downstream_asset_allow_missing(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    manager = MissingPartitionIOManager(base_path=UPath(tmp_path))
+
+    with pytest.raises(FileNotFoundError):
+        materialize(
+            [*upstream_asset.to_source_assets(), downstream_asset],
+            resources={"io_manager": manager},
+        )
+
+    result = materialize(
+        [*upstream_asset.to_source_assets(), downstream_asset_allow_missing],
+        resources={"io_manager": manager},
+    )
+    downstream_asset_data = result.output_for_node("downstream_asset_allow_missing", "result")
+    assert set(downstream_asset_data.keys()) == {"A", "B", "D"}
+
+
+def test_upath_io_manager_lazy_partition_loading(tmp_path: Path):
+    upstream_partitions_def = StaticPartitionsDefinition(["A", "B", "C"])
+    manager = ThreadRecordingIOManager(base_path=UPath(tmp_path))
+
+    @asset(partitions_def=upstream_partitions_def)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(),
+                metadata={"lazy_load_partitions": True},
+            )
+        }
+    )
+    def downstream_asset(upstream_asset: Any) -> str:
+        assert isinstance(upstream_asset, LazyPartitionMapping)
+        assert set(upstream_asset.keys()) == {"A", "B", "C"}
+        assert manager.loaded_paths == []
+        return upstream_asset["B"]
+
+    result = materialize(
+        [*upstream_asset.to_source_assets(), downstream_asset],
+        resources={"io_manager": manager},
+    )
+    assert result.output_for_node("downstream_asset") == str(tmp_path / "upstream_asset" / "B")
+    assert manager.loaded_paths == [str(tmp_path / "upstream_asset" / "B")]
+
+
+def test_upath_io_manager_lazy_partition_loading_requires_any_type(
+    dummy_io_manager: DummyIOManager,
+):
+    upstream_partitions_def = StaticPartitionsDefinition(["A", "B"])
+
+    @asset(partitions_def=upstream_partitions_def)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(),
+                metadata={"lazy_load_partitions": True},
+            )
+        }
+    )
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    with pytest.raises(CheckError, match="Lazily loading an input"):
+        materialize(
+            [*upstream_asset.to_source_assets(), downstream_asset],
+            resources={"io_manager": dummy_io_manager},
+        )
@@ -9,6 +9,7 @@
 import mock
 import pendulum
 import pytest
+import sqlalchemy as db
 from dagster import (
     AssetKey,
     AssetMaterialization,
@@ -35,6 +36,7 @@
 from dagster._core.definitions import ExpectationResult
 from dagster._core.definitions.definitions_class import Definitions
 from dagster._core.definitions.dependency import NodeHandle
+from dagster._core.definitions.events import AssetKeyPartitionKey
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionKey
 from dagster._core.definitions.pipeline_base import InMemoryJob
 from dagster._core.definitions.unresolved_asset_job_definition import define_asset_job
@@ -51,18 +53,29 @@
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
 from dagster._core.execution.results import PipelineExecutionResult
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import (
+    RunStepMarker,
+    StepEventStatus,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
 from dagster._core.host_representation.origin import (
     ExternalJobOrigin,
     ExternalRepositoryOrigin,
     InProcessCodeLocationOrigin,
 )
 from dagster._core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
-from dagster._core.storage.event_log.base import EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
 from dagster._core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_TABLES,
     migrate_asset_key_data,
 )
+from dagster._core.storage.event_log.schema import (
+    RunStatsTable,
+    RunStepStatsTable,
+    SqlEventLogStorageTable,
+)
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 from dagster._core.test_utils import create_run_for_test, instance_for_test
@@ -210,6 +223,34 @@ def _event_record(run_id, op_name, timestamp, event_type, event_specific_data=No
     )
 
 
+class _ConcurrentlyInsertedStatsConnection:
+    """Forwards to a connection, but reads each existing stats row as missing the first time, as if
+    another writer inserted it right after the read.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._read_tables = set()
+
+    def execute(self, statement, *args, **kwargs):
+        if isinstance(statement, db.sql.Update):
+            tables = {statement.table}
+        elif isinstance(statement, db.sql.Select):
+            tables = set(statement.get_final_froms())
+        else:
+            tables = set()
+
+        for table in (RunStatsTable, RunStepStatsTable):
+            if table in tables and table not in self._read_tables:
+                self._read_tables.add(table)
+                return mock.Mock(rowcount=0, **{"fetchone.return_value": None})
+
+        return self._conn.execute(statement, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
 def _default_resources():
     @resource
     def foo_resource():
@@ -628,6 +669,150 @@ def test_event_log_step_stats(self, test_run_id, storage):
         assert len(d_stats.expectation_results) == 2
         assert len(c_stats.attempts_list) == 1
 
+    def test_run_stats_tables(self, test_run_id, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        assert storage.has_secondary_index(RUN_STATS_TABLES)
+
+        now = time.time()
+        records = [
+            EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=test_run_id,
+                timestamp=now - 400,
+                dagster_event=DagsterEvent(DagsterEventType.PIPELINE_START.value, "nonce"),
+            ),
+            *_stats_records(run_id=test_run_id),
+            _event_record(
+                test_run_id,
+                "E",
+                now - 25,
+                DagsterEventType.ENGINE_EVENT,
+                EngineEventData(marker_start="step_process_start"),
+            ),
+            _event_record(test_run_id, "E", now - 20, DagsterEventType.STEP_START),
+            _event_record(test_run_id, "E", now - 15, DagsterEventType.STEP_UP_FOR_RETRY),
+            _event_record(test_run_id, "E", now - 10, DagsterEventType.STEP_RESTARTED),
+            _event_record(
+                test_run_id,
+                "E",
+                now - 5,
+                DagsterEventType.STEP_SUCCESS,
+                StepSuccessData(duration_ms=5000.0),
+            ),
+            # steps with only marker events aren't included in the step stats
+            _event_record(
+                test_run_id,
+                "F",
+                now - 3,
+                DagsterEventType.ENGINE_EVENT,
+                EngineEventData(marker_start="step_process_start"),
+            ),
+            _event_record(
+                test_run_id,
+                "F",
+                now - 2,
+                DagsterEventType.ENGINE_EVENT,
+                EngineEventData(marker_end="step_process_start"),
+            ),
+            EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=test_run_id,
+                timestamp=now,
+                dagster_event=DagsterEvent(DagsterEventType.PIPELINE_SUCCESS.value, "nonce"),
+            ),
+        ]
+
+        # the stats are maintained by both single and batched writes
+        for record in records[:5]:
+            storage.store_event(record)
+        storage.store_events(records[5:])
+
+        def _assert_stats_match_event_log():
+            expected_step_stats = build_run_step_stats_from_events(test_run_id, records)
+            assert storage.get_stats_for_run(test_run_id) == build_run_stats_from_events(
+                test_run_id, records
+            )
+            assert storage.get_step_stats_for_run(test_run_id) == expected_step_stats
+            assert storage.get_step_stats_for_run(test_run_id, ["D", "E"]) == [
+                stats for stats in expected_step_stats if stats.step_key in {"D", "E"}
+            ]
+
+        _assert_stats_match_event_log()
+        e_stats = storage.get_step_stats_for_run(test_run_id, ["E"])[0]
+        assert e_stats.attempts == 2
+        assert len(e_stats.attempts_list) == 2
+        assert e_stats.markers == [RunStepMarker(start_time=now - 25)]
+        assert storage.get_step_stats_for_run(test_run_id, ["F"]) == []
+
+        # rebuilding the stats from the event log gives the same results
+        storage.reindex_events(force=True)
+        _assert_stats_match_event_log()
+
+        storage.delete_events(test_run_id)
+        assert storage.get_stats_for_run(test_run_id).steps_succeeded == 0
+        assert storage.get_step_stats_for_run(test_run_id) == []
+
+    def test_run_stats_update_after_concurrent_insert(self, test_run_id, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        now = time.time()
+        records = [
+            EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=test_run_id,
+                timestamp=now - 10,
+                dagster_event=DagsterEvent(DagsterEventType.PIPELINE_START.value, "nonce"),
+            ),
+            _event_record(test_run_id, "A", now - 5, DagsterEventType.STEP_START),
+        ]
+        storage.store_events(records)
+
+        new_records = [
+            _event_record(
+                test_run_id,
+                "A",
+                now - 1,
+                DagsterEventType.STEP_SUCCESS,
+                StepSuccessData(duration_ms=4000.0),
+            ),
+            EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=test_run_id,
+                timestamp=now,
+                dagster_event=DagsterEvent(DagsterEventType.PIPELINE_SUCCESS.value, "nonce"),
+            ),
+        ]
+
+        # inserting the stats rows fails, since they already exist, so the stats are updated
+        # instead without aborting the open transaction
+        with storage.run_transaction(test_run_id) as conn:
+            storage.update_run_stats(
+                _ConcurrentlyInsertedStatsConnection(conn), test_run_id, new_records
+            )
+            conn.execute(
+                SqlEventLogStorageTable.insert(),
+                [storage.get_insert_event_values(event) for event in new_records],
+            )
+
+        all_records = [*records, *new_records]
+        assert storage.get_stats_for_run(test_run_id) == build_run_stats_from_events(
+            test_run_id, all_records
+        )
+        assert storage.get_step_stats_for_run(test_run_id) == build_run_step_stats_from_events(
+            test_run_id, all_records
+        )
+
     def test_secondary_index(self, storage):
         if not isinstance(storage, SqlEventLogStorage):
             pytest.skip("This test is for SQL-backed Event Log behavior")
@@ -699,6 +884,50 @@ def test_get_logs_for_run_cursor_limit(self, test_run_id, storage):
 
         assert _event_types(out_events) == _event_types(events)
 
+    def test_iter_records_for_run(self, test_run_id, storage):
+        events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
+
+        for event in events:
+            storage.store_event(event)
+
+        all_records = storage.get_records_for_run(result.run_id).records
+        assert len(all_records) > 3
+
+        # the same records are returned regardless of how many are fetched at once
+        for chunk_size in [1, 2, len(all_records), len(all_records) + 1]:
+            records = list(storage.iter_records_for_run(result.run_id, chunk_size=chunk_size))
+            assert records == all_records
+
+        # id cursors
+        cursor = EventLogCursor.from_storage_id(all_records[1].storage_id).to_string()
+        assert list(storage.iter_records_for_run(result.run_id, cursor, chunk_size=2)) == (
+            all_records[2:]
+        )
+
+        # offset cursors
+        cursor = EventLogCursor.from_offset(3).to_string()
+        assert list(storage.iter_records_for_run(result.run_id, cursor, chunk_size=2)) == (
+            all_records[3:]
+        )
+
+        # the event type filter is applied to every chunk
+        records = list(
+            storage.iter_records_for_run(
+                result.run_id,
+                of_type={DagsterEventType.STEP_SUCCESS, DagsterEventType.RUN_SUCCESS},
+                chunk_size=1,
+            )
+        )
+        assert _event_types([record.event_log_entry for record in records]) == [
+            DagsterEventType.STEP_SUCCESS,
+            DagsterEventType.RUN_SUCCESS,
+        ]
+
+        # records are fetched lazily
+        iterator = storage.iter_records_for_run(result.run_id, chunk_size=2)
+        assert next(iterator) == all_records[0]
+        iterator.close()
+
     def test_wipe_sql_backed_event_log(self, test_run_id, storage):
         events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
 
@@ -817,6 +1046,46 @@ def test_basic_get_logs_for_run_multiple_runs_cursors(self, instance, storage):
 
             assert set(map(lambda e: e.run_id, out_events_two)) == {result_two.run_id}
 
+    def test_get_records_for_runs(self, instance, storage):
+        events_one, result_one = _synthesize_events(return_one_op_func)
+        events_two, result_two = _synthesize_events(return_one_op_func)
+        run_id_one, run_id_two = result_one.run_id, result_two.run_id
+
+        with create_and_delete_test_runs(instance, [run_id_one, run_id_two]):
+            for event in events_one:
+                storage.store_event(event)
+            for event in events_two:
+                storage.store_event(event)
+
+            records = storage.get_records_for_runs({run_id_one: None, run_id_two: None})
+            assert len(records) == len(events_one) + len(events_two)
+            assert [
+                record.event_log_entry.message
+                for record in records
+                if record.event_log_entry.run_id == run_id_one
+            ] == [event.message for event in events_one]
+            assert [
+                record.event_log_entry.message
+                for record in records
+                if record.event_log_entry.run_id == run_id_two
+            ] == [event.message for event in events_two]
+
+            records_one = storage.get_records_for_run(run_id_one).records
+            records_two = storage.get_records_for_run(run_id_two).records
+            cursor_by_run_id = {
+                run_id_one: records_one[1].storage_id,
+                run_id_two: records_two[-1].storage_id,
+            }
+            records = storage.get_records_for_runs(cursor_by_run_id)
+            assert [record.storage_id for record in records] == [
+                record.storage_id for record in records_one[2:]
+            ]
+
+            records = storage.get_records_for_runs(cursor_by_run_id, limit=2)
+            assert [record.storage_id for record in records] == [
+                record.storage_id for record in records_one[2:4]
+            ]
+
     def test_event_watcher_single_run_event(self, storage, test_run_id):
         if not self.can_watch():
             pytest.skip("storage cannot watch runs")
@@ -2002,6 +2271,174 @@ def _fetch_counts(storage, after_cursor=None):
                     )
                     assert _fetch_counts(storage, after_cursor=9999999999) == {c: {}, d: {}}
 
+    def test_get_event_record_asset_keys(self, storage, instance):
+        a = AssetKey("asset_a")
+        b = AssetKey("asset_b")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a)
+            yield AssetMaterialization(b, partition="x")
+            yield AssetObservation(a)
+            yield AssetMaterialization(a)
+            yield Output(None)
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            run_id = make_new_run_id()
+            with create_and_delete_test_runs(instance, [run_id]):
+                events, _ = _synthesize_events(
+                    lambda: materialize(), instance=created_instance, run_id=run_id
+                )
+                for event in events:
+                    storage.store_event(event)
+
+                for event_type in (
+                    DagsterEventType.ASSET_MATERIALIZATION,
+                    DagsterEventType.ASSET_OBSERVATION,
+                ):
+                    for ascending in (True, False):
+                        event_records_filter = EventRecordsFilter(event_type=event_type)
+                        # matches the storage ids and asset keys of the full event records
+                        assert storage.get_event_record_asset_keys(
+                            event_records_filter, ascending=ascending
+                        ) == [
+                            (record.storage_id, record.asset_key)
+                            for record in storage.get_event_records(
+                                event_records_filter, ascending=ascending
+                            )
+                        ]
+
+                materialization_asset_keys = storage.get_event_record_asset_keys(
+                    EventRecordsFilter(event_type=DagsterEventType.ASSET_MATERIALIZATION),
+                    ascending=True,
+                )
+                assert [asset_key for _, asset_key in materialization_asset_keys] == [a, b, a]
+
+                first_storage_id = materialization_asset_keys[0][0]
+                last_storage_id = materialization_asset_keys[-1][0]
+                assert storage.get_event_record_asset_keys(
+                    EventRecordsFilter(
+                        event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                        after_cursor=first_storage_id,
+                        before_cursor=last_storage_id,
+                    ),
+                ) == [materialization_asset_keys[1]]
+                assert storage.get_event_record_asset_keys(
+                    EventRecordsFilter(event_type=DagsterEventType.ASSET_MATERIALIZATION),
+                    limit=1,
+                ) == [materialization_asset_keys[-1]]
+
+    def test_get_latest_materialization_records(self, storage, instance):
+        a = AssetKey("no_materializations_asset")
+        b = AssetKey("no_partitions_asset")
+        c = AssetKey("two_partitions_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(b)
+            yield AssetMaterialization(c, partition="a")
+            yield AssetObservation(a, partition="a")
+            yield Output(None)
+
+        @op
+        def materialize_two():
+            yield AssetMaterialization(c, partition="a")
+            yield AssetMaterialization(c, partition="b")
+            yield Output(None)
+
+        asset_partitions = [
+            AssetKeyPartitionKey(a),
+            AssetKeyPartitionKey(a, "a"),
+            AssetKeyPartitionKey(b),
+            AssetKeyPartitionKey(c),
+            AssetKeyPartitionKey(c, "a"),
+            AssetKeyPartitionKey(c, "b"),
+            AssetKeyPartitionKey(c, "c"),
+        ]
+
+        def _fetch_partitions_and_storage_ids(after_cursor=None):
+            records = storage.get_latest_materialization_records(
+                asset_partitions, after_cursor=after_cursor
+            )
+            # matches fetching the records for each asset partition individually
+            assert records == EventLogStorage.get_latest_materialization_records(
+                storage, asset_partitions, after_cursor=after_cursor
+            )
+            for asset_partition, record in records.items():
+                assert record.asset_key == asset_partition.asset_key
+                if asset_partition.partition_key is not None:
+                    assert record.partition_key == asset_partition.partition_key
+            return {
+                asset_partition: record.storage_id for asset_partition, record in records.items()
+            }
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                assert storage.get_latest_materialization_records([]) == {}
+                assert _fetch_partitions_and_storage_ids() == {}
+
+                events_one, _ = _synthesize_events(
+                    lambda: materialize(), instance=created_instance, run_id=run_id_1
+                )
+                for event in events_one:
+                    storage.store_event(event)
+
+                storage_ids_run1 = _fetch_partitions_and_storage_ids()
+                assert set(storage_ids_run1.keys()) == {
+                    AssetKeyPartitionKey(b),
+                    AssetKeyPartitionKey(c),
+                    AssetKeyPartitionKey(c, "a"),
+                }
+                assert (
+                    storage_ids_run1[AssetKeyPartitionKey(c)]
+                    == storage_ids_run1[AssetKeyPartitionKey(c, "a")]
+                )
+                cursor_run1 = max(storage_ids_run1.values())
+
+                events_two, _ = _synthesize_events(
+                    lambda: materialize_two(), instance=created_instance, run_id=run_id_2
+                )
+                for event in events_two:
+                    storage.store_event(event)
+
+                storage_ids_run2 = _fetch_partitions_and_storage_ids()
+                assert storage_ids_run2[AssetKeyPartitionKey(b)] == (
+                    storage_ids_run1[AssetKeyPartitionKey(b)]
+                )
+                assert storage_ids_run2[AssetKeyPartitionKey(c, "a")] > cursor_run1
+                assert (
+                    storage_ids_run2[AssetKeyPartitionKey(c, "b")]
+                    > storage_ids_run2[AssetKeyPartitionKey(c, "a")]
+                )
+                assert (
+                    storage_ids_run2[AssetKeyPartitionKey(c)]
+                    == storage_ids_run2[AssetKeyPartitionKey(c, "b")]
+                )
+
+                # after_cursor
+                assert _fetch_partitions_and_storage_ids(after_cursor=cursor_run1) == {
+                    asset_partition: storage_id
+                    for asset_partition, storage_id in storage_ids_run2.items()
+                    if asset_partition.asset_key == c
+                }
+                assert _fetch_partitions_and_storage_ids(after_cursor=9999999999) == {}
+
+                # wipe asset, make sure we respect that
+                if self.can_wipe():
+                    storage.wipe_asset(c)
+                    assert _fetch_partitions_and_storage_ids() == {
+                        AssetKeyPartitionKey(b): storage_ids_run1[AssetKeyPartitionKey(b)]
+                    }
+
     def test_get_latest_asset_partition_materialization_attempts_without_materializations(
         self, storage, instance
     ):
@@ -2730,6 +3167,81 @@ def my_op():
                 {"dagster/partition/country": "US", "dagster/partition/date": "2022-10-13"}
             ]
 
+    def test_store_events_batch(self, storage, instance):
+        key = AssetKey("batched")
+
+        @op
+        def batched_op(context):
+            for i in range(3):
+                context.log.info(f"message {i}")
+                yield AssetMaterialization(asset_key=key, tags={"dagster/index": str(i)})
+            yield AssetObservation(asset_key=key)
+            yield Output(5)
+
+        run_id_1, run_id_2 = make_new_run_id(), make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+            events_1, _ = _synthesize_events(lambda: batched_op(), run_id_1)
+            events_2, _ = _synthesize_events(lambda: batched_op(), run_id_2)
+
+            storage.store_events([*events_1, *events_2])
+
+            for run_id, events in [(run_id_1, events_1), (run_id_2, events_2)]:
+                stored = storage.get_logs_for_run(run_id)
+                assert [event.message for event in stored] == [event.message for event in events]
+                assert _event_types(stored) == _event_types(events)
+
+            materializations = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=key),
+                ascending=True,
+            )
+            assert len(materializations) == 6
+            assert [record.event_log_entry.run_id for record in materializations] == [
+                run_id_1
+            ] * 3 + [run_id_2] * 3
+
+            asset_records = storage.get_asset_records([key])
+            assert len(asset_records) == 1
+            last_materialization = asset_records[0].asset_entry.last_materialization_record
+            assert last_materialization.storage_id == materializations[-1].storage_id
+            assert asset_records[0].asset_entry.last_run_id == run_id_2
+
+            if storage.supports_add_asset_event_tags():
+                tags = storage.get_event_tags_for_asset(key)
+                assert sorted(tag["dagster/index"] for tag in tags) == [
+                    "0",
+                    "0",
+                    "1",
+                    "1",
+                    "2",
+                    "2",
+                ]
+
+    def test_store_events_batches_inserts(self, test_run_id, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        events = [create_test_event_log_record(str(i), test_run_id) for i in range(2500)]
+        insert_statements = []
+
+        def _before_cursor_execute(_conn, _cursor, statement, *_args):
+            if statement.lstrip().upper().startswith("INSERT INTO EVENT_LOGS"):
+                insert_statements.append(statement)
+
+        # matches the max batch size of the instance event log buffer
+        batch_size = 1000
+        db.event.listen(db.engine.Engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            for i in range(0, len(events), batch_size):
+                storage.store_events(events[i : i + batch_size])
+        finally:
+            db.event.remove(db.engine.Engine, "before_cursor_execute", _before_cursor_execute)
+
+        # each batch is written with a single insert, in the order of the events
+        assert len(insert_statements) == 3
+        assert [event.user_message for event in storage.get_logs_for_run(test_run_id)] == [
+            event.user_message for event in events
+        ]
+
     def test_add_asset_event_tags(self, storage, instance):
         if not storage.supports_add_asset_event_tags():
             pytest.skip("storage does not support adding asset event tags")
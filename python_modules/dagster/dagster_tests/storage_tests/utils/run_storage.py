@@ -937,6 +937,53 @@ def test_single_write_with_missing_snapshot(self, storage: RunStorage):
         with pytest.raises(DagsterSnapshotDoesNotExist):
             storage.add_run(run_with_missing_snapshot)
 
+    def test_add_runs(self, storage: RunStorage):
+        job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+        job_snapshot_id = storage.add_job_snapshot(job_def.get_job_snapshot())
+
+        # more runs and tags than fit in a single multi-row insert
+        runs = [
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                job_name=job_def.name,
+                tags={"foo": "bar", "index": str(i), PARTITION_NAME_TAG: f"partition_{i}"},
+                job_snapshot_id=job_snapshot_id,
+            )
+            for i in range(150)
+        ]
+        assert storage.add_runs(runs) == runs
+
+        assert {run.run_id for run in storage.get_runs()} == {run.run_id for run in runs}
+        assert len(storage.get_runs(RunsFilter(tags={"foo": "bar"}))) == 150
+        fetched = storage.get_runs(RunsFilter(tags={"index": "42"}))
+        assert len(fetched) == 1
+        assert fetched[0] == runs[42]
+
+        assert storage.add_runs([]) == []
+
+    def test_add_runs_is_atomic(self, storage: RunStorage):
+        existing_run = TestRunStorage.build_run(run_id=make_new_run_id(), job_name="some_pipeline")
+        storage.add_run(existing_run)
+
+        new_run = TestRunStorage.build_run(
+            run_id=make_new_run_id(), job_name="some_pipeline", tags={"foo": "bar"}
+        )
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs([new_run, existing_run])
+        assert not storage.has_run(new_run.run_id)
+        assert not storage.get_runs(RunsFilter(tags={"foo": "bar"}))
+
+        with pytest.raises(DagsterSnapshotDoesNotExist):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(
+                        run_id=make_new_run_id(), job_name="some_pipeline", job_snapshot_id="nope"
+                    )
+                ]
+            )
+
+        assert [run.run_id for run in storage.get_runs()] == [existing_run.run_id]
+
     def test_add_get_execution_snapshot(self, storage: RunStorage):
         from dagster._core.execution.api import create_execution_plan
         from dagster._core.snap import snapshot_from_execution_plan
@@ -957,6 +1004,59 @@ def test_add_get_execution_snapshot(self, storage: RunStorage):
 
             assert not storage.has_execution_plan_snapshot(snapshot_id)
 
+    def test_get_run_tags_by_run_id(self, storage: RunStorage):
+        one, two, three = make_new_run_id(), make_new_run_id(), make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one, job_name="some_pipeline", tags={"foo": "bar", "baz": "quux"}
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two, job_name="some_pipeline", status=DagsterRunStatus.STARTED
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(run_id=three, job_name="some_pipeline", tags={"foo": "baz"})
+        )
+
+        tags_by_run_id = storage.get_run_tags_by_run_id(RunsFilter(), ["foo"])
+        # ordered from oldest to newest, including runs without any of the tags
+        assert list(tags_by_run_id.items()) == [
+            (one, {"foo": "bar"}),
+            (two, {}),
+            (three, {"foo": "baz"}),
+        ]
+
+        assert storage.get_run_tags_by_run_id(
+            RunsFilter(statuses=[DagsterRunStatus.NOT_STARTED]), ["foo", "baz"]
+        ) == {one: {"foo": "bar", "baz": "quux"}, three: {"foo": "baz"}}
+
+    def test_snapshot_cache(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+        job_snapshot = job_def.get_job_snapshot()
+        job_snapshot_id = create_job_snapshot_id(job_snapshot)
+
+        assert not storage.has_job_snapshot(job_snapshot_id)
+        assert storage.add_job_snapshot(job_snapshot) == job_snapshot_id
+        # adding the snapshot replaces the cached lookup of the missing snapshot
+        assert storage.has_job_snapshot(job_snapshot_id)
+
+        hits = storage.get_snapshot_cache_stats()["snapshots"].hits
+        fetched = storage.get_job_snapshot(job_snapshot_id)
+        assert serialize_pp(fetched) == serialize_pp(job_snapshot)
+        assert storage.get_job_snapshot(job_snapshot_id) is fetched
+        assert storage.get_snapshot_cache_stats()["snapshots"].hits == hits + 2
+
+        if self.can_delete_runs():
+            storage.wipe()
+
+            assert storage.get_snapshot_cache_stats()["snapshots"].size == 0
+            assert not storage.has_job_snapshot(job_snapshot_id)
+
     def test_fetch_run_filter(self, storage):
         assert storage
         one = make_new_run_id()
@@ -21,6 +21,9 @@
 
 
 class PickledObjectS3IOManager(UPathIOManager):
+    # boto3 clients are thread-safe, so partition ranges can be fetched concurrently
+    partition_load_concurrency = 8
+
     def __init__(
         self,
         s3_bucket: str,
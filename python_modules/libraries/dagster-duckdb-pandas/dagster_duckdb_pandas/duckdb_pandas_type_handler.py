@@ -1,7 +1,14 @@
-from typing import Optional, Sequence, Type
+from typing import Iterator, Optional, Sequence, Type
 
 import pandas as pd
-from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
+from dagster import (
+    InputContext,
+    MetadataValue,
+    OutputContext,
+    TableColumn,
+    TableSchema,
+    _check as check,
+)
 from dagster._core.storage.db_io_manager import DbTypeHandler, TableSlice
 from dagster_duckdb.io_manager import (
     DuckDbClient,
@@ -9,12 +16,30 @@
     build_duckdb_io_manager,
 )
 
+# max number of rows written by a single insert statement in `handle_output`
+DEFAULT_WRITE_CHUNK_SIZE = 1_000_000
+
+# number of rows in each vector of a duckdb result
+DUCKDB_VECTOR_SIZE = 2048
+
+# name under which each chunk of a DataFrame is registered with the duckdb connection
+_CHUNK_VIEW_NAME = "dagster_pandas_chunk"
+
+
+def _iter_chunks(obj: pd.DataFrame, chunk_size: int) -> Iterator[pd.DataFrame]:
+    # always yield at least one chunk so that a table is created for an empty DataFrame
+    for start in range(0, max(len(obj), 1), chunk_size):
+        yield obj.iloc[start : start + chunk_size]
+
 
 class DuckDBPandasTypeHandler(DbTypeHandler[pd.DataFrame]):
     """Stores and loads Pandas DataFrames in DuckDB.
 
     To use this type handler, return it from the ``type_handlers` method of an I/O manager that inherits from ``DuckDBIOManager``.
 
+    DataFrames are written ``write_chunk_size`` rows at a time, so that the memory used by each
+    insert statement is bounded regardless of the size of the DataFrame.
+
     Example:
         .. code-block:: python
 
@@ -39,19 +64,31 @@ def my_table() -> pd.DataFrame:  # the name of the asset will be the table name
 
     """
 
+    def __init__(self, write_chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE):
+        self._write_chunk_size = check.int_param(write_chunk_size, "write_chunk_size")
+        check.invariant(self._write_chunk_size > 0, "write_chunk_size must be positive")
+
     def handle_output(
         self, context: OutputContext, table_slice: TableSlice, obj: pd.DataFrame, connection
     ):
         """Stores the pandas DataFrame in duckdb."""
-        connection.execute(
-            f"create table if not exists {table_slice.schema}.{table_slice.table} as select * from"
-            " obj;"
-        )
-        if not connection.fetchall():
-            # table was not created, therefore already exists. Insert the data
-            connection.execute(
-                f"insert into {table_slice.schema}.{table_slice.table} select * from obj"
-            )
+        table_name = f"{table_slice.schema}.{table_slice.table}"
+        for i, chunk in enumerate(_iter_chunks(obj, self._write_chunk_size)):
+            # registering the slice lets duckdb scan the DataFrame's arrays without copying them
+            connection.register(_CHUNK_VIEW_NAME, chunk)
+            try:
+                table_created = False
+                if i == 0:
+                    connection.execute(
+                        f"create table if not exists {table_name} as select * from"
+                        f" {_CHUNK_VIEW_NAME};"
+                    )
+                    table_created = bool(connection.fetchall())
+                if not table_created:
+                    # table already exists. Insert the data
+                    connection.execute(f"insert into {table_name} select * from {_CHUNK_VIEW_NAME}")
+            finally:
+                connection.unregister(_CHUNK_VIEW_NAME)
 
         context.add_output_metadata(
             {
@@ -75,6 +112,20 @@ def load_input(
             return pd.DataFrame()
         return connection.execute(DuckDbClient.get_select_statement(table_slice)).fetchdf()
 
+    def load_input_chunks(
+        self, context: InputContext, table_slice: TableSlice, connection, chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """Loads the input as a sequence of Pandas DataFrames of roughly chunk_size rows each."""
+        if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
+            return
+        connection.execute(DuckDbClient.get_select_statement(table_slice))
+        vectors_per_chunk = max(1, chunk_size // DUCKDB_VECTOR_SIZE)
+        while True:
+            chunk = connection.fetch_df_chunk(vectors_per_chunk)
+            if chunk.empty:
+                return
+            yield chunk
+
     @property
     def supported_types(self):
         return [pd.DataFrame]
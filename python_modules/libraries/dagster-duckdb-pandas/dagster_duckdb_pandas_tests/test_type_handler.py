@@ -14,13 +14,24 @@
     StaticPartitionsDefinition,
     TimeWindowPartitionMapping,
     asset,
+    build_input_context,
+    build_output_context,
     graph,
     instance_for_test,
     materialize,
     op,
 )
 from dagster._check import CheckError
-from dagster_duckdb_pandas import DuckDBPandasIOManager, duckdb_pandas_io_manager
+from dagster._core.storage.db_io_manager import TableSlice
+from dagster._core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+)
+from dagster_duckdb_pandas import (
+    DuckDBPandasIOManager,
+    DuckDBPandasTypeHandler,
+    duckdb_pandas_io_manager,
+)
 
 
 @pytest.fixture
@@ -315,6 +326,54 @@ def test_static_partitioned_asset(tmp_path, io_managers):
         duckdb_conn.close()
 
 
+@asset(
+    partitions_def=StaticPartitionsDefinition(["1", "2", "10"]),
+    key_prefix=["my_schema"],
+    metadata={"partition_expr": "num"},
+    config_schema={"value": str},
+)
+def int_partitioned(context) -> pd.DataFrame:
+    value = context.op_config["value"]
+    return pd.DataFrame(
+        {
+            "num": [int(partition) for partition in context.asset_partition_keys_for_output()],
+            "a": value,
+        }
+    )
+
+
+def test_static_partitions_on_int_column(tmp_path, io_managers):
+    for io_manager in io_managers:
+        resource_defs = {"io_manager": io_manager}
+
+        for partition_key in ["1", "2", "10"]:
+            materialize(
+                [int_partitioned],
+                partition_key=partition_key,
+                resources=resource_defs,
+                run_config={"ops": {"my_schema__int_partitioned": {"config": {"value": "1"}}}},
+            )
+
+        # "2" and "10" don't sort the same way as strings and as integers
+        materialize(
+            [int_partitioned],
+            resources=resource_defs,
+            tags={ASSET_PARTITION_RANGE_START_TAG: "2", ASSET_PARTITION_RANGE_END_TAG: "10"},
+            run_config={"ops": {"my_schema__int_partitioned": {"config": {"value": "2"}}}},
+        )
+
+        duckdb_conn = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+        out_df = duckdb_conn.execute(
+            "SELECT * FROM my_schema.int_partitioned ORDER BY num"
+        ).fetch_df()
+        assert out_df["num"].tolist() == [1, 2, 10]
+        assert out_df["a"].tolist() == ["1", "2", "2"]
+
+        # drop table so we start with an empty db for the next io manager
+        duckdb_conn.execute("DELETE FROM my_schema.int_partitioned")
+        duckdb_conn.close()
+
+
 @asset(
     partitions_def=MultiPartitionsDefinition(
         {
@@ -544,3 +603,48 @@ def self_dependent_asset(context, self_dependent_asset: pd.DataFrame) -> pd.Data
         # drop table so we start with an empty db for the next io manager
         duckdb_conn.execute("DELETE FROM my_schema.self_dependent_asset")
         duckdb_conn.close()
+
+
+class _StatementRecordingConnection:
+    """Forwards to a duckdb connection, recording the statements it executes."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.statements = []
+
+    def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        return self._connection.execute(statement, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+@pytest.mark.parametrize(
+    "n_rows,write_chunk_size",
+    [(0, 1000), (10, 1000), (10, 3), (10, 1)],
+)
+def test_chunked_writes(tmp_path, n_rows, write_chunk_size):
+    df = pd.DataFrame({"a": range(n_rows), "b": [str(i) for i in range(n_rows)]})
+    handler = DuckDBPandasTypeHandler(write_chunk_size=write_chunk_size)
+    table_slice = TableSlice(
+        table="chunked", schema="my_schema", database=None, columns=None, partition_dimensions=[]
+    )
+
+    connection = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+    try:
+        connection.execute("create schema my_schema")
+        recording_connection = _StatementRecordingConnection(connection)
+        handler.handle_output(build_output_context(), table_slice, df, recording_connection)
+        out_df = handler.load_input(build_input_context(), table_slice, connection)
+    finally:
+        connection.close()
+
+    # one statement per chunk, and at least one so that the table is created
+    write_statements = [
+        statement
+        for statement in recording_connection.statements
+        if statement.startswith(("create table", "insert into"))
+    ]
+    assert len(write_statements) == max(-(-n_rows // write_chunk_size), 1)
+    pd.testing.assert_frame_equal(out_df, df)
@@ -99,6 +99,7 @@ def duckdb_io_manager(init_context):
             database=init_context.resource_config["database"],
             schema=init_context.resource_config.get("schema"),
             default_load_type=default_load_type,
+            use_staging_table=init_context.resource_config.get("use_staging_table", False),
         )
 
     return duckdb_io_manager
@@ -160,6 +161,13 @@ def my_table_a(my_table: pd.DataFrame):
     schema_: Optional[str] = Field(
         default=None, alias="schema", description="Name of the schema to use."
     )  # schema is a reserved word for pydantic
+    use_staging_table: bool = Field(
+        default=False,
+        description=(
+            "If True, outputs are written to a staging table, and the table or partition being"
+            " materialized is replaced with its contents in a single transaction."
+        ),
+    )
 
     @staticmethod
     @abstractmethod
@@ -178,6 +186,7 @@ def create_io_manager(self, context) -> DbIOManager:
             type_handlers=self.type_handlers(),
             default_load_type=self.default_load_type(),
             io_manager_name="DuckDBIOManager",
+            use_staging_table=self.use_staging_table,
         )
 
 
@@ -194,6 +203,42 @@ def delete_table_slice(context: OutputContext, table_slice: TableSlice, connecti
     def ensure_schema_exists(context: OutputContext, table_slice: TableSlice, connection) -> None:
         connection.execute(f"create schema if not exists {table_slice.schema};")
 
+    @staticmethod
+    def replace_table_slice(
+        context: OutputContext,
+        table_slice: TableSlice,
+        staging_table_slice: TableSlice,
+        connection,
+    ) -> None:
+        table = f"{table_slice.schema}.{table_slice.table}"
+        staging_table = f"{staging_table_slice.schema}.{staging_table_slice.table}"
+        table_exists = (
+            connection.execute(
+                (
+                    "select count(*) from information_schema.tables where table_schema = ? and"
+                    " table_name = ?"
+                ),
+                [table_slice.schema, table_slice.table],
+            ).fetchone()[0]
+            > 0
+        )
+
+        connection.begin()
+        try:
+            if table_exists:
+                connection.execute(_get_cleanup_statement(table_slice))
+                connection.execute(f"insert into {table} select * from {staging_table}")
+            else:
+                connection.execute(f"create table {table} as select * from {staging_table}")
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+
+    @staticmethod
+    def drop_table(context: OutputContext, table_slice: TableSlice, connection) -> None:
+        connection.execute(f"drop table if exists {table_slice.schema}.{table_slice.table}")
+
     @staticmethod
     def get_select_statement(table_slice: TableSlice) -> str:
         col_str = ", ".join(table_slice.columns) if table_slice.columns else "*"
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+import duckdb
 from dagster import TimeWindow
 from dagster._core.storage.db_io_manager import TablePartitionDimension, TableSlice
 from dagster_duckdb.io_manager import DuckDbClient, _get_cleanup_statement
@@ -158,3 +159,37 @@ def test_get_cleanup_statement_multi_partitioned():
         == "DELETE FROM schema1.table1 WHERE\nmy_fruit_col in ('apple') AND\nmy_timestamp_col >="
         " '2020-01-02 00:00:00' AND my_timestamp_col < '2020-02-03 00:00:00'"
     )
+
+
+def test_replace_table_slice():
+    conn = duckdb.connect()
+    conn.execute("create schema my_schema")
+    table_slice = TableSlice(
+        database="my_db",
+        schema="my_schema",
+        table="my_table",
+        partition_dimensions=[TablePartitionDimension(partition_expr="color", partitions=["red"])],
+    )
+    staging_table_slice = table_slice._replace(table="my_table_staging")
+
+    # the staging table becomes the table if it doesn't exist yet
+    conn.execute("create table my_schema.my_table_staging as select 'red' as color, 1 as a")
+    DuckDbClient.replace_table_slice(None, table_slice, staging_table_slice, conn)
+    DuckDbClient.drop_table(None, staging_table_slice, conn)
+    assert conn.execute("select * from my_schema.my_table").fetchall() == [("red", 1)]
+
+    # only the rows of the partition are replaced
+    conn.execute("insert into my_schema.my_table values ('blue', 2)")
+    conn.execute("create table my_schema.my_table_staging as select 'red' as color, 3 as a")
+    DuckDbClient.replace_table_slice(None, table_slice, staging_table_slice, conn)
+    DuckDbClient.drop_table(None, staging_table_slice, conn)
+    assert sorted(conn.execute("select * from my_schema.my_table").fetchall()) == [
+        ("blue", 2),
+        ("red", 3),
+    ]
+    assert (
+        conn.execute(
+            "select count(*) from information_schema.tables where table_name = 'my_table_staging'"
+        ).fetchone()[0]
+        == 0
+    )
@@ -1,4 +1,4 @@
-from typing import Optional, Sequence, Type
+from typing import Iterator, Optional, Sequence, Type
 
 import pandas as pd
 from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
@@ -75,15 +75,29 @@ def load_input(
         """Loads the input as a Pandas DataFrame."""
         if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
             return pd.DataFrame()
-        result = connection.query(
+        result = self._query(context, table_slice, connection).to_dataframe()
+
+        result.columns = map(str.lower, result.columns)
+        return result
+
+    def load_input_chunks(
+        self, context: InputContext, table_slice: TableSlice, connection, chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """Loads the input as a sequence of Pandas DataFrames of at most chunk_size rows each."""
+        if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
+            return
+        rows = self._query(context, table_slice, connection).result(page_size=chunk_size)
+        for result in rows.to_dataframe_iterable():
+            result.columns = map(str.lower, result.columns)
+            yield result
+
+    def _query(self, context: InputContext, table_slice: TableSlice, connection):
+        return connection.query(
             query=BigQueryClient.get_select_statement(table_slice),
             project=table_slice.database,
             location=context.resource_config.get("location") if context.resource_config else None,
             timeout=context.resource_config.get("timeout") if context.resource_config else None,
-        ).to_dataframe()
-
-        result.columns = map(str.lower, result.columns)
-        return result
+        )
 
     @property
     def supported_types(self):
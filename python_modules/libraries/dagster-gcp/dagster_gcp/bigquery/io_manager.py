@@ -123,6 +123,7 @@ def bigquery_io_manager(init_context):
             database=init_context.resource_config["project"],
             schema=init_context.resource_config.get("dataset"),
             default_load_type=default_load_type,
+            use_staging_table=init_context.resource_config.get("use_staging_table", False),
         )
         if init_context.resource_config.get("gcp_credentials"):
             with setup_gcp_creds(init_context.resource_config.get("gcp_credentials")):
@@ -239,6 +240,14 @@ def my_table_a(my_table: pd.DataFrame) -> pd.DataFrame:
             " queries (loading and reading from tables)."
         ),
     )
+    use_staging_table: bool = Field(
+        default=False,
+        description=(
+            "If True, outputs are written to a staging table, and the rows of the table or"
+            " partition being materialized are replaced with its contents in a single"
+            " transaction."
+        ),
+    )
 
     @staticmethod
     @abstractmethod
@@ -257,6 +266,7 @@ def create_io_manager(self, context) -> Generator:
             schema=self.dataset,
             type_handlers=self.type_handlers(),
             default_load_type=self.default_load_type(),
+            use_staging_table=self.use_staging_table,
         )
         if self.gcp_credentials:
             with setup_gcp_creds(self.gcp_credentials):
@@ -291,6 +301,42 @@ def get_select_statement(table_slice: TableSlice) -> str:
     def ensure_schema_exists(context: OutputContext, table_slice: TableSlice, connection) -> None:
         connection.query(f"CREATE SCHEMA IF NOT EXISTS {table_slice.schema}").result()
 
+    @staticmethod
+    def replace_table_slice(
+        context: OutputContext,
+        table_slice: TableSlice,
+        staging_table_slice: TableSlice,
+        connection,
+    ) -> None:
+        table = f"{table_slice.database}.{table_slice.schema}.{table_slice.table}"
+        staging_table = f"{staging_table_slice.database}.{staging_table_slice.schema}.{staging_table_slice.table}"
+        try:
+            connection.get_table(table)
+            table_exists = True
+        except NotFound:
+            table_exists = False
+
+        if not table_exists or not table_slice.partition_dimensions:
+            # a copy job atomically replaces the whole table
+            connection.copy_table(
+                staging_table,
+                table,
+                job_config=bigquery.CopyJobConfig(write_disposition="WRITE_TRUNCATE"),
+            ).result()
+        else:
+            connection.query(
+                "BEGIN TRANSACTION;\n"
+                f"{_get_cleanup_statement(table_slice)};\n"
+                f"INSERT INTO `{table}` SELECT * FROM `{staging_table}`;\n"
+                "COMMIT TRANSACTION;"
+            ).result()
+
+    @staticmethod
+    def drop_table(context: OutputContext, table_slice: TableSlice, connection) -> None:
+        connection.delete_table(
+            f"{table_slice.database}.{table_slice.schema}.{table_slice.table}", not_found_ok=True
+        )
+
     @staticmethod
     @contextmanager
     def connect(context, _):
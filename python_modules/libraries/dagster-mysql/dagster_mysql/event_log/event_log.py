@@ -1,4 +1,5 @@
-from typing import ContextManager, Optional
+from contextlib import contextmanager
+from typing import ContextManager, Iterator, Optional, Sequence
 
 import dagster._check as check
 import sqlalchemy as db
@@ -146,6 +147,15 @@ def get_server_version(self) -> Optional[str]:
 
         return row[0]
 
+    def store_event(self, event: EventLogEntry) -> None:
+        super().store_event(event)
+        # wake up watchers in this process without waiting for their next poll
+        self._event_watcher.notify()
+
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        super().store_events(events)
+        self._event_watcher.notify()
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         # last_materialization_timestamp is updated upon observation, materialization, materialization_planned
         # See SqlEventLogStorage.store_asset_event method for more details
@@ -181,6 +191,15 @@ def _connect(self) -> ContextManager[Connection]:
     def run_connection(self, run_id: Optional[str] = None) -> ContextManager[Connection]:
         return self._connect()
 
+    @contextmanager
+    def run_transaction(self, run_id: Optional[str] = None) -> Iterator[Connection]:
+        with self.run_connection(run_id) as conn:
+            # the engine runs in autocommit mode, so the connection is switched to a transactional
+            # isolation level until it is returned to the pool
+            transaction_conn = conn.execution_options(isolation_level="READ COMMITTED")
+            with transaction_conn.begin():
+                yield transaction_conn
+
     def index_connection(self) -> ContextManager[Connection]:
         return self._connect()
 
@@ -1,4 +1,5 @@
-from typing import ContextManager, Mapping, Optional
+from contextlib import contextmanager
+from typing import ContextManager, Iterator, Mapping, Optional
 
 import dagster._check as check
 import sqlalchemy as db
@@ -137,6 +138,15 @@ def create_clean_storage(mysql_url: str) -> "MySQLRunStorage":
     def connect(self, run_id: Optional[str] = None) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "run")
 
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        with self.connect() as conn:
+            # the engine runs in autocommit mode, so the connection is switched to a transactional
+            # isolation level until it is returned to the pool
+            transaction_conn = conn.execution_options(isolation_level="READ COMMITTED")
+            with transaction_conn.begin():
+                yield transaction_conn
+
     def upgrade(self) -> None:
         alembic_config = mysql_alembic_config(__file__)
         with self.connect() as conn:
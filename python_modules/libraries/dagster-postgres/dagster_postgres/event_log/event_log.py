@@ -1,9 +1,9 @@
-from typing import Any, ContextManager, Mapping, Optional, Sequence
+from contextlib import contextmanager
+from typing import Any, ContextManager, Iterator, Mapping, Optional, Sequence, Tuple
 
 import dagster._check as check
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
-import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
@@ -20,10 +20,10 @@
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.sql_event_log import is_asset_event_to_index
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
-    create_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -31,16 +31,24 @@
 from sqlalchemy.engine import Connection
 
 from ..utils import (
+    PgConnectionCheckoutMetrics,
+    PgConnectionCheckoutStats,
     create_pg_connection,
+    create_pg_engine,
     pg_alembic_config,
+    pg_dagit_pool_config,
     pg_statement_timeout,
     pg_url_from_config,
     retry_pg_connection_fn,
     retry_pg_creation_fn,
 )
+from .event_watcher import PostgresEventLogNotifier
 
 CHANNEL_NAME = "run_events"
 
+# max number of rows written by a single multi-row insert statement in `store_events`
+EVENT_BATCH_INSERT_CHUNK_SIZE = 1000
+
 
 class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """Postgres-backed event log storage.
@@ -76,6 +84,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[Mapping[str, Any]] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
@@ -85,12 +94,15 @@ def __init__(
 
         self._disposed = False
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
-        )
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is explicitly configured
+        self._pool_config = check.opt_nullable_mapping_param(pool_config, "pool_config")
+        self._engine = create_pg_engine(self.postgres_url, pool_config=self._pool_config)
+        self._checkout_metrics = PgConnectionCheckoutMetrics()
 
-        self._event_watcher = SqlPollingEventWatcher(self)
+        self._event_watcher = SqlPollingEventWatcher(
+            self, notifier=PostgresEventLogNotifier(self.postgres_url, CHANNEL_NAME)
+        )
 
         self._secondary_index_cache = {}
 
@@ -119,12 +131,10 @@ def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
             options = f"{timeout_option} {existing_options}"
         else:
             options = timeout_option
-        self._engine = create_engine(
+        self._engine = create_pg_engine(
             self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            pool_size=1,
+            pool_config=pg_dagit_pool_config(self._pool_config, pool_recycle),
             connect_args={"options": options},
-            pool_recycle=pool_recycle,
         )
 
     def upgrade(self) -> None:
@@ -148,15 +158,14 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
     def create_clean_storage(
         conn_string: str, should_autocreate_tables: bool = True
     ) -> "PostgresEventLogStorage":
-        engine = create_engine(
-            conn_string, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
-        )
+        engine = create_pg_engine(conn_string)
         try:
             SqlEventLogStorageMetadata.drop_all(engine)
         finally:
@@ -172,7 +181,9 @@ def store_event(self, event: EventLogEntry) -> None:
         """
         check.inst_param(event, "event", EventLogEntry)
         insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
-        with self._connect() as conn:
+        # the event and its stats are committed together, and watchers are only notified once they
+        # have been
+        with self.run_transaction(event.run_id) as conn:
             result = conn.execute(
                 insert_event_statement.returning(
                     SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
@@ -181,12 +192,13 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # wakes up the LISTEN connections of event watchers (see PostgresEventLogNotifier)
             conn.execute(
                 f"""NOTIFY {CHANNEL_NAME}, %s; """,
                 (res[0] + "_" + str(res[1]),),  # type: ignore
             )
             event_id = res[1]  # type: ignore
+            self.update_run_stats(conn, event.run_id, [event])
 
         if (
             event.is_dagster_event
@@ -202,6 +214,41 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Tuple[EventLogEntry, int]]:
+        asset_events = []
+        for chunk_start in range(0, len(events), EVENT_BATCH_INSERT_CHUNK_SIZE):
+            chunk = events[chunk_start : chunk_start + EVENT_BATCH_INSERT_CHUNK_SIZE]
+            result = conn.execute(
+                SqlEventLogStorageTable.insert()
+                .values([self.get_insert_event_values(event) for event in chunk])
+                .returning(SqlEventLogStorageTable.c.id)
+            )
+            # ids are drawn from the sequence in the order of the VALUES list, so sorting the
+            # returned ids lines them back up with the events in the chunk
+            event_ids = sorted(row[0] for row in result.fetchall())
+            result.close()
+
+            # wakes up the LISTEN connections of event watchers (see PostgresEventLogNotifier)
+            conn.execute(
+                f"""SELECT pg_notify('{CHANNEL_NAME}', payload) FROM unnest(%s) AS payload; """,
+                (
+                    [
+                        event.run_id + "_" + str(event_id)
+                        for event, event_id in zip(chunk, event_ids)
+                    ],
+                ),
+            )
+
+            asset_events.extend(
+                (event, event_id)
+                for event, event_id in zip(chunk, event_ids)
+                if is_asset_event_to_index(event)
+            )
+
+        return asset_events
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -272,11 +319,26 @@ def add_dynamic_partitions(
             )
 
     def _connect(self) -> ContextManager[Connection]:
-        return create_pg_connection(self._engine)
+        return create_pg_connection(self._engine, checkout_metrics=self._checkout_metrics)
+
+    def get_connection_checkout_stats(self) -> PgConnectionCheckoutStats:
+        """Time spent waiting to check out connections to the database since this storage was
+        created.
+        """
+        return self._checkout_metrics.get_stats()
 
     def run_connection(self, run_id: Optional[str] = None) -> ContextManager[Connection]:
         return self._connect()
 
+    @contextmanager
+    def run_transaction(self, run_id: Optional[str] = None) -> Iterator[Connection]:
+        with self.run_connection(run_id) as conn:
+            # the engine runs in autocommit mode, so the connection is switched to a transactional
+            # isolation level until it is returned to the pool
+            transaction_conn = conn.execution_options(isolation_level="READ COMMITTED")
+            with transaction_conn.begin():
+                yield transaction_conn
+
     def index_connection(self) -> ContextManager[Connection]:
         return self._connect()
 
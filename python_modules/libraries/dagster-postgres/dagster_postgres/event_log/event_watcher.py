@@ -0,0 +1,80 @@
+import logging
+import select
+import threading
+from typing import Callable, Optional
+
+import dagster._check as check
+from dagster._core.storage.event_log.polling_event_watcher import EventLogNotifier
+
+from ..utils import get_conn
+
+# how long to block waiting for a notification before checking whether the notifier was closed
+LISTEN_TIMEOUT_SECONDS = 1.0
+# max wait before reconnecting after the listening connection fails
+MAX_RECONNECT_WAIT_SECONDS = 30.0
+
+
+class PostgresEventLogNotifier(EventLogNotifier):
+    """Wakes a SqlPollingEventWatcher whenever an event is stored, using Postgres LISTEN/NOTIFY.
+
+    `PostgresEventLogStorage` sends a NOTIFY on `channel` for every stored event. This notifier
+    holds a single dedicated connection that LISTENs on the channel, so that a watcher serving any
+    number of runs only needs one extra connection.
+    """
+
+    def __init__(self, conn_string: str, channel: str):
+        self._conn_string = check.str_param(conn_string, "conn_string")
+        self._channel = check.str_param(channel, "channel")
+        self._shutdown_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, on_new_events: Callable[[], None]) -> None:
+        check.callable_param(on_new_events, "on_new_events")
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._listen, args=(on_new_events,), name="postgres-event-notifier", daemon=True
+        )
+        self._thread.start()
+
+    def _listen(self, on_new_events: Callable[[], None]) -> None:
+        reconnect_wait = LISTEN_TIMEOUT_SECONDS
+        while not self._shutdown_event.is_set():
+            conn = None
+            try:
+                conn = get_conn(self._conn_string)
+                with conn.cursor() as curs:
+                    curs.execute(f"LISTEN {self._channel};")
+
+                # events may have been stored while we were not listening
+                on_new_events()
+                reconnect_wait = LISTEN_TIMEOUT_SECONDS
+
+                while not self._shutdown_event.is_set():
+                    if select.select([conn], [], [], LISTEN_TIMEOUT_SECONDS) == ([], [], []):
+                        continue
+
+                    conn.poll()
+                    if conn.notifies:
+                        conn.notifies.clear()
+                        on_new_events()
+            except Exception:
+                logging.exception(
+                    "Error listening for event log notifications, reconnecting in %s seconds.",
+                    reconnect_wait,
+                )
+                self._shutdown_event.wait(reconnect_wait)
+                reconnect_wait = min(reconnect_wait * 2, MAX_RECONNECT_WAIT_SECONDS)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+    def close(self) -> None:
+        self._shutdown_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
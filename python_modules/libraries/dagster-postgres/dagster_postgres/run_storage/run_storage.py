@@ -1,9 +1,9 @@
-from typing import ContextManager, Mapping, Optional
+from contextlib import contextmanager
+from typing import Any, ContextManager, Iterator, Mapping, Optional
 
 import dagster._check as check
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
-import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.storage.config import PostgresStorageConfig, pg_config
 from dagster._core.storage.runs import (
@@ -16,7 +16,6 @@
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
-    create_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -26,8 +25,12 @@
 from sqlalchemy.engine import Connection
 
 from ..utils import (
+    PgConnectionCheckoutMetrics,
+    PgConnectionCheckoutStats,
     create_pg_connection,
+    create_pg_engine,
     pg_alembic_config,
+    pg_dagit_pool_config,
     pg_statement_timeout,
     pg_url_from_config,
     retry_pg_connection_fn,
@@ -68,6 +71,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[Mapping[str, Any]] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
@@ -75,12 +79,11 @@ def __init__(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            poolclass=db_pool.NullPool,
-        )
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is explicitly configured
+        self._pool_config = check.opt_nullable_mapping_param(pool_config, "pool_config")
+        self._engine = create_pg_engine(self.postgres_url, pool_config=self._pool_config)
+        self._checkout_metrics = PgConnectionCheckoutMetrics()
 
         self._index_migration_cache = {}
 
@@ -112,12 +115,10 @@ def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
             options = f"{timeout_option} {existing_options}"
         else:
             options = timeout_option
-        self._engine = create_engine(
+        self._engine = create_pg_engine(
             self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            pool_size=1,
+            pool_config=pg_dagit_pool_config(self._pool_config, pool_recycle),
             connect_args={"options": options},
-            pool_recycle=pool_recycle,
         )
 
     @property
@@ -136,15 +137,14 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
     def create_clean_storage(
         postgres_url: str, should_autocreate_tables: bool = True
     ) -> "PostgresRunStorage":
-        engine = create_engine(
-            postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
-        )
+        engine = create_pg_engine(postgres_url)
         try:
             RunStorageSqlMetadata.drop_all(engine)
         finally:
@@ -152,7 +152,22 @@ def create_clean_storage(
         return PostgresRunStorage(postgres_url, should_autocreate_tables)
 
     def connect(self) -> ContextManager[Connection]:
-        return create_pg_connection(self._engine)
+        return create_pg_connection(self._engine, checkout_metrics=self._checkout_metrics)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        with self.connect() as conn:
+            # the engine runs in autocommit mode, so the connection is switched to a transactional
+            # isolation level until it is returned to the pool
+            transaction_conn = conn.execution_options(isolation_level="READ COMMITTED")
+            with transaction_conn.begin():
+                yield transaction_conn
+
+    def get_connection_checkout_stats(self) -> PgConnectionCheckoutStats:
+        """Time spent waiting to check out connections to the database since this storage was
+        created.
+        """
+        return self._checkout_metrics.get_stats()
 
     def upgrade(self) -> None:
         with self.connect() as conn:
@@ -1,10 +1,9 @@
-from typing import ContextManager, Optional
+from typing import Any, ContextManager, Mapping, Optional
 
 import dagster._check as check
 import pendulum
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
-import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.scheduler.instigation import InstigatorState
 from dagster._core.storage.config import PostgresStorageConfig, pg_config
@@ -13,7 +12,6 @@
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
-    create_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -21,8 +19,12 @@
 from sqlalchemy.engine import Connection
 
 from ..utils import (
+    PgConnectionCheckoutMetrics,
+    PgConnectionCheckoutStats,
     create_pg_connection,
+    create_pg_engine,
     pg_alembic_config,
+    pg_dagit_pool_config,
     pg_statement_timeout,
     pg_url_from_config,
     retry_pg_connection_fn,
@@ -63,6 +65,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[Mapping[str, Any]] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
@@ -70,10 +73,11 @@ def __init__(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
-        )
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is explicitly configured
+        self._pool_config = check.opt_nullable_mapping_param(pool_config, "pool_config")
+        self._engine = create_pg_engine(self.postgres_url, pool_config=self._pool_config)
+        self._checkout_metrics = PgConnectionCheckoutMetrics()
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
@@ -103,12 +107,10 @@ def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
             options = f"{timeout_option} {existing_options}"
         else:
             options = timeout_option
-        self._engine = create_engine(
+        self._engine = create_pg_engine(
             self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            pool_size=1,
+            pool_config=pg_dagit_pool_config(self._pool_config, pool_recycle),
             connect_args={"options": options},
-            pool_recycle=pool_recycle,
         )
 
     @property
@@ -127,15 +129,14 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
     def create_clean_storage(
         postgres_url: str, should_autocreate_tables: bool = True
     ) -> "PostgresScheduleStorage":
-        engine = create_engine(
-            postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
-        )
+        engine = create_pg_engine(postgres_url)
         try:
             ScheduleStorageSqlMetadata.drop_all(engine)
         finally:
@@ -143,7 +144,13 @@ def create_clean_storage(
         return PostgresScheduleStorage(postgres_url, should_autocreate_tables)
 
     def connect(self, run_id: Optional[str] = None) -> ContextManager[Connection]:
-        return create_pg_connection(self._engine)
+        return create_pg_connection(self._engine, checkout_metrics=self._checkout_metrics)
+
+    def get_connection_checkout_stats(self) -> PgConnectionCheckoutStats:
+        """Time spent waiting to check out connections to the database since this storage was
+        created.
+        """
+        return self._checkout_metrics.get_stats()
 
     def upgrade(self) -> None:
         alembic_config = pg_alembic_config(__file__)
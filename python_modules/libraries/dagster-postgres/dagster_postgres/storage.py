@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 from dagster import _check as check
 from dagster._config.config_schema import UserConfigSchema
@@ -39,15 +39,23 @@ def __init__(
         postgres_url,
         should_autocreate_tables=True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[Mapping[str, Any]] = None,
     ):
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
-        self._run_storage = PostgresRunStorage(postgres_url, should_autocreate_tables)
-        self._event_log_storage = PostgresEventLogStorage(postgres_url, should_autocreate_tables)
-        self._schedule_storage = PostgresScheduleStorage(postgres_url, should_autocreate_tables)
+        self._pool_config = check.opt_nullable_mapping_param(pool_config, "pool_config")
+        self._run_storage = PostgresRunStorage(
+            postgres_url, should_autocreate_tables, pool_config=self._pool_config
+        )
+        self._event_log_storage = PostgresEventLogStorage(
+            postgres_url, should_autocreate_tables, pool_config=self._pool_config
+        )
+        self._schedule_storage = PostgresScheduleStorage(
+            postgres_url, should_autocreate_tables, pool_config=self._pool_config
+        )
         super().__init__()
 
     @property
@@ -66,6 +74,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @property
@@ -1,7 +1,9 @@
 import logging
+import os
+import threading
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Mapping, Optional, TypeVar
+from typing import Any, Callable, Dict, Iterator, Mapping, NamedTuple, Optional, TypeVar
 from urllib.parse import quote, urlencode
 
 import alembic.config
@@ -10,13 +12,14 @@
 import psycopg2.extensions
 import sqlalchemy
 import sqlalchemy.exc
+import sqlalchemy.pool as db_pool
 from dagster import _check as check
 from dagster._core.definitions.policy import Backoff, Jitter, calculate_delay
 
 # re-export
 from dagster._core.storage.config import pg_config as pg_config
 from dagster._core.storage.event_log.sql_event_log import SqlDbConnection
-from dagster._core.storage.sql import get_alembic_config
+from dagster._core.storage.sql import create_engine, get_alembic_config
 from sqlalchemy.engine import Connection
 
 T = TypeVar("T")
@@ -154,15 +157,135 @@ def pg_alembic_config(
     )
 
 
+class PgConnectionCheckoutStats(
+    NamedTuple(
+        "_PgConnectionCheckoutStats",
+        [
+            ("num_checkouts", int),
+            ("total_wait_seconds", float),
+            ("max_wait_seconds", float),
+        ],
+    )
+):
+    """Time spent waiting for a connection from an engine, including any connection handshake
+    and retries.
+    """
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        if not self.num_checkouts:
+            return 0.0
+        return self.total_wait_seconds / self.num_checkouts
+
+
+class PgConnectionCheckoutMetrics:
+    """Thread-safe accumulator of connection checkout wait times for a storage engine."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._num_checkouts = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def record(self, wait_seconds: float) -> None:
+        with self._lock:
+            self._num_checkouts += 1
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+
+    def get_stats(self) -> PgConnectionCheckoutStats:
+        with self._lock:
+            return PgConnectionCheckoutStats(
+                num_checkouts=self._num_checkouts,
+                total_wait_seconds=self._total_wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._num_checkouts = 0
+            self._total_wait_seconds = 0.0
+            self._max_wait_seconds = 0.0
+
+
+def create_pg_engine(
+    postgres_url: str,
+    pool_config: Optional[Mapping[str, Any]] = None,
+    connect_args: Optional[Mapping[str, Any]] = None,
+) -> sqlalchemy.engine.Engine:
+    """Create an engine for a postgres storage.
+
+    Without a ``pool_config`` the engine does not hold any connections open, so that connections
+    do not accumulate per DagsterInstance. With a ``pool_config`` (the ``pool`` block of
+    :py:func:`pg_config`), connections are pooled and are invalidated when checked out in a
+    process other than the one that opened them, so that an engine inherited by a forked process
+    never shares a socket with its parent.
+    """
+    check.str_param(postgres_url, "postgres_url")
+    check.opt_mapping_param(pool_config, "pool_config")
+    check.opt_mapping_param(connect_args, "connect_args")
+
+    kwargs: Dict[str, Any] = {"isolation_level": "AUTOCOMMIT"}
+    if connect_args:
+        kwargs["connect_args"] = dict(connect_args)
+
+    if pool_config is None:
+        return create_engine(postgres_url, poolclass=db_pool.NullPool, **kwargs)
+
+    engine = create_engine(
+        postgres_url,
+        pool_size=pool_config.get("pool_size", 5),
+        max_overflow=pool_config.get("max_overflow", 10),
+        pool_timeout=pool_config.get("pool_timeout", 30),
+        pool_recycle=pool_config.get("pool_recycle", 3600),
+        pool_pre_ping=pool_config.get("pool_pre_ping", True),
+        **kwargs,
+    )
+    _register_fork_safety_listeners(engine)
+    return engine
+
+
+def pg_dagit_pool_config(
+    pool_config: Optional[Mapping[str, Any]], pool_recycle: int
+) -> Mapping[str, Any]:
+    """Pool config for an engine running in dagit, which holds at least one open connection."""
+    if pool_config is None:
+        pool_config = {"pool_size": 1, "max_overflow": 10, "pool_pre_ping": False}
+    return {**pool_config, "pool_recycle": pool_recycle}
+
+
+def _register_fork_safety_listeners(engine: sqlalchemy.engine.Engine) -> None:
+    # See https://docs.sqlalchemy.org/en/14/core/pooling.html#using-connection-pools-with-multiprocessing-or-os-fork
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def _on_connect(_dbapi_connection, connection_record):
+        connection_record.info["pid"] = os.getpid()
+
+    @sqlalchemy.event.listens_for(engine, "checkout")
+    def _on_checkout(_dbapi_connection, connection_record, connection_proxy):
+        pid = os.getpid()
+        if connection_record.info["pid"] != pid:
+            # drop the reference without closing it, the socket still belongs to the parent
+            connection_record.dbapi_connection = connection_proxy.dbapi_connection = None
+            raise sqlalchemy.exc.DisconnectionError(
+                f"Connection record belongs to pid {connection_record.info['pid']}, attempting to"
+                f" check out in pid {pid}"
+            )
+
+
 @contextmanager
 def create_pg_connection(
     engine: sqlalchemy.engine.Engine,
+    checkout_metrics: Optional[PgConnectionCheckoutMetrics] = None,
 ) -> Iterator[Connection]:
     check.inst_param(engine, "engine", sqlalchemy.engine.Engine)
+    check.opt_inst_param(checkout_metrics, "checkout_metrics", PgConnectionCheckoutMetrics)
     conn = None
     try:
         # Retry connection to gracefully handle transient connection issues
+        start_time = time.perf_counter()
         conn = retry_pg_connection_fn(engine.connect)
+        if checkout_metrics:
+            checkout_metrics.record(time.perf_counter() - start_time)
         yield conn
     finally:
         if conn:
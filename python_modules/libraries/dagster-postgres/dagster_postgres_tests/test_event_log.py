@@ -1,9 +1,12 @@
 import time
 
 import pytest
+import sqlalchemy as db
 import yaml
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.test_utils import instance_for_test
+from dagster._core.utils import make_new_run_id
+from dagster._utils.test.postgres_instance import TestPostgresInstance
 from dagster_postgres.event_log import PostgresEventLogStorage
 from dagster_tests.storage_tests.utils.event_log_storage import (
     TestEventLogStorage,
@@ -81,6 +84,44 @@ def watch_two(event, _cursor):
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
 
+    @pytest.mark.parametrize("pool_config", [None, {"pool_size": 5, "max_overflow": 10}])
+    def test_event_log_storage_pooled_writes(self, conn_string, pool_config):
+        TestPostgresInstance.clean_event_log_storage(conn_string).dispose()
+        storage = PostgresEventLogStorage(conn_string, pool_config=pool_config)
+        run_id = make_new_run_id()
+        n_events = 100
+        new_connections = []
+
+        def _on_connect(dbapi_connection, _connection_record):
+            new_connections.append(dbapi_connection)
+
+        try:
+            engine = storage._engine  # noqa: SLF001
+            if pool_config:
+                assert isinstance(engine.pool, db.pool.QueuePool)
+            else:
+                assert isinstance(engine.pool, db.pool.NullPool)
+
+            db.event.listen(engine, "connect", _on_connect)
+            try:
+                for i in range(n_events):
+                    storage.store_event(create_test_event_log_record(str(i), run_id=run_id))
+            finally:
+                db.event.remove(engine, "connect", _on_connect)
+
+            if pool_config:
+                # sequential writes keep reusing the same pooled connections
+                assert len(new_connections) <= pool_config["pool_size"]
+            else:
+                assert len(new_connections) >= n_events
+
+            assert [int(event.message) for event in storage.get_logs_for_run(run_id)] == list(
+                range(n_events)
+            )
+            assert storage.get_connection_checkout_stats().num_checkouts >= n_events
+        finally:
+            storage.dispose()
+
     def test_load_from_config(self, hostname):
         url_cfg = """
         event_log_storage:
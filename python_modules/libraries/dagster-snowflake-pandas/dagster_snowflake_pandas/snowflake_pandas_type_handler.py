@@ -1,14 +1,24 @@
-from typing import Mapping, Optional, Sequence, Type
+from typing import Iterator, Mapping, Optional, Sequence, Type
 
 import pandas as pd
 import pandas.core.dtypes.common as pd_core_dtypes_common
-from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
+from dagster import (
+    InputContext,
+    MetadataValue,
+    OutputContext,
+    TableColumn,
+    TableSchema,
+    _check as check,
+)
 from dagster._core.definitions.metadata import RawMetadataValue
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.storage.db_io_manager import DbTypeHandler, TableSlice
 from dagster_snowflake import build_snowflake_io_manager
 from dagster_snowflake.snowflake_io_manager import SnowflakeDbClient, SnowflakeIOManager
-from snowflake.connector.pandas_tools import pd_writer
+from snowflake.connector.pandas_tools import write_pandas
+
+# max number of rows per parquet file staged by `write_pandas` in `handle_output`
+DEFAULT_WRITE_CHUNK_SIZE = 1_000_000
 
 
 def _table_exists(table_slice: TableSlice, connection):
@@ -81,6 +91,16 @@ def _add_missing_timezone(
     return s
 
 
+def _widen_integer_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Snowflake returns NUMBER columns as the narrowest integer type that fits the fetched values.
+    Widen them to int64 so that the loaded dtypes do not depend on the data.
+    """
+    for column, dtype in df.dtypes.items():
+        if pd_core_dtypes_common.is_integer_dtype(dtype) and dtype.itemsize < 8:
+            df[column] = df[column].astype("int64")
+    return df
+
+
 class SnowflakePandasTypeHandler(DbTypeHandler[pd.DataFrame]):
     """Plugin for the Snowflake I/O Manager that can store and load Pandas DataFrames as Snowflake tables.
 
@@ -109,8 +129,15 @@ def my_table() -> pd.DataFrame:  # the name of the asset will be the table name
                     "io_manager": MySnowflakeIOManager(database="MY_DATABASE", account=EnvVar("SNOWFLAKE_ACCOUNT"), ...)
                 }
             )
+
+    DataFrames are written with ``write_pandas``, which stages them as parquet files of
+    ``write_chunk_size`` rows, and are loaded from Snowflake's Arrow result batches.
     """
 
+    def __init__(self, write_chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE):
+        self._write_chunk_size = check.int_param(write_chunk_size, "write_chunk_size")
+        check.invariant(self._write_chunk_size > 0, "write_chunk_size must be positive")
+
     def handle_output(
         self, context: OutputContext, table_slice: TableSlice, obj: pd.DataFrame, connection
     ) -> Mapping[str, RawMetadataValue]:
@@ -130,12 +157,22 @@ def handle_output(
             with_uppercase_cols = with_uppercase_cols.apply(
                 lambda x: _add_missing_timezone(x, column_types, table_slice.table), axis="index"
             )
-        with_uppercase_cols.to_sql(
-            table_slice.table,
-            con=connection.engine,
-            if_exists="append",
-            index=False,
-            method=pd_writer,
+        if column_types is None:
+            # create the table with the column types that to_sql infers from the DataFrame, the
+            # rows themselves are staged by write_pandas below
+            with_uppercase_cols.head(0).to_sql(
+                table_slice.table,
+                con=connection.engine,
+                if_exists="append",
+                index=False,
+            )
+        write_pandas(
+            # the raw snowflake connection underlying the sqlalchemy connection
+            conn=connection.connection.connection,
+            df=with_uppercase_cols,
+            # the sqlalchemy connector creates tables case insensitively
+            table_name=table_slice.table.upper(),
+            chunk_size=self._write_chunk_size,
         )
 
         return {
@@ -155,9 +192,32 @@ def load_input(
     ) -> pd.DataFrame:
         if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
             return pd.DataFrame()
-        result = pd.read_sql(
-            sql=SnowflakeDbClient.get_select_statement(table_slice), con=connection
-        )
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute(SnowflakeDbClient.get_select_statement(table_slice))
+            result = cursor.fetch_pandas_all()
+        finally:
+            cursor.close()
+        return self._process_loaded_df(context, result)
+
+    def load_input_chunks(
+        self, context: InputContext, table_slice: TableSlice, connection, chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """Loads the input as a sequence of Pandas DataFrames, one per result batch. Snowflake
+        determines the size of the result batches, so chunk_size is not used.
+        """
+        if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
+            return
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute(SnowflakeDbClient.get_select_statement(table_slice))
+            for batch in cursor.fetch_pandas_batches():
+                yield self._process_loaded_df(context, batch)
+        finally:
+            cursor.close()
+
+    def _process_loaded_df(self, context: InputContext, result: pd.DataFrame) -> pd.DataFrame:
+        result = _widen_integer_columns(result)
         if context.resource_config and context.resource_config.get(
             "store_timestamps_as_strings", False
         ):
@@ -46,6 +46,7 @@
     _convert_timestamp_to_string,
 )
 from pandas import DataFrame, Timestamp
+from snowflake.connector.pandas_tools import write_pandas
 
 resource_config = {
     "database": "database_abc",
@@ -92,47 +93,18 @@ def temporary_snowflake_table(schema_name: str, db_name: str) -> Iterator[str]:
 
 
 def test_handle_output():
-    handler = SnowflakePandasTypeHandler()
-    connection = MagicMock()
-    df = DataFrame([{"col1": "a", "col2": 1}])
-    output_context = build_output_context(
-        resource_config={**resource_config, "time_data_to_string": False}
-    )
-
-    metadata = handler.handle_output(
-        output_context,
-        TableSlice(
-            table="my_table",
-            schema="my_schema",
-            database="my_db",
-            columns=None,
-            partition_dimensions=[],
-        ),
-        df,
-        connection,
-    )
-
-    assert metadata == {
-        "dataframe_columns": MetadataValue.table_schema(
-            TableSchema(columns=[TableColumn("col1", "object"), TableColumn("col2", "int64")])
-        ),
-        "row_count": 1,
-    }
-
-
-def test_load_input():
     with patch(
-        "dagster_snowflake_pandas.snowflake_pandas_type_handler.pd.read_sql"
-    ) as mock_read_sql:
+        "dagster_snowflake_pandas.snowflake_pandas_type_handler.write_pandas"
+    ) as mock_write_pandas:
+        handler = SnowflakePandasTypeHandler(write_chunk_size=100)
         connection = MagicMock()
-        mock_read_sql.return_value = DataFrame([{"COL1": "a", "COL2": 1}])
-
-        handler = SnowflakePandasTypeHandler()
-        input_context = build_input_context(
+        df = DataFrame([{"col1": "a", "col2": 1}])
+        output_context = build_output_context(
             resource_config={**resource_config, "time_data_to_string": False}
         )
-        df = handler.load_input(
-            input_context,
+
+        metadata = handler.handle_output(
+            output_context,
             TableSlice(
                 table="my_table",
                 schema="my_schema",
@@ -140,10 +112,48 @@ def test_load_input():
                 columns=None,
                 partition_dimensions=[],
             ),
+            df,
             connection,
         )
-        assert mock_read_sql.call_args_list[0][1]["sql"] == "SELECT * FROM my_db.my_schema.my_table"
-        assert df.equals(DataFrame([{"col1": "a", "col2": 1}]))
+
+        assert metadata == {
+            "dataframe_columns": MetadataValue.table_schema(
+                TableSchema(columns=[TableColumn("col1", "object"), TableColumn("col2", "int64")])
+            ),
+            "row_count": 1,
+        }
+
+        write_pandas_kwargs = mock_write_pandas.call_args_list[0][1]
+        assert write_pandas_kwargs["table_name"] == "MY_TABLE"
+        assert write_pandas_kwargs["chunk_size"] == 100
+        assert write_pandas_kwargs["df"].equals(DataFrame([{"COL1": "a", "COL2": 1}]))
+
+
+def test_load_input():
+    connection = MagicMock()
+    cursor = connection.connection.cursor.return_value
+    cursor.fetch_pandas_all.return_value = DataFrame(
+        {"COL1": ["a"], "COL2": pandas.Series([1], dtype="int8")}
+    )
+
+    handler = SnowflakePandasTypeHandler()
+    input_context = build_input_context(
+        resource_config={**resource_config, "time_data_to_string": False}
+    )
+    df = handler.load_input(
+        input_context,
+        TableSlice(
+            table="my_table",
+            schema="my_schema",
+            database="my_db",
+            columns=None,
+            partition_dimensions=[],
+        ),
+        connection,
+    )
+    assert cursor.execute.call_args_list[0][0][0] == "SELECT * FROM my_db.my_schema.my_table"
+    assert cursor.close.called
+    assert df.equals(DataFrame([{"col1": "a", "col2": 1}]))
 
 
 def test_type_conversions():
@@ -765,3 +775,37 @@ def self_dependent_asset(context, self_dependent_asset: DataFrame) -> DataFrame:
             f"SELECT * FROM {snowflake_table_path}", use_pandas_result=True, fetch_results=True
         )
         assert sorted(out_df["A"].tolist()) == ["1", "1", "1", "2", "2", "2"]
+
+
+@pytest.mark.skipif(not IS_BUILDKITE, reason="Requires access to the BUILDKITE snowflake DB")
+@pytest.mark.parametrize("n_rows,write_chunk_size", [(100_000, 1_000_000), (100_000, 30_000)])
+def test_snowflake_pandas_bulk_round_trip(n_rows: int, write_chunk_size: int):
+    snowflake_config = dict(database=DATABASE, schema=SCHEMA, **SHARED_BUILDKITE_SNOWFLAKE_CONF)
+    df = pandas.DataFrame({f"col_{i}": range(n_rows) for i in range(20)})
+    handler = SnowflakePandasTypeHandler(write_chunk_size=write_chunk_size)
+
+    with temporary_snowflake_table(schema_name=SCHEMA, db_name=DATABASE) as table_name:
+        table_slice = TableSlice(
+            table=table_name,
+            schema=SCHEMA,
+            database=DATABASE,
+            columns=None,
+            partition_dimensions=[],
+        )
+        with SnowflakeConnection(
+            snowflake_config, logging.getLogger("test_snowflake_pandas_bulk_round_trip")
+        ).get_connection(raw_conn=False) as conn:
+            with patch(
+                "dagster_snowflake_pandas.snowflake_pandas_type_handler.write_pandas",
+                wraps=write_pandas,
+            ) as write_pandas_spy:
+                handler.handle_output(build_output_context(), table_slice, df, conn)
+            loaded = handler.load_input(build_input_context(), table_slice, conn)
+
+    # all rows are staged by a single bulk write, in files of write_chunk_size rows
+    assert write_pandas_spy.call_count == 1
+    assert write_pandas_spy.call_args.kwargs["chunk_size"] == write_chunk_size
+
+    pandas.testing.assert_frame_equal(
+        loaded.sort_values("col_0").reset_index(drop=True), df, check_dtype=False
+    )
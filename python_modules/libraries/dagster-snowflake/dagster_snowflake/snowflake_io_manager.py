@@ -100,6 +100,7 @@ def snowflake_io_manager(init_context):
             database=init_context.resource_config["database"],
             schema=init_context.resource_config.get("schema"),
             default_load_type=default_load_type,
+            use_staging_table=init_context.resource_config.get("use_staging_table", False),
         )
 
     return snowflake_io_manager
@@ -203,6 +204,15 @@ def my_table_a(my_table: pd.DataFrame) -> pd.DataFrame:
             " set to UTC timezone to avoid a Snowflake bug. Defaults to False."
         ),
     )
+    use_staging_table: bool = Field(
+        default=False,
+        description=(
+            "If True, outputs are written to a staging table, and the rows of the table or"
+            " partition being materialized are replaced with its contents in a single"
+            " transaction, so that the target table is only locked for the swap. Defaults to"
+            " False."
+        ),
+    )
 
     @staticmethod
     @abstractmethod
@@ -259,6 +269,7 @@ def create_io_manager(self, context) -> DbIOManager:
             schema=self.schema_,
             type_handlers=self.type_handlers(),
             default_load_type=self.default_load_type(),
+            use_staging_table=self.use_staging_table,
         )
 
 
@@ -297,6 +308,53 @@ def delete_table_slice(context: OutputContext, table_slice: TableSlice, connecti
             # table doesn't exist yet, so ignore the error
             pass
 
+    @staticmethod
+    def create_staging_table(
+        context: OutputContext,
+        table_slice: TableSlice,
+        staging_table_slice: TableSlice,
+        connection,
+    ) -> None:
+        # give the staging table the column types of the existing table, so that type handlers
+        # convert timestamps for the table's columns rather than inferring new column types
+        if _table_exists(table_slice, connection):
+            connection.execute(
+                f"create table {_get_table_name(staging_table_slice)} like"
+                f" {_get_table_name(table_slice)}"
+            )
+
+    @staticmethod
+    def replace_table_slice(
+        context: OutputContext,
+        table_slice: TableSlice,
+        staging_table_slice: TableSlice,
+        connection,
+    ) -> None:
+        table = _get_table_name(table_slice)
+        staging_table = _get_table_name(staging_table_slice)
+        if not _table_exists(table_slice, connection):
+            # nothing to swap with yet, so the staging table becomes the table
+            connection.execute(f"alter table {staging_table} rename to {table}")
+            return
+
+        # statements are run on the underlying snowflake connection, so that they are all part of
+        # the explicit transaction rather than being committed one by one by sqlalchemy
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute("begin")
+            cursor.execute(_get_cleanup_statement(table_slice))
+            cursor.execute(f"insert into {table} select * from {staging_table}")
+            cursor.execute("commit")
+        except Exception:
+            cursor.execute("rollback")
+            raise
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def drop_table(context: OutputContext, table_slice: TableSlice, connection) -> None:
+        connection.execute(f"drop table if exists {_get_table_name(table_slice)}")
+
     @staticmethod
     def get_select_statement(table_slice: TableSlice) -> str:
         col_str = ", ".join(table_slice.columns) if table_slice.columns else "*"
@@ -345,3 +403,15 @@ def _time_window_where_clause(table_partition: TablePartitionDimension) -> str:
 def _static_where_clause(table_partition: TablePartitionDimension) -> str:
     partitions = ", ".join(f"'{partition}'" for partition in table_partition.partitions)
     return f"""{table_partition.partition_expr} in ({partitions})"""
+
+
+def _get_table_name(table_slice: TableSlice) -> str:
+    return f"{table_slice.database}.{table_slice.schema}.{table_slice.table}"
+
+
+def _table_exists(table_slice: TableSlice, connection) -> bool:
+    tables = connection.execute(
+        f"show tables like '{table_slice.table}' in schema"
+        f" {table_slice.database}.{table_slice.schema}"
+    ).fetchall()
+    return len(tables) > 0
@@ -1,4 +1,5 @@
 from datetime import datetime
+from unittest.mock import MagicMock
 
 from dagster import TimeWindow
 from dagster._core.storage.db_io_manager import TablePartitionDimension, TableSlice
@@ -173,3 +174,27 @@ def test_get_cleanup_statement_multi_partitioned():
         " AND\nmy_timestamp_col >= '2020-01-02 00:00:00' AND my_timestamp_col < '2020-02-03"
         " 00:00:00'"
     )
+
+
+def test_create_staging_table():
+    table_slice = TableSlice(database="database_abc", schema="schema1", table="table1")
+    staging_table_slice = table_slice._replace(table="table1_dagster_staging_abc")
+
+    connection = MagicMock()
+    connection.execute.return_value.fetchall.return_value = [("table1",)]
+    SnowflakeDbClient.create_staging_table(
+        MagicMock(), table_slice, staging_table_slice, connection
+    )
+    assert (
+        connection.execute.call_args[0][0]
+        == "create table database_abc.schema1.table1_dagster_staging_abc like"
+        " database_abc.schema1.table1"
+    )
+
+    # the type handler creates the staging table if there is no table to copy column types from
+    connection = MagicMock()
+    connection.execute.return_value.fetchall.return_value = []
+    SnowflakeDbClient.create_staging_table(
+        MagicMock(), table_slice, staging_table_slice, connection
+    )
+    assert connection.execute.call_count == 1